@@ -38,7 +38,10 @@ def parse_args():
         'list_projects',
         'get_runtimes',
         'create_job_run',
+        'run_job_sweep',
+        'run_job_dag',
         'list_job_runs',
+        'wait_for_job_run',
         'create_model_build',
         'create_model_deployment',
         'delete_application',
@@ -52,15 +55,42 @@ def parse_args():
     parser.add_argument('--file-path', help='Path to the file to upload')
     parser.add_argument('--target-name', help='Target name for the uploaded file')
     parser.add_argument('--target-dir', help='Target directory for the uploaded file')
+    parser.add_argument('--chunked', action='store_true', help='Upload the file in resumable parts')
+    parser.add_argument('--part-size', type=int, default=64 * 1024 * 1024, help='Size of each part in bytes with --chunked')
     parser.add_argument('--folder-path', help='Local folder path to upload')
+    parser.add_argument('--concurrency', type=int,
+                        help='Number of files to upload (default: 1), runs to start (default: 4), or jobs to delete or list runs of (default: 8) in parallel')
+    parser.add_argument('--sync', action='store_true', help='Only upload files changed since the last sync')
+    parser.add_argument('--delete-removed', action='store_true', help='With --sync, delete remote files removed locally')
+    parser.add_argument('--remote-diff', action='store_true', help='Skip files whose remote copy is already up to date')
+    parser.add_argument('--batch', action='store_true', help='Upload many small files per request')
+    parser.add_argument('--batch-max-files', type=int, default=100, help='Maximum number of files per batch request')
+    parser.add_argument('--batch-max-bytes', type=int, default=8 * 1024 * 1024, help='Maximum total bytes per batch request')
     parser.add_argument('--path', help='Path to list files from (relative to project root)')
-    parser.add_argument('--job-name', help='Name for the job to create')
+    parser.add_argument('--bypass-cache', action='store_true', help='Fetch fresh results instead of cached responses')
+    parser.add_argument('--limit', type=int, help='Maximum number of records to list')
+    parser.add_argument('--page-size', type=int, default=100, help='Records fetched per API request when listing')
+    parser.add_argument('--job-name', help='Name for the job to create (with delete_all_jobs, the job name to delete)')
     parser.add_argument('--script-path', help='Script path for the job to create')
     parser.add_argument('--job-id', help='ID of the job to delete or run')
+    parser.add_argument('--run-id', help='ID of the job run to wait for')
+    parser.add_argument('--timeout', type=float,
+                        help='Seconds to wait for job runs (default: 600, or 3600 with run_job_dag)')
+    parser.add_argument('--name-regex', help='With delete_all_jobs, only delete jobs whose name matches this regex')
+    parser.add_argument('--older-than-days', type=float, help='With delete_all_jobs, only delete jobs older than this')
+    parser.add_argument('--status', help='With delete_all_jobs or list_job_runs, comma-separated statuses to select')
+    parser.add_argument('--since', help='With list_job_runs, only runs created at or after this ISO 8601 time')
+    parser.add_argument('--until', help='With list_job_runs, only runs created before this ISO 8601 time')
+    parser.add_argument('--dry-run', action='store_true', help='With delete_all_jobs, only list the jobs to delete')
     parser.add_argument('--project-name', help='Name of the project to find')
     parser.add_argument('--runtime', help='Runtime identifier for jobs or applications')
     parser.add_argument('--env-vars', help='Environment variables as JSON string')
     parser.add_argument('--override-config', help='Job configuration overrides as JSON string')
+    parser.add_argument('--grid', help='With run_job_sweep, JSON object of environment variable to list of values')
+    parser.add_argument('--variants', help='With run_job_sweep, JSON list of run variants')
+    parser.add_argument('--nodes', help='With run_job_dag, JSON list of {"name", "job_id", "depends_on"} nodes')
+    parser.add_argument('--retries', type=int, default=0, help='With run_job_dag, times a failed node is run again')
+    parser.add_argument('--fail-fast', action='store_true', help='With run_job_dag, stop everything once a node fails')
     parser.add_argument('--description', help='Description for the job or application')
     # Model build specific arguments
     parser.add_argument('--model-id', help='ID of the model to build or deploy')
@@ -121,7 +151,7 @@ def main():
     
     try:
         if args.command == 'list_jobs':
-            result = mcp.list_jobs()
+            result = mcp.list_jobs(bypass_cache=args.bypass_cache, limit=args.limit, page_size=args.page_size)
         
         elif args.command == 'upload_file':
             if not args.file_path:
@@ -131,7 +161,10 @@ def main():
                 file_path=args.file_path, 
                 target_name=args.target_name, 
                 target_dir=args.target_dir,
-                project_id=args.project_id
+                project_id=args.project_id,
+                chunked=args.chunked,
+                part_size=args.part_size,
+                runtime_identifier=args.runtime
             )
         
         elif args.command == 'upload_folder':
@@ -140,7 +173,14 @@ def main():
                 return 1
             result = mcp.upload_folder(
                 folder_path=args.folder_path, 
-                project_id=args.project_id
+                project_id=args.project_id,
+                concurrency=args.concurrency or 1,
+                sync=args.sync,
+                delete_removed=args.delete_removed,
+                remote_diff=args.remote_diff,
+                batch=args.batch,
+                batch_max_files=args.batch_max_files,
+                batch_max_bytes=args.batch_max_bytes
             )
         
         elif args.command == 'create_job':
@@ -156,7 +196,10 @@ def main():
             result = mcp.delete_job(job_id=args.job_id)
         
         elif args.command == 'delete_all_jobs':
-            result = mcp.delete_all_jobs()
+            result = mcp.delete_all_jobs(name=args.job_name, name_regex=args.name_regex,
+                                         older_than_days=args.older_than_days,
+                                         status=args.status.split(",") if args.status else None,
+                                         dry_run=args.dry_run, concurrency=args.concurrency or 8)
             
         elif args.command == 'get_project_id':
             if not args.project_name:
@@ -165,15 +208,25 @@ def main():
             result = mcp.get_project_id(project_name=args.project_name)
             
         elif args.command == 'list_projects':
-            result = mcp.list_projects()
+            result = mcp.list_projects(bypass_cache=args.bypass_cache, limit=args.limit, page_size=args.page_size)
             
         elif args.command == 'get_runtimes':
-            result = mcp.get_runtimes()
+            result = mcp.get_runtimes(bypass_cache=args.bypass_cache)
             
         elif args.command == 'list_job_runs':
             # Get job_id if provided
             job_id = args.job_id
-            result = mcp.list_job_runs(job_id=job_id, project_id=args.project_id)
+            result = mcp.list_job_runs(job_id=job_id, project_id=args.project_id,
+                                       status=args.status.split(",") if args.status else None,
+                                       since=args.since, until=args.until, limit=args.limit,
+                                       concurrency=args.concurrency or 8, bypass_cache=args.bypass_cache)
+        
+        elif args.command == 'wait_for_job_run':
+            if not args.job_id or not args.run_id:
+                print("Error: --job-id and --run-id are required for wait_for_job_run command")
+                return 1
+            result = mcp.wait_for_job_run(job_id=args.job_id, run_id=args.run_id, project_id=args.project_id,
+                                          timeout=args.timeout if args.timeout is not None else 600)
         
         elif args.command == 'create_job_run':
             if not args.project_id:
@@ -209,6 +262,39 @@ def main():
                 override_config=override_config
             )
             
+        elif args.command == 'run_job_sweep':
+            if not args.job_id or not (args.grid or args.variants):
+                print("Error: --job-id and --grid or --variants are required for run_job_sweep command")
+                return 1
+            
+            sweep = {}
+            for name, value in (("grid", args.grid), ("variants", args.variants),
+                                ("environment_variables", args.env_vars), ("override_config", args.override_config)):
+                if value:
+                    try:
+                        sweep[name] = json.loads(value)
+                    except json.JSONDecodeError:
+                        print(f"Error: the {name} option must be valid JSON")
+                        return 1
+            
+            result = mcp.run_job_sweep(job_id=args.job_id, project_id=args.project_id,
+                                       runtime_identifier=args.runtime, concurrency=args.concurrency or 4,
+                                       timeout=args.timeout if args.timeout is not None else 600, **sweep)
+            
+        elif args.command == 'run_job_dag':
+            if not args.nodes:
+                print("Error: --nodes is required for run_job_dag command")
+                return 1
+            try:
+                nodes = json.loads(args.nodes)
+            except json.JSONDecodeError:
+                print("Error: the nodes option must be valid JSON")
+                return 1
+            
+            result = mcp.run_job_dag(nodes=nodes, project_id=args.project_id, max_parallel=args.concurrency or 4,
+                                     retries=args.retries, fail_fast=args.fail_fast,
+                                     timeout=args.timeout if args.timeout is not None else 3600)
+            
         elif args.command == 'create_model_build':
             if not args.project_id:
                 print("Error: --project-id is required for create_model_build command")
@@ -319,7 +405,8 @@ def main():
             )
             
         elif args.command == 'list_applications':
-            result = mcp.list_applications(project_id=args.project_id)
+            result = mcp.list_applications(project_id=args.project_id, bypass_cache=args.bypass_cache,
+                                           limit=args.limit, page_size=args.page_size)
             
         elif args.command == 'create_application':
             if not args.name:
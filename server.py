@@ -6,7 +6,9 @@ This server enables LLMs to interact with Cloudera Machine Learning via API.
 
 import os
 import json
-from mcp.server.fastmcp import FastMCP
+import asyncio
+import threading
+from mcp.server.fastmcp import FastMCP, Context
 from dotenv import load_dotenv
 from typing import Dict, Any, Optional, List
 
@@ -38,6 +40,9 @@ from src.functions.get_experiment import get_experiment
 from src.functions.get_experiment_run import get_experiment_run
 from src.functions.get_job import get_job
 from src.functions.get_job_run import get_job_run
+from src.functions.wait_for_job_run import wait_for_job_run
+from src.functions.run_job_sweep import run_job_sweep
+from src.functions.run_job_dag import run_job_dag
 from src.functions.get_model import get_model
 from src.functions.get_model_build import get_model_build
 from src.functions.get_model_deployment import get_model_deployment
@@ -49,6 +54,11 @@ from src.functions.list_model_builds import list_model_builds
 from src.functions.list_model_deployments import list_model_deployments
 from src.functions.list_project_files import list_project_files
 from src.functions.log_experiment_run_batch import log_experiment_run_batch
+from src.functions.export_experiment_runs import export_experiment_runs
+from src.functions.compare_experiment_runs import compare_experiment_runs
+from src.functions.best_runs import best_runs
+from src.functions.sync_experiment_runs import sync_experiment_runs
+from src.functions.query_experiment_runs import query_experiment_runs
 from src.functions.restart_application import restart_application
 from src.functions.stop_application import stop_application
 from src.functions.stop_job_run import stop_job_run
@@ -60,10 +70,28 @@ from src.functions.update_job import update_job
 from src.functions.update_project import update_project
 from src.functions.update_project_file_metadata import update_project_file_metadata
 from src.utils import get_session, handle_error, format_url
+from src.transport import rate_limit_stats
+from src.aio import make_async, run_blocking, run_long_running
 
 # Create MCP server
 mcp = FastMCP(name="Cloudera ML MCP Server")
 
+
+def async_tool(long_running=False):
+    """
+    Register a tool as async, running its blocking API calls on a worker pool
+    
+    The function modules use blocking HTTP, so calling them directly from
+    a tool would stall the server's event loop until they return. Wrapped
+    this way, concurrent tool calls are multiplexed on one loop and a long
+    upload no longer holds up other tools. Tools that can take minutes pass
+    long_running=True and get a pool of their own, so they cannot take every
+    worker from short calls.
+    """
+    def decorator(func):
+        return mcp.tool()(make_async(func, long_running=long_running))
+    return decorator
+
 # Get configuration from environment variables
 def get_config():
     return {
@@ -72,8 +100,11 @@ def get_config():
     }
 
 # Register functions as MCP tools
-@mcp.tool()
-def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id: str = None) -> str:
+@async_tool(long_running=True)
+def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id: str = None,
+                       concurrency: int = 1, sync: bool = False, delete_removed: bool = False,
+                       remote_diff: bool = False, batch: bool = False, batch_max_files: int = 100,
+                       batch_max_bytes: int = 8388608) -> str:
     """
     Upload a folder to Cloudera ML.
     
@@ -81,6 +112,13 @@ def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id:
         folder_path: Local path to the folder to upload
         ignore_folders: Comma-separated list of folders to ignore (optional)
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        concurrency: Number of files to upload in parallel (default: 1)
+        sync: Only upload files that changed since the last sync of this folder (default: False)
+        delete_removed: With sync, delete remote files that were removed locally (default: False)
+        remote_diff: Skip files whose remote copy already has the same size and is not older (default: False)
+        batch: Upload many small files per request (default: False)
+        batch_max_files: Maximum number of files per batch request (default: 100)
+        batch_max_bytes: Maximum total bytes per batch request (default: 8 MiB)
     
     Returns:
         JSON string with upload results
@@ -94,12 +132,20 @@ def upload_folder_tool(folder_path: str, ignore_folders: str = None, project_id:
     
     result = upload_folder(config, {
         "folder_path": folder_path,
-        "ignore_folders": ignore_list
+        "ignore_folders": ignore_list,
+        "concurrency": concurrency,
+        "sync": sync,
+        "delete_removed": delete_removed,
+        "remote_diff": remote_diff,
+        "batch": batch,
+        "batch_max_files": batch_max_files,
+        "batch_max_bytes": batch_max_bytes
     })
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def upload_file_tool(file_path: str, target_name: str = None, target_dir: str = None, project_id: str = None) -> str:
+@async_tool(long_running=True)
+def upload_file_tool(file_path: str, target_name: str = None, target_dir: str = None, project_id: str = None,
+                     chunked: bool = False, part_size: int = 67108864, runtime_identifier: str = None) -> str:
     """
     Upload a single file to Cloudera ML.
     
@@ -108,6 +154,10 @@ def upload_file_tool(file_path: str, target_name: str = None, target_dir: str =
         target_name: Optional name to use for the uploaded file
         target_dir: Optional directory to upload to
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        chunked: Upload in resumable parts reassembled by a job in the project; calling
+            again after a failure resumes from the last uploaded part (default: False)
+        part_size: Size of each part in bytes in chunked mode (default: 64 MiB)
+        runtime_identifier: Optional runtime for the reassembly job in chunked mode
     
     Returns:
         JSON string with upload results
@@ -119,11 +169,14 @@ def upload_file_tool(file_path: str, target_name: str = None, target_dir: str =
     result = upload_file(config, {
         "file_path": file_path,
         "target_name": target_name,
-        "target_dir": target_dir
+        "target_dir": target_dir,
+        "chunked": chunked,
+        "part_size": part_size,
+        "runtime_identifier": runtime_identifier
     })
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def create_job_tool(name: str, script: str, kernel: str = "python3", 
                    cpu: int = 1, memory: int = 1, nvidia_gpu: int = 0,
                    runtime_identifier: str = None, project_id: str = None) -> str:
@@ -156,15 +209,18 @@ def create_job_tool(name: str, script: str, kernel: str = "python3",
         "nvidia_gpu": nvidia_gpu,
         "runtime_identifier": runtime_identifier
     })
-    return result
+    return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_jobs_tool(project_id: str = None) -> str:
+@async_tool()
+def list_jobs_tool(project_id: str = None, bypass_cache: bool = False, limit: int = None, page_size: int = 100) -> str:
     """
     List all jobs in the Cloudera ML project.
     
     Args:
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        bypass_cache: Fetch a fresh list instead of a recently cached one (default: False)
+        limit: Maximum number of jobs to return (optional - default: all)
+        page_size: Number of jobs fetched per API request (default: 100)
     
     Returns:
         JSON string containing list of jobs
@@ -173,16 +229,20 @@ def list_jobs_tool(project_id: str = None) -> str:
     if project_id:
         config["project_id"] = project_id
         
-    result = list_jobs(config, {})
-    return result
+    result = list_jobs(config, {"bypass_cache": bypass_cache, "limit": limit, "page_size": page_size})
+    return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_applications_tool(project_id: str = None) -> str:
+@async_tool()
+def list_applications_tool(project_id: str = None, bypass_cache: bool = False, limit: int = None,
+                           page_size: int = 100) -> str:
     """
     List all applications in the Cloudera ML project.
     
     Args:
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        bypass_cache: Fetch a fresh list instead of a recently cached one (default: False)
+        limit: Maximum number of applications to return (optional - default: all)
+        page_size: Number of applications fetched per API request (default: 100)
     
     Returns:
         JSON string containing list of applications
@@ -191,16 +251,23 @@ def list_applications_tool(project_id: str = None) -> str:
     if project_id:
         config["project_id"] = project_id
         
-    result = list_applications(config, {"project_id": project_id or config.get("project_id", "")})
+    result = list_applications(config, {
+        "project_id": project_id or config.get("project_id", ""),
+        "bypass_cache": bypass_cache,
+        "limit": limit,
+        "page_size": page_size
+    })
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_experiments_tool(project_id: str = None) -> str:
+@async_tool()
+def list_experiments_tool(project_id: str = None, limit: int = None, page_size: int = 100) -> str:
     """
     List all experiments in the Cloudera ML project.
     
     Args:
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        limit: Maximum number of experiments to return (optional - default: all)
+        page_size: Number of experiments fetched per API request (default: 100)
     
     Returns:
         JSON string containing list of experiments
@@ -209,17 +276,29 @@ def list_experiments_tool(project_id: str = None) -> str:
     if project_id:
         config["project_id"] = project_id
         
-    result = list_experiments(config, {"project_id": project_id or config.get("project_id", "")})
+    result = list_experiments(config, {
+        "project_id": project_id or config.get("project_id", ""),
+        "limit": limit,
+        "page_size": page_size
+    })
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_job_runs_tool(job_id: str = None, project_id: str = None) -> str:
+@async_tool()
+def list_job_runs_tool(job_id: str = None, project_id: str = None, status: str = None, since: str = None,
+                       until: str = None, limit: int = None, concurrency: int = 8) -> str:
     """
-    List all job runs in the Cloudera ML project.
+    List job runs in the Cloudera ML project, newest first.
+    
+    Without job_id, the runs of all jobs in the project are listed in one call.
     
     Args:
         job_id: If provided, only list runs for this specific job
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        status: Comma-separated run statuses to keep, e.g. "ENGINE_FAILED" (optional)
+        since: Only runs created at or after this ISO 8601 time, e.g. "2024-05-01T00:00:00Z" (optional)
+        until: Only runs created before this ISO 8601 time (optional)
+        limit: Maximum number of runs to return (optional - default: all)
+        concurrency: Number of jobs whose runs are listed in parallel without job_id (default: 8)
     
     Returns:
         JSON string containing list of job runs
@@ -228,20 +307,29 @@ def list_job_runs_tool(job_id: str = None, project_id: str = None) -> str:
     if project_id:
         config["project_id"] = project_id
     
-    params = {"project_id": project_id or config.get("project_id", "")}
+    params = {
+        "project_id": project_id or config.get("project_id", ""),
+        "status": status.split(",") if status else None,
+        "since": since,
+        "until": until,
+        "limit": limit,
+        "concurrency": concurrency
+    }
     if job_id:
         params["job_id"] = job_id
         
     result = list_job_runs(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_models_tool(project_id: str = None) -> str:
+@async_tool()
+def list_models_tool(project_id: str = None, limit: int = None, page_size: int = 100) -> str:
     """
     List all models in the Cloudera ML project.
     
     Args:
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        limit: Maximum number of models to return (optional - default: all)
+        page_size: Number of models fetched per API request (default: 100)
     
     Returns:
         JSON string containing list of models
@@ -250,10 +338,14 @@ def list_models_tool(project_id: str = None) -> str:
     if project_id:
         config["project_id"] = project_id
         
-    result = list_models(config, {"project_id": project_id or config.get("project_id", "")})
+    result = list_models(config, {
+        "project_id": project_id or config.get("project_id", ""),
+        "limit": limit,
+        "page_size": page_size
+    })
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def list_model_builds_tool(model_id: str = None, project_id: str = None) -> str:
     """
     List all model builds in the Cloudera ML project.
@@ -276,8 +368,9 @@ def list_model_builds_tool(model_id: str = None, project_id: str = None) -> str:
     result = list_model_builds(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_model_deployments_tool(model_id: str = None, build_id: str = None, project_id: str = None) -> str:
+@async_tool()
+def list_model_deployments_tool(model_id: str = None, build_id: str = None, project_id: str = None,
+                                limit: int = None, page_size: int = 100) -> str:
     """
     List all model deployments in the Cloudera ML project.
     
@@ -285,6 +378,8 @@ def list_model_deployments_tool(model_id: str = None, build_id: str = None, proj
         model_id: If provided, only list deployments for this specific model
         build_id: If provided, only list deployments for this specific build
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        limit: Maximum number of deployments to return (optional - default: all)
+        page_size: Number of deployments fetched per API request (default: 100)
     
     Returns:
         JSON string containing list of model deployments
@@ -293,7 +388,7 @@ def list_model_deployments_tool(model_id: str = None, build_id: str = None, proj
     if project_id:
         config["project_id"] = project_id
     
-    params = {"project_id": project_id or config.get("project_id", "")}
+    params = {"project_id": project_id or config.get("project_id", ""), "limit": limit, "page_size": page_size}
     if model_id:
         params["model_id"] = model_id
     if build_id:
@@ -302,7 +397,7 @@ def list_model_deployments_tool(model_id: str = None, build_id: str = None, proj
     result = list_model_deployments(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def delete_job_tool(job_id: str, project_id: str = None) -> str:
     """
     Delete a job by ID.
@@ -319,15 +414,23 @@ def delete_job_tool(job_id: str, project_id: str = None) -> str:
         config["project_id"] = project_id
         
     result = delete_job(config, {"job_id": job_id})
-    return result
+    return json.dumps(result, indent=2)
 
 @mcp.tool()
-def delete_all_jobs_tool(project_id: str = None) -> str:
+async def delete_all_jobs_tool(project_id: str = None, name: str = None, name_regex: str = None,
+                               older_than_days: float = None, status: str = None, dry_run: bool = False,
+                               concurrency: int = 8, ctx: Context = None) -> str:
     """
-    Delete all jobs in the project.
+    Delete all jobs in the project, or only the jobs matching the given filters.
     
     Args:
         project_id: Project ID (optional - if not provided, uses default from configuration)
+        name: Only delete the job with this exact name (optional)
+        name_regex: Only delete jobs whose name matches this regular expression (optional)
+        older_than_days: Only delete jobs created more than this many days ago (optional)
+        status: Comma-separated job statuses to delete, e.g. "ENGINE_FAILED,ENGINE_SUCCEEDED" (optional)
+        dry_run: Only list the jobs that would be deleted (default: False)
+        concurrency: Number of jobs to delete in parallel (default: 8)
     
     Returns:
         JSON string with delete operation results
@@ -335,56 +438,84 @@ def delete_all_jobs_tool(project_id: str = None) -> str:
     config = get_config()
     if project_id:
         config["project_id"] = project_id
-        
-    result = delete_all_jobs(config, {})
-    return result
+    
+    # Deletes finish on worker threads; report each one to the client from the event loop
+    loop = asyncio.get_running_loop()
+    def progress(done, total, job):
+        if ctx is not None:
+            asyncio.run_coroutine_threadsafe(ctx.report_progress(done, total), loop)
+    
+    result = await run_blocking(delete_all_jobs, config, {
+        "name": name,
+        "name_regex": name_regex,
+        "older_than_days": older_than_days,
+        "status": status.split(",") if status else None,
+        "dry_run": dry_run,
+        "concurrency": concurrency,
+        "progress": progress
+    })
+    return json.dumps(result, indent=2)
 
-@mcp.tool()
-def get_project_id_tool(project_name: str) -> str:
+@async_tool()
+def get_project_id_tool(project_name: str, bypass_cache: bool = False) -> str:
     """
     Get project ID from a project name.
     
     Args:
         project_name: Name of the project to find. Use "*" to list all projects.
+        bypass_cache: Look the name up on the server even if it was resolved recently (default: False)
         
     Returns:
         JSON string with project information and ID
     """
     config = get_config()
-    result = get_project_id(config, {"project_name": project_name})
+    result = get_project_id(config, {"project_name": project_name, "bypass_cache": bypass_cache})
     
     # Convert result to string
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def list_projects_tool() -> str:
+@async_tool()
+def list_projects_tool(bypass_cache: bool = False, limit: int = None, page_size: int = 100) -> str:
     """
     List all available projects.
     
+    Args:
+        bypass_cache: Fetch a fresh list instead of a recently cached one (default: False)
+        limit: Maximum number of projects to return (optional - default: all)
+        page_size: Number of projects fetched per API request (default: 100)
+    
     Returns:
         JSON string with all project information
     """
     config = get_config()
-    result = get_project_id(config, {"project_name": "*"})
+    result = get_project_id(config, {
+        "project_name": "*",
+        "bypass_cache": bypass_cache,
+        "limit": limit,
+        "page_size": page_size
+    })
     
     # Convert result to string
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def get_runtimes_tool() -> str:
+@async_tool()
+def get_runtimes_tool(bypass_cache: bool = False) -> str:
     """
     Get available runtimes from Cloudera ML.
     
+    Args:
+        bypass_cache: Fetch a fresh list instead of a recently cached one (default: False)
+    
     Returns:
         JSON string with list of available runtimes and their details
     """
     config = get_config()
-    result = get_runtimes(config, {})
+    result = get_runtimes(config, {"bypass_cache": bypass_cache})
     
     # Convert result to string
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def create_job_run_tool(project_id: str, job_id: str, 
                        runtime_identifier: str = None, 
                        environment_variables: str = None,
@@ -435,7 +566,108 @@ def create_job_run_tool(project_id: str, job_id: str,
     result = create_job_run(config, params)
     return json.dumps(result, indent=2)
 
+@async_tool(long_running=True)
+def run_job_sweep_tool(job_id: str, grid: str = None, variants: str = None, project_id: str = None,
+                       environment_variables: str = None, override_config: str = None,
+                       runtime_identifier: str = None, concurrency: int = 4, wait: bool = True,
+                       timeout: float = 600) -> str:
+    """
+    Start one run of a job per parameter variant, in one call, and wait for all of them to finish.
+    
+    Args:
+        job_id: ID of the job to run
+        grid: JSON object of environment variable name to list of values, e.g. {"LR": [0.1, 0.01], "SEED": [1, 2]};
+              one run per combination (optional)
+        variants: JSON list of {"environment_variables": {...}, "override_config": {...}} objects,
+                  one run each (optional)
+        project_id: ID of the project containing the job (optional)
+        environment_variables: JSON object of environment variables for every run (optional)
+        override_config: JSON object of configuration overrides for every run (optional)
+        runtime_identifier: Runtime identifier for every run (optional)
+        concurrency: Number of runs submitted in parallel (default: 4)
+        wait: Wait for all runs to finish (default: True)
+        timeout: Seconds to wait for all runs (default: 600)
+    
+    Returns:
+        JSON string with run_id, variant and final status for each run
+    """
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+    
+    params = {
+        "job_id": job_id,
+        "runtime_identifier": runtime_identifier,
+        "concurrency": concurrency,
+        "wait": wait,
+        "timeout": timeout
+    }
+    for name, value in (("grid", grid), ("variants", variants),
+                        ("environment_variables", environment_variables), ("override_config", override_config)):
+        if value:
+            try:
+                params[name] = json.loads(value)
+            except json.JSONDecodeError:
+                return json.dumps({
+                    "success": False,
+                    "message": f"Invalid JSON for {name}"
+                })
+    
+    result = run_job_sweep(config, params)
+    return json.dumps(result, indent=2)
+
 @mcp.tool()
+async def run_job_dag_tool(nodes: str, project_id: str = None, max_parallel: int = 4, retries: int = 0,
+                           fail_fast: bool = False, node_timeout: float = None, timeout: float = 3600) -> str:
+    """
+    Run several jobs in dependency order: each job starts as soon as the jobs it depends on have succeeded,
+    and independent branches run in parallel.
+    
+    Args:
+        nodes: JSON list of {"name": ..., "job_id": ..., "depends_on": [names]} objects; each may also set
+               environment_variables, override_config, runtime_identifier and retries
+        project_id: ID of the project containing the jobs (optional)
+        max_parallel: Largest number of runs at a time (default: 4)
+        retries: Times a failed node is run again, unless the node sets its own (default: 0)
+        fail_fast: Stop all running nodes once one has failed for good (default: False)
+        node_timeout: Seconds a single run may take before it is stopped (optional)
+        timeout: Seconds the whole DAG may take (default: 3600)
+    
+    Returns:
+        JSON string with each node's state, run IDs and timings, the critical path and the makespan
+    
+    If the call is cancelled, the DAG's running jobs are stopped and the rest are not started.
+    """
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+    
+    try:
+        node_list = json.loads(nodes)
+    except json.JSONDecodeError:
+        return json.dumps({
+            "success": False,
+            "message": "Invalid JSON for nodes"
+        })
+    
+    # The DAG runs on a worker thread, which cancelling the call does not stop; the event does
+    cancel = threading.Event()
+    try:
+        result = await run_long_running(run_job_dag, config, {
+            "nodes": node_list,
+            "max_parallel": max_parallel,
+            "retries": retries,
+            "fail_fast": fail_fast,
+            "node_timeout": node_timeout,
+            "timeout": timeout,
+            "cancel": cancel
+        })
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
+    return json.dumps(result, indent=2)
+
+@async_tool()
 def create_model_build_tool(project_id: str, model_id: str, file_path: str, function_name: str,
                            kernel: str = "python3", runtime_identifier: str = None,
                            replica_size: str = None, cpu: int = 1, memory: int = 2,
@@ -499,7 +731,7 @@ def create_model_build_tool(project_id: str, model_id: str, file_path: str, func
     result = create_model_build(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def create_model_deployment_tool(project_id: str, model_id: str, build_id: str, name: str,
                                 cpu: int = 1, memory: int = 2, replica_count: int = 1,
                                 min_replica_count: int = None, max_replica_count: int = None,
@@ -563,7 +795,7 @@ def create_model_deployment_tool(project_id: str, model_id: str, build_id: str,
     result = create_model_deployment(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def delete_application_tool(application_id: str, project_id: str = None) -> str:
     """
     Delete an application in Cloudera ML.
@@ -587,7 +819,7 @@ def delete_application_tool(application_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def delete_experiment_tool(experiment_id: str, project_id: str = None) -> str:
     """
     Delete an experiment in Cloudera ML.
@@ -611,7 +843,7 @@ def delete_experiment_tool(experiment_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def delete_experiment_run_tool(experiment_id: str, run_id: str, project_id: str = None) -> str:
     """
     Delete an experiment run in Cloudera ML.
@@ -637,7 +869,7 @@ def delete_experiment_run_tool(experiment_id: str, run_id: str, project_id: str
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def create_experiment_run_tool(project_id: str, experiment_id: str, name: str = None, 
                               description: str = None, metrics: str = None,
                               parameters: str = None, tags: str = None) -> str:
@@ -696,36 +928,54 @@ def create_experiment_run_tool(project_id: str, experiment_id: str, name: str =
     result = create_experiment_run(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def delete_experiment_run_batch_tool(experiment_id: str, run_ids: str, project_id: str = None) -> str:
+@async_tool()
+def delete_experiment_run_batch_tool(experiment_id: str, run_ids: str = None, project_id: str = None,
+                                     older_than_days: float = None, status: str = None, metric: str = None,
+                                     metric_below: float = None, metric_above: float = None,
+                                     dry_run: bool = False, concurrency: int = 4) -> str:
     """
-    Delete multiple experiment runs in a single request.
+    Delete multiple experiment runs, given by ID or selected with filters. Use the filters instead of
+    listing run IDs to clean out many runs; try dry_run first to see how many runs match.
     
     Args:
         experiment_id: ID of the experiment containing the runs
-        run_ids: Comma-separated list of run IDs to delete
+        run_ids: Comma-separated list of run IDs to delete (required unless filters are given)
         project_id: ID of the project (optional if not provided, uses default from configuration)
+        older_than_days: Only delete runs started more than this many days ago (optional)
+        status: Comma-separated statuses of the runs to delete, e.g. "FAILED,KILLED" (optional)
+        metric: Metric that metric_below and metric_above apply to (optional)
+        metric_below: Only delete runs whose latest metric value is below this (optional)
+        metric_above: Only delete runs whose latest metric value is above this (optional)
+        dry_run: Only count the runs that would be deleted (default: False)
+        concurrency: Number of delete requests sent in parallel (default: 4)
     
     Returns:
-        JSON string with operation result
+        JSON string with deleted and failed counts, failed run IDs and errors
     """
     config = get_config()
     
     if project_id:
         config["project_id"] = project_id
         
-    # Convert comma-separated string to list
-    run_ids_list = [run_id.strip() for run_id in run_ids.split(",")]
+    # Convert comma-separated strings to lists
+    run_ids_list = [run_id.strip() for run_id in run_ids.split(",") if run_id.strip()] if run_ids else None
     
     result = delete_experiment_run_batch(config, {
         "experiment_id": experiment_id,
         "run_ids": run_ids_list,
-        "project_id": project_id or config.get("project_id", "")
+        "project_id": project_id or config.get("project_id", ""),
+        "older_than_days": older_than_days,
+        "status": [item.strip() for item in status.split(",")] if status else None,
+        "metric": metric,
+        "metric_below": metric_below,
+        "metric_above": metric_above,
+        "dry_run": dry_run,
+        "concurrency": concurrency
     })
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def delete_model_tool(model_id: str, project_id: str = None) -> str:
     """
     Delete a model in Cloudera ML.
@@ -749,7 +999,7 @@ def delete_model_tool(model_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def delete_project_file_tool(file_path: str, project_id: str = None) -> str:
     """
     Delete a file or directory from a Cloudera ML project.
@@ -773,7 +1023,7 @@ def delete_project_file_tool(file_path: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_application_tool(application_id: str, project_id: str = None) -> str:
     """
     Get details of a specific application from a Cloudera ML project.
@@ -797,7 +1047,7 @@ def get_application_tool(application_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_experiment_tool(experiment_id: str, project_id: str = None) -> str:
     """
     Get details of a specific experiment from a Cloudera ML project.
@@ -821,7 +1071,7 @@ def get_experiment_tool(experiment_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_experiment_run_tool(experiment_id: str, run_id: str, project_id: str = None) -> str:
     """
     Get details of a specific experiment run from a Cloudera ML project.
@@ -847,7 +1097,7 @@ def get_experiment_run_tool(experiment_id: str, run_id: str, project_id: str = N
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_job_tool(job_id: str, project_id: str = None) -> str:
     """
     Get details of a specific job from a Cloudera ML project.
@@ -871,7 +1121,7 @@ def get_job_tool(job_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_job_run_tool(job_id: str, run_id: str, project_id: str = None) -> str:
     """
     Get details of a specific job run from a Cloudera ML project.
@@ -897,7 +1147,35 @@ def get_job_run_tool(job_id: str, run_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool(long_running=True)
+def wait_for_job_run_tool(job_id: str, run_id: str, project_id: str = None, timeout: float = 600,
+                          max_interval: float = 30) -> str:
+    """
+    Wait for a job run to finish instead of polling get_job_run_tool.
+    
+    Args:
+        job_id: ID of the job containing the run
+        run_id: ID of the job run to wait for
+        project_id: ID of the project containing the job (optional)
+        timeout: Seconds to wait before giving up (default: 600)
+        max_interval: Longest time between status checks in seconds (default: 30)
+    
+    Returns:
+        JSON string with the final status and the state transitions seen
+    """
+    config = get_config()
+    if project_id:
+        config["project_id"] = project_id
+    
+    result = wait_for_job_run(config, {
+        "job_id": job_id,
+        "run_id": run_id,
+        "timeout": timeout,
+        "max_interval": max_interval
+    })
+    return json.dumps(result, indent=2)
+
+@async_tool()
 def get_model_tool(model_id: str, project_id: str = None) -> str:
     """
     Get details of a specific model from a Cloudera ML project.
@@ -921,7 +1199,7 @@ def get_model_tool(model_id: str, project_id: str = None) -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_model_build_tool(model_id: str, build_id: str, project_id: str = None) -> str:
     """
     Get details of a specific model build from a Cloudera ML project.
@@ -947,7 +1225,7 @@ def get_model_build_tool(model_id: str, build_id: str, project_id: str = None) -
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def get_model_deployment_tool(model_id: str, deployment_id: str, project_id: str = None) -> str:
     """
     Get details of a specific model deployment from a Cloudera ML project.
@@ -973,7 +1251,7 @@ def get_model_deployment_tool(model_id: str, deployment_id: str, project_id: str
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def list_project_files_tool(project_id: str, path: str = "") -> str:
     """
     List files in a Cloudera ML project.
@@ -995,10 +1273,12 @@ def list_project_files_tool(project_id: str, path: str = "") -> str:
     result = list_project_files(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
-def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_id: str = None) -> str:
+@async_tool()
+def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_id: str = None,
+                                  concurrency: int = 4) -> str:
     """
     Log metrics and parameters for multiple experiment runs in a batch.
+    Large lists are split into chunks that are sent in parallel.
     
     Args:
         experiment_id: ID of the experiment containing the runs
@@ -1008,9 +1288,10 @@ def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_
             - parameters (optional): Dictionary of parameters to log
             - tags (optional): Array of tags to add to the run
         project_id: ID of the project (optional if not provided, uses default from configuration)
+        concurrency: Number of chunks sent in parallel (default: 4)
     
     Returns:
-        JSON string containing operation result
+        JSON string containing operation result, with a success flag per run
     """
     config = get_config()
     if project_id:
@@ -1028,13 +1309,205 @@ def log_experiment_run_batch_tool(experiment_id: str, run_updates: str, project_
     params = {
         "experiment_id": experiment_id,
         "run_updates": run_updates_list,
-        "project_id": project_id or config.get("project_id", "")
+        "project_id": project_id or config.get("project_id", ""),
+        "concurrency": concurrency
     }
         
     result = log_experiment_run_batch(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
+def export_experiment_runs_tool(experiment_id: str, path: str = None, format: str = None,
+                                project_id: str = None, concurrency: int = 8) -> str:
+    """
+    Export all runs of an experiment with their latest metrics and parameters, one column each.
+    Writes a CSV or Parquet file on the server's machine; the reply only summarizes the table.
+    
+    Args:
+        experiment_id: ID of the experiment
+        path: File to write, e.g. "runs.parquet" (optional; without it only the summary is returned)
+        format: "csv" or "parquet" (optional, default: from the path's extension)
+        project_id: ID of the project (optional if not provided, uses default from configuration)
+        concurrency: Number of runs fetched in parallel (default: 8)
+    
+    Returns:
+        JSON string with the run count, metric and parameter names and statistics per metric
+    """
+    config = get_config()
+    
+    if project_id:
+        config["project_id"] = project_id
+    
+    result = export_experiment_runs(config, {
+        "experiment_id": experiment_id,
+        "path": path,
+        "format": format,
+        "project_id": project_id or config.get("project_id", ""),
+        "concurrency": concurrency
+    })
+    
+    return json.dumps(result, indent=2)
+
+@async_tool()
+def best_runs_tool(experiment_id: str, metric: str, k: int = 5, ascending: bool = False,
+                   tie_breakers: str = None, status: str = None, project_id: str = None) -> str:
+    """
+    Find the best runs of an experiment by a metric, e.g. "which run has the best val_auc".
+    Reads the runs page by page and returns only short summaries of the winners.
+    
+    Args:
+        experiment_id: ID of the experiment
+        metric: Metric to rank by, e.g. "val_auc"
+        k: Number of runs to return (default: 5)
+        ascending: Lowest values are best, e.g. for losses (default: False)
+        tie_breakers: Comma-separated metric names, start_time or end_time that order runs with equal
+            values, lowest first or highest first with a "-" prefix, e.g. "-epochs,start_time" (optional)
+        status: Comma-separated statuses of the runs to rank, e.g. "FINISHED" (optional)
+        project_id: ID of the project (optional if not provided, uses default from configuration)
+    
+    Returns:
+        JSON string with the best runs and the number of runs scanned
+    """
+    config = get_config()
+    
+    if project_id:
+        config["project_id"] = project_id
+    
+    result = best_runs(config, {
+        "experiment_id": experiment_id,
+        "metric": metric,
+        "k": k,
+        "ascending": ascending,
+        "tie_breakers": tie_breakers,
+        "status": status,
+        "project_id": project_id or config.get("project_id", "")
+    })
+    
+    return json.dumps(result, indent=2)
+
+@async_tool()
+def compare_experiment_runs_tool(experiment_id: str, metric: str, k: int = 10, ascending: bool = False,
+                                 run_ids: str = None, status: str = None, columns: str = None,
+                                 project_id: str = None) -> str:
+    """
+    Rank all runs of an experiment by a metric and return the best k, with their metrics and
+    parameters. Use this instead of fetching runs one by one to find or compare the best runs.
+    
+    Args:
+        experiment_id: ID of the experiment
+        metric: Metric to rank by, e.g. "val_loss"
+        k: Number of runs to return (default: 10)
+        ascending: Rank the lowest values first, e.g. for losses (default: False)
+        run_ids: Comma-separated run IDs to rank (optional, default: all runs)
+        status: Comma-separated statuses of the runs to rank, e.g. "FINISHED" (optional)
+        columns: Comma-separated columns to include, e.g. "metrics.accuracy,params.lr" (optional, default: all)
+        project_id: ID of the project (optional if not provided, uses default from configuration)
+    
+    Returns:
+        JSON string with the ranked runs and statistics of the metric
+    """
+    config = get_config()
+    
+    if project_id:
+        config["project_id"] = project_id
+    
+    result = compare_experiment_runs(config, {
+        "experiment_id": experiment_id,
+        "metric": metric,
+        "k": k,
+        "ascending": ascending,
+        "run_ids": run_ids,
+        "status": status,
+        "columns": columns,
+        "project_id": project_id or config.get("project_id", "")
+    })
+    
+    return json.dumps(result, indent=2)
+
+@async_tool()
+def sync_experiment_runs_tool(project_id: str = None, experiment_ids: str = None, full: bool = False,
+                              concurrency: int = 8) -> str:
+    """
+    Sync the experiments and runs of a project into a local store that query_experiment_runs_tool reads.
+    Only runs that are new, changed status, were still running, or started or ended since the last
+    sync are fetched, so run it before querying.
+    
+    Args:
+        project_id: ID of the project (optional if not provided, uses default from configuration)
+        experiment_ids: Comma-separated IDs of the experiments to sync (optional, default: all)
+        full: Re-read every run, ignoring the last sync (default: False)
+        concurrency: Number of experiments listed, and runs fetched, in parallel (default: 8)
+    
+    Returns:
+        JSON string with the numbers of runs added, updated, removed and unchanged
+    """
+    config = get_config()
+    
+    if project_id:
+        config["project_id"] = project_id
+    
+    result = sync_experiment_runs(config, {
+        "project_id": project_id or config.get("project_id", ""),
+        "experiment_ids": experiment_ids,
+        "full": full,
+        "concurrency": concurrency
+    })
+    
+    return json.dumps(result, indent=2)
+
+@async_tool()
+def query_experiment_runs_tool(project_id: str = None, experiment_id: str = None, status: str = None,
+                               tags: str = None, params: str = None, metric: str = None,
+                               metric_min: float = None, metric_max: float = None, order: str = None,
+                               limit: int = 100) -> str:
+    """
+    Find experiment runs in the local store filled by sync_experiment_runs_tool, without calling the API.
+    All given filters must match.
+    
+    Args:
+        project_id: ID of the project (optional if not provided, uses default from configuration)
+        experiment_id: Only runs of this experiment (optional)
+        status: Comma-separated statuses, e.g. "FINISHED" (optional)
+        tags: Comma-separated tag names the runs must have (optional)
+        params: JSON object of parameter values the runs must have, e.g. '{"lr": "0.01"}' (optional)
+        metric: Only runs with this metric; metric_min, metric_max and order apply to it (optional)
+        metric_min: Lowest metric value, inclusive (optional)
+        metric_max: Highest metric value, inclusive (optional)
+        order: "asc" or "desc" to sort by the metric (optional, default: newest runs first)
+        limit: Maximum number of runs to return (default: 100)
+    
+    Returns:
+        JSON string with the total matches, the matching runs and the last sync time
+    """
+    config = get_config()
+    
+    if project_id:
+        config["project_id"] = project_id
+    
+    try:
+        params_dict = json.loads(params) if params else None
+    except json.JSONDecodeError:
+        return json.dumps({
+            "success": False,
+            "message": "Invalid JSON for params"
+        }, indent=2)
+    
+    result = query_experiment_runs(config, {
+        "project_id": project_id or config.get("project_id", ""),
+        "experiment_id": experiment_id,
+        "status": status,
+        "tags": tags,
+        "params": params_dict,
+        "metric": metric,
+        "metric_min": metric_min,
+        "metric_max": metric_max,
+        "order": order,
+        "limit": limit
+    })
+    
+    return json.dumps(result, indent=2)
+
+@async_tool()
 def restart_application_tool(application_id: str, project_id: str = None) -> str:
     """
     Restart a running application in a Cloudera ML project.
@@ -1058,7 +1531,7 @@ def restart_application_tool(application_id: str, project_id: str = None) -> str
     result = restart_application(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def update_job_tool(job_id: str, name: str = None, script: str = None, 
                    kernel: str = None, cpu: int = None, memory: int = None, 
                    nvidia_gpu: int = None, runtime_identifier: str = None,
@@ -1117,7 +1590,7 @@ def update_job_tool(job_id: str, name: str = None, script: str = None,
     result = update_job(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def update_project_tool(name: str = None, summary: str = None, template: str = None,
                        public: bool = None, disable_git_repo: bool = None, 
                        project_id: str = None) -> str:
@@ -1162,7 +1635,7 @@ def update_project_tool(name: str = None, summary: str = None, template: str = N
     result = update_project(config, params)
     return json.dumps(result, indent=2)
 
-@mcp.tool()
+@async_tool()
 def update_project_file_metadata_tool(file_path: str, description: str = None,
                                      hidden: bool = None, project_id: str = None) -> str:
     """
@@ -1197,6 +1670,25 @@ def update_project_file_metadata_tool(file_path: str, description: str = None,
     result = update_project_file_metadata(config, params)
     return json.dumps(result, indent=2)
 
+@mcp.tool()
+def get_rate_limit_stats_tool() -> str:
+    """
+    Get the state of the client-side API rate limiter.
+    
+    Requests are rate limited per host and endpoint class (read, mutate, upload).
+    For each bucket this reports the configured rate and burst, the tokens currently
+    available, the number of calls waiting (queue depth, split into interactive and
+    bulk callers) and the total, average and maximum time calls have waited.
+    
+    Returns:
+        JSON string with rate limiter statistics per host and endpoint class
+    """
+    return json.dumps({
+        "success": True,
+        "message": "Rate limiter statistics",
+        "data": rate_limit_stats()
+    }, indent=2)
+
 if __name__ == "__main__":
     # Check if configuration is complete
     config = get_config()
@@ -3,6 +3,6 @@ Cloudera ML MCP Implementation
 This MCP allows Claude to interact with Cloudera Machine Learning
 """
 
-from .mcp import ClouderaMCP
+from .mcp import ClouderaMCP, AsyncClouderaMCP
 
-__all__ = ['ClouderaMCP'] 
\ No newline at end of file
+__all__ = ['ClouderaMCP', 'AsyncClouderaMCP'] 
\ No newline at end of file
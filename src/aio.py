@@ -0,0 +1,134 @@
+"""
+Asyncio entry points for the Cloudera ML function modules
+
+Each function module does blocking HTTP through the shared transport.
+The coroutines here run them on a bounded worker pool, so an event loop
+(such as FastMCP's) keeps serving other calls while one is waiting on
+the network. Connection pooling, retries, rate limiting and the
+response cache all stay in the transport and behave the same as for
+synchronous callers.
+
+Calls that can take minutes (folder and chunked uploads, waiting for
+runs, sweeps and DAGs) run on a second, smaller pool, so however many
+of them are in flight, short list and get calls still find a worker.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+from . import functions
+from . import transport
+
+
+# Blocking calls in flight at once; matches the transport's per-host connection pool
+MAX_WORKERS = transport.POOL_MAXSIZE
+
+# Long-running calls in flight at once; more wait for a worker of their own pool
+LONG_RUNNING_WORKERS = 16
+
+# Function modules that upload whole folders or large files, or poll runs until they finish
+LONG_RUNNING = ("upload_folder", "upload_file", "wait_for_job_run", "run_job_sweep", "run_job_dag")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_long_running_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(long_running: bool = False) -> ThreadPoolExecutor:
+    """
+    Get the worker pool that async calls run their blocking work on
+
+    Args:
+        long_running: Get the pool for calls that can take minutes instead
+
+    Returns:
+        Process-wide thread pool, created on first use
+    """
+    global _executor, _long_running_executor
+    if long_running:
+        if _long_running_executor is None:
+            with _executor_lock:
+                if _long_running_executor is None:
+                    _long_running_executor = ThreadPoolExecutor(max_workers=LONG_RUNNING_WORKERS,
+                                                                thread_name_prefix="cloudera-ml-aio-long")
+        return _long_running_executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="cloudera-ml-aio")
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function on the worker pool without blocking the event loop
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def run_long_running(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function that can take minutes on the long-running pool
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(long_running=True), functools.partial(func, *args, **kwargs))
+
+
+def make_async(func: Callable[..., Any], long_running: bool = False) -> Callable[..., Awaitable[Any]]:
+    """
+    Wrap a blocking function in a coroutine function with the same signature
+
+    The wrapper keeps the name, docstring and signature (via __wrapped__),
+    so it can be registered with FastMCP in place of the original.
+
+    Args:
+        func: Blocking function to wrap
+        long_running: Run func on the long-running pool
+
+    Returns:
+        Coroutine function that runs func on a worker pool
+    """
+    run = run_long_running if long_running else run_blocking
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await run(func, *args, **kwargs)
+    return wrapper
+
+
+def shutdown() -> None:
+    """Wait for running calls to finish and stop the worker pools"""
+    global _executor, _long_running_executor
+    with _executor_lock:
+        for executor in (_executor, _long_running_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        _executor = None
+        _long_running_executor = None
+
+
+# Async versions of every function module, e.g. `await aio.list_jobs(config, params)`
+for _name in functions.__all__:
+    globals()[_name] = make_async(getattr(functions, _name), long_running=_name in LONG_RUNNING)
+
+__all__ = ["run_blocking", "run_long_running", "make_async", "get_executor", "shutdown"] + list(functions.__all__)
@@ -9,6 +9,8 @@ from .delete_all_jobs import delete_all_jobs
 from .get_project_id import get_project_id
 from .get_runtimes import get_runtimes
 from .batch_list_projects import batch_list_projects
+from .best_runs import best_runs
+from .compare_experiment_runs import compare_experiment_runs
 from .create_experiment import create_experiment
 from .create_experiment_run import create_experiment_run
 from .create_job_run import create_job_run
@@ -20,6 +22,7 @@ from .delete_experiment_run import delete_experiment_run
 from .delete_experiment_run_batch import delete_experiment_run_batch
 from .delete_model import delete_model
 from .delete_project_file import delete_project_file
+from .export_experiment_runs import export_experiment_runs
 from .get_application import get_application
 from .get_experiment import get_experiment
 from .get_experiment_run import get_experiment_run
@@ -36,10 +39,12 @@ from .list_model_builds import list_model_builds
 from .list_model_deployments import list_model_deployments
 from .list_project_files import list_project_files
 from .log_experiment_run_batch import log_experiment_run_batch
+from .query_experiment_runs import query_experiment_runs
 from .restart_application import restart_application
 from .stop_application import stop_application
 from .stop_job_run import stop_job_run
 from .stop_model_deployment import stop_model_deployment
+from .sync_experiment_runs import sync_experiment_runs
 from .update_application import update_application
 from .update_experiment import update_experiment
 from .update_experiment_run import update_experiment_run
@@ -47,6 +52,9 @@ from .update_job import update_job
 from .update_project import update_project
 from .update_project_file_metadata import update_project_file_metadata
 from .create_application import create_application
+from .wait_for_job_run import wait_for_job_run
+from .run_job_sweep import run_job_sweep
+from .run_job_dag import run_job_dag
 
 __all__ = [
     'upload_file',
@@ -58,6 +66,8 @@ __all__ = [
     'get_project_id',
     'get_runtimes',
     'batch_list_projects',
+    'best_runs',
+    'compare_experiment_runs',
     'create_experiment',
     'create_experiment_run',
     'create_job_run',
@@ -69,6 +79,7 @@ __all__ = [
     'delete_experiment_run_batch',
     'delete_model',
     'delete_project_file',
+    'export_experiment_runs',
     'get_application',
     'get_experiment',
     'get_experiment_run',
@@ -85,15 +96,20 @@ __all__ = [
     'list_model_deployments',
     'list_project_files',
     'log_experiment_run_batch',
+    'query_experiment_runs',
     'restart_application',
     'stop_application',
     'stop_job_run',
     'stop_model_deployment',
+    'sync_experiment_runs',
     'update_application',
     'update_experiment',
     'update_experiment_run',
     'update_job',
     'update_project',
     'update_project_file_metadata',
-    'create_application'
+    'create_application',
+    'wait_for_job_run',
+    'run_job_sweep',
+    'run_job_dag'
 ] 
\ No newline at end of file
@@ -3,10 +3,11 @@ Return a list of projects given a list of project IDs
 """
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any, List
 
+from .. import transport
+
 def batch_list_projects(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Return a list of projects given a list of project IDs
@@ -53,29 +54,13 @@ def batch_list_projects(config: Dict[str, str], params: Dict[str, Any]) -> Dict[
     api_url = f"{host}/api/v2/projects/batchList"
     print(f"Batch listing projects with URL: {api_url}")
     
-    # Construct curl command
-    curl_cmd = [
-        "curl", "-s", "-X", "POST",
-        "-H", f"Authorization: Bearer {api_key}",
-        "-H", "Content-Type: application/json",
-        "-d", request_data_json,
-        api_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to retrieve projects: {result.stderr}"
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("POST", api_url, api_key=api_key, data=request_data_json)
         
         # Parse the response
         try:
-            response = json.loads(result.stdout)
+            response = json.loads(result.text)
             
             # Check if there's an error in the response
             if "error" in response:
@@ -93,7 +78,7 @@ def batch_list_projects(config: Dict[str, str], params: Dict[str, Any]) -> Dict[
         except json.JSONDecodeError:
             return {
                 "success": False,
-                "message": f"Failed to parse response: {result.stdout}"
+                "message": f"Failed to parse response: {result.text}"
             }
     
     except Exception as e:
@@ -0,0 +1,187 @@
+"""
+Find the best runs of an experiment in Cloudera ML by a metric, streaming the run listing
+"""
+import heapq
+import math
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from .. import pagination
+from ..run_table import (latest_metrics, run_params, experiment_runs_url, fetch_runs,
+                         DEFAULT_CONCURRENCY, LIST_PAGE_SIZE)
+from ..utils import parse_remote_time
+
+# Runs returned unless the caller asks for another number
+DEFAULT_K = 5
+
+# Run fields that can break ties besides metrics
+TIME_FIELDS = ("start_time", "end_time")
+
+
+def _parse_order(spec: str) -> Tuple[str, bool]:
+    """Split a tie-breaker like "-epochs" into its key and whether higher values are better"""
+    return (spec[1:], True) if spec.startswith("-") else (spec.lstrip("+"), False)
+
+
+def _number(value: Any) -> Optional[float]:
+    """Value as a float, or None if it is missing, not a number or NaN"""
+    try:
+        number = float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+    return None if number is None or math.isnan(number) else number
+
+
+def top_runs(runs: Iterable[Dict[str, Any]], metric: str, k: int, ascending: bool = False,
+             tie_breakers: Sequence[str] = ()) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, Any]]], int, int]:
+    """
+    Keep the k best runs of a stream in a bounded heap
+
+    Only k runs are held at any time, however long the stream is. Runs
+    without the metric, or with a NaN value, are skipped; a NaN tie-breaker
+    counts as missing. Runs that tie on the metric are ordered by the
+    tie-breakers, then by their position in the stream.
+
+    Args:
+        runs: Experiment runs, e.g. a lazy listing
+        metric: Metric to rank by, using its latest value
+        k: Number of runs to keep
+        ascending: Lowest values are best, e.g. for losses (default: highest first)
+        tie_breakers: Metric names, "start_time" or "end_time", lowest first, or highest first
+            with a "-" prefix, e.g. ["-epochs", "start_time"]
+
+    Returns:
+        The best runs as (run, latest metrics) pairs, best first; the number of runs
+        seen; and the number of runs that had the metric
+    """
+    orders = [_parse_order(spec) for spec in tie_breakers]
+    heap: List[Tuple[tuple, int, Dict[str, Any], Dict[str, Any]]] = []
+    seen = ranked = 0
+    for position, run in enumerate(runs):
+        seen += 1
+        metrics = latest_metrics(run)
+        value = _number(metrics.get(metric))
+        if value is None:
+            continue
+        ranked += 1
+        # Larger keys are better; a missing tie-breaker loses to any value
+        key = [value if not ascending else -value]
+        for name, higher_first in orders:
+            found = parse_remote_time(run.get(name)) if name in TIME_FIELDS else _number(metrics.get(name))
+            key.append((0, 0.0) if found is None else (1, found if higher_first else -found))
+        # Earlier runs win ties, so a smaller position is better
+        entry = (tuple(key), -position, run, metrics)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    best = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+    return [(run, metrics) for _, _, run, metrics in best], seen, ranked
+
+
+def best_runs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Find the best runs of an experiment by a metric
+
+    The run listing is read page by page and only the k best runs are
+    kept, so memory stays at one page plus k runs however large the
+    experiment is. Runs a page lists without their data are fetched
+    concurrently before the next page is read. Only compact summaries of
+    the winners are returned.
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Parameters for the API call:
+            - project_id: ID of the project (optional if in config)
+            - experiment_id: ID of the experiment (required)
+            - metric: Metric to rank by (required)
+            - k: Number of runs to return (default: 5)
+            - ascending: Lowest values are best, e.g. for losses (default: False)
+            - tie_breakers: Metric names, "start_time" or "end_time" that order runs with equal
+              values, lowest first, or highest first with a "-" prefix (optional)
+            - status: Only rank runs with one of these statuses (optional)
+            - concurrency: Runs fetched in parallel when a page lacks their data (default: 8)
+            - bypass_cache: Skip the response cache for the listing and the runs
+
+    Returns:
+        Dict with success flag, message, the best runs (rank, id, name, status, start_time,
+        value, the metric and tie-breaker values and params) and the numbers of runs scanned and ranked
+    """
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+    metric = params.get("metric")
+
+    # Validate required parameters
+    missing_params = [name for name, value in (("project_id", project_id), ("experiment_id", experiment_id),
+                                               ("metric", metric)) if not value]
+    if missing_params:
+        return {"success": False, "message": f"Missing required parameters: {', '.join(missing_params)}"}
+
+    if not config.get("host"):
+        return {"success": False, "message": "Missing host in configuration"}
+
+    tie_breakers = params.get("tie_breakers") or []
+    if isinstance(tie_breakers, str):
+        tie_breakers = [item.strip() for item in tie_breakers.split(",") if item.strip()]
+    statuses = params.get("status")
+    if isinstance(statuses, str):
+        statuses = [item.strip() for item in statuses.split(",") if item.strip()]
+    statuses = {item.upper() for item in statuses} if statuses else None
+
+    try:
+        k = int(params["k"]) if params.get("k") is not None else DEFAULT_K
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if k < 1 or concurrency < 1:
+            raise ValueError("k and concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+
+    cache = not params.get("bypass_cache")
+    url = experiment_runs_url(config, project_id, experiment_id)
+    print(f"Accessing: {url}")
+    counts = {"pages": 0, "fetched": 0}
+
+    def stream():
+        for page in pagination.iter_pages(url, "experiment_runs", api_key=config.get("api_key", ""),
+                                          page_size=LIST_PAGE_SIZE, cache=cache):
+            counts["pages"] += 1
+            runs = [run for run in page.get("experiment_runs") or []
+                    if statuses is None or str(run.get("status") or "").upper() in statuses]
+            missing = [index for index, run in enumerate(runs) if "data" not in run]
+            details = fetch_runs(config, project_id, experiment_id, [runs[index].get("id") for index in missing],
+                                 concurrency, cache)
+            counts["fetched"] += len(details)
+            for index, run in zip(missing, details):
+                runs[index] = run
+            yield from runs
+
+    try:
+        best, seen, ranked = top_runs(stream(), metric, k, ascending=bool(params.get("ascending")),
+                                      tie_breakers=tie_breakers)
+    except Exception as e:
+        return {"success": False, "message": f"Error reading experiment runs: {str(e)}"}
+
+    shown = [metric] + [_parse_order(spec)[0] for spec in tie_breakers]
+    winners = []
+    for rank, (run, metrics) in enumerate(best, start=1):
+        winners.append({
+            "rank": rank,
+            "id": run.get("id"),
+            "name": run.get("name"),
+            "status": run.get("status"),
+            "start_time": run.get("start_time"),
+            "value": _number(metrics.get(metric)),
+            "metrics": {name: metrics[name] for name in shown if name in metrics},
+            "params": run_params(run)
+        })
+
+    order = "lowest" if params.get("ascending") else "highest"
+    return {
+        "success": True,
+        "message": f"Best {len(winners)} of {ranked} runs by {order} {metric} ({seen} runs scanned)",
+        "metric": metric,
+        "runs": winners,
+        "scanned": seen,
+        "ranked": ranked,
+        "pages": counts["pages"],
+        "fetched": counts["fetched"]
+    }
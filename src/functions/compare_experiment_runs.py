@@ -0,0 +1,111 @@
+"""
+Rank and compare the runs of an experiment in Cloudera ML by a metric
+"""
+from typing import Dict, Any
+
+from ..run_table import load_run_table, DEFAULT_CONCURRENCY, RUN_FIELDS
+
+# Runs returned unless the caller asks for another number
+DEFAULT_TOP_K = 10
+
+
+def _as_list(value: Any) -> Any:
+    """Accept a comma-separated string where a list is expected"""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
+def compare_experiment_runs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rank the runs of an experiment by a metric and compare the best ones
+
+    All runs are loaded into a columnar table once (see run_table.RunTable),
+    then ranked with vectorized operations, so one call answers "best k
+    runs by validation loss" however many runs the experiment has. Runs
+    without the metric are not ranked.
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Parameters for the API call:
+            - project_id: ID of the project (optional if in config)
+            - experiment_id: ID of the experiment (required)
+            - metric: Metric to rank by (required)
+            - k: Number of runs to return (default: 10)
+            - ascending: Rank the lowest values first, e.g. for losses (default: False)
+            - run_ids: Only rank these runs (optional)
+            - status: Only rank runs with one of these statuses (optional)
+            - columns: Metrics and parameters to include for each run, as "metrics.<name>"
+              or "params.<name>" (default: all)
+            - concurrency: Runs fetched in parallel (default: 8)
+            - bypass_cache: Skip the response cache for the listing and the runs
+
+    Returns:
+        Dict with success flag, message, the ranked runs (rank, run fields, value and
+        the chosen columns), run counts and statistics of the metric over the compared runs
+    """
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+    metric = params.get("metric")
+
+    # Validate required parameters
+    missing_params = [name for name, value in (("project_id", project_id), ("experiment_id", experiment_id),
+                                               ("metric", metric)) if not value]
+    if missing_params:
+        return {"success": False, "message": f"Missing required parameters: {', '.join(missing_params)}"}
+
+    if not config.get("host"):
+        return {"success": False, "message": "Missing host in configuration"}
+
+    try:
+        k = int(params["k"]) if params.get("k") is not None else DEFAULT_TOP_K
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if k < 1 or concurrency < 1:
+            raise ValueError("k and concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+
+    try:
+        table = load_run_table(config, project_id, experiment_id, concurrency=concurrency,
+                               cache=not params.get("bypass_cache"))
+    except Exception as e:
+        return {"success": False, "message": f"Error loading experiment runs: {str(e)}"}
+
+    run_ids = _as_list(params.get("run_ids"))
+    status = _as_list(params.get("status"))
+    if run_ids or status:
+        table = table.where(run_ids=run_ids or None, status=status or None)
+
+    if f"metrics.{metric}" not in table.columns:
+        return {"success": False, "message": f"No run has metric {metric}", "run_count": len(table),
+                "metrics": table.metric_names}
+
+    columns = _as_list(params.get("columns"))
+    if columns:
+        unknown = [name for name in columns if name not in table.columns]
+        if unknown:
+            return {"success": False, "message": f"Unknown columns: {', '.join(unknown)}",
+                    "metrics": table.metric_names, "params": table.param_names}
+    else:
+        columns = [name for name in table.columns if name not in RUN_FIELDS]
+
+    ascending = bool(params.get("ascending"))
+    best = table.top_k(metric, k, ascending=ascending)
+    runs = table.rows(best, list(RUN_FIELDS) + [name for name in columns if name not in RUN_FIELDS])
+    values = table.metric(metric)
+    for rank, (run, index) in enumerate(zip(runs, best), start=1):
+        run["rank"] = rank
+        run["value"] = float(values[index])
+
+    stats = table.summary([metric])[metric]
+    order = "lowest" if ascending else "highest"
+    return {
+        "success": True,
+        "message": f"Top {len(runs)} of {stats['count']} runs by {order} {metric}",
+        "metric": metric,
+        "ascending": ascending,
+        "run_count": len(table),
+        "ranked_count": stats["count"],
+        "runs": runs,
+        "summary": stats
+    }
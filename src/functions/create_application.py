@@ -4,6 +4,8 @@ import requests
 import json
 from typing import Dict, Any
 
+from .. import transport
+
 
 def create_application(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -90,7 +92,7 @@ def create_application(config: Dict[str, str], params: Dict[str, Any]) -> Dict[s
         }
         
         # Make the request
-        response = requests.post(api_url, headers=headers, json=payload)
+        response = transport.request("POST", api_url, headers=headers, json=payload)
         response.raise_for_status()
         
         # Parse the response
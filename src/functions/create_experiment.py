@@ -3,10 +3,11 @@ Create a new experiment in Cloudera ML
 """
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any, List, Optional
 
+from .. import transport
+
 def create_experiment(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a new experiment in Cloudera ML
@@ -60,29 +61,13 @@ def create_experiment(config: Dict[str, str], params: Dict[str, Any]) -> Dict[st
     api_url = f"{host}/api/v2/projects/{params['project_id']}/experiments"
     print(f"Creating experiment with URL: {api_url}")
     
-    # Construct curl command
-    curl_cmd = [
-        "curl", "-s", "-X", "POST",
-        "-H", f"Authorization: Bearer {api_key}",
-        "-H", "Content-Type: application/json",
-        "-d", request_data_json,
-        api_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to create experiment: {result.stderr}"
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("POST", api_url, api_key=api_key, data=request_data_json)
         
         # Parse the response
         try:
-            response = json.loads(result.stdout)
+            response = json.loads(result.text)
             
             # Check if there's an error in the response
             if "error" in response:
@@ -100,7 +85,7 @@ def create_experiment(config: Dict[str, str], params: Dict[str, Any]) -> Dict[st
         except json.JSONDecodeError:
             return {
                 "success": False,
-                "message": f"Failed to parse response: {result.stdout}"
+                "message": f"Failed to parse response: {result.text}"
             }
     
     except Exception as e:
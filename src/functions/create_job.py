@@ -6,6 +6,8 @@ import os
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 
+from .. import transport
+
 
 def create_job(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -128,7 +130,7 @@ def create_job(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]
         print(f"Creating job '{name}' at: {url}")
         print(f"Job payload: {json.dumps(job_data, indent=2)}")
         
-        response = requests.post(url, json=job_data, headers=headers)
+        response = transport.request("POST", url, json=job_data, headers=headers)
         
         # Enhanced error handling for 400 errors
         if response.status_code == 400:
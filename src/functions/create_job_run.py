@@ -3,10 +3,11 @@ Create a run for an existing job in Cloudera ML
 """
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 def create_job_run(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a run for an existing job in Cloudera ML
@@ -79,36 +80,18 @@ def create_job_run(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
     api_url = f"{host}/api/v2/projects/{project_id}/jobs/{job_id}/runs"
     print(f"Creating job run with URL: {api_url}")
     
-    # Construct curl command
-    curl_cmd = [
-        "curl", "-s", "-X", "POST",
-        "-H", f"Authorization: Bearer {api_key}",
-        "-H", "Content-Type: application/json",
-        "-d", request_data_json,
-        api_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
+        # Send the request over the shared connection pool
+        result = transport.request("POST", api_url, api_key=api_key, data=request_data_json)
         
         # Debug the result
-        print(f"curl result type: {type(result)}")
-        print(f"curl returncode: {result.returncode}")
-        print(f"curl stdout type: {type(result.stdout)}")
-        print(f"curl stdout (first 200 chars): {result.stdout[:200]}")
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to create job run: {result.stderr}"
-            }
+        print(f"Response status code: {result.status_code}")
+        print(f"Response body (first 200 chars): {result.text[:200]}")
         
         # Parse the response
         try:
             print("Attempting to parse JSON response...")
-            response = json.loads(result.stdout)
+            response = json.loads(result.text)
             print(f"Response parsed successfully. Type: {type(response)}")
             
             # Check if there's an error in the response
@@ -127,7 +110,7 @@ def create_job_run(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
         except json.JSONDecodeError:
             return {
                 "success": False,
-                "message": f"Failed to parse response: {result.stdout}"
+                "message": f"Failed to parse response: {result.text}"
             }
     
     except Exception as e:
@@ -3,10 +3,11 @@ Create a new model build in Cloudera ML
 """
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 def create_model_build(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a new model build in Cloudera ML
@@ -96,29 +97,13 @@ def create_model_build(config: Dict[str, str], params: Dict[str, Any]) -> Dict[s
     api_url = f"{host}/api/v2/projects/{project_id}/models/{model_id}/builds"
     print(f"Creating model build with URL: {api_url}")
     
-    # Construct curl command
-    curl_cmd = [
-        "curl", "-s", "-X", "POST",
-        "-H", f"Authorization: Bearer {api_key}",
-        "-H", "Content-Type: application/json",
-        "-d", request_data_json,
-        api_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to create model build: {result.stderr}"
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("POST", api_url, api_key=api_key, data=request_data_json)
         
         # Parse the response
         try:
-            response = json.loads(result.stdout)
+            response = json.loads(result.text)
             
             # Check if there's an error in the response
             if "error" in response:
@@ -136,7 +121,7 @@ def create_model_build(config: Dict[str, str], params: Dict[str, Any]) -> Dict[s
         except json.JSONDecodeError:
             return {
                 "success": False,
-                "message": f"Failed to parse response: {result.stdout}"
+                "message": f"Failed to parse response: {result.text}"
             }
     
     except Exception as e:
@@ -1,17 +1,90 @@
 """Delete all jobs function for Cloudera ML MCP"""
 
+import re
+import time
 import requests
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable
+
+from .. import transport
+from .. import pagination
+from ..utils import parse_remote_time
+
+# Deletes in flight at once unless the caller asks for another number
+DEFAULT_CONCURRENCY = 8
+
+
+def job_filter(params: Dict[str, Any], now: Optional[float] = None) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build a predicate that selects the jobs to delete
+
+    All given filters must match; with no filters every job is selected.
+
+    Args:
+        params: Function parameters
+            - name: Exact job name, or a list of names
+            - name_regex: Regular expression searched for in the job name
+            - older_than_days: Only jobs created more than this many days ago
+            - status: Job status, or a list of statuses (case-insensitive)
+        now: Current time in seconds since the epoch (default: time.time())
+
+    Returns:
+        Function that returns True for jobs to delete
+
+    Raises:
+        ValueError: If name_regex is not a valid regular expression
+    """
+    names = params.get("name")
+    if isinstance(names, str):
+        names = [names]
+    names = set(names) if names else None
+
+    pattern = params.get("name_regex")
+    try:
+        pattern = re.compile(pattern) if pattern else None
+    except re.error as e:
+        raise ValueError(f"Invalid name_regex: {e}")
+
+    cutoff = None
+    if params.get("older_than_days") is not None:
+        cutoff = (now if now is not None else time.time()) - float(params["older_than_days"]) * 86400
+
+    statuses = params.get("status")
+    if isinstance(statuses, str):
+        statuses = [statuses]
+    statuses = {status.upper() for status in statuses} if statuses else None
+
+    def matches(job: Dict[str, Any]) -> bool:
+        name = job.get("name") or ""
+        if names is not None and name not in names:
+            return False
+        if pattern is not None and not pattern.search(name):
+            return False
+        if cutoff is not None:
+            # Jobs without a readable creation time are never old enough
+            created_at = parse_remote_time(job.get("created_at"))
+            if created_at is None or created_at >= cutoff:
+                return False
+        if statuses is not None and str(job.get("status") or "").upper() not in statuses:
+            return False
+        return True
+
+    return matches
 
 
 def delete_all_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Delete all jobs in the project
-    
+    Delete all jobs in the project, or the jobs matching some filters
+
     Args:
         config: MCP configuration
-        params: Function parameters (unused)
-        
+        params: Function parameters
+            - name, name_regex, older_than_days, status: Optional filters, see job_filter()
+            - dry_run: Only report the jobs that would be deleted (default: False)
+            - concurrency: Number of jobs to delete in parallel (default: 8)
+            - progress: Optional callable(done, total, job) called as each delete finishes;
+              job has id, name and, if the delete failed, error
+
     Returns:
         Delete operation results
     """
@@ -22,7 +95,22 @@ def delete_all_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
                 "success": False,
                 "message": "Missing project_id in configuration"
             }
-            
+
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if concurrency < 1:
+            return {
+                "success": False,
+                "message": "concurrency must be at least 1"
+            }
+        try:
+            matches = job_filter(params)
+        except ValueError as e:
+            return {
+                "success": False,
+                "message": str(e)
+            }
+        progress = params.get("progress")
+
         # Properly format the host URL
         host = config['host'].strip()
         # Remove duplicate https:// if present
@@ -33,63 +121,83 @@ def delete_all_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
             host = "https://" + host
         # Remove trailing slash if present
         host = host.rstrip("/")
-        
+
         # Setup common headers
         headers = {
             "Authorization": f"Bearer {config['api_key']}",
             "Content-Type": "application/json"
         }
-        
-        # Get all jobs
+
+        # Get every page of jobs, fresh: a cached list could name jobs that are already gone
         jobs_url = f"{host}/api/v2/projects/{project_id}/jobs"
         print(f"Getting all jobs from: {jobs_url}")  # Debug output
-        response = requests.get(jobs_url, headers=headers)
-        response.raise_for_status()
-        
-        jobs_data = response.json()
-        jobs = jobs_data.get("jobs", [])
-        
+        jobs = [
+            {"id": job.get("id"), "name": job.get("name", f"Job ID {job.get('id')}")}
+            for job in pagination.paginate(jobs_url, "jobs", headers=headers, cache=False)
+            if matches(job)
+        ]
+
+        if params.get("dry_run"):
+            return {
+                "success": True,
+                "message": f"Dry run: {len(jobs)} jobs would be deleted",
+                "dry_run": True,
+                "planned_count": len(jobs),
+                "planned_jobs": jobs,
+                "deleted_count": 0,
+                "deleted_jobs": [],
+                "failed_count": 0,
+                "failed_jobs": []
+            }
+
         if not jobs:
             return {
                 "success": True,
                 "message": "No jobs found to delete",
                 "deleted_count": 0,
-                "deleted_jobs": []
+                "deleted_jobs": [],
+                "failed_count": 0,
+                "failed_jobs": []
             }
-        
-        # Delete each job
+
+        # Bulk lane: interactive calls made meanwhile are not held up by these deletes
+        @transport.in_bulk
+        def delete(job):
+            delete_url = f"{host}/api/v2/projects/{project_id}/jobs/{job['id']}"
+            delete_response = transport.request("DELETE", delete_url, headers=headers)
+            delete_response.raise_for_status()
+
         deleted_jobs = []
         failed_jobs = []
-        
-        for job in jobs:
-            job_id = job.get("id")
-            job_name = job.get("name", f"Job ID {job_id}")
-            
-            try:
-                delete_url = f"{host}/api/v2/projects/{project_id}/jobs/{job_id}"
-                print(f"Deleting job: {job_name} at: {delete_url}")  # Debug output
-                delete_response = requests.delete(delete_url, headers=headers)
-                delete_response.raise_for_status()
-                
-                deleted_jobs.append({
-                    "id": job_id,
-                    "name": job_name
-                })
-            except Exception as e:
-                failed_jobs.append({
-                    "id": job_id,
-                    "name": job_name,
-                    "error": str(e)
-                })
-        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+            futures = {executor.submit(delete, job): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                job = futures[future]
+                try:
+                    future.result()
+                    deleted_jobs.append(job)
+                    outcome = job
+                except Exception as e:
+                    outcome = dict(job, error=str(e))
+                    failed_jobs.append(outcome)
+                print(f"[{done}/{len(jobs)}] {'Failed to delete' if 'error' in outcome else 'Deleted'} "
+                      f"job: {job['name']}")  # Debug output
+                if progress:
+                    progress(done, len(jobs), outcome)
+
+        # Report jobs in listing order, not completion order
+        order = {job["id"]: index for index, job in enumerate(jobs)}
+        deleted_jobs.sort(key=lambda job: order[job["id"]])
+        failed_jobs.sort(key=lambda job: order[job["id"]])
+
         # Prepare result
         success = len(failed_jobs) == 0
         message = (
-            f"Successfully deleted all {len(deleted_jobs)} jobs" 
-            if success else 
+            f"Successfully deleted all {len(deleted_jobs)} jobs"
+            if success else
             f"Deleted {len(deleted_jobs)} jobs, but failed to delete {len(failed_jobs)} jobs"
         )
-        
+
         return {
             "success": success,
             "message": message,
@@ -107,4 +215,4 @@ def delete_all_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
         return {
             "success": False,
             "message": f"Error deleting jobs: {str(e)}"
-        } 
\ No newline at end of file
+        }
@@ -3,10 +3,11 @@ Delete an application in Cloudera ML
 """
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 def delete_application(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Delete an application in Cloudera ML
@@ -49,28 +50,14 @@ def delete_application(config: Dict[str, str], params: Dict[str, Any]) -> Dict[s
     api_url = f"{host}/api/v2/projects/{project_id}/applications/{application_id}"
     print(f"Deleting application with URL: {api_url}")
     
-    # Construct curl command
-    curl_cmd = [
-        "curl", "-s", "-X", "DELETE",
-        "-H", f"Authorization: Bearer {api_key}",
-        api_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to delete application: {result.stderr}"
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("DELETE", api_url, api_key=api_key)
         
         # Parse the response if there is any content
-        if result.stdout.strip():
+        if result.text.strip():
             try:
-                response = json.loads(result.stdout)
+                response = json.loads(result.text)
                 
                 # Check if there's an error in the response
                 if "error" in response:
@@ -3,34 +3,214 @@ Delete multiple experiment runs in Cloudera ML
 """
 import os
 import json
-import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
+
+from .. import transport
+from .. import pagination
+from ..utils import parse_remote_time
+from ..run_table import latest_metrics, fetch_runs
+
+# Run IDs sent in one delete request
+MAX_BATCH_IDS = 500
+
+# Delete requests in flight at once unless the caller asks for another number
+DEFAULT_CONCURRENCY = 4
+
+# Runs fetched per page when selecting runs with filters
+LIST_PAGE_SIZE = 1000
+
+# Run IDs shown in a dry run; the count covers the rest
+DRY_RUN_SAMPLE = 100
+
+
+def metric_value(run: Dict[str, Any], key: str) -> Optional[float]:
+    """
+    Get the latest value of a metric of an experiment run
+
+    Args:
+        run: Experiment run; metrics are either a {key: value} dict or a list
+            of {key, value, step, timestamp} points
+        key: Metric name
+
+    Returns:
+        The value with the highest step and timestamp, or None if the run has no such metric
+    """
+    value = latest_metrics(run).get(key)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def experiment_run_filter(params: Dict[str, Any], now: Optional[float] = None) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Build a predicate that selects the experiment runs to delete
+
+    All given filters must match.
+
+    Args:
+        params: Function parameters
+            - older_than_days: Only runs started more than this many days ago
+            - status: Run status, or a list of statuses (case-insensitive)
+            - metric: Name of the metric that metric_below and metric_above apply to
+            - metric_below: Only runs whose latest metric value is below this
+            - metric_above: Only runs whose latest metric value is above this
+        now: Current time in seconds since the epoch (default: time.time())
+
+    Returns:
+        Function that returns True for runs to delete, or None if no filter was given
+
+    Raises:
+        ValueError: If a metric threshold is given without a metric, or a value is not a number
+    """
+    cutoff = None
+    if params.get("older_than_days") is not None:
+        cutoff = (now if now is not None else time.time()) - float(params["older_than_days"]) * 86400
+
+    statuses = params.get("status")
+    if isinstance(statuses, str):
+        statuses = [statuses]
+    statuses = {status.upper() for status in statuses} if statuses else None
+
+    metric = params.get("metric")
+    below = float(params["metric_below"]) if params.get("metric_below") is not None else None
+    above = float(params["metric_above"]) if params.get("metric_above") is not None else None
+    if (below is not None or above is not None) and not metric:
+        raise ValueError("metric is required with metric_below or metric_above")
+    if metric and below is None and above is None:
+        raise ValueError("metric_below or metric_above is required with metric")
+
+    if cutoff is None and statuses is None and not metric:
+        return None
+
+    def matches(run: Dict[str, Any]) -> bool:
+        if cutoff is not None:
+            # Runs without a readable start time are never old enough
+            started = parse_remote_time(run.get("start_time") or run.get("created_at"))
+            if started is None or started >= cutoff:
+                return False
+        if statuses is not None and str(run.get("status") or "").upper() not in statuses:
+            return False
+        if metric:
+            value = metric_value(run, metric)
+            if value is None:
+                return False
+            if below is not None and not value < below:
+                return False
+            if above is not None and not value > above:
+                return False
+        return True
+
+    return matches
+
+
+def _delete_chunk(api_url: str, api_key: str, run_ids: List[str]) -> Dict[str, Any]:
+    """Delete one chunk of runs with a single request"""
+    # Prepare the JSON payload with run IDs
+    request_data = {
+        "ids": run_ids
+    }
+    
+    try:
+        # Send the request over the shared connection pool
+        result = transport.request("DELETE", api_url, api_key=api_key, data=json.dumps(request_data))
+        
+        # Parse the response if there is any content
+        if result.text.strip():
+            try:
+                response = json.loads(result.text)
+                
+                # Check if there's an error in the response
+                if "error" in response:
+                    return {
+                        "success": False, 
+                        "message": f"API error: {response.get('error', {}).get('message', 'Unknown error')}",
+                        "details": response.get("error", {})
+                    }
+                
+                if result.status_code < 400:
+                    return {
+                        "success": True,
+                        "message": f"Successfully deleted {len(run_ids)} experiment runs",
+                        "data": response
+                    }
+            except json.JSONDecodeError:
+                # If the response is not JSON, it might be empty for a successful deletion
+                pass
+        
+        if result.status_code >= 400:
+            return {
+                "success": False,
+                "message": f"API error: HTTP {result.status_code} {result.text.strip()[:200]}"
+            }
+        
+        # If we got here, the deletion was likely successful but returned no content
+        return {
+            "success": True,
+            "message": f"Successfully deleted {len(run_ids)} experiment runs"
+        }
+    
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"Error deleting experiment runs: {str(e)}"
+        }
+
 
 def delete_experiment_run_batch(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Delete multiple experiment runs in Cloudera ML
     
+    The runs are either given as run_ids or selected with filters from a
+    fresh listing of the experiment's runs, so large cleanups need no ID
+    list. They are deleted in chunks of batch_size IDs, several chunks at
+    a time, and chunks that fail are reported without stopping the rest.
+    
     Args:
         config: MCP configuration with host and api_key
         params: Parameters for the API call:
-            - project_id: ID of the project (required)
+            - project_id: ID of the project (optional if in config)
             - experiment_id: ID of the experiment (required)
-            - run_ids: List of run IDs to delete (required)
+            - run_ids: List of run IDs to delete (required unless filters are given)
+            - older_than_days, status, metric, metric_below, metric_above: Select the
+              runs to delete instead of run_ids, see experiment_run_filter()
+            - dry_run: Only count the runs that would be deleted (default: False)
+            - batch_size: Run IDs per delete request (default: 500)
+            - concurrency: Delete requests sent in parallel (default: 4)
     
     Returns:
-        Dict with success flag, message, and deletion results
+        Dict with success flag, message, deleted_count, failed_count,
+        failed_run_ids and the distinct errors of failed chunks
     """
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+    run_ids = params.get("run_ids")
+    
     # Validate required parameters
-    required_params = ["project_id", "experiment_id", "run_ids"]
-    missing_params = [p for p in required_params if p not in params or not params[p]]
+    missing_params = [name for name, value in (("project_id", project_id), ("experiment_id", experiment_id))
+                      if not value]
     if missing_params:
         return {"success": False, "message": f"Missing required parameters: {', '.join(missing_params)}"}
     
+    try:
+        matches = experiment_run_filter(params)
+        batch_size = int(params.get("batch_size") or MAX_BATCH_IDS)
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+    
+    if matches is not None and run_ids:
+        return {"success": False, "message": "Give either run_ids or filters, not both"}
+    
     # Make sure run_ids is a list
-    run_ids = params["run_ids"]
-    if not isinstance(run_ids, list) or not run_ids:
-        return {"success": False, "message": "run_ids must be a non-empty list of experiment run IDs"}
+    if matches is None and (not isinstance(run_ids, list) or not run_ids):
+        return {"success": False, "message": "run_ids must be a non-empty list of experiment run IDs, "
+                                             "or filters must select the runs"}
     
     # Format host URL correctly
     host = config.get("host", "")
@@ -44,72 +224,97 @@ def delete_experiment_run_batch(config: Dict[str, str], params: Dict[str, Any])
     elif parsed_url.scheme and "://" in host[len(parsed_url.scheme)+3:]:
         # Fix potential double https:// in the URL
         host = parsed_url.scheme + "://" + host.split("://")[-1]
+    host = host.rstrip("/")
     
     api_key = config.get("api_key")
     if not api_key:
         return {"success": False, "message": "Missing api_key in configuration"}
     
-    # Build the URL for the delete request
-    project_id = params["project_id"]
-    experiment_id = params["experiment_id"]
-    api_url = f"{host}/api/v2/projects/{project_id}/experiments/{experiment_id}/runs-batch"
-    print(f"Deleting experiment runs batch with URL: {api_url}")
-    
-    # Prepare the JSON payload with run IDs
-    request_data = {
-        "ids": run_ids
-    }
+    experiment_url = f"{host}/api/v2/projects/{project_id}/experiments/{experiment_id}"
     
-    # Construct curl command for deletion
-    curl_cmd = [
-        "curl", "-s", "-X", "DELETE",
-        "-H", f"Authorization: Bearer {api_key}",
-        "-H", "Content-Type: application/json",
-        "-d", json.dumps(request_data),
-        api_url
-    ]
+    if matches is not None:
+        # A fresh listing: a cached one could name runs that are already gone. Pages are read
+        # in full before deleting, since deletes would shift the pages still to be read.
+        runs_url = f"{experiment_url}/runs"
+        print(f"Selecting experiment runs from: {runs_url}")
+        try:
+            runs = list(pagination.paginate(runs_url, "experiment_runs", api_key=api_key,
+                                            page_size=LIST_PAGE_SIZE, cache=False))
+            if params.get("metric"):
+                # Listings may leave out the metrics; read those runs one by one
+                missing = [index for index, run in enumerate(runs) if "data" not in run]
+                details = fetch_runs(dict(config, host=host), project_id, experiment_id,
+                                     [runs[index].get("id") for index in missing], cache=False)
+                for index, run in zip(missing, details):
+                    runs[index] = run
+            run_ids = [run.get("id") for run in runs if matches(run)]
+        except Exception as e:
+            return {"success": False, "message": f"Error listing experiment runs: {str(e)}"}
     
-    try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to delete experiment runs: {result.stderr}"
-            }
-        
-        # Parse the response if there is any content
-        if result.stdout.strip():
-            try:
-                response = json.loads(result.stdout)
-                
-                # Check if there's an error in the response
-                if "error" in response:
-                    return {
-                        "success": False, 
-                        "message": f"API error: {response.get('error', {}).get('message', 'Unknown error')}",
-                        "details": response.get("error", {})
-                    }
-                
-                return {
-                    "success": True,
-                    "message": f"Successfully deleted {len(run_ids)} experiment runs",
-                    "data": response
-                }
-            except json.JSONDecodeError:
-                # If the response is not JSON, it might be empty for a successful deletion
-                pass
-        
-        # If we got here, the deletion was likely successful but returned no content
+    if params.get("dry_run"):
         return {
             "success": True,
-            "message": f"Successfully deleted {len(run_ids)} experiment runs"
+            "message": f"Dry run: {len(run_ids)} experiment runs would be deleted",
+            "dry_run": True,
+            "planned_count": len(run_ids),
+            "planned_run_ids": run_ids[:DRY_RUN_SAMPLE]
         }
-    
-    except Exception as e:
+    if not run_ids:
         return {
+            "success": True,
+            "message": "No experiment runs matched the filters",
+            "deleted_count": 0,
+            "failed_count": 0,
+            "failed_run_ids": [],
+            "errors": []
+        }
+    
+    # Build the URL for the delete request
+    api_url = f"{experiment_url}/runs-batch"
+    print(f"Deleting experiment runs batch with URL: {api_url}")
+    
+    chunks = [run_ids[start:start + batch_size] for start in range(0, len(run_ids), batch_size)]
+    if len(chunks) == 1:
+        result = _delete_chunk(api_url, api_key, chunks[0])
+        results = [result]
+    else:
+        # Bulk lane: a mass cleanup should not hold up interactive calls
+        @transport.in_bulk
+        def delete(chunk):
+            return _delete_chunk(api_url, api_key, chunk)
+        
+        results = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            futures = {executor.submit(delete, chunk): index for index, chunk in enumerate(chunks)}
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                results[index] = future.result()
+                print(f"[{done}/{len(chunks)}] {'Deleted' if results[index]['success'] else 'Failed to delete'} "
+                      f"{len(chunks[index])} experiment runs")  # Debug output
+    
+    failed_chunks = [chunk for chunk, result in zip(chunks, results) if not result["success"]]
+    failed_run_ids = [run_id for chunk in failed_chunks for run_id in chunk]
+    errors = list(dict.fromkeys(result["message"] for result in results if not result["success"]))
+    deleted_count = len(run_ids) - len(failed_run_ids)
+    
+    if len(chunks) == 1:
+        # One request: keep its own response fields
+        result = dict(results[0])
+    elif failed_run_ids:
+        result = {
             "success": False,
-            "message": f"Error deleting experiment runs: {str(e)}"
-        } 
\ No newline at end of file
+            "message": f"Deleted {deleted_count} experiment runs, but {len(failed_chunks)} of {len(chunks)} "
+                       f"requests failed for {len(failed_run_ids)} runs: {errors[0]}"
+        }
+    else:
+        result = {
+            "success": True,
+            "message": f"Successfully deleted {deleted_count} experiment runs in {len(chunks)} requests"
+        }
+    result.update({
+        "deleted_count": deleted_count,
+        "failed_count": len(failed_run_ids),
+        "failed_run_ids": failed_run_ids,
+        "errors": errors
+    })
+    return result
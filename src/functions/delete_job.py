@@ -2,10 +2,11 @@
 
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 
 def delete_job(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -53,22 +54,15 @@ def delete_job(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]
     job_url = f"{host}/api/v2/projects/{project_id}/jobs/{job_id}"
     print(f"Getting job details from: {job_url}")
     
-    # Construct curl command for getting job details
-    get_job_cmd = [
-        "curl", "-s",
-        "-H", f"Authorization: Bearer {api_key}",
-        job_url
-    ]
-    
     job_name = f"Job ID {job_id}"
     try:
-        # Execute curl command to get job details
-        job_result = subprocess.run(get_job_cmd, capture_output=True, text=True)
+        # Send the request over the shared connection pool
+        job_result = transport.request("GET", job_url, api_key=api_key)
         
         # If successful, parse the job name
-        if job_result.returncode == 0 and job_result.stdout.strip():
+        if job_result.ok and job_result.text.strip():
             try:
-                job_info = json.loads(job_result.stdout)
+                job_info = json.loads(job_result.text)
                 job_name = job_info.get("name", job_name)
             except json.JSONDecodeError:
                 # If we can't parse the response, continue with deletion anyway
@@ -81,32 +75,16 @@ def delete_job(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]
     delete_url = f"{host}/api/v2/projects/{project_id}/jobs/{job_id}"
     print(f"Deleting job with URL: {delete_url}")
     
-    # Construct curl command for deletion
-    curl_cmd = [
-        "curl", "-s", "-X", "DELETE",
-        "-H", f"Authorization: Bearer {api_key}",
-        delete_url
-    ]
-    
     try:
-        # Execute curl command with debug output
-        print(f"Executing curl command: {' '.join(curl_cmd)}")
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        print(f"Curl exit code: {result.returncode}")
-        print(f"Curl stdout: '{result.stdout}'")
-        print(f"Curl stderr: '{result.stderr}'")
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to delete job: {result.stderr}"
-            }
+        # Send the request over the shared connection pool with debug output
+        result = transport.request("DELETE", delete_url, api_key=api_key)
+        print(f"Response status code: {result.status_code}")
+        print(f"Response body: '{result.text}'")
         
         # Parse the response if there is any content
-        if result.stdout.strip():
+        if result.text.strip():
             try:
-                response = json.loads(result.stdout)
+                response = json.loads(result.text)
                 
                 # Check if there's an error in the response
                 if "error" in response:
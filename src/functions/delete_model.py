@@ -2,10 +2,11 @@
 
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 
 def delete_model(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -51,22 +52,15 @@ def delete_model(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, An
     model_url = f"{host}/api/v2/projects/{project_id}/models/{model_id}"
     print(f"Getting model details from: {model_url}")
     
-    # Construct curl command for getting model details
-    get_model_cmd = [
-        "curl", "-s",
-        "-H", f"Authorization: Bearer {api_key}",
-        model_url
-    ]
-    
     model_name = f"Model ID {model_id}"
     try:
-        # Execute curl command to get model details
-        model_result = subprocess.run(get_model_cmd, capture_output=True, text=True)
+        # Send the request over the shared connection pool
+        model_result = transport.request("GET", model_url, api_key=api_key)
         
         # If successful, parse the model name
-        if model_result.returncode == 0 and model_result.stdout.strip():
+        if model_result.ok and model_result.text.strip():
             try:
-                model_info = json.loads(model_result.stdout)
+                model_info = json.loads(model_result.text)
                 model_name = model_info.get("name", model_name)
             except json.JSONDecodeError:
                 # If we can't parse the response, continue with deletion anyway
@@ -79,28 +73,14 @@ def delete_model(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, An
     delete_url = f"{host}/api/v2/projects/{project_id}/models/{model_id}"
     print(f"Deleting model with URL: {delete_url}")
     
-    # Construct curl command for deletion
-    curl_cmd = [
-        "curl", "-s", "-X", "DELETE",
-        "-H", f"Authorization: Bearer {api_key}",
-        delete_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to delete model: {result.stderr}"
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("DELETE", delete_url, api_key=api_key)
         
         # Parse the response if there is any content
-        if result.stdout.strip():
+        if result.text.strip():
             try:
-                response = json.loads(result.stdout)
+                response = json.loads(result.text)
                 
                 # Check if there's an error in the response
                 if "error" in response:
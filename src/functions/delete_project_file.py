@@ -2,10 +2,11 @@
 
 import os
 import json
-import subprocess
 from urllib.parse import urlparse, quote
 from typing import Dict, Any
 
+from .. import transport
+
 
 def delete_project_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -54,28 +55,14 @@ def delete_project_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[
     delete_url = f"{host}/api/v2/projects/{project_id}/files?path={encoded_file_path}"
     print(f"Deleting project file with URL: {delete_url}")
     
-    # Construct curl command for deletion
-    curl_cmd = [
-        "curl", "-s", "-X", "DELETE",
-        "-H", f"Authorization: Bearer {api_key}",
-        delete_url
-    ]
-    
     try:
-        # Execute curl command
-        result = subprocess.run(curl_cmd, capture_output=True, text=True)
-        
-        # Check if the curl command was successful
-        if result.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to delete file: {result.stderr}"
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("DELETE", delete_url, api_key=api_key)
         
         # Parse the response if there is any content
-        if result.stdout.strip():
+        if result.text.strip():
             try:
-                response = json.loads(result.stdout)
+                response = json.loads(result.text)
                 
                 # Check if there's an error in the response
                 if "error" in response:
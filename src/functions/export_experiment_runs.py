@@ -0,0 +1,96 @@
+"""
+Export all runs of an experiment in Cloudera ML as a table
+"""
+import os
+from typing import Dict, Any
+
+from ..run_table import load_run_table, DEFAULT_CONCURRENCY
+
+# File formats export_experiment_runs can write, by extension
+EXPORT_FORMATS = {".csv": "csv", ".parquet": "parquet"}
+
+
+def export_experiment_runs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Export all runs of an experiment with their metrics and parameters
+
+    The runs are loaded into a columnar table (see run_table.RunTable): one
+    column per metric holding each run's latest value, and one per
+    parameter. Runs the listing returns without their data are fetched
+    concurrently. The table is written to path as CSV or Parquet; the
+    result only summarizes it, so even large experiments fit in a reply.
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Parameters for the API call:
+            - project_id: ID of the project (optional if in config)
+            - experiment_id: ID of the experiment (required)
+            - path: File to write (optional; without it only the summary is returned)
+            - format: "csv" or "parquet" (default: from the path's extension, else csv)
+            - concurrency: Runs fetched in parallel (default: 8)
+            - fetch_details: Fetch every run on its own even if the listing has its data
+            - bypass_cache: Skip the response cache for the listing and the runs
+
+    Returns:
+        Dict with success flag, message, run_count, metric and parameter names,
+        per-metric statistics and the path written
+    """
+    project_id = params.get("project_id") or config.get("project_id")
+    experiment_id = params.get("experiment_id")
+
+    # Validate required parameters
+    missing_params = [name for name, value in (("project_id", project_id), ("experiment_id", experiment_id))
+                      if not value]
+    if missing_params:
+        return {"success": False, "message": f"Missing required parameters: {', '.join(missing_params)}"}
+
+    if not config.get("host"):
+        return {"success": False, "message": "Missing host in configuration"}
+
+    path = params.get("path")
+    file_format = params.get("format")
+    if path and not file_format:
+        file_format = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower(), "csv")
+    if file_format and file_format not in EXPORT_FORMATS.values():
+        return {"success": False, "message": f"Unknown format {file_format}; use one of: "
+                                             f"{', '.join(EXPORT_FORMATS.values())}"}
+    if file_format and not path:
+        return {"success": False, "message": "path is required to write a file"}
+
+    try:
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+
+    try:
+        table = load_run_table(config, project_id, experiment_id, concurrency=concurrency,
+                               fetch_details=bool(params.get("fetch_details")),
+                               cache=not params.get("bypass_cache"))
+    except Exception as e:
+        return {"success": False, "message": f"Error loading experiment runs: {str(e)}"}
+
+    result = {
+        "success": True,
+        "message": f"Loaded {len(table)} experiment runs with {len(table.metric_names)} metrics "
+                   f"and {len(table.param_names)} parameters",
+        "run_count": len(table),
+        "metrics": table.metric_names,
+        "params": table.param_names,
+        "summary": table.summary()
+    }
+
+    if path:
+        try:
+            if file_format == "parquet":
+                table.to_parquet(path)
+            else:
+                table.to_csv(path)
+        except (ImportError, OSError) as e:
+            return dict(result, success=False, message=f"Error writing {path}: {str(e)}")
+        result["message"] += f"; wrote {path}"
+        result["path"] = os.path.abspath(path)
+        result["format"] = file_format
+
+    return result
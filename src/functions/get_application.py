@@ -3,6 +3,8 @@
 import requests
 from typing import Dict, Any
 
+from .. import transport
+
 
 def get_application(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -53,7 +55,7 @@ def get_application(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
         }
         
         # Make the request
-        response = requests.get(app_url, headers=headers)
+        response = transport.request("GET", app_url, headers=headers)
         response.raise_for_status()
         
         # Parse the response
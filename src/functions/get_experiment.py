@@ -2,10 +2,11 @@
 
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 
 def get_experiment(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -49,24 +50,16 @@ def get_experiment(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
         "Authorization": f"Bearer {config.get('api_key', '')}"
     }
     
-    # Construct curl command
-    curl_command = [
-        "curl", "-s", "-X", "GET",
-        "-H", f"Content-Type: {headers['Content-Type']}",
-        "-H", f"Authorization: {headers['Authorization']}",
-        url
-    ]
-    
     print(f"DEBUG: Accessing URL: {url}")
     
     try:
-        # Execute curl command
-        result = subprocess.run(curl_command, capture_output=True, text=True)
+        # Send the request over the shared connection pool
+        result = transport.request("GET", url, headers=headers)
         
-        # Check if the command was successful
-        if result.returncode == 0:
+        # Check if the request was successful
+        if result.ok:
             try:
-                response_data = json.loads(result.stdout)
+                response_data = json.loads(result.text)
                 return {
                     "success": True,
                     "data": response_data
@@ -75,13 +68,13 @@ def get_experiment(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
                 return {
                     "success": False,
                     "message": "Failed to parse API response",
-                    "raw_response": result.stdout
+                    "raw_response": result.text
                 }
         else:
             return {
                 "success": False,
-                "message": f"API request failed with status code {result.returncode}",
-                "error": result.stderr
+                "message": f"API request failed with status code {result.status_code}",
+                "error": result.text
             }
     except Exception as e:
         return {
@@ -2,10 +2,11 @@
 
 import os
 import json
-import subprocess
 from urllib.parse import urlparse
 from typing import Dict, Any
 
+from .. import transport
+
 
 def get_model(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -51,36 +52,13 @@ def get_model(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     # Construct API URL
     api_url = f"{host}/api/v1/projects/{project_id}/models/{model_id}"
     
-    # Set up headers
-    headers = [
-        '-H', f'Authorization: Bearer {config["api_key"]}',
-        '-H', 'Content-Type: application/json'
-    ]
-    
-    # Construct curl command
-    curl_command = ['curl', '-s', '-X', 'GET']
-    curl_command.extend(headers)
-    curl_command.append(api_url)
-    
     try:
-        # Execute the curl command
-        process = subprocess.run(
-            curl_command,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        # Check if the command was successful
-        if process.returncode != 0:
-            return {
-                'success': False,
-                'message': f'Failed to get model: {process.stderr}'
-            }
+        # Send the request over the shared connection pool
+        result = transport.request("GET", api_url, api_key=config["api_key"])
         
         # Parse the response
         try:
-            response = json.loads(process.stdout)
+            response = json.loads(result.text)
             return {
                 'success': True,
                 'data': response
@@ -88,7 +66,7 @@ def get_model(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
         except json.JSONDecodeError:
             return {
                 'success': False,
-                'message': f'Invalid JSON response: {process.stdout}'
+                'message': f'Invalid JSON response: {result.text}'
             }
     
     except Exception as e:
@@ -3,18 +3,101 @@ Get project ID from project name.
 """
 
 import json
+import time
+import hashlib
+import threading
 import requests
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterator
 from urllib.parse import urlparse
 
+from .. import pagination
+
+
+# How long a resolved name stays in the index, and how many names it holds
+INDEX_TTL = 300
+INDEX_MAX_ENTRIES = 1024
+
+# (host, API key hash, project name) -> (expiry, project), least recently used first
+_project_index: "OrderedDict[tuple, tuple]" = OrderedDict()
+_project_index_lock = threading.Lock()
+
+
+def _index_key(host: str, api_key: str, project_name: str) -> tuple:
+    return (host, hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16], project_name)
+
+
+def _index_get(key: tuple) -> Optional[Dict[str, Any]]:
+    with _project_index_lock:
+        entry = _project_index.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _project_index[key]
+            return None
+        _project_index.move_to_end(key)
+        return entry[1]
+
+
+def _index_put(key: tuple, project: Dict[str, Any]) -> None:
+    with _project_index_lock:
+        _project_index[key] = (time.monotonic() + INDEX_TTL, project)
+        _project_index.move_to_end(key)
+        while len(_project_index) > INDEX_MAX_ENTRIES:
+            _project_index.popitem(last=False)
+
+
+def _index_drop(key: tuple) -> None:
+    with _project_index_lock:
+        _project_index.pop(key, None)
+
+
+def clear_project_index() -> None:
+    """Forget every resolved project name, e.g. after a project is renamed"""
+    with _project_index_lock:
+        _project_index.clear()
+
+
+def iter_projects(host: str, headers: Dict[str, str], search_filter: Optional[Dict[str, str]] = None,
+                  use_cache: bool = True, page_size: int = pagination.DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Yield projects from the projects API, fetching pages as they are needed
+    
+    Args:
+        host: Normalised CML host URL
+        headers: Request headers with authorization
+        search_filter: Optional server-side filter, e.g. {"name": "my-project"}
+        use_cache: Whether pages may come from the response cache
+        page_size: Projects fetched per API request
+        
+    Yields:
+        Project objects as returned by the API
+        
+    Raises:
+        requests.RequestException: If a page could not be fetched
+    """
+    url = f"{host}/api/v2/projects"
+    print(f"Making request to: {url}")  # Debug output
+    query = {"search_filter": json.dumps(search_filter)} if search_filter else None
+    return pagination.paginate(url, "projects", headers=headers, page_size=page_size, query=query, cache=use_cache)
+
 
 def get_project_id(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Get a project ID from a project name.
     
+    The name is resolved with the API's server-side search filter, paging
+    through the results until an exact match is found, and the result is
+    kept in a bounded in-process index for INDEX_TTL seconds so repeated
+    lookups need no request. Passing "*" lists every project, across all
+    pages, and fills the index.
+    
     Args:
         config: MCP configuration with host and api_key
         params: Parameters containing project_name
+            - limit: With "*", maximum number of projects to return (default: all)
+            - page_size: Projects fetched per API request (default: 100)
+            - bypass_cache: Skip the name index and cached responses and ask the API (default: False)
         
     Returns:
         Dictionary with project information and ID
@@ -39,50 +122,61 @@ def get_project_id(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str,
         # Remove trailing slash if present
         host = host.rstrip("/")
         
-        url = f"{host}/api/v2/projects"
         headers = {
             "Authorization": f"Bearer {config['api_key']}",
             "Content-Type": "application/json"
         }
-        
-        print(f"Making request to: {url}")  # Debug output
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        use_cache = not params.get("bypass_cache")
+        limit, page_size = pagination.parse_limits(params)
         
         # Handle special case for listing all projects
         if project_name == "*":
             projects_list = []
-            if 'projects' in data and data['projects']:
-                for project in data['projects']:
-                    projects_list.append({
-                        "name": project.get('name'),
-                        "id": project.get('id'),
-                        "owner": project.get('owner')
-                    })
-                
+            indexed_names = set()
+            projects, truncated = pagination.take(iter_projects(host, headers, use_cache=use_cache, page_size=page_size), limit)
+            for project in projects:
+                projects_list.append({
+                    "name": project.get('name'),
+                    "id": project.get('id'),
+                    "owner": project.get('owner')
+                })
+                # Index the first project listed under each name, as a lookup would find it
+                if project.get('name') and project['name'] not in indexed_names:
+                    indexed_names.add(project['name'])
+                    _index_put(_index_key(host, config['api_key'], project['name']), project)
+            
+            if projects_list:
                 return {
                     "status": "success",
                     "projects": projects_list,
-                    "count": len(projects_list)
+                    "count": len(projects_list),
+                    "truncated": truncated
                 }
+            return {
+                "status": "error",
+                "message": "No projects found or you don't have permission to access them"
+            }
+        
+        key = _index_key(host, config['api_key'], project_name)
+        project = _index_get(key) if use_cache else None
+        if project is None:
+            # The search filter matches substrings, so keep paging until the exact name turns up
+            for candidate in iter_projects(host, headers, {"name": project_name}, use_cache=use_cache, page_size=page_size):
+                if candidate.get('name') == project_name:
+                    project = candidate
+                    _index_put(key, project)
+                    break
             else:
-                return {
-                    "status": "error",
-                    "message": "No projects found or you don't have permission to access them",
-                    "raw_response": data
-                }
+                # The name is gone, e.g. the project was deleted; forget what the index had for it
+                _index_drop(key)
         
-        # Find the project with the matching name
-        if 'projects' in data and data['projects']:
-            for project in data['projects']:
-                if project.get('name') == project_name:
-                    return {
-                        "status": "success",
-                        "project_id": project.get('id'),
-                        "project_name": project_name,
-                        "project_info": project
-                    }
+        if project is not None:
+            return {
+                "status": "success",
+                "project_id": project.get('id'),
+                "project_name": project_name,
+                "project_info": project
+            }
         
         # If no project is found
         return {
@@ -5,6 +5,8 @@ import json
 from typing import Dict, Any
 from urllib.parse import urlparse
 
+from .. import transport
+
 
 def get_runtimes(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -12,7 +14,8 @@ def get_runtimes(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, An
     
     Args:
         config: MCP configuration
-        params: Function parameters (unused)
+        params: Function parameters
+            - bypass_cache: Fetch a fresh list instead of a cached response (default: False)
         
     Returns:
         Dictionary containing list of available runtimes
@@ -61,13 +64,13 @@ def get_runtimes(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, An
         # Try v2 API first
         url = f"{host}/api/v2/runtimes"
         print(f"Getting runtimes from: {url}")
-        response = requests.get(url, headers=headers)
+        response = transport.request("GET", url, headers=headers, cache=not params.get("bypass_cache"))
         
         if response.status_code == 404:
             # Try fallback to v1 API
             url = f"{host}/api/v1/runtimes"
             print(f"V2 API not found, trying: {url}")
-            response = requests.get(url, headers=headers)
+            response = transport.request("GET", url, headers=headers, cache=not params.get("bypass_cache"))
         
         response.raise_for_status()
         api_response = response.json()
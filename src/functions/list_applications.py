@@ -3,6 +3,8 @@
 import requests
 from typing import Dict, Any
 
+from .. import pagination
+
 
 def list_applications(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -12,6 +14,9 @@ def list_applications(config: Dict[str, str], params: Dict[str, Any]) -> Dict[st
         config (dict): MCP configuration containing host and api_key
         params (dict): Parameters for API call
             - project_id (str): ID of the project to list applications from
+            - limit (int, optional): Maximum number of applications to return (default: all)
+            - page_size (int, optional): Applications fetched per API request (default: 100)
+            - bypass_cache (bool, optional): Fetch a fresh list instead of a cached response
     
     Returns:
         dict: Response containing list of applications or error message
@@ -45,19 +50,19 @@ def list_applications(config: Dict[str, str], params: Dict[str, Any]) -> Dict[st
             "Content-Type": "application/json"
         }
         
-        print(f"Making request to: {api_url}")  # Debug output
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
+        limit, page_size = pagination.parse_limits(params)
         
-        # Parse the response
-        applications_data = response.json()
-        applications = applications_data.get("applications", [])
+        print(f"Making request to: {api_url}")  # Debug output
+        applications = pagination.paginate(api_url, "applications", headers=headers, page_size=page_size,
+                                           cache=not params.get("bypass_cache"))
+        applications, truncated = pagination.take(applications, limit)
         
         return {
             'success': True,
             'message': f"Found {len(applications)} applications",
             'applications': applications,
-            'count': len(applications)
+            'count': len(applications),
+            'truncated': truncated
         }
     
     except requests.exceptions.RequestException as e:
@@ -2,27 +2,111 @@
 
 import json
 import os
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
+import requests
+
+from .. import transport
+from .. import pagination
+from ..utils import parse_remote_time
+
+# Jobs whose runs are fetched at once when listing runs across all jobs
+DEFAULT_CONCURRENCY = 8
+
+
+def parse_time(value):
+    """
+    Parse a time window bound
+
+    Args:
+        value: ISO 8601 timestamp string, or seconds since the epoch
+
+    Returns:
+        Seconds since the epoch, or None if no bound was given
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    parsed = parse_remote_time(value)
+    if parsed is None:
+        raise ValueError(f"Invalid time: {value}")
+    return parsed
+
+
+def run_filter(params):
+    """
+    Build a predicate for the status and time window filters
+
+    Args:
+        params (dict): Function parameters
+            - status (str or list, optional): Only runs with this status, or one of these statuses
+            - since (str or float, optional): Only runs created at or after this time
+            - until (str or float, optional): Only runs created before this time
+
+    Returns:
+        function: Returns True for runs to keep
+
+    Raises:
+        ValueError: If since or until cannot be parsed
+    """
+    statuses = params.get('status')
+    if isinstance(statuses, str):
+        statuses = [statuses]
+    statuses = {status.upper() for status in statuses} if statuses else None
+    since = parse_time(params.get('since'))
+    until = parse_time(params.get('until'))
+
+    def matches(run):
+        if statuses is not None and str(run.get('status') or '').upper() not in statuses:
+            return False
+        if since is not None or until is not None:
+            created_at = parse_remote_time(run.get('created_at'))
+            if created_at is None:
+                return False
+            if since is not None and created_at < since:
+                return False
+            if until is not None and created_at >= until:
+                return False
+        return True
+
+    return matches
 
 
 def list_job_runs(config, params=None):
     """
     List job runs in a Cloudera ML project.
 
+    Without a job_id, the runs of every job in the project are fetched
+    concurrently and merged, newest first. The API has no project-wide
+    runs endpoint, so this costs one listing per job.
+
     Args:
         config (dict): MCP configuration.
         params (dict, optional): Parameters for the API call. Default is None.
             - project_id (str, optional): ID of the project to list job runs from.
                 If not provided, it will be taken from the configuration.
             - job_id (str, optional): If provided, only list runs for this specific job.
+            - status (str or list, optional): Only runs with this status, or one of these statuses.
+            - since (str or float, optional): Only runs created at or after this time
+                (ISO 8601 or seconds since the epoch).
+            - until (str or float, optional): Only runs created before this time.
+            - limit (int, optional): Maximum number of runs to return, newest first.
+            - concurrency (int, optional): Jobs listed at once without a job_id (default: 8).
+            - bypass_cache (bool, optional): Fetch fresh run lists instead of cached responses.
 
     Returns:
         dict: Response with the following structure:
             {
                 "success": bool,
                 "message": str,
-                "data": list  # List of job run objects if successful, otherwise None
+                "data": {"job_runs": list}  # Matching job runs if successful, otherwise None
+                "count": int,
+                "truncated": bool,  # True if limit cut the list short
+                "failed_jobs": list  # Jobs whose runs could not be listed, without a job_id
             }
     """
     params = params or {}
@@ -54,67 +138,87 @@ def list_job_runs(config, params=None):
 
     host = host.rstrip('/')
 
-    # Build the API URL
-    if job_id:
-        url = f"{host}/api/v2/projects/{project_id}/jobs/{job_id}/runs"
-    else:
-        # The generic endpoint doesn't seem to work, let the user know they need to provide a job ID
+    try:
+        matches = run_filter(params)
+        limit, page_size = pagination.parse_limits(params)
+        concurrency = int(params.get('concurrency') or DEFAULT_CONCURRENCY)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
         return {
             "success": False,
-            "message": "A job_id is required. The Cloudera ML API does not support listing all job runs without a specific job ID.",
+            "message": str(e),
             "data": None
         }
 
-    print(f"Accessing: {url}")
-
-    # Set up headers
-    headers = {
-        'Content-Type': 'application/json',
-        'Authorization': f"Bearer {config.get('api_key', '')}"
-    }
-
-    # Prepare the curl command
-    curl_command = [
-        'curl', '-s',
-        '-X', 'GET',
-        '-H', f"Authorization: Bearer {config.get('api_key', '')}",
-        '-H', 'Content-Type: application/json',
-        url
-    ]
-
-    # Execute the curl command
+    api_key = config.get('api_key', '')
+    use_cache = not params.get('bypass_cache')
+    jobs_url = f"{host}/api/v2/projects/{project_id}/jobs"
+
+    def job_runs(job):
+        """Matching runs of one job, tagged with the job's name"""
+        url = f"{jobs_url}/{job['id']}/runs"
+        print(f"Accessing: {url}")
+        runs = []
+        for run in pagination.paginate(url, "job_runs", api_key=api_key, page_size=page_size, cache=use_cache):
+            if matches(run):
+                run.setdefault('job_id', job['id'])
+                if job.get('name') is not None:
+                    run['job_name'] = job['name']
+                runs.append(run)
+        return runs
+
+    # Send the requests over the shared connection pool
     try:
-        response = subprocess.run(
-            curl_command,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if response.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to execute curl command: {response.stderr}",
-                "data": None
-            }
-
-        try:
-            data = json.loads(response.stdout)
-            return {
-                "success": True,
-                "message": "Successfully listed job runs",
-                "data": data
-            }
-        except json.JSONDecodeError:
-            return {
-                "success": False,
-                "message": f"Failed to parse response as JSON: {response.stdout}",
-                "data": None
-            }
-    except subprocess.SubprocessError as e:
+        if job_id:
+            runs = job_runs({"id": job_id})
+            failed_jobs = []
+        else:
+            jobs = list(pagination.paginate(jobs_url, "jobs", api_key=api_key, cache=use_cache))
+            print(f"Listing runs of {len(jobs)} jobs")
+
+            # Bulk lane: one listing per job should not hold up interactive calls
+            @transport.in_bulk
+            def fetch(job):
+                try:
+                    return job, job_runs(job), None
+                except (requests.RequestException, ValueError) as e:
+                    return job, [], str(e)
+
+            runs = []
+            failed_jobs = []
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+                    for job, job_run_list, error in executor.map(fetch, jobs):
+                        runs.extend(job_run_list)
+                        if error:
+                            failed_jobs.append({"id": job.get('id'), "name": job.get('name'), "error": error})
+
+        # Newest first; runs without a creation time go last
+        runs.sort(key=lambda run: parse_remote_time(run.get('created_at')) or float('-inf'), reverse=True)
+        runs, truncated = pagination.take(runs, limit)
+
+        result = {
+            "success": not failed_jobs,
+            "message": (f"Found {len(runs)} job runs" if not failed_jobs else
+                        f"Found {len(runs)} job runs, but could not list the runs of {len(failed_jobs)} jobs"),
+            "data": {"job_runs": runs},
+            "count": len(runs),
+            "truncated": truncated
+        }
+        if not job_id:
+            result["failed_jobs"] = failed_jobs
+        return result
+    except json.JSONDecodeError as e:
+        return {
+            "success": False,
+            "message": f"Failed to parse response as JSON: {str(e)}",
+            "data": None
+        }
+    except requests.RequestException as e:
         return {
             "success": False,
-            "message": f"Failed to execute curl command: {str(e)}",
+            "message": f"Failed to send request: {str(e)}",
             "data": None
         }
     except Exception as e:
@@ -122,4 +226,4 @@ def list_job_runs(config, params=None):
             "success": False,
             "message": f"An unexpected error occurred: {str(e)}",
             "data": None
-        } 
\ No newline at end of file
+        }
@@ -4,6 +4,8 @@ import requests
 from typing import Dict, Any
 from datetime import datetime
 
+from .. import pagination
+
 
 def list_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -11,10 +13,13 @@ def list_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         config: MCP configuration
-        params: Function parameters (unused)
+        params: Function parameters
+            - limit: Maximum number of jobs to return (default: all)
+            - page_size: Jobs fetched per API request (default: 100)
+            - bypass_cache: Fetch a fresh list instead of a cached response (default: False)
         
     Returns:
-        Dictionary containing list of jobs
+        Dictionary containing list of jobs; truncated is True if more jobs exist beyond limit
     """
     try:
         project_id = config.get("project_id")
@@ -42,14 +47,14 @@ def list_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
             "Content-Type": "application/json"
         }
         
+        limit, page_size = pagination.parse_limits(params)
+        
         print(f"Making request to: {url}")  # Debug output
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        jobs = pagination.paginate(url, "jobs", headers=headers, page_size=page_size,
+                                   cache=not params.get("bypass_cache"))
+        jobs, truncated = pagination.take(jobs, limit)
         
         # Format jobs for easier consumption
-        jobs_data = response.json()
-        jobs = jobs_data.get("jobs", [])
-        
         formatted_jobs = []
         for job in jobs:
             # Format date for better readability
@@ -79,7 +84,8 @@ def list_jobs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
             "success": True,
             "message": f"Found {len(formatted_jobs)} jobs",
             "jobs": formatted_jobs,
-            "count": len(formatted_jobs)
+            "count": len(formatted_jobs),
+            "truncated": truncated
         }
     except requests.exceptions.RequestException as e:
         return {
@@ -2,8 +2,10 @@
 
 import json
 import os
-import subprocess
 from urllib.parse import urlparse
+import requests
+
+from .. import pagination
 
 
 def list_model_deployments(config, params=None):
@@ -17,13 +19,17 @@ def list_model_deployments(config, params=None):
                 If not provided, it will be taken from the configuration.
             - model_id (str, optional): If provided, only list deployments for this specific model.
             - build_id (str, optional): If provided, only list deployments for this specific build.
+            - limit (int, optional): Maximum number of model deployments to return (default: all).
+            - page_size (int, optional): Model deployments fetched per API request (default: 100).
 
     Returns:
         dict: Response with the following structure:
             {
                 "success": bool,
                 "message": str,
-                "data": list  # List of model deployment objects if successful, otherwise None
+                "data": dict,  # {"model_deployments": [...]} if successful, otherwise None
+                "count": int,
+                "truncated": bool  # True if more records exist beyond limit
             }
     """
     params = params or {}
@@ -66,48 +72,28 @@ def list_model_deployments(config, params=None):
     
     print(f"Accessing: {url}")
 
-    # Prepare the curl command
-    curl_command = [
-        'curl', '-s',
-        '-X', 'GET',
-        '-H', f"Authorization: Bearer {config.get('api_key', '')}",
-        '-H', 'Content-Type: application/json',
-        url
-    ]
-
-    # Execute the curl command
+    # Page through the list over the shared connection pool
     try:
-        response = subprocess.run(
-            curl_command,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if response.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to execute curl command: {response.stderr}",
-                "data": None
-            }
-
-        try:
-            data = json.loads(response.stdout)
-            return {
-                "success": True,
-                "message": "Successfully listed model deployments",
-                "data": data
-            }
-        except json.JSONDecodeError:
-            return {
-                "success": False,
-                "message": f"Failed to parse response as JSON: {response.stdout}",
-                "data": None
-            }
-    except subprocess.SubprocessError as e:
+        limit, page_size = pagination.parse_limits(params)
+        records = pagination.paginate(url, "model_deployments", api_key=config.get('api_key', ''), page_size=page_size)
+        records, truncated = pagination.take(records, limit)
+        return {
+            "success": True,
+            "message": "Successfully listed model deployments",
+            "data": {"model_deployments": records},
+            "count": len(records),
+            "truncated": truncated
+        }
+    except json.JSONDecodeError as e:
+        return {
+            "success": False,
+            "message": f"Failed to parse response as JSON: {str(e)}",
+            "data": None
+        }
+    except requests.RequestException as e:
         return {
             "success": False,
-            "message": f"Failed to execute curl command: {str(e)}",
+            "message": f"Failed to send request: {str(e)}",
             "data": None
         }
     except Exception as e:
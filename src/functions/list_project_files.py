@@ -4,6 +4,8 @@ import json
 import requests
 from urllib.parse import urlparse, quote
 
+from .. import transport
+
 
 def list_project_files(config, params):
     """
@@ -15,6 +17,7 @@ def list_project_files(config, params):
             - project_id (str): ID of the project to list files from. Required.
             - path (str, optional): Path to list files from (relative to project root).
                 Default is empty string (project root).
+            - bypass_cache (bool, optional): Fetch a fresh listing instead of a cached response
 
     Returns:
         dict: Response with the following structure:
@@ -89,7 +92,7 @@ def list_project_files(config, params):
             url = url.lstrip("http://").lstrip("/")
             url = "https://" + url
         print(f"URL: {url}")
-        response = requests.get(url, headers=headers, timeout=30)
+        response = transport.request("GET", url, headers=headers, timeout=30, cache=not params.get("bypass_cache"))
         
         # Check if request was successful
         if response.status_code == 200:
@@ -2,8 +2,126 @@
 
 import json
 import os
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
+import requests
+
+from .. import transport
+
+# Largest request body sent in one run-batch request, in bytes
+MAX_BATCH_BYTES = 1024 * 1024
+
+# Largest number of run updates sent in one run-batch request
+MAX_BATCH_RUNS = 100
+
+# Chunks sent at once unless the caller asks for another number
+DEFAULT_CONCURRENCY = 4
+
+# Run update fields that hold values and can be split across chunks
+VALUE_FIELDS = ("metrics", "parameters", "tags")
+
+
+def _encoded_size(value):
+    return len(json.dumps(value))
+
+
+def split_run_update(update, max_bytes):
+    """
+    Split one run update whose JSON is larger than max_bytes into smaller updates of the same run
+
+    Args:
+        update (dict): Run update with id and metrics, parameters and/or tags
+        max_bytes (int): Largest encoded size of each piece
+
+    Returns:
+        list: Run updates with the same id that together hold every value, in order
+    """
+    if _encoded_size(update) <= max_bytes:
+        return [update]
+    base = {key: value for key, value in update.items() if key not in VALUE_FIELDS}
+    pieces = []
+    piece = dict(base)
+    size = _encoded_size(base)
+    for field in VALUE_FIELDS:
+        values = update.get(field)
+        if not values:
+            continue
+        items = values if isinstance(values, list) else list(values.items())
+        for item in items:
+            # Upper bound of the item's share of the encoded piece, field name included
+            item_size = _encoded_size(item) + len(field) + 8
+            if size + item_size > max_bytes and len(piece) > len(base):
+                pieces.append(piece)
+                piece = dict(base)
+                size = _encoded_size(base)
+            if isinstance(values, list):
+                piece.setdefault(field, []).append(item)
+            else:
+                piece.setdefault(field, {})[item[0]] = item[1]
+            size += item_size
+    pieces.append(piece)
+    return pieces
+
+
+def _plan_chunks(run_updates, max_bytes, max_runs):
+    """Chunks of (index of the original update, piece) pairs, see chunk_run_updates()"""
+    # Room for the {"runs": [...]} envelope
+    budget = max_bytes - len('{"runs": []}')
+    chunks = []
+    chunk, size = [], 0
+    for index, update in enumerate(run_updates):
+        for piece in split_run_update(update, budget):
+            piece_size = _encoded_size(piece) + 2
+            if chunk and (size + piece_size > budget or len(chunk) >= max_runs):
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append((index, piece))
+            size += piece_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def chunk_run_updates(run_updates, max_bytes=MAX_BATCH_BYTES, max_runs=MAX_BATCH_RUNS):
+    """
+    Split run updates into request-sized chunks
+
+    Args:
+        run_updates (list): Run updates in the order they should be applied
+        max_bytes (int): Largest encoded request body per chunk
+        max_runs (int): Largest number of run updates per chunk
+
+    Returns:
+        list: Chunks (lists of run updates); updates larger than max_bytes are split by value
+    """
+    return [[piece for _, piece in chunk] for chunk in _plan_chunks(run_updates, max_bytes, max_runs)]
+
+
+def _chunk_dependencies(chunks):
+    """
+    For each chunk, the earlier chunks it must wait for
+
+    A chunk waits for every chunk holding the previous update of each of
+    its runs. Pieces of one split update hold different values, so they
+    need no order among themselves.
+    """
+    dependencies = []
+    current = {}   # run id -> (index of its latest update, chunks holding it)
+    previous = {}  # run id -> chunks holding the update before that
+    for chunk_index, chunk in enumerate(chunks):
+        waits = set()
+        for index, piece in chunk:
+            run_id = piece.get('id')
+            latest = current.get(run_id)
+            if latest is None or latest[0] < index:
+                previous[run_id] = latest[1] if latest else set()
+                latest = current[run_id] = (index, set())
+            latest[1].add(chunk_index)
+            waits |= previous[run_id]
+        # Updates within one chunk are applied in list order
+        waits.discard(chunk_index)
+        dependencies.append(sorted(waits))
+    return dependencies
 
 
 def log_experiment_run_batch(config, params=None):
@@ -21,13 +139,23 @@ def log_experiment_run_batch(config, params=None):
                 - metrics (dict, optional): Dictionary of metrics to log
                 - parameters (dict, optional): Dictionary of parameters to log
                 - tags (list, optional): List of tags to add to the run
+            - max_batch_bytes (int, optional): Largest request body in bytes (default: 1 MiB).
+            - max_batch_runs (int, optional): Largest number of run updates per request (default: 100).
+            - concurrency (int, optional): Requests sent at once (default: 4).
+
+    Large lists are split into chunks by size and run count and the chunks
+    are sent in parallel. Updates of the same run are still applied in
+    order: a chunk waits for the chunks with the previous update of each
+    of its runs.
 
     Returns:
         dict: Response with the following structure:
             {
                 "success": bool,
                 "message": str,
-                "data": dict  # Result data if successful, otherwise None
+                "data": dict,  # Result data if successful, otherwise None;
+                               # {"chunks": [...]} with one result per chunk when the list was split
+                "runs": list  # {"id", "success", "chunks", "error"} for each run
             }
     """
     params = params or {}
@@ -74,62 +202,112 @@ def log_experiment_run_batch(config, params=None):
 
     host = host.rstrip('/')
 
+    try:
+        max_bytes = int(params.get('max_batch_bytes') or MAX_BATCH_BYTES)
+        max_runs = int(params.get('max_batch_runs') or MAX_BATCH_RUNS)
+        concurrency = int(params.get('concurrency') or DEFAULT_CONCURRENCY)
+        if max_bytes < 1024 or max_runs < 1 or concurrency < 1:
+            raise ValueError("max_batch_bytes must be at least 1024, max_batch_runs and concurrency at least 1")
+    except (TypeError, ValueError) as e:
+        return {
+            "success": False,
+            "message": str(e),
+            "data": None
+        }
+
     # Build the API URL
     url = f"{host}/api/v2/projects/{project_id}/experiments/{experiment_id}/run-batch"
     
     print(f"Accessing: {url}")
 
-    # Prepare the request payload
-    payload = json.dumps({"runs": run_updates})
+    def send(chunk):
+        """Send one chunk of run updates"""
+        # Prepare the request payload
+        payload = json.dumps({"runs": chunk})
+
+        # Send the request over the shared connection pool
+        try:
+            response = transport.request("POST", url, api_key=config.get('api_key', ''), data=payload)
 
-    # Prepare the curl command
-    curl_command = [
-        'curl', '-s',
-        '-X', 'POST',
-        '-H', f"Authorization: Bearer {config.get('api_key', '')}",
-        '-H', 'Content-Type: application/json',
-        '-d', payload,
-        url
-    ]
+            # Error responses often carry a JSON body too; they still failed
+            if response.status_code >= 400:
+                return {
+                    "success": False,
+                    "message": f"API error: HTTP {response.status_code} {response.text.strip()[:200]}",
+                    "data": None
+                }
 
-    # Execute the curl command
-    try:
-        response = subprocess.run(
-            curl_command,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if response.returncode != 0:
+            try:
+                data = json.loads(response.text)
+                return {
+                    "success": True,
+                    "message": "Successfully logged batch updates to experiment runs",
+                    "data": data
+                }
+            except json.JSONDecodeError:
+                return {
+                    "success": False,
+                    "message": f"Failed to parse response as JSON: {response.text}",
+                    "data": None
+                }
+        except requests.RequestException as e:
             return {
                 "success": False,
-                "message": f"Failed to execute curl command: {response.stderr}",
+                "message": f"Failed to send request: {str(e)}",
                 "data": None
             }
-
-        try:
-            data = json.loads(response.stdout)
-            return {
-                "success": True,
-                "message": "Successfully logged batch updates to experiment runs",
-                "data": data
-            }
-        except json.JSONDecodeError:
+        except Exception as e:
             return {
                 "success": False,
-                "message": f"Failed to parse response as JSON: {response.stdout}",
+                "message": f"An unexpected error occurred: {str(e)}",
                 "data": None
             }
-    except subprocess.SubprocessError as e:
-        return {
-            "success": False,
-            "message": f"Failed to execute curl command: {str(e)}",
-            "data": None
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"An unexpected error occurred: {str(e)}",
-            "data": None
-        } 
\ No newline at end of file
+
+    plan = _plan_chunks(run_updates, max_bytes, max_runs)
+    chunks = [[piece for _, piece in chunk] for chunk in plan]
+    if len(chunks) == 1:
+        results = [send(chunks[0])]
+    else:
+        print(f"Sending {len(run_updates)} run updates in {len(chunks)} chunks")
+        # The pool starts chunks in order, so the chunks one waits for are already
+        # running or done, and the wait cannot deadlock
+        futures = []
+
+        # Bulk lane: a backfill's requests should not hold up interactive calls
+        @transport.in_bulk
+        def send_after(chunk, earlier):
+            for future in earlier:
+                future.result()
+            return send(chunk)
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            for chunk, waits in zip(chunks, _chunk_dependencies(plan)):
+                futures.append(executor.submit(send_after, chunk, [futures[i] for i in waits]))
+            results = [future.result() for future in futures]
+
+    # One entry per run: failed if any chunk with its updates failed
+    runs = {}
+    for chunk, result in zip(chunks, results):
+        for run_id in dict.fromkeys(update.get('id') for update in chunk):
+            entry = runs.setdefault(run_id, {"id": run_id, "success": True, "chunks": 0})
+            entry["chunks"] += 1
+            if not result["success"]:
+                entry["success"] = False
+                entry["error"] = result["message"]
+
+    if len(results) == 1:
+        return dict(results[0], runs=list(runs.values()))
+
+    failed = [result for result in results if not result["success"]]
+    failed_runs = sum(1 for entry in runs.values() if not entry["success"])
+    if failed:
+        message = (f"{len(failed)} of {len(chunks)} chunks failed, {failed_runs} of {len(runs)} runs "
+                   f"not fully logged: {failed[0]['message']}")
+    else:
+        message = f"Successfully logged batch updates to {len(runs)} experiment runs in {len(chunks)} chunks"
+    return {
+        "success": not failed,
+        "message": message,
+        "data": {"chunks": [result["data"] for result in results]},
+        "runs": list(runs.values())
+    }
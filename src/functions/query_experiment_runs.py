@@ -0,0 +1,74 @@
+"""
+Query the experiment runs in the local run store
+"""
+import os
+from typing import Dict, Any
+
+from ..run_store import RunStore, store_path, DEFAULT_QUERY_LIMIT
+
+
+def query_experiment_runs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Find experiment runs in the local run store, without calling the API
+
+    Sync the project with sync_experiment_runs first; the result says when
+    that last happened.
+
+    Args:
+        config: MCP configuration with host
+        params: Query parameters:
+            - project_id: ID of the project (optional if in config)
+            - experiment_id: Only runs of this experiment (optional)
+            - status: Run status, or a list of statuses (optional)
+            - tags: Tag names, or a {name: value} dict, the runs must have (optional)
+            - params: {name: value} parameters the runs must have (optional)
+            - metric: Only runs with this metric; metric_min, metric_max and order apply to it
+            - metric_min: Lowest metric value, inclusive (optional)
+            - metric_max: Highest metric value, inclusive (optional)
+            - order: "asc" or "desc" to sort by the metric (default: newest runs first)
+            - limit: Runs returned at most (default: 100)
+            - store_path: SQLite file to query (default: one per host under ~/.cloudera_ml_mcp)
+
+    Returns:
+        Dict with success flag, message, total matches, the matching runs
+        and the time of the project's last sync
+    """
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required either in config or params"}
+
+    path = params.get("store_path") or store_path(config.get("host", ""))
+    if not os.path.exists(path):
+        return {"success": False, "message": f"No run store at {path}; call sync_experiment_runs first"}
+
+    status = params.get("status")
+    if isinstance(status, str):
+        status = [item.strip() for item in status.split(",") if item.strip()]
+    tags = params.get("tags")
+    if isinstance(tags, str):
+        tags = [item.strip() for item in tags.split(",") if item.strip()]
+
+    try:
+        limit = int(params["limit"]) if params.get("limit") is not None else DEFAULT_QUERY_LIMIT
+        with RunStore(path) as store:
+            synced_at = store.last_synced(project_id)
+            if synced_at is None:
+                return {"success": False,
+                        "message": f"Project {project_id} was never synced; call sync_experiment_runs first"}
+            result = store.query_runs(project_id=project_id, experiment_id=params.get("experiment_id"),
+                                      status=status, tags=tags, params=params.get("params"),
+                                      metric=params.get("metric"), metric_min=params.get("metric_min"),
+                                      metric_max=params.get("metric_max"), order=params.get("order"),
+                                      limit=limit)
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+    except Exception as e:
+        return {"success": False, "message": f"Error querying run store: {str(e)}"}
+
+    return {
+        "success": True,
+        "message": f"Found {result['total']} runs, returning {len(result['runs'])}",
+        "total": result["total"],
+        "runs": result["runs"],
+        "synced_at": synced_at
+    }
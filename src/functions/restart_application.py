@@ -2,8 +2,10 @@
 
 import json
 import os
-import subprocess
 from urllib.parse import urlparse
+import requests
+
+from .. import transport
 
 
 def restart_application(config, params=None):
@@ -66,33 +68,12 @@ def restart_application(config, params=None):
     
     print(f"Accessing: {url}")
 
-    # Prepare the curl command
-    curl_command = [
-        'curl', '-s',
-        '-X', 'POST',
-        '-H', f"Authorization: Bearer {config.get('api_key', '')}",
-        '-H', 'Content-Type: application/json',
-        url
-    ]
-
-    # Execute the curl command
+    # Send the request over the shared connection pool
     try:
-        response = subprocess.run(
-            curl_command,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if response.returncode != 0:
-            return {
-                "success": False,
-                "message": f"Failed to execute curl command: {response.stderr}",
-                "data": None
-            }
+        response = transport.request("POST", url, api_key=config.get('api_key', ''))
 
         try:
-            data = json.loads(response.stdout)
+            data = json.loads(response.text)
             return {
                 "success": True,
                 "message": f"Successfully restarted application {application_id}",
@@ -101,13 +82,13 @@ def restart_application(config, params=None):
         except json.JSONDecodeError:
             return {
                 "success": False,
-                "message": f"Failed to parse response as JSON: {response.stdout}",
+                "message": f"Failed to parse response as JSON: {response.text}",
                 "data": None
             }
-    except subprocess.SubprocessError as e:
+    except requests.RequestException as e:
         return {
             "success": False,
-            "message": f"Failed to execute curl command: {str(e)}",
+            "message": f"Failed to send request: {str(e)}",
             "data": None
         }
     except Exception as e:
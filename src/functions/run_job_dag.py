@@ -0,0 +1,67 @@
+"""Run jobs in dependency order for Cloudera ML MCP"""
+
+from typing import Dict, Any
+
+from .. import job_watcher
+from ..job_dag import JobDag
+
+# Seconds the whole DAG may take unless the caller gives a timeout
+DEFAULT_TIMEOUT = 3600
+
+# Runs at a time unless the caller asks for another number
+DEFAULT_MAX_PARALLEL = 4
+
+
+def run_job_dag(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a DAG of jobs, starting each job as soon as the jobs it depends on have succeeded
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Function parameters
+            - nodes: List of {"name", "job_id", "depends_on": [names], "environment_variables",
+              "override_config", "runtime_identifier", "retries"}; name and job_id are required
+            - project_id: ID of the project (optional if in config)
+            - max_parallel: Largest number of runs at a time (default: 4)
+            - retries: Times a failed node is run again, unless the node sets its own (default: 0)
+            - fail_fast: Stop all running nodes once one has failed for good (default: False)
+            - node_timeout: Seconds a single run may take before it is stopped (optional)
+            - timeout: Seconds the whole DAG may take (default: 3600)
+            - max_interval: Longest time between status checks of a run in seconds (default: 30)
+            - cancel: Optional threading.Event; setting it stops running nodes and cancels the rest
+
+    Returns:
+        Per-node state, run IDs and timings, the critical path and the makespan;
+        success is True if every node succeeded
+    """
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required either in config or params"}
+
+    try:
+        dag = JobDag(
+            config, project_id, params.get("nodes") or [],
+            max_parallel=int(params.get("max_parallel") or DEFAULT_MAX_PARALLEL),
+            retries=int(params.get("retries") or 0),
+            fail_fast=bool(params.get("fail_fast")),
+            node_timeout=float(params["node_timeout"]) if params.get("node_timeout") else None,
+            initial_interval=float(params.get("initial_interval") or job_watcher.INITIAL_INTERVAL),
+            max_interval=float(params.get("max_interval") or job_watcher.MAX_INTERVAL)
+        )
+        timeout = float(params["timeout"]) if params.get("timeout") is not None else DEFAULT_TIMEOUT
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+
+    report = dag.run(timeout=timeout, cancel=params.get("cancel"))
+    counts = report["state_counts"]
+    succeeded = counts.get("SUCCEEDED", 0)
+    message = f"{succeeded} of {len(report['nodes'])} nodes succeeded"
+    others = [f"{count} {state.lower()}" for state, count in counts.items() if state != "SUCCEEDED"]
+    if others:
+        message += f" ({', '.join(others)})"
+
+    return {
+        "success": succeeded == len(report["nodes"]),
+        "message": message,
+        **report
+    }
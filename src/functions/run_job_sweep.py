@@ -0,0 +1,163 @@
+"""Parameter sweep over runs of one job for Cloudera ML MCP"""
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+
+from .. import transport
+from .create_job_run import create_job_run
+from .wait_for_job_run import wait_for_job_run, DEFAULT_TIMEOUT
+
+# Runs submitted at once unless the caller asks for another number
+DEFAULT_CONCURRENCY = 4
+
+# Largest sweep accepted, so a mistyped grid cannot start thousands of runs
+MAX_VARIANTS = 200
+
+
+def expand_variants(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build the list of run variants from a grid and/or explicit variants
+
+    Args:
+        params: Function parameters
+            - grid: Dict of environment variable name to list of values; every combination is a variant
+            - variants: List of dicts with environment_variables and/or override_config
+
+    Returns:
+        Variants, each with environment_variables and override_config (grid variants first)
+
+    Raises:
+        ValueError: If there are no variants, too many, or they are malformed
+    """
+    variants = []
+    grid = params.get("grid") or {}
+    if not isinstance(grid, dict) or not all(isinstance(values, list) and values for values in grid.values()):
+        raise ValueError("grid must map each environment variable to a non-empty list of values")
+    if grid:
+        names = list(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            variants.append({
+                "environment_variables": {name: str(value) for name, value in zip(names, values)},
+                "override_config": {}
+            })
+
+    for variant in params.get("variants") or []:
+        if not isinstance(variant, dict) or not set(variant) <= {"environment_variables", "override_config"}:
+            raise ValueError("each variant must be a dict with environment_variables and/or override_config")
+        variants.append({
+            "environment_variables": {name: str(value) for name, value in
+                                      (variant.get("environment_variables") or {}).items()},
+            "override_config": dict(variant.get("override_config") or {})
+        })
+
+    if not variants:
+        raise ValueError("grid or variants is required")
+    max_variants = int(params.get("max_variants") or MAX_VARIANTS)
+    if len(variants) > max_variants:
+        raise ValueError(f"Sweep has {len(variants)} variants, more than max_variants ({max_variants})")
+    return variants
+
+
+def run_job_sweep(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Start one run of a job per variant and wait for all of them to finish
+
+    Runs are submitted concurrently (at most `concurrency` at a time),
+    then tracked together by the shared job run poller.
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Function parameters
+            - job_id: ID of the job to run
+            - project_id: ID of the project (optional if in config)
+            - grid, variants: Variants to run, see expand_variants()
+            - environment_variables: Environment variables for every run; variants override them
+            - override_config: Configuration overrides for every run; variants override them
+            - runtime_identifier: Runtime for every run (optional)
+            - max_variants: Largest number of runs to start (default: 200)
+            - concurrency: Number of runs submitted in parallel (default: 4)
+            - wait: Wait for the runs to finish (default: True)
+            - timeout: Seconds to wait for all runs (default: 600)
+            - max_interval: Longest time between status checks in seconds (default: 30)
+
+    Returns:
+        One row per variant with run_id, variant and final status, plus a count per status;
+        success is True if every run was started and, when waiting, finished in time
+    """
+    job_id = params.get("job_id")
+    project_id = params.get("project_id") or config.get("project_id")
+    if not job_id or not project_id:
+        return {"success": False, "message": "job_id and project_id are required"}
+
+    try:
+        variants = expand_variants(params)
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+
+    base_environment = params.get("environment_variables") or {}
+    base_override = params.get("override_config") or {}
+
+    # Bulk lane: a sweep's submissions should not hold up interactive calls
+    @transport.in_bulk
+    def submit(variant):
+        run_params = {
+            "project_id": project_id,
+            "job_id": job_id,
+            "environment_variables": dict(base_environment, **variant["environment_variables"]),
+            "runtime_identifier": params.get("runtime_identifier")
+        }
+        override_config = dict(base_override, **variant["override_config"])
+        if override_config:
+            run_params["override_config"] = override_config
+        return create_job_run(config, run_params)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(variants))) as executor:
+        submissions = list(executor.map(submit, variants))
+
+    rows = []
+    for variant, submission in zip(variants, submissions):
+        row = {"run_id": None, "variant": {key: value for key, value in variant.items() if value}, "status": None}
+        if submission.get("success"):
+            row["run_id"] = submission["data"].get("id")
+            row["status"] = submission["data"].get("status")
+        else:
+            row["error"] = submission.get("message")
+        rows.append(row)
+    started = [row for row in rows if row["run_id"]]
+
+    wait_result = None
+    if params.get("wait", True) and started:
+        wait_result = wait_for_job_run(config, {
+            "project_id": project_id,
+            "runs": [{"job_id": job_id, "run_id": row["run_id"]} for row in started],
+            "timeout": params.get("timeout") if params.get("timeout") is not None else DEFAULT_TIMEOUT,
+            "max_interval": params.get("max_interval")
+        })
+        for row, summary in zip(started, wait_result.get("runs", [])):
+            row["status"] = summary["status"]
+            if summary.get("error"):
+                row["error"] = summary["error"]
+
+    status_counts: Dict[str, int] = {}
+    for row in rows:
+        status = row["status"] or ("NOT_STARTED" if not row["run_id"] else "UNKNOWN")
+        status_counts[status] = status_counts.get(status, 0) + 1
+
+    not_started = len(rows) - len(started)
+    finished = wait_result is None or wait_result.get("success", False)
+    message = f"Started {len(started)} of {len(rows)} runs of job {job_id}"
+    if wait_result is not None:
+        message += f"; {wait_result.get('message')}"
+
+    return {
+        "success": not not_started and finished,
+        "message": message,
+        "job_id": job_id,
+        "succeeded": status_counts.get("ENGINE_SUCCEEDED", 0) == len(rows),
+        "status_counts": status_counts,
+        "runs": rows
+    }
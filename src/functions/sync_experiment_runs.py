@@ -0,0 +1,61 @@
+"""
+Sync the experiments and runs of a Cloudera ML project into the local run store
+"""
+from typing import Dict, Any
+
+from ..run_store import RunStore, store_path, DEFAULT_CONCURRENCY
+
+
+def sync_experiment_runs(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bring the local run store of a project up to date
+
+    Only runs that are new, changed status, were still running, or started
+    or ended since the last sync are fetched and written; see run_store.RunStore.
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Parameters for the API call:
+            - project_id: ID of the project (optional if in config)
+            - experiment_ids: Only sync the runs of these experiments (default: all)
+            - full: Re-read every run, ignoring the last sync (default: False)
+            - concurrency: Experiments listed, and runs fetched, in parallel (default: 8)
+            - store_path: SQLite file to sync into (default: one per host under ~/.cloudera_ml_mcp)
+
+    Returns:
+        Dict with success flag, message, the store path, and the numbers of experiments
+        synced and runs added, updated, removed, unchanged and fetched
+    """
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required either in config or params"}
+
+    if not config.get("host"):
+        return {"success": False, "message": "Missing host in configuration"}
+
+    experiment_ids = params.get("experiment_ids")
+    if isinstance(experiment_ids, str):
+        experiment_ids = [item.strip() for item in experiment_ids.split(",") if item.strip()]
+
+    try:
+        concurrency = int(params.get("concurrency") or DEFAULT_CONCURRENCY)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+    except (TypeError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+
+    path = params.get("store_path") or store_path(config["host"])
+    try:
+        with RunStore(path) as store:
+            counts = store.sync(config, project_id, experiment_ids=experiment_ids or None,
+                                full=bool(params.get("full")), concurrency=concurrency)
+    except Exception as e:
+        return {"success": False, "message": f"Error syncing experiment runs: {str(e)}", "store_path": path}
+
+    return dict({
+        "success": True,
+        "message": f"Synced {counts['experiments']} experiments: {counts['added']} runs added, "
+                   f"{counts['updated']} updated, {counts['removed']} removed, "
+                   f"{counts['unchanged']} unchanged",
+        "store_path": path
+    }, **counts)
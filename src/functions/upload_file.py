@@ -1,10 +1,69 @@
 """Upload file function for Cloudera ML MCP"""
 
 import os
-import time
+import tempfile
+import posixpath
 import requests
 from typing import Dict, Any
 
+from .. import transport
+from .. import upload_journal
+from ..multipart import MultipartFileStream
+from .create_job import create_job
+from .create_job_run import create_job_run
+from .wait_for_job_run import wait_for_job_run
+from .delete_job import delete_job
+from .list_project_files import list_project_files
+
+
+# Default size of each part in chunked mode
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+
+# Longest time between status checks of the reassembly job, and how long to wait for it
+ASSEMBLY_POLL_INTERVAL = 5
+DEFAULT_ASSEMBLY_TIMEOUT = 3600
+
+# Script run as a job inside the project to join the parts and verify the result
+ASSEMBLER_SCRIPT = """\
+# Reassembles a chunked upload made by the Cloudera ML MCP upload_file tool
+import hashlib
+import os
+import shutil
+import sys
+
+PARTS_DIR = {parts_dir!r}
+TARGET_PATH = {target_path!r}
+PART_COUNT = {part_count}
+SIZE = {size}
+SHA256 = {sha256!r}
+
+# Project files are mounted at /home/cdsw inside the job
+os.chdir("/home/cdsw")
+
+digest = hashlib.sha256()
+temp_path = TARGET_PATH + ".assembling"
+with open(temp_path, "wb") as target:
+    for index in range(PART_COUNT):
+        part_path = os.path.join(PARTS_DIR, "part-%05d" % index)
+        if not os.path.isfile(part_path):
+            os.remove(temp_path)
+            sys.exit("Missing part: " + part_path)
+        with open(part_path, "rb") as part:
+            for chunk in iter(lambda: part.read(1024 * 1024), b""):
+                digest.update(chunk)
+                target.write(chunk)
+
+size = os.path.getsize(temp_path)
+if size != SIZE or digest.hexdigest() != SHA256:
+    os.remove(temp_path)
+    sys.exit("Verification failed: got %d bytes with sha256 %s, expected %d bytes with sha256 %s"
+             % (size, digest.hexdigest(), SIZE, SHA256))
+
+os.replace(temp_path, TARGET_PATH)
+shutil.rmtree(PARTS_DIR)
+print("Assembled %s (%d bytes, sha256 %s)" % (TARGET_PATH, SIZE, SHA256))
+"""
+
 
 def upload_file_to_root(host, api_key, project_id, file_path, target_name=None, target_dir=None):
     """
@@ -37,24 +96,22 @@ def upload_file_to_root(host, api_key, project_id, file_path, target_name=None,
         # Setup the upload URL
         upload_url = f"{host}/api/v2/projects/{project_id}/files"
         
-        # Set the authorization header
+        # Stream the form data, with the target path as the field name, in fixed-size chunks
+        body = MultipartFileStream([(target_path, file_path)])
+        
+        # Set the authorization and multipart headers
         headers = {
-            "Authorization": f"Bearer {api_key}"
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": body.content_type
         }
         
-        # Open the file to upload
-        with open(file_path, 'rb') as file_data:
-            # Create the form data with the target path as the field name
-            files = {
-                target_path: file_data
-            }
-            
-            # Make the PUT request
-            response = requests.put(
-                upload_url,
-                headers=headers,
-                files=files
-            )
+        # Make the PUT request
+        response = transport.request(
+            "PUT",
+            upload_url,
+            headers=headers,
+            data=body
+        )
         
         # Check the response
         if response.status_code in (200, 201, 202, 204):
@@ -69,6 +126,260 @@ def upload_file_to_root(host, api_key, project_id, file_path, target_name=None,
         return False
 
 
+def upload_part(host, api_key, project_id, file_path, part_path, offset, length):
+    """
+    Upload one byte range of a local file as a separate project file
+    
+    Args:
+        host: CML host URL
+        api_key: API key for authentication
+        project_id: ID of the project to upload to
+        file_path: Full path to the local file
+        part_path: Path of the part in the project
+        offset: Position of the first byte of the part
+        length: Number of bytes in the part
+        
+    Returns:
+        Success/failure status
+    """
+    body = MultipartFileStream([(part_path, file_path, offset, length)])
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": body.content_type
+    }
+    
+    # Transient failures are retried by the transport; anything left is resumed on the next call
+    try:
+        response = transport.request(
+            "PUT",
+            f"{host}/api/v2/projects/{project_id}/files",
+            headers=headers,
+            data=body
+        )
+        if response.status_code in (200, 201, 202, 204):
+            return True
+        print(f"Failed to upload part {part_path}: {response.status_code} - {response.text}")
+    except requests.RequestException as e:
+        print(f"Error uploading part {part_path}: {str(e)}")
+    return False
+
+
+def list_remote_sizes(config, project_id, directory):
+    """
+    Get the sizes of the files in a project directory
+    
+    Args:
+        config: MCP configuration
+        project_id: ID of the project
+        directory: Directory relative to the project root
+        
+    Returns:
+        Mapping of file name to size, or None if the directory could not be listed
+    """
+    result = list_project_files(config, {"project_id": project_id, "path": directory, "bypass_cache": True})
+    if not result.get("success"):
+        return None
+    
+    sizes = {}
+    for entry in (result.get("data") or {}).get("files", []):
+        if entry.get("is_dir"):
+            continue
+        try:
+            sizes[posixpath.basename(entry.get("path", ""))] = int(entry.get("file_size"))
+        except (TypeError, ValueError):
+            continue
+    return sizes
+
+
+def assemble_parts(config, project_id, journal, parts_dir, runtime_identifier=None,
+                   timeout=DEFAULT_ASSEMBLY_TIMEOUT):
+    """
+    Join the uploaded parts into the target file by running a job in the project
+    
+    The project files API has no append or compose operation, so a small
+    script is uploaded next to the parts and run as a one-off job. It
+    concatenates the parts, checks the size and SHA-256 against the
+    journal, moves the result into place and removes the parts. The job is
+    deleted afterwards.
+    
+    Args:
+        config: MCP configuration
+        project_id: ID of the project
+        journal: Upload journal with target_path, part_count, size and sha256
+        parts_dir: Project directory holding the parts
+        runtime_identifier: Optional runtime for the job (default: create_job's default)
+        timeout: Seconds to wait for the job to finish
+        
+    Returns:
+        Tuple of (success, message)
+    """
+    host = config["host"]
+    script_path = posixpath.join(parts_dir, "assemble.py")
+    script = ASSEMBLER_SCRIPT.format(
+        parts_dir=parts_dir,
+        target_path=journal["target_path"],
+        part_count=journal["part_count"],
+        size=journal["size"],
+        sha256=journal["sha256"]
+    )
+    
+    # Upload the script the same way as a part, from a local temporary file
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as script_file:
+        script_file.write(script)
+        local_script = script_file.name
+    try:
+        uploaded = upload_part(host, config["api_key"], project_id, local_script, script_path,
+                               0, os.path.getsize(local_script))
+    finally:
+        os.remove(local_script)
+    if not uploaded:
+        return False, f"Failed to upload assembly script: {script_path}"
+    
+    job_params = {
+        "name": f"Assemble {journal['target_path']}",
+        "script": script_path
+    }
+    if runtime_identifier:
+        job_params["runtime_identifier"] = runtime_identifier
+    job_result = create_job(dict(config, project_id=project_id), job_params)
+    if not job_result.get("success"):
+        return False, f"Failed to create assembly job: {job_result.get('message')}"
+    job_id = job_result["job"].get("id")
+    
+    try:
+        run_result = create_job_run(config, {"project_id": project_id, "job_id": job_id})
+        if not run_result.get("success"):
+            return False, f"Failed to start assembly job: {run_result.get('message')}"
+        run_id = run_result["data"].get("id")
+        
+        wait_result = wait_for_job_run(config, {
+            "project_id": project_id, "job_id": job_id, "run_id": run_id,
+            "timeout": timeout, "max_interval": ASSEMBLY_POLL_INTERVAL
+        })
+        status = wait_result.get("status")
+        
+        if status != "ENGINE_SUCCEEDED":
+            return False, f"Assembly job {job_id} run {run_id} did not succeed (status: {status})"
+        return True, f"Assembly job {job_id} run {run_id} succeeded"
+    finally:
+        delete_job(config, {"project_id": project_id, "job_id": job_id})
+
+
+def upload_file_chunked(config, project_id, file_path, target_path, part_size=DEFAULT_PART_SIZE,
+                        journal_dir=None, runtime_identifier=None, assembly_timeout=DEFAULT_ASSEMBLY_TIMEOUT):
+    """
+    Upload a large file in parts that can be resumed after a failure
+    
+    Each part is uploaded as its own project file under a hidden
+    ".<name>.parts" directory next to the target, and recorded in a local
+    journal once the server acknowledges it. Calling again with the same
+    file and target skips the parts already in the journal (after checking
+    their remote sizes) and continues with the rest. Once every part is up,
+    the parts are joined into the target by a job in the project, which
+    verifies size and SHA-256, and the final size is checked with a listing.
+    
+    Args:
+        config: MCP configuration with a normalised host
+        project_id: ID of the project to upload to
+        file_path: Full path to the local file
+        target_path: Path of the file in the project
+        part_size: Size of each part in bytes
+        journal_dir: Optional directory to keep journals in (default: upload_journal.JOURNAL_DIR)
+        runtime_identifier: Optional runtime for the reassembly job
+        assembly_timeout: Seconds to wait for the reassembly job
+        
+    Returns:
+        Upload results
+    """
+    host = config["host"]
+    api_key = config["api_key"]
+    target_dir, target_file_name = posixpath.split(target_path)
+    parts_dir = posixpath.join(target_dir, f".{target_file_name}.parts")
+    
+    path = upload_journal.journal_path(host, project_id, file_path, target_path, journal_dir)
+    previous = upload_journal.load_journal(path)
+    journal = upload_journal.start_journal(file_path, target_path, part_size, previous)
+    resumed = len(journal["completed"])
+    
+    # Only trust journalled parts that are still on the server with the right size
+    if journal["completed"]:
+        remote_sizes = list_remote_sizes(config, project_id, parts_dir)
+        if remote_sizes is not None:
+            journal["completed"] = [
+                index for index in journal["completed"]
+                if remote_sizes.get(f"part-{index:05d}") == min(part_size, journal["size"] - index * part_size)
+            ]
+            resumed = len(journal["completed"])
+    upload_journal.save_journal(path, journal)
+    if resumed:
+        print(f"Resuming upload of {target_path}: {resumed}/{journal['part_count']} parts already uploaded")
+    
+    completed = set(journal["completed"])
+    uploaded = 0
+    for index in range(journal["part_count"]):
+        if index in completed:
+            continue
+        offset = index * part_size
+        length = min(part_size, journal["size"] - offset)
+        part_path = posixpath.join(parts_dir, f"part-{index:05d}")
+        with transport.bulk():
+            part_uploaded = upload_part(host, api_key, project_id, file_path, part_path, offset, length)
+        if not part_uploaded:
+            return {
+                "success": False,
+                "message": f"Failed to upload part {index + 1}/{journal['part_count']} of {target_path}; "
+                           f"call again to resume from this part",
+                "parts_uploaded": uploaded,
+                "parts_resumed": resumed,
+                "part_count": journal["part_count"],
+                "journal_path": path
+            }
+        completed.add(index)
+        journal["completed"] = sorted(completed)
+        upload_journal.save_journal(path, journal)
+        uploaded += 1
+        print(f"Uploaded part {index + 1}/{journal['part_count']} of {target_path}")
+    
+    assembled, message = assemble_parts(
+        config, project_id, journal, parts_dir,
+        runtime_identifier=runtime_identifier,
+        timeout=assembly_timeout
+    )
+    if not assembled:
+        return {
+            "success": False,
+            "message": f"All parts of {target_path} uploaded but reassembly failed: {message}; "
+                       f"call again to retry reassembly",
+            "parts_uploaded": uploaded,
+            "parts_resumed": resumed,
+            "part_count": journal["part_count"],
+            "journal_path": path
+        }
+    
+    remote_sizes = list_remote_sizes(config, project_id, target_dir)
+    if remote_sizes is not None and remote_sizes.get(target_file_name) != journal["size"]:
+        return {
+            "success": False,
+            "message": f"Reassembled {target_path} has size {remote_sizes.get(target_file_name)}, "
+                       f"expected {journal['size']}",
+            "parts_uploaded": uploaded,
+            "parts_resumed": resumed,
+            "part_count": journal["part_count"],
+            "journal_path": path
+        }
+    
+    upload_journal.remove_journal(path)
+    return {
+        "success": True,
+        "message": f"Successfully uploaded file in {journal['part_count']} parts: {target_path}",
+        "parts_uploaded": uploaded,
+        "parts_resumed": resumed,
+        "part_count": journal["part_count"],
+        "size": journal["size"],
+        "sha256": journal["sha256"]
+    }
+
+
 def upload_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Upload a single file to Cloudera ML
@@ -79,6 +390,12 @@ def upload_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any
             - file_path: Local path to the file to upload
             - target_name: Optional name to use for the uploaded file
             - target_dir: Optional directory to upload to
+            - chunked: Upload in resumable parts that are reassembled by a job in
+                the project (default: False); use for very large files
+            - part_size: Size of each part in bytes in chunked mode (default: 64 MiB)
+            - runtime_identifier: Optional runtime for the reassembly job in chunked mode
+            - journal_dir: Optional directory for the local upload journal in chunked mode
+            - assembly_timeout: Seconds to wait for the reassembly job (default: 3600)
             
     Returns:
         Upload results
@@ -114,6 +431,38 @@ def upload_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any
         # Remove trailing slash if present
         host = host.rstrip("/")
         
+        # Create the full target path for the response
+        target_filename = target_name or os.path.basename(file_path)
+        target_path = target_filename
+        if target_dir:
+            target_dir = target_dir.strip('/')
+            if target_dir:
+                target_path = f"{target_dir}/{target_filename}"
+        
+        if params.get("chunked"):
+            part_size = int(params.get("part_size") or DEFAULT_PART_SIZE)
+            if part_size <= 0:
+                raise ValueError("part_size must be positive")
+            print(f"Uploading file in parts of {part_size} bytes: {file_path}")
+            result = upload_file_chunked(
+                config=dict(config, host=host),
+                project_id=project_id,
+                file_path=file_path,
+                target_path=target_path,
+                part_size=part_size,
+                journal_dir=params.get("journal_dir"),
+                runtime_identifier=params.get("runtime_identifier"),
+                assembly_timeout=float(params.get("assembly_timeout") or DEFAULT_ASSEMBLY_TIMEOUT)
+            )
+            if result["success"]:
+                result.update({
+                    "file_path": file_path,
+                    "target_name": target_filename,
+                    "target_dir": target_dir or "",
+                    "target_path": target_path
+                })
+            return result
+        
         # Upload the file
         print(f"Uploading file: {file_path}")
         success = upload_file_to_root(
@@ -125,14 +474,6 @@ def upload_file(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any
             target_dir=target_dir
         )
         
-        # Create the full target path for the response
-        target_filename = target_name or os.path.basename(file_path)
-        target_path = target_filename
-        if target_dir:
-            target_dir = target_dir.strip('/')
-            if target_dir:
-                target_path = f"{target_dir}/{target_filename}"
-        
         if success:
             return {
                 "success": True,
@@ -3,12 +3,31 @@
 import os
 import json
 import time
-import datetime
+import posixpath
 from pathlib import Path
 import requests
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, Any, List, Optional
 import cmlapi
 
+from .. import transport
+from .. import manifest
+from ..utils import parse_remote_time
+from ..multipart import MultipartFileStream
+from .delete_project_file import delete_project_file
+from .list_project_files import list_project_files
+
+
+# Upper bound for parallel uploads; matches the transport's per-host connection pool
+MAX_UPLOAD_CONCURRENCY = transport.POOL_MAXSIZE
+
+# Minimum number of directories listed in parallel when building a remote index
+REMOTE_LISTING_CONCURRENCY = 8
+
+# Default limits for multi-file upload requests in batch mode
+DEFAULT_BATCH_MAX_FILES = 100
+DEFAULT_BATCH_MAX_BYTES = 8 * 1024 * 1024
+
 
 def setup_client(host, api_key):
     """
@@ -79,24 +98,22 @@ def upload_file_to_project(host, api_key, project_id, file_path, relative_path):
         # Setup the upload URL
         upload_url = f"{host}/api/v2/projects/{project_id}/files"
         
-        # Set the authorization header
+        # Stream the form data, with the target path as the field name, in fixed-size chunks
+        body = MultipartFileStream([(target_path, file_path)])
+        
+        # Set the authorization and multipart headers
         headers = {
-            "Authorization": f"Bearer {api_key}"
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": body.content_type
         }
         
-        # Open the file to upload
-        with open(file_path, 'rb') as file_data:
-            # Create the form data with the target path as the field name
-            files = {
-                target_path: file_data
-            }
-            
-            # Make the PUT request
-            response = requests.put(
-                upload_url,
-                headers=headers,
-                files=files
-            )
+        # Make the PUT request
+        response = transport.request(
+            "PUT",
+            upload_url,
+            headers=headers,
+            data=body
+        )
         
         # Check the response
         if response.status_code in (200, 201, 202, 204):
@@ -111,6 +128,208 @@ def upload_file_to_project(host, api_key, project_id, file_path, relative_path):
         return False
 
 
+def upload_files_to_project(host, api_key, project_id, file_entries):
+    """
+    Upload several files to Cloudera ML in a single multipart PUT request
+    
+    Args:
+        host: CML host URL
+        api_key: API key for authentication
+        project_id: ID of the project to upload to
+        file_entries: List of (file_path, relative_path) tuples
+        
+    Returns:
+        Success/failure status for the whole request
+    """
+    try:
+        # Setup the upload URL
+        upload_url = f"{host}/api/v2/projects/{project_id}/files"
+        
+        # Stream all files of the batch, each one a form field named after its target path
+        body = MultipartFileStream([
+            (str(relative_path), file_path)
+            for file_path, relative_path in file_entries
+        ])
+        
+        # Set the authorization and multipart headers
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": body.content_type
+        }
+        
+        # Make the PUT request
+        response = transport.request(
+            "PUT",
+            upload_url,
+            headers=headers,
+            data=body
+        )
+        
+        # Check the response
+        if response.status_code in (200, 201, 202, 204):
+            print(f"Successfully uploaded batch of {len(file_entries)} files")
+            return True
+        else:
+            print(f"Failed to upload batch of {len(file_entries)} files: {response.status_code} - {response.text}")
+            return False
+            
+    except Exception as e:
+        print(f"Error uploading batch of {len(file_entries)} files: {str(e)}")
+        return False
+
+
+def upload_batch(host, api_key, project_id, file_entries):
+    """
+    Upload a batch of files, bisecting a failed batch to isolate the bad files
+    
+    Args:
+        host: CML host URL
+        api_key: API key for authentication
+        project_id: ID of the project to upload to
+        file_entries: List of (file_path, relative_path) tuples
+        
+    Returns:
+        List of success/failure statuses, one per file
+    """
+    if upload_files_to_project(host, api_key, project_id, file_entries):
+        return [True] * len(file_entries)
+    if len(file_entries) == 1:
+        return [False]
+    
+    middle = len(file_entries) // 2
+    return (
+        upload_batch(host, api_key, project_id, file_entries[:middle]) +
+        upload_batch(host, api_key, project_id, file_entries[middle:])
+    )
+
+
+def make_batches(file_entries, max_files, max_bytes):
+    """
+    Group files into upload batches, keeping their order
+    
+    Args:
+        file_entries: List of (file_path, relative_path) tuples
+        max_files: Maximum number of files per batch
+        max_bytes: Maximum total size of a batch; larger files get a batch of their own
+        
+    Returns:
+        List of batches, each a list of (file_path, relative_path) tuples
+    """
+    batches = []
+    current_batch = []
+    current_bytes = 0
+    for file_entry in file_entries:
+        size = os.path.getsize(file_entry[0])
+        if current_batch and (len(current_batch) >= max_files or current_bytes + size > max_bytes):
+            batches.append(current_batch)
+            current_batch = []
+            current_bytes = 0
+        current_batch.append(file_entry)
+        current_bytes += size
+    if current_batch:
+        batches.append(current_batch)
+    return batches
+
+
+def run_tasks(task_func, tasks, concurrency):
+    """
+    Run a function over a list of tasks, in parallel when concurrency > 1
+    
+    Args:
+        task_func: Function called with each task
+        tasks: List of tasks
+        concurrency: Maximum number of tasks running at once
+        
+    Returns:
+        List of results in task order
+    """
+    # Folder uploads are bulk work; interactive calls get rate-limit tokens first
+    task_func = transport.in_bulk(task_func)
+    if concurrency > 1:
+        # Run with a bounded pool of workers sharing the keep-alive session
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(task_func, tasks))
+    
+    return [task_func(task) for task in tasks]
+
+
+def build_remote_index(config, project_id, relative_paths, concurrency):
+    """
+    Build an index of the remote files at the given project paths
+    
+    Directories are listed in parallel with list_project_files, and only
+    directories that contain one of the given paths are descended into.
+    
+    Args:
+        config: MCP configuration
+        project_id: ID of the project
+        relative_paths: POSIX paths, relative to the project root, to look up
+        concurrency: Maximum number of directories listed at once
+        
+    Returns:
+        Tuple of (mapping of path to {"size", "mtime"}, list of listing errors)
+    """
+    # Every directory on the way to a wanted file
+    wanted_dirs = set()
+    for relative_path in relative_paths:
+        parent = posixpath.dirname(relative_path)
+        while parent and parent not in wanted_dirs:
+            wanted_dirs.add(parent)
+            parent = posixpath.dirname(parent)
+    
+    @transport.in_bulk
+    def list_directory(directory):
+        return list_project_files(config, {"project_id": project_id, "path": directory, "bypass_cache": True})
+    
+    remote_files = {}
+    listing_errors = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = {executor.submit(list_directory, ""): ""}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                result = future.result()
+                if not result.get("success"):
+                    listing_errors.append({"path": directory, "error": result.get("message")})
+                    continue
+                
+                for entry in (result.get("data") or {}).get("files", []):
+                    # Entries may be relative to the project root or to the listed directory
+                    path = posixpath.join(directory, posixpath.basename(entry.get("path", "").rstrip("/")))
+                    if entry.get("is_dir"):
+                        if path in wanted_dirs:
+                            pending[executor.submit(list_directory, path)] = path
+                    else:
+                        try:
+                            size = int(entry.get("file_size"))
+                        except (TypeError, ValueError):
+                            size = None
+                        remote_files[path] = {
+                            "size": size,
+                            "mtime": parse_remote_time(entry.get("last_modified"))
+                        }
+    
+    return remote_files, listing_errors
+
+
+def remote_file_matches(file_path, remote_file):
+    """
+    Check whether a remote file is already up to date with a local file
+    
+    Args:
+        file_path: Path of the local file
+        remote_file: Remote index entry for the same path, if any
+        
+    Returns:
+        True if the remote file has the same size and was modified no earlier than the local file
+    """
+    if not remote_file or remote_file.get("size") is None or remote_file.get("mtime") is None:
+        return False
+    stat = os.stat(file_path)
+    return remote_file["size"] == stat.st_size and remote_file["mtime"] >= stat.st_mtime
+
+
 def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Upload a folder to Cloudera ML using direct PUT request
@@ -120,6 +339,14 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
         params: Function parameters
             - folder_path: Local path to the folder to upload
             - ignore_folders: Optional list of folders to ignore
+            - concurrency: Optional number of files to upload in parallel (default: 1)
+            - sync: Only upload files that are new or changed since the last sync (default: False)
+            - delete_removed: With sync, also delete remote files that were removed locally (default: False)
+            - manifest_dir: Optional directory for sync manifests (default: ~/.cloudera_ml_mcp/manifests)
+            - remote_diff: Skip files whose remote copy has the same size and is not older (default: False)
+            - batch: Upload many small files per multipart request (default: False)
+            - batch_max_files: Maximum number of files per batch request (default: 100)
+            - batch_max_bytes: Maximum total bytes per batch request (default: 8 MiB)
             
     Returns:
         Upload results
@@ -156,10 +383,11 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
         # Remove trailing slash if present
         host = host.rstrip("/")
         
-        successful_uploads = []
-        failed_uploads = []
+        # Number of parallel uploads, bounded by the connection pool size
+        concurrency = max(1, min(int(params.get("concurrency") or 1), MAX_UPLOAD_CONCURRENCY))
         
-        # Walk through the directory structure and upload files
+        # Walk through the directory structure and collect the files to upload
+        upload_tasks = []
         for root, dirs, files in os.walk(folder_path):
             # Skip ignored folders - this modifies dirs in place to avoid walking into them
             dirs[:] = [d for d in dirs if d not in ignore_folders]
@@ -168,36 +396,143 @@ def upload_folder(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, A
                 # Get the full path and relative path
                 full_path = os.path.join(root, file)
                 relative_path = Path(full_path).relative_to(folder_path_obj)
-                
-                # Upload the file using direct PUT
-                print(f"Processing file: {relative_path}")
-                success = upload_file_to_project(
-                    host=host,
-                    api_key=config['api_key'],
-                    project_id=project_id,
-                    file_path=full_path,
-                    relative_path=relative_path
-                )
-                
-                if success:
-                    successful_uploads.append(str(relative_path))
+                upload_tasks.append((full_path, relative_path))
+        
+        # In sync mode, skip files whose content matches the last upload
+        sync = bool(params.get("sync"))
+        skipped_uploads = []
+        if sync:
+            manifest_file = manifest.manifest_path(host, project_id, folder_path, params.get("manifest_dir"))
+            previous_files = manifest.load_manifest(manifest_file)
+            current_files = {}
+            changed_tasks = []
+            for full_path, relative_path in upload_tasks:
+                key = relative_path.as_posix()
+                current_files[key] = manifest.file_entry(full_path, previous_files.get(key))
+                if manifest.is_unchanged(current_files[key], previous_files.get(key)):
+                    skipped_uploads.append(str(relative_path))
                 else:
-                    failed_uploads.append({
-                        "file": str(relative_path),
-                        "error": "Failed to upload file"
-                    })
+                    changed_tasks.append((full_path, relative_path))
+            upload_tasks = changed_tasks
+            removed_files = [key for key in previous_files if key not in current_files]
+            print(f"Sync: {len(upload_tasks)} changed, {len(skipped_uploads)} unchanged, {len(removed_files)} removed")
+        
+        # In remote diff mode, skip files whose remote copy already matches
+        remote_diff = bool(params.get("remote_diff"))
+        listing_errors = []
+        if remote_diff and upload_tasks:
+            remote_files, listing_errors = build_remote_index(
+                config,
+                project_id,
+                [relative_path.as_posix() for _, relative_path in upload_tasks],
+                max(concurrency, REMOTE_LISTING_CONCURRENCY)
+            )
+            changed_tasks = []
+            for full_path, relative_path in upload_tasks:
+                if remote_file_matches(full_path, remote_files.get(relative_path.as_posix())):
+                    skipped_uploads.append(str(relative_path))
+                else:
+                    changed_tasks.append((full_path, relative_path))
+            print(f"Remote diff: {len(upload_tasks) - len(changed_tasks)} files already up to date")
+            upload_tasks = changed_tasks
+        
+        def upload_task(task):
+            full_path, relative_path = task
+            # Upload the file using direct PUT
+            print(f"Processing file: {relative_path}")
+            return upload_file_to_project(
+                host=host,
+                api_key=config['api_key'],
+                project_id=project_id,
+                file_path=full_path,
+                relative_path=relative_path
+            )
+        
+        if params.get("batch"):
+            # Pack many small files into each multipart PUT request
+            batches = make_batches(
+                upload_tasks,
+                int(params.get("batch_max_files") or DEFAULT_BATCH_MAX_FILES),
+                int(params.get("batch_max_bytes") or DEFAULT_BATCH_MAX_BYTES)
+            )
+            print(f"Uploading {len(upload_tasks)} files in {len(batches)} requests")
+            
+            def batch_task(batch):
+                return upload_batch(host, config['api_key'], project_id, batch)
+            
+            # Batches keep the file order, so the per-file outcomes line up with upload_tasks
+            outcomes = []
+            for batch_outcomes in run_tasks(batch_task, batches, concurrency):
+                outcomes.extend(batch_outcomes)
+        else:
+            # Rate limiting is handled by the transport, which backs off when the server asks
+            outcomes = run_tasks(upload_task, upload_tasks, concurrency)
+        
+        successful_uploads = []
+        failed_uploads = []
+        
+        for (full_path, relative_path), success in zip(upload_tasks, outcomes):
+            if success:
+                successful_uploads.append(str(relative_path))
+            else:
+                failed_uploads.append({
+                    "file": str(relative_path),
+                    "error": "Failed to upload file"
+                })
+        
+        if not (sync or remote_diff):
+            return {
+                "success": True,
+                "message": f"Upload completed. Successfully uploaded {len(successful_uploads)} files.",
+                "failed_count": len(failed_uploads),
+                "successful_count": len(successful_uploads),
+                "results": {
+                    "success": successful_uploads,
+                    "failed": failed_uploads
+                }
+            }
+        
+        deleted_files = []
+        failed_deletes = []
+        if sync:
+            if params.get("delete_removed") and removed_files:
+                def delete_task(key):
+                    return delete_project_file(config, {"file_path": key, "project_id": project_id})
                 
-                # Add a small delay between uploads to prevent rate limiting
-                time.sleep(0.5)
+                for key, result in zip(removed_files, run_tasks(delete_task, removed_files, concurrency)):
+                    if result.get("success"):
+                        deleted_files.append(key)
+                    else:
+                        failed_deletes.append({"file": key, "error": result.get("message")})
+            
+            # Record uploaded and unchanged files; failed uploads keep their old entry so they are
+            # retried. Files gone locally are dropped, unless deleting their remote copy failed:
+            # those stay so the next sync tries again.
+            new_files = {key: previous_files[key] for key in current_files if key in previous_files}
+            for item in failed_deletes:
+                new_files[item["file"]] = previous_files[item["file"]]
+            for relative_path in skipped_uploads + successful_uploads:
+                key = Path(relative_path).as_posix()
+                new_files[key] = current_files[key]
+            manifest.save_manifest(manifest_file, new_files)
         
         return {
             "success": True,
-            "message": f"Upload completed. Successfully uploaded {len(successful_uploads)} files.",
+            "message": (
+                f"Sync completed. Uploaded {len(successful_uploads)} changed files, "
+                f"skipped {len(skipped_uploads)} unchanged files, deleted {len(deleted_files)} removed files."
+            ),
             "failed_count": len(failed_uploads),
             "successful_count": len(successful_uploads),
+            "skipped_count": len(skipped_uploads),
+            "deleted_count": len(deleted_files),
             "results": {
                 "success": successful_uploads,
-                "failed": failed_uploads
+                "failed": failed_uploads,
+                "skipped": skipped_uploads,
+                "deleted": deleted_files,
+                "delete_failed": failed_deletes,
+                "listing_errors": listing_errors
             }
         }
         
@@ -0,0 +1,94 @@
+"""Wait for job run function for Cloudera ML MCP"""
+
+import time
+from typing import Dict, Any, List
+
+from .. import job_watcher
+
+# Seconds to wait unless the caller gives a timeout
+DEFAULT_TIMEOUT = 600
+
+
+def wait_for_job_run(config: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wait until one or more job runs reach a terminal state or a deadline passes
+
+    Runs are polled by the shared job_watcher.poller: quickly at first and
+    after each state change, then less often while nothing changes. Several
+    callers waiting for the same run share its polls.
+
+    Args:
+        config: MCP configuration with host and api_key
+        params: Function parameters
+            - job_id: ID of the job containing the run
+            - run_id: ID of the job run to wait for
+            - runs: Instead of job_id/run_id, a list of {"job_id", "run_id"} to wait for together
+            - project_id: ID of the project (optional if in config)
+            - timeout: Seconds to wait before giving up (default: 600)
+            - initial_interval: Seconds between the first polls (default: 1)
+            - max_interval: Longest time between polls in seconds (default: 30, caps initial_interval)
+
+    Returns:
+        Final status and the state transitions seen for each run;
+        success is True if every run reached a terminal state in time
+    """
+    runs: List[Dict[str, Any]] = params.get("runs") or [{"job_id": params.get("job_id"), "run_id": params.get("run_id")}]
+    if not all(run.get("job_id") and run.get("run_id") for run in runs):
+        return {"success": False, "message": "job_id and run_id are required for every run"}
+
+    project_id = params.get("project_id") or config.get("project_id")
+    if not project_id:
+        return {"success": False, "message": "project_id is required either in config or params"}
+
+    try:
+        timeout = float(params["timeout"]) if params.get("timeout") is not None else DEFAULT_TIMEOUT
+        initial_interval = float(params.get("initial_interval") or job_watcher.INITIAL_INTERVAL)
+        max_interval = float(params.get("max_interval") or job_watcher.MAX_INTERVAL)
+    except (TypeError, ValueError):
+        return {"success": False, "message": "timeout, initial_interval and max_interval must be numbers"}
+    if timeout < 0 or initial_interval <= 0 or max_interval <= 0:
+        return {"success": False, "message": "timeout must be non-negative and poll intervals positive"}
+    initial_interval = min(initial_interval, max_interval)
+
+    start = time.monotonic()
+    deadline = start + timeout
+    watches = [
+        job_watcher.poller.watch(config, project_id, run["job_id"], run["run_id"], initial_interval, max_interval)
+        for run in runs
+    ]
+    try:
+        for watch in watches:
+            watch.done.wait(max(0.0, deadline - time.monotonic()))
+        summaries = [watch.summary() for watch in watches]
+    finally:
+        for watch in watches:
+            job_watcher.poller.release(watch)
+
+    elapsed = round(time.monotonic() - start, 3)
+    unfinished = [summary for summary in summaries if not summary["terminal"]]
+    unreachable = [summary for summary in unfinished if summary["error"]]
+    succeeded = all(summary["status"] == "ENGINE_SUCCEEDED" for summary in summaries)
+
+    if unreachable:
+        message = f"Could not get the status of {len(unreachable)} runs: {unreachable[0]['error']}"
+    elif unfinished:
+        message = f"Timed out after {timeout:g}s with {len(unfinished)} runs still running"
+    elif len(summaries) == 1:
+        message = f"Run {summaries[0]['run_id']} finished with status {summaries[0]['status']}"
+    elif succeeded:
+        message = f"All {len(summaries)} runs succeeded"
+    else:
+        message = f"All {len(summaries)} runs finished, but not all succeeded"
+
+    result = {
+        "success": not unfinished,
+        "message": message,
+        "succeeded": succeeded,
+        "timed_out": bool(unfinished) and not unreachable,
+        "elapsed": elapsed,
+    }
+    if params.get("runs"):
+        result["runs"] = summaries
+    else:
+        result.update(summaries[0])
+    return result
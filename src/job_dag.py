@@ -0,0 +1,342 @@
+"""Local orchestrator that runs Cloudera ML jobs in dependency order"""
+
+import time
+import threading
+from typing import Dict, Any, Optional, List
+
+from . import job_watcher
+from .functions.create_job_run import create_job_run
+from .functions.stop_job_run import stop_job_run
+
+
+# Node states; PENDING and RUNNING are the only ones that can still change
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+SUCCEEDED = "SUCCEEDED"
+FAILED = "FAILED"
+SKIPPED = "SKIPPED"
+CANCELLED = "CANCELLED"
+
+# Seconds between checks of the running nodes' watches; status polls themselves follow job_watcher's schedule
+TICK = 0.05
+
+# Seconds before a node whose run could not be created is tried again, doubling with each failure in a row
+START_RETRY_DELAY = 1.0
+MAX_START_RETRY_DELAY = 30.0
+
+
+class DagNode:
+    """One job in the DAG, with its run history and timings"""
+
+    def __init__(self, spec: Dict[str, Any], default_retries: int):
+        self.name = spec["name"]
+        self.job_id = spec["job_id"]
+        self.depends_on: List[str] = list(spec.get("depends_on") or [])
+        self.environment_variables = spec.get("environment_variables")
+        self.override_config = spec.get("override_config")
+        self.runtime_identifier = spec.get("runtime_identifier")
+        self.retries = int(spec["retries"]) if spec.get("retries") is not None else default_retries
+        self.state = PENDING
+        self.run_ids: List[str] = []
+        self.statuses: List[Optional[str]] = []
+        self.error: Optional[str] = None
+        self.watch: Optional[job_watcher.RunWatch] = None
+        self.start_failures = 0
+        self.not_before = 0.0
+        self.ready_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.run_started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Timings in seconds since the DAG started, and the run history"""
+        def rounded(value):
+            return round(value, 3) if value is not None else None
+
+        duration = self.finished_at - self.started_at if self.finished_at is not None and self.started_at is not None \
+            else None
+        queued = self.started_at - self.ready_at if self.started_at is not None and self.ready_at is not None \
+            else None
+        return {
+            "name": self.name,
+            "job_id": self.job_id,
+            "state": self.state,
+            "attempts": len(self.run_ids),
+            "run_ids": list(self.run_ids),
+            "statuses": list(self.statuses),
+            "error": self.error,
+            "ready_at": rounded(self.ready_at),
+            "started_at": rounded(self.started_at),
+            "finished_at": rounded(self.finished_at),
+            "queued": rounded(queued),
+            "duration": rounded(duration),
+        }
+
+
+class JobDag:
+    """
+    Run jobs as soon as the jobs they depend on have succeeded
+
+    Independent branches run in parallel, up to max_parallel runs at a
+    time. A failed run is started again up to its node's retries, after a
+    growing delay if the run could not even be created; a node that
+    still fails skips everything downstream of it, and with fail_fast
+    also stops every other running node. All runs are tracked through
+    the shared job_watcher.poller.
+    """
+
+    def __init__(self, config: Dict[str, str], project_id: str, nodes: List[Dict[str, Any]],
+                 max_parallel: int = 4, retries: int = 0, fail_fast: bool = False,
+                 node_timeout: Optional[float] = None, initial_interval: float = job_watcher.INITIAL_INTERVAL,
+                 max_interval: float = job_watcher.MAX_INTERVAL):
+        """
+        Build and validate a DAG
+
+        Args:
+            config: MCP configuration with host and api_key
+            project_id: ID of the project the jobs are in
+            nodes: List of {"name", "job_id", "depends_on", "environment_variables",
+                   "override_config", "runtime_identifier", "retries"}; only name and job_id are required
+            max_parallel: Largest number of runs at a time
+            retries: Default number of times a failed node is run again
+            fail_fast: Stop all running nodes once one node has failed for good
+            node_timeout: Seconds a single run may take before it is stopped and counted as failed
+            initial_interval: Seconds between the first status polls of a run
+            max_interval: Longest time between status polls of a run
+
+        Raises:
+            ValueError: If a node is malformed, names repeat, a dependency is unknown or there is a cycle
+        """
+        if not nodes:
+            raise ValueError("nodes must be a non-empty list")
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+        self.config = config
+        self.project_id = project_id
+        self.max_parallel = max_parallel
+        self.fail_fast = fail_fast
+        self.node_timeout = node_timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+
+        self.nodes: Dict[str, DagNode] = {}
+        for spec in nodes:
+            if not isinstance(spec, dict) or not spec.get("name") or not spec.get("job_id"):
+                raise ValueError("every node needs a name and a job_id")
+            if spec["name"] in self.nodes:
+                raise ValueError(f"Duplicate node name: {spec['name']}")
+            self.nodes[spec["name"]] = DagNode(spec, retries)
+        for node in self.nodes.values():
+            unknown = [name for name in node.depends_on if name not in self.nodes]
+            if unknown:
+                raise ValueError(f"Node {node.name} depends on unknown nodes: {', '.join(unknown)}")
+        self.order = self._topological_order()
+        self.started = None
+
+    def _topological_order(self) -> List[str]:
+        """Node names with every node after its dependencies (Kahn's algorithm)"""
+        remaining = {name: len(set(node.depends_on)) for name, node in self.nodes.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for upstream in set(node.depends_on):
+                dependents[upstream].append(node.name)
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for downstream in dependents[name]:
+                remaining[downstream] -= 1
+                if remaining[downstream] == 0:
+                    ready.append(downstream)
+        if len(order) != len(self.nodes):
+            cycle = sorted(name for name in self.nodes if name not in order)
+            raise ValueError(f"Dependency cycle between nodes: {', '.join(cycle)}")
+        return order
+
+    def _now(self) -> float:
+        return time.monotonic() - self.started
+
+    def _start(self, node: DagNode) -> None:
+        """Start a run of a node, or count the failed submission as a failed attempt"""
+        run_params = {"project_id": self.project_id, "job_id": node.job_id}
+        for key in ("environment_variables", "override_config", "runtime_identifier"):
+            if getattr(node, key):
+                run_params[key] = getattr(node, key)
+        if node.started_at is None:
+            node.started_at = self._now()
+        node.run_started_at = time.monotonic()
+        node.state = RUNNING
+        result = create_job_run(self.config, run_params)
+        if not result.get("success"):
+            node.run_ids.append(None)
+            node.statuses.append(None)
+            # Back off, so an API that refuses runs is not asked again on every tick
+            node.start_failures += 1
+            node.not_before = time.monotonic() + min(START_RETRY_DELAY * 2 ** (node.start_failures - 1),
+                                                     MAX_START_RETRY_DELAY)
+            self._attempt_failed(node, result.get("message", "Failed to start run"))
+            return
+        node.start_failures = 0
+        run_id = result["data"].get("id")
+        node.run_ids.append(run_id)
+        node.statuses.append(result["data"].get("status"))
+        node.watch = job_watcher.poller.watch(self.config, self.project_id, node.job_id, run_id,
+                                              self.initial_interval, self.max_interval)
+
+    def _stop(self, node: DagNode) -> None:
+        """Stop a node's current run and stop watching it"""
+        if node.watch is not None:
+            stop_job_run(self.config, {"project_id": self.project_id, "job_id": node.job_id,
+                                       "run_id": node.run_ids[-1]})
+            job_watcher.poller.release(node.watch)
+            node.watch = None
+
+    def _attempt_failed(self, node: DagNode, error: str) -> None:
+        """Retry a node, or fail it and skip everything downstream"""
+        node.error = error
+        if len(node.run_ids) <= node.retries:
+            node.state = PENDING
+            return
+        node.state = FAILED
+        node.finished_at = self._now()
+        # Topological order, so skips reach nodes that only depend on this one indirectly
+        for name in self.order:
+            downstream = self.nodes[name]
+            blocked = [upstream for upstream in downstream.depends_on
+                       if self.nodes[upstream].state in (FAILED, SKIPPED)]
+            if downstream.state == PENDING and blocked:
+                downstream.state = SKIPPED
+                downstream.error = f"Upstream node {blocked[0]} did not succeed"
+
+    def _check(self, node: DagNode) -> None:
+        """Handle a running node whose run finished or ran out of time"""
+        watch = node.watch
+        timed_out = self.node_timeout is not None and time.monotonic() - node.run_started_at > self.node_timeout
+        if not watch.done.is_set() and not timed_out:
+            return
+        summary = watch.summary()
+        node.statuses[-1] = summary["status"]
+        if summary["status"] == "ENGINE_SUCCEEDED":
+            job_watcher.poller.release(watch)
+            node.watch = None
+            node.state = SUCCEEDED
+            node.finished_at = self._now()
+            node.error = None
+        elif timed_out and not watch.done.is_set():
+            self._stop(node)
+            self._attempt_failed(node, f"Run did not finish within {self.node_timeout:g}s")
+        else:
+            if summary["status"] not in job_watcher.TERMINAL_STATES:
+                # The poller gave up on a run that may still be going; stop it before starting another
+                self._stop(node)
+            else:
+                job_watcher.poller.release(watch)
+                node.watch = None
+            self._attempt_failed(node, summary["error"] or f"Run finished with status {summary['status']}")
+
+    def cancel_all(self, reason: str) -> None:
+        """Stop every running node and cancel every node that has not started"""
+        for node in self.nodes.values():
+            if node.state == RUNNING:
+                self._stop(node)
+            if node.state in (RUNNING, PENDING):
+                node.state = CANCELLED
+                node.error = reason
+                node.finished_at = self._now() if node.started_at is not None else None
+
+    def run(self, timeout: Optional[float] = None, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Run the DAG until every node has finished, been skipped or been cancelled
+
+        Args:
+            timeout: Seconds after which running nodes are stopped and the rest cancelled
+            cancel: Optional event; setting it stops running nodes and cancels the rest
+
+        Returns:
+            Per-node stats in dependency order, the critical path and the makespan
+        """
+        self.started = time.monotonic()
+        deadline = self.started + timeout if timeout is not None else None
+        try:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    self.cancel_all("Cancelled")
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.cancel_all(f"DAG did not finish within {timeout:g}s")
+                    break
+
+                for node in self.nodes.values():
+                    if node.state == RUNNING:
+                        self._check(node)
+
+                if self.fail_fast and any(node.state == FAILED for node in self.nodes.values()):
+                    self.cancel_all("Cancelled after another node failed")
+                    break
+
+                running = sum(1 for node in self.nodes.values() if node.state == RUNNING)
+                for name in self.order:
+                    node = self.nodes[name]
+                    if node.state != PENDING or running >= self.max_parallel:
+                        continue
+                    if all(self.nodes[upstream].state == SUCCEEDED for upstream in node.depends_on):
+                        if node.ready_at is None:
+                            node.ready_at = self._now()
+                        if node.not_before > time.monotonic():
+                            continue
+                        self._start(node)
+                        running += node.state == RUNNING
+
+                if not any(node.state in (PENDING, RUNNING) for node in self.nodes.values()):
+                    break
+                time.sleep(TICK)
+        finally:
+            # Never leave watches behind, whatever happened
+            for node in self.nodes.values():
+                if node.watch is not None:
+                    job_watcher.poller.release(node.watch)
+                    node.watch = None
+        return self.report()
+
+    def critical_path(self) -> List[str]:
+        """
+        The chain of nodes that determined when the DAG finished
+
+        Starting from the node that finished last, repeatedly follow the
+        dependency that finished last, i.e. the one the node waited for.
+
+        Returns:
+            Node names from first to last
+        """
+        finished = [node for node in self.nodes.values() if node.finished_at is not None]
+        if not finished:
+            return []
+        node = max(finished, key=lambda item: item.finished_at)
+        path = [node.name]
+        while True:
+            upstream = [self.nodes[name] for name in node.depends_on if self.nodes[name].finished_at is not None]
+            if not upstream:
+                break
+            node = max(upstream, key=lambda item: item.finished_at)
+            path.append(node.name)
+        return path[::-1]
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summary of the DAG run
+
+        Returns:
+            Dict with nodes (stats in dependency order), state_counts, critical_path and makespan
+        """
+        nodes = [self.nodes[name].stats() for name in self.order]
+        state_counts: Dict[str, int] = {}
+        for node in nodes:
+            state_counts[node["state"]] = state_counts.get(node["state"], 0) + 1
+        finish_times = [node["finished_at"] for node in nodes if node["finished_at"] is not None]
+        return {
+            "nodes": nodes,
+            "state_counts": state_counts,
+            "critical_path": self.critical_path(),
+            "makespan": max(finish_times) if finish_times else 0.0,
+        }
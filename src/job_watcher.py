@@ -0,0 +1,200 @@
+"""Shared, adaptive poller that waits for Cloudera ML job runs to finish"""
+
+import time
+import hashlib
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+
+from .functions.get_job_run import get_job_run
+
+
+# Job run states after which a run will not change any more
+TERMINAL_STATES = ("ENGINE_SUCCEEDED", "ENGINE_FAILED", "ENGINE_TIMEDOUT", "ENGINE_STOPPED")
+
+# Poll intervals in seconds: start fast, grow by BACKOFF_FACTOR per unchanged poll, never above the maximum
+INITIAL_INTERVAL = 1.0
+MAX_INTERVAL = 30.0
+BACKOFF_FACTOR = 1.5
+
+# Consecutive failed polls after which a watch gives up
+MAX_POLL_FAILURES = 5
+
+
+class RunWatch:
+    """State of one watched job run, shared by every caller waiting for it"""
+
+    def __init__(self, config: Dict[str, str], project_id: str, job_id: str, run_id: str,
+                 initial_interval: float, max_interval: float):
+        self.config = config
+        self.project_id = project_id
+        self.job_id = job_id
+        self.run_id = run_id
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.interval = initial_interval
+        self.next_poll = time.monotonic()
+        self.started = time.monotonic()
+        self.status: Optional[str] = None
+        self.transitions: List[Dict[str, Any]] = []
+        self.polls = 0
+        self.failures = 0
+        self.error: Optional[str] = None
+        self.waiters = 0
+        self.done = threading.Event()
+
+    def record(self, status: Optional[str]) -> None:
+        """Record a polled status and schedule the next poll"""
+        self.polls += 1
+        self.failures = 0
+        if status != self.status:
+            self.status = status
+            self.transitions.append({"status": status, "elapsed": round(time.monotonic() - self.started, 3)})
+            # A run that just changed state is likely to change again soon
+            self.interval = self.initial_interval
+        else:
+            self.interval = min(self.interval * BACKOFF_FACTOR, self.max_interval)
+        if status in TERMINAL_STATES:
+            self.done.set()
+        self.next_poll = time.monotonic() + self.interval
+
+    def record_failure(self, message: str) -> None:
+        """Record a failed poll; give up after MAX_POLL_FAILURES in a row"""
+        self.polls += 1
+        self.failures += 1
+        self.error = message
+        if self.failures >= MAX_POLL_FAILURES:
+            self.done.set()
+        self.interval = min(self.interval * BACKOFF_FACTOR, self.max_interval)
+        self.next_poll = time.monotonic() + self.interval
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact result for callers: the state history, not the whole run"""
+        return {
+            "job_id": self.job_id,
+            "run_id": self.run_id,
+            "status": self.status,
+            "terminal": self.status in TERMINAL_STATES,
+            "transitions": list(self.transitions),
+            "polls": self.polls,
+            "error": self.error if self.failures else None,
+        }
+
+
+class JobRunPoller:
+    """
+    One background thread that polls every watched job run
+
+    Runs watched by several callers at once are polled once per interval,
+    not once per caller. Each run is polled on its own adaptive schedule:
+    every INITIAL_INTERVAL seconds at first and after each state change,
+    backing off by BACKOFF_FACTOR while the state stays the same, up to
+    MAX_INTERVAL. The thread stops when nothing is being watched.
+    """
+
+    def __init__(self):
+        self._watches: Dict[Tuple[str, ...], RunWatch] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(config: Dict[str, str], project_id: str, job_id: str, run_id: str) -> Tuple[str, ...]:
+        auth_hash = hashlib.sha256(config.get("api_key", "").encode("utf-8")).hexdigest()[:16]
+        return (config.get("host", ""), auth_hash, project_id, job_id, run_id)
+
+    def watch(self, config: Dict[str, str], project_id: str, job_id: str, run_id: str,
+              initial_interval: float = INITIAL_INTERVAL, max_interval: float = MAX_INTERVAL) -> RunWatch:
+        """
+        Start watching a job run, or join an existing watch of the same run
+
+        Every call must be paired with release().
+
+        Args:
+            config: MCP configuration with host and api_key
+            project_id: ID of the project
+            job_id: ID of the job
+            run_id: ID of the job run
+            initial_interval: Seconds between the first polls
+            max_interval: Longest time between polls
+
+        Returns:
+            The shared watch; its done event is set once the run reaches a terminal state
+        """
+        key = self._key(config, project_id, job_id, run_id)
+        with self._lock:
+            watch = self._watches.get(key)
+            if watch is None:
+                watch = RunWatch(dict(config), project_id, job_id, run_id, initial_interval, max_interval)
+                self._watches[key] = watch
+            else:
+                # A later caller asking for faster polling gets it from now on
+                watch.initial_interval = min(watch.initial_interval, initial_interval)
+                watch.max_interval = min(watch.max_interval, max_interval)
+                watch.interval = min(watch.interval, watch.max_interval)
+                watch.next_poll = min(watch.next_poll, time.monotonic() + watch.max_interval)
+                if watch.done.is_set() and watch.status not in TERMINAL_STATES:
+                    # The last watch gave up after failed polls; try again for the new caller
+                    watch.failures = 0
+                    watch.next_poll = time.monotonic()
+                    watch.done.clear()
+            watch.waiters += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cloudera-ml-run-poller", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        return watch
+
+    def release(self, watch: RunWatch) -> None:
+        """Stop waiting for a run; the last caller to release it ends the watch"""
+        with self._lock:
+            watch.waiters -= 1
+            if watch.waiters <= 0:
+                key = self._key(watch.config, watch.project_id, watch.job_id, watch.run_id)
+                if self._watches.get(key) is watch:
+                    del self._watches[key]
+            self._wakeup.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                pending = [watch for watch in self._watches.values() if not watch.done.is_set()]
+                if not pending:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                due = [watch for watch in pending if watch.next_poll <= now]
+                if not due:
+                    self._wakeup.wait(min(watch.next_poll for watch in pending) - now)
+                    continue
+            for watch in due:
+                self._poll(watch)
+
+    @staticmethod
+    def _poll(watch: RunWatch) -> None:
+        result = get_job_run(watch.config, {
+            "project_id": watch.project_id, "job_id": watch.job_id, "run_id": watch.run_id, "bypass_cache": True
+        })
+        if result.get("success"):
+            watch.record(result["data"].get("status"))
+        else:
+            watch.record_failure(result.get("message", "Failed to get job run"))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the runs currently being watched
+
+        Returns:
+            Dict with the number of watches and their job_id, run_id, status and waiters
+        """
+        with self._lock:
+            return {
+                "watching": len(self._watches),
+                "runs": [
+                    {"job_id": watch.job_id, "run_id": watch.run_id, "status": watch.status, "waiters": watch.waiters}
+                    for watch in self._watches.values()
+                ],
+            }
+
+
+# Poller shared by every wait in the process
+poller = JobRunPoller()
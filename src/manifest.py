@@ -0,0 +1,137 @@
+"""Local upload manifest for incremental folder sync"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+# Default location for upload manifests (one file per host, project and folder)
+MANIFEST_DIR = os.path.join(os.path.expanduser("~"), ".cloudera_ml_mcp", "manifests")
+
+# Read size used when hashing file contents
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def manifest_path(host: str, project_id: str, folder_path: str, manifest_dir: Optional[str] = None) -> str:
+    """
+    Get the manifest file location for a folder synced to a project
+
+    Args:
+        host: CML host URL
+        project_id: ID of the target project
+        folder_path: Local folder being synced
+        manifest_dir: Optional directory to keep manifests in (default: MANIFEST_DIR)
+
+    Returns:
+        Path of the manifest file
+    """
+    folder_key = str(Path(folder_path).resolve())
+    digest = hashlib.sha256(f"{host}|{project_id}|{folder_key}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(manifest_dir or MANIFEST_DIR, f"{project_id}_{digest}.json")
+
+
+def load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the file entries of a manifest
+
+    Args:
+        path: Manifest file path
+
+    Returns:
+        Mapping of relative path to entry; empty if the manifest is missing or unreadable
+    """
+    try:
+        with open(path, "r") as manifest_file:
+            data = json.load(manifest_file)
+        files = data.get("files", {})
+        return files if isinstance(files, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write a JSON file so readers only ever see the old or the new contents
+
+    Args:
+        path: File path
+        data: JSON-serialisable mapping
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as json_file:
+            json.dump(data, json_file, indent=1, sort_keys=True)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def save_manifest(path: str, files: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Atomically write the file entries of a manifest
+
+    Args:
+        path: Manifest file path
+        files: Mapping of relative path to entry
+    """
+    write_json_atomic(path, {"version": 1, "files": files})
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Compute the SHA-256 of a file's contents
+
+    Args:
+        file_path: Path of the file to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file_data:
+        for chunk in iter(lambda: file_data.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_entry(file_path: str, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the manifest entry for a local file
+
+    The content hash is only recomputed when size or mtime differ from the
+    previous entry, so unchanged trees are checked with a stat per file.
+
+    Args:
+        file_path: Path of the local file
+        previous: Entry recorded for this file on the last sync, if any
+
+    Returns:
+        Entry with size, mtime (nanoseconds) and sha256
+    """
+    stat = os.stat(file_path)
+    if previous and previous.get("size") == stat.st_size and previous.get("mtime") == stat.st_mtime_ns:
+        content_hash = previous.get("sha256")
+    else:
+        content_hash = hash_file(file_path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": content_hash}
+
+
+def is_unchanged(entry: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a file matches what was last uploaded
+
+    Args:
+        entry: Current entry for the file
+        previous: Entry recorded on the last sync, if any
+
+    Returns:
+        True if the content is the same as the uploaded copy
+    """
+    return bool(previous) and previous.get("size") == entry["size"] and previous.get("sha256") == entry["sha256"]
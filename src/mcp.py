@@ -3,11 +3,20 @@ Main implementation of the Cloudera ML Model Control Protocol
 """
 
 from typing import Dict, Any, Optional, List, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import inspect
+import threading
 import json
 import os
 
+from . import aio
 from . import functions
 from . import utils
+from .metrics_logger import MetricsLogger, BATCH_SIZE, FLUSH_INTERVAL
+from .run_table import RunTable, load_run_table
+from .run_store import RunStore, store_path
 
 
 class ClouderaMCP:
@@ -69,7 +78,9 @@ class ClouderaMCP:
             if schema.get("required", False) and not self.config.get(key):
                 raise ValueError(f"Missing required configuration: {key}")
     
-    def upload_file(self, file_path: str, target_name: Optional[str] = None, target_dir: Optional[str] = None, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def upload_file(self, file_path: str, target_name: Optional[str] = None, target_dir: Optional[str] = None, project_id: Optional[str] = None,
+                    chunked: bool = False, part_size: int = 64 * 1024 * 1024,
+                    runtime_identifier: Optional[str] = None) -> Dict[str, Any]:
         """
         Upload a file to the Cloudera ML project
         
@@ -78,6 +89,9 @@ class ClouderaMCP:
             target_name: Optional name to save the file as
             target_dir: Optional directory to save the file in
             project_id: Optional project ID (uses the one in config if not provided)
+            chunked: Upload in resumable parts reassembled by a job in the project
+            part_size: Size of each part in bytes in chunked mode
+            runtime_identifier: Optional runtime for the reassembly job in chunked mode
             
         Returns:
             Upload file result
@@ -90,10 +104,16 @@ class ClouderaMCP:
         return functions.upload_file(config, {
             "file_path": file_path,
             "target_name": target_name,
-            "target_dir": target_dir
+            "target_dir": target_dir,
+            "chunked": chunked,
+            "part_size": part_size,
+            "runtime_identifier": runtime_identifier
         })
     
-    def upload_folder(self, folder_path: str, ignore_folders: Optional[List[str]] = None, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def upload_folder(self, folder_path: str, ignore_folders: Optional[List[str]] = None, project_id: Optional[str] = None,
+                      concurrency: int = 1, sync: bool = False, delete_removed: bool = False,
+                      remote_diff: bool = False, batch: bool = False, batch_max_files: int = 100,
+                      batch_max_bytes: int = 8 * 1024 * 1024) -> Dict[str, Any]:
         """
         Upload a folder to Cloudera ML
         
@@ -101,6 +121,13 @@ class ClouderaMCP:
             folder_path: Local path to the folder to upload
             ignore_folders: Folders to ignore during upload
             project_id: Optional project ID (uses the one in config if not provided)
+            concurrency: Number of files to upload in parallel (default: 1)
+            sync: Only upload files that changed since the last sync of this folder (default: False)
+            delete_removed: With sync, delete remote files that were removed locally (default: False)
+            remote_diff: Skip files whose remote copy already has the same size and is not older (default: False)
+            batch: Upload many small files per request (default: False)
+            batch_max_files: Maximum number of files per batch request (default: 100)
+            batch_max_bytes: Maximum total bytes per batch request (default: 8 MiB)
             
         Returns:
             Upload results
@@ -108,6 +135,13 @@ class ClouderaMCP:
         # Prepare parameters
         params = {
             "folder_path": folder_path,
+            "concurrency": concurrency,
+            "sync": sync,
+            "delete_removed": delete_removed,
+            "remote_diff": remote_diff,
+            "batch": batch,
+            "batch_max_files": batch_max_files,
+            "batch_max_bytes": batch_max_bytes,
         }
         
         if ignore_folders:
@@ -150,27 +184,36 @@ class ClouderaMCP:
             "runtime_identifier": runtime_identifier
         })
     
-    def list_jobs(self) -> Dict[str, Any]:
+    def list_jobs(self, bypass_cache: bool = False, limit: Optional[int] = None, page_size: int = 100) -> Dict[str, Any]:
         """
         List jobs in the Cloudera ML project
         
+        Args:
+            bypass_cache: Fetch a fresh list instead of a cached response
+            limit: Maximum number of jobs to return (default: all)
+            page_size: Number of jobs fetched per API request
+            
         Returns:
             Dictionary containing list of jobs
         """
-        return functions.list_jobs(self.config, {})
+        return functions.list_jobs(self.config, {"bypass_cache": bypass_cache, "limit": limit, "page_size": page_size})
     
-    def list_applications(self, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def list_applications(self, project_id: Optional[str] = None, bypass_cache: bool = False,
+                          limit: Optional[int] = None, page_size: int = 100) -> Dict[str, Any]:
         """
         List applications in a Cloudera ML project
         
         Args:
             project_id: Optional project ID (uses the one in config if not provided)
+            bypass_cache: Fetch a fresh list instead of a cached response
+            limit: Maximum number of applications to return (default: all)
+            page_size: Number of applications fetched per API request
             
         Returns:
             Dictionary containing list of applications
         """
         # Prepare parameters
-        params = {}
+        params = {"bypass_cache": bypass_cache, "limit": limit, "page_size": page_size}
         
         # Add project_id if provided
         if project_id:
@@ -254,44 +297,78 @@ class ClouderaMCP:
         """
         return functions.delete_job(self.config, {"job_id": job_id})
     
-    def delete_all_jobs(self) -> Dict[str, Any]:
+    def delete_all_jobs(self, name: Optional[Union[str, List[str]]] = None, name_regex: Optional[str] = None,
+                        older_than_days: Optional[float] = None, status: Optional[Union[str, List[str]]] = None,
+                        dry_run: bool = False, concurrency: int = 8,
+                        progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
-        Delete all jobs in the project
+        Delete all jobs in the project, or only the jobs matching the given filters
         
+        Args:
+            name: Only delete jobs with this exact name, or one of these names
+            name_regex: Only delete jobs whose name matches this regular expression
+            older_than_days: Only delete jobs created more than this many days ago
+            status: Only delete jobs with this status, or one of these statuses
+            dry_run: Only report the jobs that would be deleted (default: False)
+            concurrency: Number of jobs to delete in parallel (default: 8)
+            progress: Optional callable(done, total, job) called as each delete finishes
+            
         Returns:
             Delete operation results
         """
-        return functions.delete_all_jobs(self.config, {})
+        return functions.delete_all_jobs(self.config, {
+            "name": name,
+            "name_regex": name_regex,
+            "older_than_days": older_than_days,
+            "status": status,
+            "dry_run": dry_run,
+            "concurrency": concurrency,
+            "progress": progress
+        })
 
-    def get_project_id(self, project_name: str) -> Dict[str, Any]:
+    def get_project_id(self, project_name: str, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Get project ID from a project name
         
         Args:
             project_name: Name of the project to find
+            bypass_cache: Look the name up on the server even if it was resolved recently
             
         Returns:
             Project information with ID
         """
-        return functions.get_project_id(self.config, {"project_name": project_name})
+        return functions.get_project_id(self.config, {"project_name": project_name, "bypass_cache": bypass_cache})
     
-    def list_projects(self) -> Dict[str, Any]:
+    def list_projects(self, bypass_cache: bool = False, limit: Optional[int] = None, page_size: int = 100) -> Dict[str, Any]:
         """
         List all available projects
         
+        Args:
+            bypass_cache: Fetch a fresh list instead of a cached response
+            limit: Maximum number of projects to return (default: all)
+            page_size: Number of projects fetched per API request
+            
         Returns:
             Dictionary containing all projects information
         """
-        return functions.get_project_id(self.config, {"project_name": "*"})
+        return functions.get_project_id(self.config, {
+            "project_name": "*",
+            "bypass_cache": bypass_cache,
+            "limit": limit,
+            "page_size": page_size
+        })
     
-    def get_runtimes(self) -> Dict[str, Any]:
+    def get_runtimes(self, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Get available runtimes from Cloudera ML
         
+        Args:
+            bypass_cache: Fetch a fresh list instead of a cached response
+            
         Returns:
             Dictionary containing list of available runtimes
         """
-        return functions.get_runtimes(self.config, {})
+        return functions.get_runtimes(self.config, {"bypass_cache": bypass_cache})
     
     def batch_list_projects(self, project_ids: List[str]) -> Dict[str, Any]:
         """
@@ -363,6 +440,83 @@ class ClouderaMCP:
             
         return functions.create_job_run(self.config, params)
     
+    def run_job_sweep(self, job_id: str, grid: Optional[Dict[str, List[Any]]] = None,
+                      variants: Optional[List[Dict[str, Any]]] = None, project_id: Optional[str] = None,
+                      environment_variables: Optional[Dict[str, str]] = None,
+                      override_config: Optional[Dict[str, Any]] = None,
+                      runtime_identifier: Optional[str] = None, concurrency: int = 4, wait: bool = True,
+                      timeout: float = 600, max_interval: float = 30) -> Dict[str, Any]:
+        """
+        Start one run of a job per parameter variant and wait for them to finish
+        
+        Args:
+            job_id: ID of the job to run
+            grid: Environment variable name to list of values; one run per combination
+            variants: List of {"environment_variables", "override_config"} dicts, one run each
+            project_id: ID of the project (optional if set in configuration)
+            environment_variables: Environment variables for every run (optional)
+            override_config: Configuration overrides for every run (optional)
+            runtime_identifier: Runtime identifier for every run (optional)
+            concurrency: Number of runs submitted in parallel (default: 4)
+            wait: Wait for all runs to finish (default: True)
+            timeout: Seconds to wait for all runs (default: 600)
+            max_interval: Longest time between status checks in seconds (default: 30)
+            
+        Returns:
+            Table of run_id, variant and final status, with a count per status
+        """
+        params = {
+            "job_id": job_id,
+            "grid": grid,
+            "variants": variants,
+            "environment_variables": environment_variables,
+            "override_config": override_config,
+            "runtime_identifier": runtime_identifier,
+            "concurrency": concurrency,
+            "wait": wait,
+            "timeout": timeout,
+            "max_interval": max_interval
+        }
+        if project_id:
+            params["project_id"] = project_id
+        return functions.run_job_sweep(self.config, params)
+    
+    def run_job_dag(self, nodes: List[Dict[str, Any]], project_id: Optional[str] = None,
+                    max_parallel: int = 4, retries: int = 0, fail_fast: bool = False,
+                    node_timeout: Optional[float] = None, timeout: float = 3600,
+                    max_interval: float = 30, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Run jobs in dependency order, starting each as soon as its upstream jobs have succeeded
+        
+        Args:
+            nodes: List of {"name", "job_id", "depends_on", "environment_variables",
+                   "override_config", "runtime_identifier", "retries"} dicts
+            project_id: ID of the project (optional if set in configuration)
+            max_parallel: Largest number of runs at a time (default: 4)
+            retries: Times a failed node is run again, unless the node sets its own (default: 0)
+            fail_fast: Stop all running nodes once one has failed for good (default: False)
+            node_timeout: Seconds a single run may take before it is stopped (optional)
+            timeout: Seconds the whole DAG may take (default: 3600)
+            max_interval: Longest time between status checks of a run in seconds (default: 30)
+            cancel: Optional event another thread can set to stop running nodes and cancel the rest
+            
+        Returns:
+            Per-node state, run IDs and timings, the critical path and the makespan
+        """
+        params = {
+            "nodes": nodes,
+            "max_parallel": max_parallel,
+            "retries": retries,
+            "fail_fast": fail_fast,
+            "node_timeout": node_timeout,
+            "timeout": timeout,
+            "max_interval": max_interval,
+            "cancel": cancel
+        }
+        if project_id:
+            params["project_id"] = project_id
+        return functions.run_job_dag(self.config, params)
+    
     def create_model_build(self, project_id: str, model_id: str, file_path: str, function_name: str,
                           kernel: str = "python3",
                           runtime_identifier: Optional[str] = None,
@@ -560,21 +714,42 @@ class ClouderaMCP:
             
         return functions.delete_experiment_run(self.config, params)
     
-    def delete_experiment_run_batch(self, experiment_id: str, run_ids: List[str], project_id: Optional[str] = None) -> Dict[str, Any]:
+    def delete_experiment_run_batch(self, experiment_id: str, run_ids: Optional[List[str]] = None, project_id: Optional[str] = None,
+                                    older_than_days: Optional[float] = None,
+                                    status: Optional[Union[str, List[str]]] = None,
+                                    metric: Optional[str] = None, metric_below: Optional[float] = None,
+                                    metric_above: Optional[float] = None, dry_run: bool = False,
+                                    concurrency: int = 4) -> Dict[str, Any]:
         """
-        Delete multiple experiment runs in a single request
+        Delete multiple experiment runs, given by ID or selected with filters
+        
+        Runs are deleted in requests of 500 IDs, several requests at a time.
         
         Args:
             experiment_id: ID of the experiment containing the runs
-            run_ids: List of run IDs to delete
+            run_ids: List of run IDs to delete (required unless filters are given)
             project_id: ID of the project (optional if set in configuration)
+            older_than_days: Only delete runs started more than this many days ago
+            status: Only delete runs with this status, or one of these statuses
+            metric: Metric that metric_below and metric_above apply to
+            metric_below: Only delete runs whose latest metric value is below this
+            metric_above: Only delete runs whose latest metric value is above this
+            dry_run: Only count the runs that would be deleted (default: False)
+            concurrency: Number of delete requests sent in parallel (default: 4)
             
         Returns:
-            Dict with success flag and message
+            Dict with success flag, message, deleted and failed counts, and failed run IDs
         """
         params = {
             "experiment_id": experiment_id,
-            "run_ids": run_ids
+            "run_ids": run_ids,
+            "older_than_days": older_than_days,
+            "status": status,
+            "metric": metric,
+            "metric_below": metric_below,
+            "metric_above": metric_above,
+            "dry_run": dry_run,
+            "concurrency": concurrency
         }
         
         if project_id:
@@ -854,17 +1029,20 @@ class ClouderaMCP:
             
         return functions.create_experiment_run(self.config, params)
     
-    def list_experiments(self, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def list_experiments(self, project_id: Optional[str] = None, limit: Optional[int] = None,
+                 page_size: int = 100) -> Dict[str, Any]:
         """
         List experiments in a Cloudera ML project
         
         Args:
             project_id: ID of the project (optional if set in configuration)
+            limit: Maximum number of experiments to return (default: all)
+            page_size: Number of experiments fetched per API request
             
         Returns:
             Dictionary containing list of experiments
         """
-        params = {}
+        params = {"limit": limit, "page_size": page_size}
         
         if project_id:
             params["project_id"] = project_id
@@ -878,18 +1056,34 @@ class ClouderaMCP:
             
         return functions.list_experiments(self.config, params)
     
-    def list_job_runs(self, job_id: Optional[str] = None, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def list_job_runs(self, job_id: Optional[str] = None, project_id: Optional[str] = None,
+                      status: Optional[Union[str, List[str]]] = None, since: Optional[Union[str, float]] = None,
+                      until: Optional[Union[str, float]] = None, limit: Optional[int] = None,
+                      concurrency: int = 8, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         List job runs in a Cloudera ML project
         
         Args:
-            job_id: If provided, only list runs for this specific job
+            job_id: If provided, only list runs for this specific job; otherwise list the runs of all jobs
             project_id: ID of the project (optional if set in configuration)
+            status: Only runs with this status, or one of these statuses
+            since: Only runs created at or after this time (ISO 8601 or seconds since the epoch)
+            until: Only runs created before this time
+            limit: Maximum number of runs to return, newest first
+            concurrency: Number of jobs whose runs are listed in parallel without a job_id (default: 8)
+            bypass_cache: Fetch fresh run lists instead of cached responses (default: False)
             
         Returns:
             Dictionary containing list of job runs
         """
-        params = {}
+        params = {
+            "status": status,
+            "since": since,
+            "until": until,
+            "limit": limit,
+            "concurrency": concurrency,
+            "bypass_cache": bypass_cache
+        }
         
         if job_id:
             params["job_id"] = job_id
@@ -906,17 +1100,20 @@ class ClouderaMCP:
             
         return functions.list_job_runs(self.config, params)
     
-    def list_models(self, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def list_models(self, project_id: Optional[str] = None, limit: Optional[int] = None,
+                 page_size: int = 100) -> Dict[str, Any]:
         """
         List models in a Cloudera ML project
         
         Args:
             project_id: ID of the project (optional if set in configuration)
+            limit: Maximum number of models to return (default: all)
+            page_size: Number of models fetched per API request
             
         Returns:
             Dictionary containing list of models
         """
-        params = {}
+        params = {"limit": limit, "page_size": page_size}
         
         if project_id:
             params["project_id"] = project_id
@@ -958,7 +1155,8 @@ class ClouderaMCP:
             
         return functions.list_model_builds(self.config, params)
     
-    def list_model_deployments(self, model_id: Optional[str] = None, build_id: Optional[str] = None, project_id: Optional[str] = None) -> Dict[str, Any]:
+    def list_model_deployments(self, model_id: Optional[str] = None, build_id: Optional[str] = None, project_id: Optional[str] = None,
+                               limit: Optional[int] = None, page_size: int = 100) -> Dict[str, Any]:
         """
         List model deployments in a Cloudera ML project
         
@@ -966,11 +1164,13 @@ class ClouderaMCP:
             model_id: If provided, only list deployments for this specific model
             build_id: If provided, only list deployments for this specific build
             project_id: ID of the project (optional if set in configuration)
+            limit: Maximum number of deployments to return (default: all)
+            page_size: Number of deployments fetched per API request
             
         Returns:
             Dictionary containing list of model deployments
         """
-        params = {}
+        params = {"limit": limit, "page_size": page_size}
         
         if model_id:
             params["model_id"] = model_id
@@ -1010,10 +1210,14 @@ class ClouderaMCP:
             
         return functions.list_project_files(self.config, params)
 
-    def log_experiment_run_batch(self, experiment_id: str, run_updates: List[Dict[str, Any]], project_id: Optional[str] = None) -> Dict[str, Any]:
+    def log_experiment_run_batch(self, experiment_id: str, run_updates: List[Dict[str, Any]], project_id: Optional[str] = None,
+                                 concurrency: int = 4) -> Dict[str, Any]:
         """
         Log metrics and parameters for multiple experiment runs in a batch
         
+        Large lists are split into requests of at most 1 MiB and 100 run updates,
+        sent in parallel while keeping each run's updates in order.
+        
         Args:
             experiment_id: ID of the experiment containing the runs
             run_updates: List of run update objects, each containing:
@@ -1022,13 +1226,15 @@ class ClouderaMCP:
                 - parameters (optional): Dictionary of parameters to log
                 - tags (optional): List of tags to add to the run
             project_id: ID of the project (optional if set in configuration)
+            concurrency: Number of requests sent in parallel (default: 4)
             
         Returns:
-            Dictionary containing operation result
+            Dictionary containing operation result, with a success flag per run
         """
         params = {
             "experiment_id": experiment_id,
-            "run_updates": run_updates
+            "run_updates": run_updates,
+            "concurrency": concurrency
         }
         
         if project_id:
@@ -1043,6 +1249,260 @@ class ClouderaMCP:
             
         return functions.log_experiment_run_batch(self.config, params)
 
+    def metrics_logger(self, experiment_id: str, project_id: Optional[str] = None,
+                       batch_size: int = BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL) -> MetricsLogger:
+        """
+        Create a buffered logger for the metrics, parameters and tags of an experiment's runs
+        
+        Logged values are sent with log_experiment_run_batch in the background once
+        batch_size values are buffered or the oldest is flush_interval seconds old.
+        Close the logger (or use it as a context manager) to send the rest.
+        
+        Args:
+            experiment_id: ID of the experiment containing the runs
+            project_id: ID of the project (optional if set in configuration)
+            batch_size: Values per run-batch request (default: 1000)
+            flush_interval: Seconds before buffered values are sent (default: 5)
+            
+        Returns:
+            MetricsLogger with log_metric, log_metrics, log_param, log_params, add_tags, flush and close
+        """
+        return MetricsLogger(self.config, experiment_id, project_id=project_id,
+                             batch_size=batch_size, flush_interval=flush_interval)
+
+    def experiment_run_table(self, experiment_id: str, project_id: Optional[str] = None,
+                             concurrency: int = 8) -> RunTable:
+        """
+        Load all runs of an experiment into a columnar table
+        
+        Args:
+            experiment_id: ID of the experiment
+            project_id: ID of the project (optional if set in configuration)
+            concurrency: Runs fetched in parallel when the listing lacks their data (default: 8)
+            
+        Returns:
+            RunTable with NumPy columns for run fields, metrics and parameters
+        
+        Raises:
+            ValueError: If no project ID is given or configured
+        """
+        project_id = project_id or self.config.get("project_id")
+        if not project_id:
+            raise ValueError("Project ID is required but not provided in parameters or configuration")
+        return load_run_table(self.config, project_id, experiment_id, concurrency=concurrency)
+
+    def export_experiment_runs(self, experiment_id: str, path: Optional[str] = None, project_id: Optional[str] = None,
+                               format: Optional[str] = None, concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Export all runs of an experiment with their metrics and parameters
+        
+        Args:
+            experiment_id: ID of the experiment
+            path: CSV or Parquet file to write (optional; without it only a summary is returned)
+            project_id: ID of the project (optional if set in configuration)
+            format: "csv" or "parquet" (default: from the path's extension)
+            concurrency: Runs fetched in parallel (default: 8)
+            
+        Returns:
+            Dict with success flag, message, run count, metric and parameter names and per-metric statistics
+        """
+        params = {
+            "experiment_id": experiment_id,
+            "path": path,
+            "format": format,
+            "concurrency": concurrency
+        }
+        
+        if project_id:
+            params["project_id"] = project_id
+        elif "project_id" in self.config:
+            params["project_id"] = self.config["project_id"]
+        else:
+            return {
+                "success": False, 
+                "message": "Project ID is required but not provided in parameters or configuration"
+            }
+            
+        return functions.export_experiment_runs(self.config, params)
+
+    def compare_experiment_runs(self, experiment_id: str, metric: str, k: int = 10, ascending: bool = False,
+                                run_ids: Optional[List[str]] = None, status: Optional[List[str]] = None,
+                                columns: Optional[List[str]] = None, project_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Rank the runs of an experiment by a metric and return the best k
+        
+        Args:
+            experiment_id: ID of the experiment
+            metric: Metric to rank by
+            k: Number of runs to return (default: 10)
+            ascending: Rank the lowest values first, e.g. for losses (default: False)
+            run_ids: Only rank these runs (optional)
+            status: Only rank runs with one of these statuses (optional)
+            columns: Columns to include, as "metrics.<name>" or "params.<name>" (default: all)
+            project_id: ID of the project (optional if set in configuration)
+            
+        Returns:
+            Dict with success flag, message, ranked runs and statistics of the metric
+        """
+        params = {
+            "experiment_id": experiment_id,
+            "metric": metric,
+            "k": k,
+            "ascending": ascending,
+            "run_ids": run_ids,
+            "status": status,
+            "columns": columns
+        }
+        
+        if project_id:
+            params["project_id"] = project_id
+        elif "project_id" in self.config:
+            params["project_id"] = self.config["project_id"]
+        else:
+            return {
+                "success": False, 
+                "message": "Project ID is required but not provided in parameters or configuration"
+            }
+            
+        return functions.compare_experiment_runs(self.config, params)
+
+    def best_runs(self, experiment_id: str, metric: str, k: int = 5, ascending: bool = False,
+                  tie_breakers: Optional[List[str]] = None, status: Optional[List[str]] = None,
+                  project_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Find the best runs of an experiment by a metric, reading the run listing page by page
+        
+        Only the k best runs are kept while the listing is read.
+        
+        Args:
+            experiment_id: ID of the experiment
+            metric: Metric to rank by
+            k: Number of runs to return (default: 5)
+            ascending: Lowest values are best, e.g. for losses (default: False)
+            tie_breakers: Metric names, "start_time" or "end_time" that order runs with equal
+                values, lowest first, or highest first with a "-" prefix (optional)
+            status: Only rank runs with one of these statuses (optional)
+            project_id: ID of the project (optional if set in configuration)
+            
+        Returns:
+            Dict with success flag, message, compact summaries of the best runs and the runs scanned
+        """
+        params = {
+            "experiment_id": experiment_id,
+            "metric": metric,
+            "k": k,
+            "ascending": ascending,
+            "tie_breakers": tie_breakers,
+            "status": status
+        }
+        
+        if project_id:
+            params["project_id"] = project_id
+        elif "project_id" in self.config:
+            params["project_id"] = self.config["project_id"]
+        else:
+            return {
+                "success": False, 
+                "message": "Project ID is required but not provided in parameters or configuration"
+            }
+            
+        return functions.best_runs(self.config, params)
+
+    def run_store(self) -> RunStore:
+        """
+        Open the local run store for the configured host
+        
+        The store mirrors experiments and runs synced with sync_experiment_runs;
+        its queries answer from disk without calling the API. Close it when done.
+        
+        Returns:
+            RunStore with sync, query_runs, get_run and experiments
+        """
+        return RunStore(store_path(self.config.get("host", "")))
+
+    def sync_experiment_runs(self, project_id: Optional[str] = None, experiment_ids: Optional[List[str]] = None,
+                             full: bool = False, concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Sync the experiments and runs of a project into the local run store
+        
+        Only runs that are new, changed status, were still running, or started or
+        ended since the last sync are fetched.
+        
+        Args:
+            project_id: ID of the project (optional if set in configuration)
+            experiment_ids: Only sync the runs of these experiments (default: all)
+            full: Re-read every run, ignoring the last sync (default: False)
+            concurrency: Experiments listed, and runs fetched, in parallel (default: 8)
+            
+        Returns:
+            Dict with success flag, message and the numbers of runs added, updated, removed and unchanged
+        """
+        params = {
+            "experiment_ids": experiment_ids,
+            "full": full,
+            "concurrency": concurrency
+        }
+        
+        if project_id:
+            params["project_id"] = project_id
+        elif "project_id" in self.config:
+            params["project_id"] = self.config["project_id"]
+        else:
+            return {
+                "success": False, 
+                "message": "Project ID is required but not provided in parameters or configuration"
+            }
+            
+        return functions.sync_experiment_runs(self.config, params)
+
+    def query_experiment_runs(self, project_id: Optional[str] = None, experiment_id: Optional[str] = None,
+                              status: Optional[List[str]] = None,
+                              tags: Optional[Union[List[str], Dict[str, Any]]] = None,
+                              params: Optional[Dict[str, Any]] = None, metric: Optional[str] = None,
+                              metric_min: Optional[float] = None, metric_max: Optional[float] = None,
+                              order: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """
+        Find experiment runs in the local run store, without calling the API
+        
+        Args:
+            project_id: ID of the project (optional if set in configuration)
+            experiment_id: Only runs of this experiment (optional)
+            status: Only runs with one of these statuses (optional)
+            tags: Tag names, or a {name: value} dict, the runs must have (optional)
+            params: {name: value} parameters the runs must have (optional)
+            metric: Only runs with this metric; metric_min, metric_max and order apply to it
+            metric_min: Lowest metric value, inclusive (optional)
+            metric_max: Highest metric value, inclusive (optional)
+            order: "asc" or "desc" to sort by the metric (default: newest runs first)
+            limit: Runs returned at most (default: 100)
+            
+        Returns:
+            Dict with success flag, message, total matches, matching runs and the last sync time
+        """
+        query = {
+            "experiment_id": experiment_id,
+            "status": status,
+            "tags": tags,
+            "params": params,
+            "metric": metric,
+            "metric_min": metric_min,
+            "metric_max": metric_max,
+            "order": order,
+            "limit": limit
+        }
+        
+        if project_id:
+            query["project_id"] = project_id
+        elif "project_id" in self.config:
+            query["project_id"] = self.config["project_id"]
+        else:
+            return {
+                "success": False, 
+                "message": "Project ID is required but not provided in parameters or configuration"
+            }
+            
+        return functions.query_experiment_runs(self.config, query)
+
     def restart_application(self, application_id: str, project_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Restart a running application in a Cloudera ML project
@@ -1278,6 +1738,37 @@ class ClouderaMCP:
             
         return functions.stop_job_run(self.config, params)
     
+    def wait_for_job_run(self, job_id: Optional[str] = None, run_id: Optional[str] = None,
+                         runs: Optional[List[Dict[str, str]]] = None, project_id: Optional[str] = None,
+                         timeout: float = 600, initial_interval: float = 1,
+                         max_interval: float = 30) -> Dict[str, Any]:
+        """
+        Wait until job runs reach a terminal state or the timeout passes
+        
+        Args:
+            job_id: ID of the job
+            run_id: ID of the job run to wait for
+            runs: Instead of job_id and run_id, a list of {"job_id", "run_id"} to wait for together
+            project_id: ID of the project (optional if set in configuration)
+            timeout: Seconds to wait before giving up (default: 600)
+            initial_interval: Seconds between the first status checks (default: 1)
+            max_interval: Longest time between status checks in seconds (default: 30)
+            
+        Returns:
+            Final status and state transitions of each run
+        """
+        params = {
+            "job_id": job_id,
+            "run_id": run_id,
+            "runs": runs,
+            "timeout": timeout,
+            "initial_interval": initial_interval,
+            "max_interval": max_interval
+        }
+        if project_id:
+            params["project_id"] = project_id
+        return functions.wait_for_job_run(self.config, params)
+    
     def stop_model_deployment(self, deployment_id: str, project_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Stop a model deployment in a Cloudera ML project
@@ -1319,6 +1810,14 @@ class ClouderaMCP:
                     "target_name": {
                         "type": "string",
                         "description": "Optional name to use for the uploaded file"
+                    },
+                    "chunked": {
+                        "type": "boolean",
+                        "description": "Upload in resumable parts reassembled by a job in the project"
+                    },
+                    "part_size": {
+                        "type": "integer",
+                        "description": "Size of each part in bytes in chunked mode (default: 64 MiB)"
                     }
                 },
                 "required": ["file_path"]
@@ -1337,6 +1836,34 @@ class ClouderaMCP:
                         "type": "array",
                         "items": {"type": "string"},
                         "description": "Folders to ignore during upload"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of files to upload in parallel (default: 1)"
+                    },
+                    "sync": {
+                        "type": "boolean",
+                        "description": "Only upload files that changed since the last sync (default: false)"
+                    },
+                    "delete_removed": {
+                        "type": "boolean",
+                        "description": "With sync, delete remote files that were removed locally (default: false)"
+                    },
+                    "remote_diff": {
+                        "type": "boolean",
+                        "description": "Skip files whose remote copy already has the same size and is not older (default: false)"
+                    },
+                    "batch": {
+                        "type": "boolean",
+                        "description": "Upload many small files per request (default: false)"
+                    },
+                    "batch_max_files": {
+                        "type": "integer",
+                        "description": "Maximum number of files per batch request (default: 100)"
+                    },
+                    "batch_max_bytes": {
+                        "type": "integer",
+                        "description": "Maximum total bytes per batch request (default: 8 MiB)"
                     }
                 },
                 "required": ["folder_path"]
@@ -1412,10 +1939,36 @@ class ClouderaMCP:
             }
         },
         "delete_all_jobs": {
-            "description": "Delete all jobs in the project",
+            "description": "Delete all jobs in the project, or only the jobs matching the given filters",
             "parameters": {
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Only delete the job with this exact name"
+                    },
+                    "name_regex": {
+                        "type": "string",
+                        "description": "Only delete jobs whose name matches this regular expression"
+                    },
+                    "older_than_days": {
+                        "type": "number",
+                        "description": "Only delete jobs created more than this many days ago"
+                    },
+                    "status": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only delete jobs with one of these statuses"
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "Only report the jobs that would be deleted (default: false)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of jobs to delete in parallel (default: 8)"
+                    }
+                }
             }
         },
         "get_project_id": {
@@ -1502,6 +2055,90 @@ class ClouderaMCP:
                 "required": ["project_id", "job_id"]
             }
         },
+        "run_job_sweep": {
+            "description": "Start one run of a job per parameter variant and wait for all of them to finish",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "ID of the job to run"
+                    },
+                    "grid": {
+                        "type": "object",
+                        "description": "Environment variable name to list of values; one run per combination"
+                    },
+                    "variants": {
+                        "type": "array",
+                        "items": {"type": "object"},
+                        "description": "List of {environment_variables, override_config} objects, one run each"
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "environment_variables": {
+                        "type": "object",
+                        "description": "Environment variables for every run (optional)"
+                    },
+                    "override_config": {
+                        "type": "object",
+                        "description": "Configuration overrides for every run (optional)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of runs submitted in parallel (default: 4)"
+                    },
+                    "wait": {
+                        "type": "boolean",
+                        "description": "Wait for all runs to finish (default: true)"
+                    },
+                    "timeout": {
+                        "type": "number",
+                        "description": "Seconds to wait for all runs (default: 600)"
+                    }
+                },
+                "required": ["job_id"]
+            }
+        },
+        "run_job_dag": {
+            "description": "Run jobs in dependency order, running independent branches in parallel, with retries and timing stats",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "nodes": {
+                        "type": "array",
+                        "items": {"type": "object"},
+                        "description": "List of {name, job_id, depends_on, environment_variables, override_config, runtime_identifier, retries} objects"
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "max_parallel": {
+                        "type": "integer",
+                        "description": "Largest number of runs at a time (default: 4)"
+                    },
+                    "retries": {
+                        "type": "integer",
+                        "description": "Times a failed node is run again, unless the node sets its own (default: 0)"
+                    },
+                    "fail_fast": {
+                        "type": "boolean",
+                        "description": "Stop all running nodes once one has failed for good (default: false)"
+                    },
+                    "node_timeout": {
+                        "type": "number",
+                        "description": "Seconds a single run may take before it is stopped (optional)"
+                    },
+                    "timeout": {
+                        "type": "number",
+                        "description": "Seconds the whole DAG may take (default: 3600)"
+                    }
+                },
+                "required": ["nodes"]
+            }
+        },
         "create_model_build": {
             "description": "Create a new model build in Cloudera ML",
             "parameters": {
@@ -1680,7 +2317,7 @@ class ClouderaMCP:
             }
         },
         "delete_experiment_run_batch": {
-            "description": "Delete multiple experiment runs in a single request",
+            "description": "Delete experiment runs given by ID or selected by age, status or metric threshold, in parallel chunks",
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -1691,14 +2328,43 @@ class ClouderaMCP:
                     "run_ids": {
                         "type": "array",
                         "items": {"type": "string"},
-                        "description": "List of run IDs to delete"
+                        "description": "List of run IDs to delete (required unless filters are given)"
                     },
                     "project_id": {
                         "type": "string",
                         "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "older_than_days": {
+                        "type": "number",
+                        "description": "Only delete runs started more than this many days ago"
+                    },
+                    "status": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only delete runs with one of these statuses"
+                    },
+                    "metric": {
+                        "type": "string",
+                        "description": "Metric that metric_below and metric_above apply to"
+                    },
+                    "metric_below": {
+                        "type": "number",
+                        "description": "Only delete runs whose latest metric value is below this"
+                    },
+                    "metric_above": {
+                        "type": "number",
+                        "description": "Only delete runs whose latest metric value is above this"
+                    },
+                    "dry_run": {
+                        "type": "boolean",
+                        "description": "Only count the runs that would be deleted (default: false)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of delete requests sent in parallel (default: 4)"
                     }
                 },
-                "required": ["experiment_id", "run_ids"]
+                "required": ["experiment_id"]
             }
         },
         "delete_model": {
@@ -1919,11 +2585,32 @@ class ClouderaMCP:
                 "properties": {
                     "job_id": {
                         "type": "string",
-                        "description": "If provided, only list runs for this specific job"
+                        "description": "If provided, only list runs for this specific job; otherwise list the runs of all jobs"
                     },
                     "project_id": {
                         "type": "string",
                         "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "status": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only runs with one of these statuses, e.g. [\"ENGINE_FAILED\"]"
+                    },
+                    "since": {
+                        "type": "string",
+                        "description": "Only runs created at or after this ISO 8601 time"
+                    },
+                    "until": {
+                        "type": "string",
+                        "description": "Only runs created before this ISO 8601 time"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of runs to return, newest first"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of jobs whose runs are listed in parallel without a job_id (default: 8)"
                     }
                 },
                 "required": []
@@ -2032,6 +2719,10 @@ class ClouderaMCP:
                         },
                         "description": "List of run update objects, each containing: id, metrics, parameters, tags"
                     },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of requests sent in parallel when the list is split into chunks (default: 4)"
+                    },
                     "project_id": {
                         "type": "string",
                         "description": "ID of the project (optional if set in configuration)"
@@ -2040,6 +2731,194 @@ class ClouderaMCP:
                 "required": ["experiment_id", "run_updates"]
             }
         },
+        "export_experiment_runs": {
+            "description": "Export all runs of an experiment with their latest metrics and parameters to a CSV or Parquet file",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "experiment_id": {
+                        "type": "string",
+                        "description": "ID of the experiment"
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "File to write; without it only a summary is returned"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["csv", "parquet"],
+                        "description": "File format (default: from the path's extension)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of runs fetched in parallel (default: 8)"
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    }
+                },
+                "required": ["experiment_id"]
+            }
+        },
+        "compare_experiment_runs": {
+            "description": "Rank all runs of an experiment by a metric and return the best k with their metrics and parameters",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "experiment_id": {
+                        "type": "string",
+                        "description": "ID of the experiment"
+                    },
+                    "metric": {
+                        "type": "string",
+                        "description": "Metric to rank by"
+                    },
+                    "k": {
+                        "type": "integer",
+                        "description": "Number of runs to return (default: 10)"
+                    },
+                    "ascending": {
+                        "type": "boolean",
+                        "description": "Rank the lowest values first, e.g. for losses (default: false)"
+                    },
+                    "run_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only rank these runs"
+                    },
+                    "status": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only rank runs with one of these statuses"
+                    },
+                    "columns": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Columns to include for each run, as metrics.<name> or params.<name> (default: all)"
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    }
+                },
+                "required": ["experiment_id", "metric"]
+            }
+        },
+        "sync_experiment_runs": {
+            "description": "Sync the experiments and runs of a project into a local store; only new and changed runs are fetched",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "experiment_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only sync the runs of these experiments (default: all)"
+                    },
+                    "full": {
+                        "type": "boolean",
+                        "description": "Re-read every run, ignoring the last sync (default: false)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Number of experiments listed, and runs fetched, in parallel (default: 8)"
+                    }
+                }
+            }
+        },
+        "query_experiment_runs": {
+            "description": "Find synced experiment runs by experiment, status, tags, parameter values or metric range without calling the API",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "experiment_id": {
+                        "type": "string",
+                        "description": "Only runs of this experiment"
+                    },
+                    "status": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only runs with one of these statuses"
+                    },
+                    "tags": {
+                        "type": "object",
+                        "description": "Tags the runs must have, as {name: value}"
+                    },
+                    "params": {
+                        "type": "object",
+                        "description": "Parameter values the runs must have, as {name: value}"
+                    },
+                    "metric": {
+                        "type": "string",
+                        "description": "Only runs with this metric; metric_min, metric_max and order apply to it"
+                    },
+                    "metric_min": {
+                        "type": "number",
+                        "description": "Lowest metric value, inclusive"
+                    },
+                    "metric_max": {
+                        "type": "number",
+                        "description": "Highest metric value, inclusive"
+                    },
+                    "order": {
+                        "type": "string",
+                        "enum": ["asc", "desc"],
+                        "description": "Sort by the metric (default: newest runs first)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of runs to return (default: 100)"
+                    }
+                }
+            }
+        },
+        "best_runs": {
+            "description": "Find the best k runs of an experiment by a metric, streaming the run listing and keeping only the winners",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "experiment_id": {
+                        "type": "string",
+                        "description": "ID of the experiment"
+                    },
+                    "metric": {
+                        "type": "string",
+                        "description": "Metric to rank by"
+                    },
+                    "k": {
+                        "type": "integer",
+                        "description": "Number of runs to return (default: 5)"
+                    },
+                    "ascending": {
+                        "type": "boolean",
+                        "description": "Lowest values are best, e.g. for losses (default: false)"
+                    },
+                    "tie_breakers": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Metric names, start_time or end_time ordering runs with equal values, lowest first or highest first with a - prefix"
+                    },
+                    "status": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only rank runs with one of these statuses"
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    }
+                },
+                "required": ["experiment_id", "metric"]
+            }
+        },
         "restart_application": {
             "description": "Restart a running application in a Cloudera ML project",
             "parameters": {
@@ -2095,6 +2974,35 @@ class ClouderaMCP:
                 "required": ["job_id", "run_id"]
             }
         },
+        "wait_for_job_run": {
+            "description": "Wait until a job run finishes and report the state transitions seen",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "ID of the job"
+                    },
+                    "run_id": {
+                        "type": "string",
+                        "description": "ID of the job run to wait for"
+                    },
+                    "project_id": {
+                        "type": "string",
+                        "description": "ID of the project (optional if set in configuration)"
+                    },
+                    "timeout": {
+                        "type": "number",
+                        "description": "Seconds to wait before giving up (default: 600)"
+                    },
+                    "max_interval": {
+                        "type": "number",
+                        "description": "Longest time between status checks in seconds (default: 30)"
+                    }
+                },
+                "required": ["job_id", "run_id"]
+            }
+        },
         "stop_model_deployment": {
             "description": "Stop a model deployment in a Cloudera ML project",
             "parameters": {
@@ -2331,4 +3239,114 @@ class ClouderaMCP:
                 "required": ["file_path"]
             }
         }
-    } 
\ No newline at end of file
+    } 
+
+
+class AsyncClouderaMCP:
+    """
+    Asyncio counterpart of ClouderaMCP
+    
+    Every public ClouderaMCP method is available here as a coroutine with
+    the same name and arguments, so many calls can run at once with
+    asyncio.gather. Calls run on a worker pool and share the transport's
+    pooled connections, retries, rate limiter and response cache with
+    synchronous callers.
+    
+    Use it as an async context manager:
+    
+        async with AsyncClouderaMCP(config) as client:
+            jobs, runtimes = await asyncio.gather(client.list_jobs(), client.get_runtimes())
+    
+    Leaving the block waits for calls still in flight. Pooled connections
+    are shared with every other caller in the process and stay open.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, str]] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the async Cloudera ML MCP
+        
+        Args:
+            config: Optional configuration dictionary with host, api_key, and project_id
+                   If not provided, will try to load from environment variables
+            max_workers: Optional size of a worker pool private to this client
+                        (default: share the process-wide pool of aio.MAX_WORKERS workers)
+        """
+        self.sync = ClouderaMCP(config)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cloudera-ml-client") \
+            if max_workers else None
+        self._pending = set()
+        self.closed = False
+    
+    @property
+    def config(self) -> Dict[str, str]:
+        """Configuration shared with the underlying ClouderaMCP"""
+        return self.sync.config
+    
+    async def _run(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking ClouderaMCP method on the worker pool, or the long-running pool if it polls or uploads"""
+        if self.closed:
+            raise RuntimeError("AsyncClouderaMCP is closed")
+        loop = asyncio.get_running_loop()
+        executor = self._executor or aio.get_executor(long_running=method.__name__ in aio.LONG_RUNNING)
+        future = loop.run_in_executor(executor, functools.partial(method, *args, **kwargs))
+        self._pending.add(future)
+        try:
+            return await future
+        finally:
+            self._pending.discard(future)
+    
+    async def __aenter__(self) -> "AsyncClouderaMCP":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """
+        Stop accepting calls, wait for calls in flight and release resources
+        
+        Only this client's private worker pool is shut down. The transport's
+        connection pool serves the whole process and lives until it exits.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+def _async_method(name: str) -> Callable[..., Any]:
+    """
+    Coroutine method that runs the ClouderaMCP method of the same name
+    
+    Methods that take a cancel event get one when the caller passes none,
+    and it is set if the awaiting task is cancelled, so the blocking call
+    stops its work instead of carrying on in the worker thread.
+    """
+    method = getattr(ClouderaMCP, name)
+    
+    if "cancel" not in inspect.signature(method).parameters:
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            return await self._run(getattr(self.sync, name), *args, **kwargs)
+        return wrapper
+    
+    @functools.wraps(method)
+    async def cancellable(self, *args, **kwargs):
+        bound = inspect.signature(method).bind(self.sync, *args, **kwargs)
+        cancel = bound.arguments.get("cancel") or threading.Event()
+        bound.arguments["cancel"] = cancel
+        try:
+            return await self._run(getattr(ClouderaMCP, name), *bound.args, **bound.kwargs)
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+    return cancellable
+
+
+# Mirror ClouderaMCP's public surface: methods become coroutines, metadata is shared
+for _name, _member in list(vars(ClouderaMCP).items()):
+    if not _name.startswith("_"):
+        setattr(AsyncClouderaMCP, _name, _async_method(_name) if callable(_member) else _member)
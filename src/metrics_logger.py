@@ -0,0 +1,255 @@
+"""Client-side buffer that coalesces experiment run metrics into run-batch requests"""
+
+import time
+import threading
+from typing import Dict, Any, Optional, List
+
+from . import transport
+from .functions.log_experiment_run_batch import log_experiment_run_batch
+
+
+# Metric, parameter and tag values per run-batch request
+BATCH_SIZE = 1000
+
+# Seconds a value may wait in the buffer before it is sent
+FLUSH_INTERVAL = 5.0
+
+# Batches of values buffered at most; logging blocks beyond this until a flush catches up
+MAX_PENDING_BATCHES = 10
+
+
+def _size(update: Dict[str, Any]) -> int:
+    """Number of values in one run update"""
+    return sum(len(update.get(kind) or ()) for kind in ("metrics", "parameters", "tags"))
+
+
+class MetricsLogger:
+    """
+    Buffer metric, parameter and tag writes for the runs of one experiment
+
+    Writes only touch memory. A background thread sends the buffer with
+    log_experiment_run_batch once it holds batch_size values or its
+    oldest value is flush_interval seconds old; flush() and close() send
+    it right away. Writes for the same run are merged into one run update,
+    and a metric logged again before the next flush starts a new update
+    for the run, so every point reaches the server in order.
+
+    Use it as a context manager, or call close() when done:
+
+        with MetricsLogger(config, experiment_id) as logger:
+            for step in range(steps):
+                logger.log_metric(run_id, "loss", loss)
+    """
+
+    def __init__(self, config: Dict[str, str], experiment_id: str, project_id: Optional[str] = None,
+                 batch_size: int = BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL,
+                 max_pending: Optional[int] = None):
+        """
+        Create a logger; nothing is sent until values are logged
+
+        Args:
+            config: MCP configuration with host and api_key
+            experiment_id: ID of the experiment the runs belong to
+            project_id: ID of the project (optional if in config)
+            batch_size: Values per run-batch request, and the buffer size that triggers a flush
+            flush_interval: Seconds after which buffered values are sent even if the batch is not full
+            max_pending: Values buffered at most before logging blocks (default: 10 batches)
+
+        Raises:
+            ValueError: If project_id is missing or the sizes are not positive
+        """
+        self.config = config
+        self.experiment_id = experiment_id
+        self.project_id = project_id or config.get("project_id")
+        if not self.project_id:
+            raise ValueError("project_id is required either in config or params")
+        if batch_size < 1 or flush_interval <= 0:
+            raise ValueError("batch_size and flush_interval must be positive")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending or batch_size * MAX_PENDING_BATCHES
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Only one flush sends at a time, so batches reach the server in logging order
+        self._send_lock = threading.Lock()
+        self._updates: List[Dict[str, Any]] = []
+        self._open: Dict[str, Dict[str, Any]] = {}
+        self._pending = 0
+        self._first_at: Optional[float] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"logged": 0, "sent": 0, "failed": 0, "requests": 0}
+        self._last_error: Optional[str] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _add(self, run_id: str, kind: str, key: Any, value: Any = None) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MetricsLogger is closed")
+            while self._pending >= self.max_pending:
+                self._wakeup.notify_all()
+                self._wakeup.wait()
+                if self._closed:
+                    raise RuntimeError("MetricsLogger is closed")
+
+            update = self._open.get(run_id)
+            if update is None or (kind == "metrics" and key in update.get("metrics", {})):
+                update = {"id": run_id}
+                self._updates.append(update)
+                self._open[run_id] = update
+            if kind == "tags":
+                update.setdefault("tags", []).append(key)
+            else:
+                values = update.setdefault(kind, {})
+                if key in values:
+                    # A parameter set twice before a flush only sends its latest value
+                    self._pending -= 1
+                values[key] = value
+
+            self._pending += 1
+            self._stats["logged"] += 1
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cloudera-ml-metrics-logger", daemon=True)
+                self._thread.start()
+            if self._pending >= self.batch_size:
+                self._wakeup.notify_all()
+
+    def log_metric(self, run_id: str, key: str, value: Any) -> None:
+        """Buffer one metric value of a run"""
+        self._add(run_id, "metrics", key, value)
+
+    def log_metrics(self, run_id: str, metrics: Dict[str, Any]) -> None:
+        """Buffer several metric values of a run"""
+        for key, value in metrics.items():
+            self._add(run_id, "metrics", key, value)
+
+    def log_param(self, run_id: str, key: str, value: Any) -> None:
+        """Buffer one parameter of a run"""
+        self._add(run_id, "parameters", key, value)
+
+    def log_params(self, run_id: str, parameters: Dict[str, Any]) -> None:
+        """Buffer several parameters of a run"""
+        for key, value in parameters.items():
+            self._add(run_id, "parameters", key, value)
+
+    def add_tags(self, run_id: str, *tags: str) -> None:
+        """Buffer tags to add to a run"""
+        for tag in tags:
+            self._add(run_id, "tags", tag)
+
+    def _run(self) -> None:
+        """Flush whenever the buffer is full or its oldest value is due"""
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if self._pending >= self.batch_size:
+                        break
+                    if self._updates:
+                        remaining = self._first_at + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._wakeup.wait(remaining)
+                    else:
+                        self._wakeup.wait()
+                if self._closed:
+                    self._thread = None
+                    return
+            self.flush()
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Send everything buffered so far
+
+        Returns:
+            Dict with success, message, and the values and requests sent by this flush
+        """
+        with self._send_lock:
+            with self._lock:
+                updates, self._updates = self._updates, []
+                self._open.clear()
+                self._pending = 0
+                self._first_at = None
+                # Writers blocked on a full buffer can go on
+                self._wakeup.notify_all()
+
+            batches: List[List[Dict[str, Any]]] = []
+            batch_values = self.batch_size
+            for update in updates:
+                size = _size(update)
+                if batch_values + size > self.batch_size:
+                    batches.append([])
+                    batch_values = 0
+                batches[-1].append(update)
+                batch_values += size
+
+            sent = failed = 0
+            errors = []
+            for batch in batches:
+                try:
+                    result = self._send(batch)
+                except Exception as e:
+                    # Keep the flusher alive; writers would block forever without it
+                    result = {"success": False, "message": f"An unexpected error occurred: {str(e)}"}
+                values = sum(_size(update) for update in batch)
+                if result.get("success"):
+                    sent += values
+                else:
+                    failed += values
+                    errors.append(result.get("message"))
+
+            with self._lock:
+                self._stats["sent"] += sent
+                self._stats["failed"] += failed
+                self._stats["requests"] += len(batches)
+                if errors:
+                    self._last_error = errors[-1]
+
+        message = f"Sent {sent} values in {len(batches)} requests"
+        if failed:
+            message += f"; {failed} values could not be sent: {errors[-1]}"
+        return {"success": not failed, "message": message, "sent": sent, "failed": failed,
+                "requests": len(batches)}
+
+    # Bulk lane: background metric uploads should not hold up interactive calls
+    @transport.in_bulk
+    def _send(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return log_experiment_run_batch(self.config, {
+            "project_id": self.project_id,
+            "experiment_id": self.experiment_id,
+            "run_updates": batch,
+            # A batch often has one update per point; keep it to one request unless it is too large
+            "max_batch_runs": self.batch_size
+        })
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Stop the background thread and send whatever is still buffered
+
+        Returns:
+            The result of the final flush
+        """
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get counters for everything logged so far
+
+        Returns:
+            Dict with writes logged, values sent, failed and pending, requests made and the last error
+        """
+        with self._lock:
+            return dict(self._stats, pending=self._pending, last_error=self._last_error)
@@ -0,0 +1,72 @@
+"""Streaming multipart/form-data encoder for Cloudera ML file uploads"""
+
+import os
+import uuid
+from typing import Iterator, List, Tuple, Union
+
+
+# Size of the chunks read from disk and sent on the wire
+CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartFileStream:
+    """
+    Multipart/form-data body that streams files from disk in fixed-size chunks
+
+    requests sends an object with __iter__ and __len__ as a streamed body
+    with a Content-Length header, so memory use stays at one chunk no
+    matter how large the files are. Iterating again starts over from the
+    first byte, which lets a failed request be resent.
+    """
+
+    def __init__(self, fields: List[Union[Tuple[str, str], Tuple[str, str, int, int]]], chunk_size: int = CHUNK_SIZE):
+        """
+        Prepare the multipart body
+
+        Args:
+            fields: List of (field_name, file_path) tuples, or (field_name, file_path,
+                offset, length) tuples to send only a byte range of the file; the
+                project files API uses the target path in the project as the field name
+            chunk_size: Number of bytes read from disk at a time
+        """
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        # Segments are either bytes or (file_path, offset, size) to be read lazily
+        self._segments = []
+        for field in fields:
+            field_name, file_path = field[0], field[1]
+            offset, size = (field[2], field[3]) if len(field) == 4 else (0, os.path.getsize(file_path))
+            file_name = os.path.basename(file_path).replace('"', '%22')
+            name = field_name.replace('"', '%22')
+            self._segments.append((
+                f"--{self.boundary}\r\n"
+                f"Content-Disposition: form-data; name=\"{name}\"; filename=\"{file_name}\"\r\n"
+                f"Content-Type: application/octet-stream\r\n\r\n"
+            ).encode("utf-8"))
+            self._segments.append((file_path, offset, size))
+            self._segments.append(b"\r\n")
+        self._segments.append(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+    def __len__(self) -> int:
+        """Total size of the encoded body in bytes"""
+        return sum(len(s) if isinstance(s, bytes) else s[2] for s in self._segments)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the encoded body, reading files one chunk at a time"""
+        for segment in self._segments:
+            if isinstance(segment, bytes):
+                yield segment
+                continue
+
+            file_path, offset, size = segment
+            remaining = size
+            with open(file_path, "rb") as file_data:
+                file_data.seek(offset)
+                while remaining > 0:
+                    chunk = file_data.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        raise IOError(f"{file_path} changed size during upload")
+                    remaining -= len(chunk)
+                    yield chunk
@@ -0,0 +1,121 @@
+"""Lazy page-token pagination for Cloudera ML list endpoints"""
+
+import itertools
+from typing import Dict, Any, Optional, Iterator, Iterable, List, Tuple
+
+from . import transport
+
+
+# Records requested per page unless the caller asks for another size
+DEFAULT_PAGE_SIZE = 100
+
+
+def iter_pages(url: str, items_key: str, api_key: Optional[str] = None,
+               headers: Optional[Dict[str, str]] = None, page_size: int = DEFAULT_PAGE_SIZE,
+               query: Optional[Dict[str, Any]] = None, cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the pages of a list endpoint, fetching each one only when asked for
+
+    Args:
+        url: Full URL of the list endpoint
+        items_key: Key of the record list in each page, e.g. "jobs"
+        api_key: Optional API key, sent as a bearer token
+        headers: Optional request headers
+        page_size: Records per page
+        query: Extra query parameters, e.g. {"search_filter": ...}
+        cache: Whether pages may come from the response cache
+
+    Yields:
+        Decoded pages; each has items_key and, unless it is the last, next_page_token
+
+    Raises:
+        requests.RequestException: If a page could not be fetched
+        ValueError: If a page is not valid JSON
+    """
+    page_query = dict(query or {})
+    page_query["page_size"] = page_size
+    while True:
+        response = transport.request("GET", url, api_key=api_key, headers=headers, params=page_query, cache=cache)
+        response.raise_for_status()
+        page = response.json()
+        yield page
+
+        next_page_token = page.get("next_page_token")
+        if not next_page_token or not page.get(items_key):
+            return
+        page_query["page_token"] = next_page_token
+
+
+def paginate(url: str, items_key: str, api_key: Optional[str] = None,
+             headers: Optional[Dict[str, str]] = None, page_size: int = DEFAULT_PAGE_SIZE,
+             limit: Optional[int] = None, query: Optional[Dict[str, Any]] = None,
+             cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a list endpoint across all of its pages
+
+    Only one page is held at a time, and no further page is requested
+    once the caller stops iterating or `limit` records have been yielded.
+
+    Args:
+        url: Full URL of the list endpoint
+        items_key: Key of the record list in each page, e.g. "jobs"
+        api_key: Optional API key, sent as a bearer token
+        headers: Optional request headers
+        page_size: Records per page
+        limit: Optional maximum number of records
+        query: Extra query parameters
+        cache: Whether pages may come from the response cache
+
+    Yields:
+        Records in API order
+    """
+    if limit is not None:
+        # Never ask for more records than will be used
+        page_size = max(1, min(page_size, limit))
+    records = itertools.chain.from_iterable(
+        page.get(items_key) or []
+        for page in iter_pages(url, items_key, api_key, headers, page_size, query, cache)
+    )
+    return itertools.islice(records, limit) if limit is not None else records
+
+
+def take(records: Iterable[Dict[str, Any]], limit: Optional[int]) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Collect up to `limit` records and report whether more were available
+
+    At most one record beyond the limit is read, so an unfinished listing
+    costs at most one extra page.
+
+    Args:
+        records: Record iterator, e.g. from paginate()
+        limit: Maximum number of records to collect, or None for all
+
+    Returns:
+        Tuple of (records, whether the listing was cut short by the limit)
+    """
+    if limit is None:
+        return list(records), False
+    collected = list(itertools.islice(records, limit + 1))
+    return collected[:limit], len(collected) > limit
+
+
+def parse_limits(params: Dict[str, Any]) -> Tuple[Optional[int], int]:
+    """
+    Read the limit and page_size parameters shared by the list functions
+
+    Args:
+        params: Function parameters
+
+    Returns:
+        Tuple of (limit or None for no limit, page size)
+
+    Raises:
+        ValueError: If either value is not a positive integer
+    """
+    limit = params.get("limit")
+    page_size = params.get("page_size") or DEFAULT_PAGE_SIZE
+    limit = int(limit) if limit is not None else None
+    page_size = int(page_size)
+    if (limit is not None and limit < 0) or page_size <= 0:
+        raise ValueError("limit must be non-negative and page_size positive")
+    return limit, page_size
@@ -0,0 +1,232 @@
+"""In-process TTL and LRU cache for read-only Cloudera ML API responses"""
+
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+
+# Seconds a GET response stays fresh, by the resource it returns (the last collection in the path)
+CACHE_TTLS: Dict[str, float] = {
+    "runtimes": 300,
+    "projects": 30,
+    "jobs": 10,
+    "applications": 10,
+    "models": 10,
+    "experiments": 10,
+    "builds": 5,
+    "deployments": 5,
+    "model-builds": 5,
+    "model-deployments": 5,
+    "files": 5,
+    "runs": 2,
+}
+
+# TTL for resources not listed above
+DEFAULT_TTL = 5.0
+
+# Memory bounds: number of responses and total size of their bodies
+MAX_ENTRIES = 512
+MAX_BYTES = 32 * 1024 * 1024
+
+# POST endpoints that only read, and so neither get cached nor invalidate anything
+READ_ONLY_POSTS = ("/api/v2/projects/batchList",)
+
+
+def _segments(url: str) -> Tuple[str, ...]:
+    """Path segments after /api/v2"""
+    path = urlparse(url).path.strip("/")
+    if path.startswith("api/v2"):
+        path = path[len("api/v2"):].strip("/")
+    return tuple(segment for segment in path.split("/") if segment)
+
+
+def resource_type(url: str) -> str:
+    """
+    Get the resource a URL returns, e.g. "runs" for /projects/p/jobs/j/runs/r
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        The last collection name in the path, or "" for the API root
+    """
+    collections = _segments(url)[::2]
+    return collections[-1] if collections else ""
+
+
+def cache_scope(url: str) -> Tuple[str, ...]:
+    """
+    Get the invalidation scope of a URL
+
+    Scopes are tuples compared by prefix. Inside a project the scope is the
+    project and its top-level collection, with the model, model-build and
+    model-deployment collections grouped together, so a mutation only drops
+    related reads in the same project. Anything at project level or above
+    has a broader scope.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        Scope tuple starting with the scheme and host
+    """
+    parsed_url = urlparse(url)
+    host = f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
+    segments = _segments(url)
+    if len(segments) >= 3 and segments[0] == "projects":
+        collection = "models" if segments[2].startswith("model") else segments[2]
+        return (host, "projects", segments[1], collection)
+    return (host,) + segments[:1]
+
+
+def cache_key(url: str, params: Any = None, authorization: Optional[str] = None) -> str:
+    """
+    Build the cache key for a GET request
+
+    The key includes a hash of the Authorization header, so responses are
+    never shared between API keys.
+
+    Args:
+        url: Full request URL
+        params: Query parameters passed separately from the URL, if any
+        authorization: Authorization header value, if any
+
+    Returns:
+        Cache key
+    """
+    full_url = requests.Request("GET", url, params=params).prepare().url
+    auth_hash = hashlib.sha256((authorization or "").encode("utf-8")).hexdigest()[:16]
+    return f"{auth_hash} {full_url}"
+
+
+def _copy_response(response: requests.Response) -> requests.Response:
+    """Independent copy of a fully read response"""
+    copy = requests.Response()
+    copy.status_code = response.status_code
+    copy.headers = requests.structures.CaseInsensitiveDict(response.headers)
+    copy._content = response.content
+    copy.encoding = response.encoding
+    copy.reason = response.reason
+    copy.url = response.url
+    copy.elapsed = response.elapsed
+    return copy
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU of successful GET responses with per-resource expiry
+
+    Entries are dropped when they expire, when the cache goes over its
+    entry or byte limit (least recently used first), or when a mutation
+    in the same scope is sent.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        """
+        Create an empty cache
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, ...], requests.Response]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _drop(self, key: str) -> None:
+        _, _, response = self._entries.pop(key)
+        self._bytes -= len(response.content)
+
+    def get(self, key: str) -> Optional[requests.Response]:
+        """
+        Look up a fresh response
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            A copy of the cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy_response(entry[2])
+
+    def put(self, key: str, url: str, response: requests.Response) -> None:
+        """
+        Store a successful response for its resource's TTL
+
+        Args:
+            key: Cache key from cache_key()
+            url: Request URL, used for the TTL and invalidation scope
+            response: Response to store; only 200 responses that fit the cache are kept
+        """
+        ttl = CACHE_TTLS.get(resource_type(url), DEFAULT_TTL)
+        size = len(response.content)
+        if response.status_code != 200 or ttl <= 0 or size > self.max_bytes // 8:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, cache_scope(url), _copy_response(response))
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drop every response in the scope of a mutation
+
+        Args:
+            url: URL of the mutating request
+
+        Returns:
+            Number of responses dropped
+        """
+        scope = cache_scope(url)
+        with self._lock:
+            stale = [key for key, (_, entry_scope, _) in self._entries.items()
+                     if entry_scope[:len(scope)] == scope]
+            for key in stale:
+                self._drop(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache size and hit statistics
+
+        Returns:
+            Dict with entries, bytes, hits and misses
+        """
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+# Set CLOUDERA_ML_RESPONSE_CACHE=0 to turn the cache off
+ENABLED = os.environ.get("CLOUDERA_ML_RESPONSE_CACHE", "1") not in ("0", "false", "no")
+
+# Cache shared by every request in the process
+response_cache = ResponseCache()
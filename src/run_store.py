@@ -0,0 +1,439 @@
+"""Local SQLite mirror of experiments and runs, synced incrementally"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Sequence, Union
+
+from . import pagination
+from .run_table import (latest_metrics, run_params, run_tags, experiment_runs_url, fetch_runs,
+                        DEFAULT_CONCURRENCY, LIST_PAGE_SIZE)
+from .utils import parse_remote_time
+
+
+# Default location for run stores (one database per host)
+STORE_DIR = os.path.join(os.path.expanduser("~"), ".cloudera_ml_mcp", "run_stores")
+
+# Runs that can still change without their start or end time moving
+ACTIVE_STATUSES = ("RUNNING", "SCHEDULED")
+
+# Seconds subtracted from the watermark, for clock skew and runs written during a sync
+WATERMARK_SKEW = 300
+
+# Runs returned by a query unless the caller asks for another number
+DEFAULT_QUERY_LIMIT = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    name TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS experiments_project ON experiments (project_id);
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    experiment_id TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    start_time REAL,
+    end_time REAL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_experiment ON runs (experiment_id, status);
+CREATE INDEX IF NOT EXISTS runs_project ON runs (project_id, status);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS metrics_key_value ON metrics (key, value);
+CREATE TABLE IF NOT EXISTS params (
+    run_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS params_key_value ON params (key, value);
+CREATE TABLE IF NOT EXISTS tags (
+    run_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_key_value ON tags (key, value);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_id TEXT NOT NULL,
+    experiment_id TEXT NOT NULL,
+    watermark REAL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (project_id, experiment_id)
+);
+"""
+
+
+def store_path(host: str, store_dir: Optional[str] = None) -> str:
+    """
+    Get the run store location for a CML host
+
+    Args:
+        host: CML host URL
+        store_dir: Optional directory to keep stores in (default: STORE_DIR)
+
+    Returns:
+        Path of the SQLite database
+    """
+    digest = hashlib.sha256(host.rstrip("/").encode("utf-8")).hexdigest()[:16]
+    return os.path.join(store_dir or STORE_DIR, f"{digest}.db")
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _text(value: Any) -> Optional[str]:
+    """Parameter and tag values are compared as text, the way the API returns them"""
+    return None if value is None else str(value)
+
+
+def changed_at(run: Dict[str, Any]) -> Optional[float]:
+    """
+    Latest time an experiment run is known to have changed
+
+    Args:
+        run: Experiment run as listed by the API
+
+    Returns:
+        Its end time, else its start time, in seconds since the epoch; None if it has neither
+    """
+    times = [parse_remote_time(run.get(field)) for field in ("start_time", "created_at", "end_time")]
+    times = [value for value in times if value is not None]
+    return max(times) if times else None
+
+
+class RunStore:
+    """
+    Local mirror of the experiments and runs of CML projects in SQLite
+
+    sync() brings a project up to date. Each experiment keeps a watermark:
+    the latest start or end time seen at its last sync. The next sync reads
+    the run listing and only fetches and writes runs that are new, changed
+    status, were still running, or started or ended after the watermark;
+    runs that are gone from the listing are removed. Queries then answer
+    from the indexed tables on disk without calling the API.
+
+    Metrics are stored with their latest value; parameters and tags as text.
+    A metric logged to a run that has already ended does not move its
+    watermark, so sync(full=True) re-reads every run.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) a run store
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._db.close()
+
+    def sync(self, config: Dict[str, str], project_id: str, experiment_ids: Optional[Sequence[str]] = None,
+             full: bool = False, concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Any]:
+        """
+        Bring the experiments and runs of a project up to date
+
+        Experiment runs are listed `concurrency` experiments at a time, and
+        the runs that need their details are fetched `concurrency` at a time.
+
+        Args:
+            config: MCP configuration with host and api_key
+            project_id: ID of the project
+            experiment_ids: Only sync the runs of these experiments (default: all)
+            full: Re-read every run, ignoring the watermarks
+            concurrency: Experiments listed, and runs fetched, in parallel
+
+        Returns:
+            Dict with experiments synced and the numbers of runs added, updated,
+            removed, unchanged and fetched one by one
+
+        Raises:
+            requests.RequestException: If a listing failed
+            ValueError: If a page is not valid JSON
+            RuntimeError: If a run could not be fetched
+        """
+        host = config.get("host", "").rstrip("/")
+        if "://" not in host:
+            host = "https://" + host
+        experiments_url = f"{host}/api/v2/projects/{project_id}/experiments"
+        print(f"Syncing experiments from: {experiments_url}")
+        # Fresh listings: a cached page would hide changes since the last sync
+        experiments = list(pagination.paginate(experiments_url, "experiments", api_key=config.get("api_key", ""),
+                                               page_size=LIST_PAGE_SIZE, cache=False))
+        listed_ids = {experiment.get("id") for experiment in experiments}
+        if experiment_ids is None:
+            experiment_ids = sorted(listed_ids)
+        else:
+            experiment_ids = list(experiment_ids)
+
+        with self._lock:
+            with self._db:
+                stored = [row["id"] for row in
+                          self._db.execute("SELECT id FROM experiments WHERE project_id = ?", (project_id,))]
+                for experiment_id in set(stored) - listed_ids:
+                    self._delete_experiment(project_id, experiment_id)
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO experiments (id, project_id, name, record) VALUES (?, ?, ?, ?)",
+                    [(experiment.get("id"), project_id, experiment.get("name"), json.dumps(experiment))
+                     for experiment in experiments])
+
+        def list_runs(experiment_id):
+            url = experiment_runs_url(config, project_id, experiment_id)
+            return list(pagination.paginate(url, "experiment_runs", api_key=config.get("api_key", ""),
+                                            page_size=LIST_PAGE_SIZE, cache=False))
+
+        totals = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "fetched": 0}
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(experiment_ids)))) as executor:
+            listings = executor.map(list_runs, experiment_ids)
+            for experiment_id, listed in zip(experiment_ids, listings):
+                counts = self._sync_runs(config, project_id, experiment_id, listed, full, concurrency)
+                for name in totals:
+                    totals[name] += counts[name]
+
+        return dict(totals, experiments=len(experiment_ids))
+
+    def _sync_runs(self, config: Dict[str, str], project_id: str, experiment_id: str,
+                   listed: List[Dict[str, Any]], full: bool, concurrency: int) -> Dict[str, int]:
+        """Write the new and changed runs of one experiment's listing, and drop the runs it no longer has"""
+        with self._lock:
+            row = self._db.execute("SELECT watermark FROM sync_state WHERE project_id = ? AND experiment_id = ?",
+                                   (project_id, experiment_id)).fetchone()
+            stored = {row["id"]: row["status"] for row in
+                      self._db.execute("SELECT id, status FROM runs WHERE experiment_id = ?", (experiment_id,))}
+        watermark = None if full or row is None else row["watermark"]
+
+        changed = []
+        latest = watermark
+        for run in listed:
+            run_changed_at = changed_at(run)
+            if run_changed_at is not None and (latest is None or run_changed_at > latest):
+                latest = run_changed_at
+            run_id = run.get("id")
+            if (watermark is None or run_id not in stored or stored[run_id] != run.get("status")
+                    or stored[run_id] in ACTIVE_STATUSES or run_changed_at is None
+                    or run_changed_at > watermark - WATERMARK_SKEW):
+                changed.append(run)
+
+        # Only the changed runs the listing has no data for are fetched one by one
+        missing = [index for index, run in enumerate(changed) if "data" not in run]
+        details = fetch_runs(config, project_id, experiment_id, [changed[index].get("id") for index in missing],
+                             concurrency, cache=False)
+        for index, run in zip(missing, details):
+            changed[index] = run
+
+        listed_ids = {run.get("id") for run in listed}
+        removed = [run_id for run_id in stored if run_id not in listed_ids]
+        with self._lock:
+            with self._db:
+                self._delete_runs(removed)
+                self._write_runs(project_id, experiment_id, changed)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sync_state (project_id, experiment_id, watermark, synced_at) "
+                    "VALUES (?, ?, ?, ?)", (project_id, experiment_id, latest, time.time()))
+
+        added = sum(1 for run in changed if run.get("id") not in stored)
+        return {"added": added, "updated": len(changed) - added, "removed": len(removed),
+                "unchanged": len(listed) - len(changed), "fetched": len(missing)}
+
+    def _write_runs(self, project_id: str, experiment_id: str, runs: List[Dict[str, Any]]) -> None:
+        """Replace the rows of the given runs; the caller holds the lock and a transaction"""
+        self._delete_runs([run.get("id") for run in runs])
+        self._db.executemany(
+            "INSERT INTO runs (id, project_id, experiment_id, name, status, start_time, end_time, record) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run.get("id"), project_id, experiment_id, run.get("name"), run.get("status"),
+              parse_remote_time(run.get("start_time") or run.get("created_at")),
+              parse_remote_time(run.get("end_time")), json.dumps(run)) for run in runs])
+        self._db.executemany("INSERT INTO metrics (run_id, key, value) VALUES (?, ?, ?)",
+                             [(run.get("id"), key, _to_float(value)) for run in runs
+                              for key, value in latest_metrics(run).items()])
+        self._db.executemany("INSERT INTO params (run_id, key, value) VALUES (?, ?, ?)",
+                             [(run.get("id"), key, _text(value)) for run in runs
+                              for key, value in run_params(run).items()])
+        self._db.executemany("INSERT INTO tags (run_id, key, value) VALUES (?, ?, ?)",
+                             [(run.get("id"), key, _text(value)) for run in runs
+                              for key, value in run_tags(run).items()])
+
+    def _delete_runs(self, run_ids: List[str]) -> None:
+        """Delete runs and their metrics, parameters and tags; the caller holds the lock and a transaction"""
+        rows = [(run_id,) for run_id in run_ids]
+        for table in ("metrics", "params", "tags"):
+            self._db.executemany(f"DELETE FROM {table} WHERE run_id = ?", rows)
+        self._db.executemany("DELETE FROM runs WHERE id = ?", rows)
+
+    def _delete_experiment(self, project_id: str, experiment_id: str) -> None:
+        """Delete an experiment with its runs; the caller holds the lock and a transaction"""
+        self._delete_runs([row["id"] for row in
+                           self._db.execute("SELECT id FROM runs WHERE experiment_id = ?", (experiment_id,))])
+        self._db.execute("DELETE FROM experiments WHERE id = ?", (experiment_id,))
+        self._db.execute("DELETE FROM sync_state WHERE project_id = ? AND experiment_id = ?",
+                         (project_id, experiment_id))
+
+    def experiments(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        List the stored experiments of a project
+
+        Args:
+            project_id: ID of the project
+
+        Returns:
+            Experiments as listed by the API, with run_count and synced_at
+            (None if their runs were never synced) added
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT e.record, s.synced_at, (SELECT COUNT(*) FROM runs r WHERE r.experiment_id = e.id) AS run_count "
+                "FROM experiments e LEFT JOIN sync_state s ON s.project_id = e.project_id AND s.experiment_id = e.id "
+                "WHERE e.project_id = ? ORDER BY e.name", (project_id,)).fetchall()
+        return [dict(json.loads(row["record"]), run_count=row["run_count"], synced_at=row["synced_at"])
+                for row in rows]
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored run as returned by the API
+
+        Args:
+            run_id: ID of the run
+
+        Returns:
+            The run, or None if it is not stored
+        """
+        with self._lock:
+            row = self._db.execute("SELECT record FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return json.loads(row["record"]) if row else None
+
+    def last_synced(self, project_id: str) -> Optional[float]:
+        """Time of the latest sync of any experiment of a project, or None if it was never synced"""
+        with self._lock:
+            row = self._db.execute("SELECT MAX(synced_at) AS synced_at FROM sync_state WHERE project_id = ?",
+                                   (project_id,)).fetchone()
+        return row["synced_at"]
+
+    def query_runs(self, project_id: Optional[str] = None, experiment_id: Optional[str] = None,
+                   status: Optional[Union[str, Sequence[str]]] = None,
+                   tags: Optional[Union[Dict[str, Any], Sequence[str]]] = None,
+                   params: Optional[Dict[str, Any]] = None, metric: Optional[str] = None,
+                   metric_min: Optional[float] = None, metric_max: Optional[float] = None,
+                   order: Optional[str] = None, limit: Optional[int] = DEFAULT_QUERY_LIMIT) -> Dict[str, Any]:
+        """
+        Find stored runs; all given filters must match
+
+        Args:
+            project_id: Only runs of this project
+            experiment_id: Only runs of this experiment
+            status: Run status, or a list of statuses (case-insensitive)
+            tags: Tags the runs must have: a list of tag names, or a {name: value} dict
+            params: Parameter values the runs must have, compared as text
+            metric: Only runs with this metric; metric_min, metric_max and order apply to it
+            metric_min: Lowest metric value, inclusive
+            metric_max: Highest metric value, inclusive
+            order: "asc" or "desc" to sort by the metric (default: by start time, newest first)
+            limit: Runs returned at most; None for all
+
+        Returns:
+            Dict with the total number of matches and the matching runs, each with
+            id, experiment_id, name, status, start_time, end_time, metrics, params and tags
+
+        Raises:
+            ValueError: If a metric filter or order is given without a metric, or order is unknown
+        """
+        if (metric_min is not None or metric_max is not None or order) and not metric:
+            raise ValueError("metric is required for metric_min, metric_max and order")
+        if order and order.lower() not in ("asc", "desc"):
+            raise ValueError("order must be asc or desc")
+
+        joins, where, args = [], [], []
+        if metric:
+            joins.append("JOIN metrics m ON m.run_id = r.id AND m.key = ?")
+            args.append(metric)
+            if metric_min is not None:
+                where.append("m.value >= ?")
+                args.append(float(metric_min))
+            if metric_max is not None:
+                where.append("m.value <= ?")
+                args.append(float(metric_max))
+        if project_id:
+            where.append("r.project_id = ?")
+            args.append(project_id)
+        if experiment_id:
+            where.append("r.experiment_id = ?")
+            args.append(experiment_id)
+        if status:
+            statuses = [status] if isinstance(status, str) else list(status)
+            where.append(f"UPPER(r.status) IN ({', '.join('?' * len(statuses))})")
+            args.extend(item.upper() for item in statuses)
+        tag_filters = tags.items() if isinstance(tags, dict) else [(name, None) for name in tags or []]
+        for name, value in tag_filters:
+            if value is None:
+                where.append("EXISTS (SELECT 1 FROM tags t WHERE t.run_id = r.id AND t.key = ?)")
+                args.append(name)
+            else:
+                where.append("EXISTS (SELECT 1 FROM tags t WHERE t.run_id = r.id AND t.key = ? AND t.value = ?)")
+                args.extend((name, _text(value)))
+        for name, value in (params or {}).items():
+            where.append("EXISTS (SELECT 1 FROM params p WHERE p.run_id = r.id AND p.key = ? AND p.value = ?)")
+            args.extend((name, _text(value)))
+
+        sql = f"FROM runs r {' '.join(joins)}"
+        if where:
+            sql += f" WHERE {' AND '.join(where)}"
+        if order:
+            order_by = f"m.value {order.upper()}, r.id"
+        else:
+            order_by = "r.start_time DESC, r.id"
+
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) {sql}", args).fetchone()[0]
+            select = f"SELECT r.id, r.experiment_id, r.name, r.status, r.start_time, r.end_time {sql} ORDER BY {order_by}"
+            if limit is not None:
+                select += f" LIMIT {int(limit)}"
+            rows = self._db.execute(select, args).fetchall()
+
+            runs = {row["id"]: dict(row, metrics={}, params={}, tags={}) for row in rows}
+            ids = list(runs)
+            # Chunked to stay under SQLite's limit on query parameters
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ", ".join("?" * len(chunk))
+                for table in ("metrics", "params", "tags"):
+                    for row in self._db.execute(f"SELECT run_id, key, value FROM {table} WHERE run_id IN ({marks})",
+                                                chunk):
+                        runs[row["run_id"]][table][row["key"]] = row["value"]
+
+        return {"total": total, "runs": list(runs.values())}
@@ -0,0 +1,440 @@
+"""Columnar in-memory table of experiment runs, with vectorized ranking and comparison"""
+
+import csv
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable, Sequence
+
+import numpy as np
+
+from . import transport
+from . import pagination
+from .functions.get_experiment_run import get_experiment_run
+from .utils import parse_remote_time
+
+
+# Runs fetched one by one at once when the listing lacks their metrics and parameters
+DEFAULT_CONCURRENCY = 8
+
+# Runs fetched per page when listing an experiment
+LIST_PAGE_SIZE = 1000
+
+# Run fields kept as columns next to the metrics and parameters
+RUN_FIELDS = ("id", "name", "status", "start_time")
+
+
+def _run_data(run: Dict[str, Any]) -> Dict[str, Any]:
+    """The metrics/params/tags part of a run, wherever the API put it"""
+    return run.get("data") or run
+
+
+def _point_position(value: Any) -> float:
+    """A metric point's step or timestamp as a number; ISO times are parsed, missing values sort first"""
+    if value is None or value == "":
+        return -math.inf
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = parse_remote_time(value)
+    return -math.inf if number is None or math.isnan(number) else number
+
+
+def latest_metrics(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the latest value of every metric of an experiment run
+
+    Args:
+        run: Experiment run; metrics are either a {key: value} dict or a list
+            of {key, value, step, timestamp} points
+
+    Returns:
+        Dict of metric name to the value with the highest step, then the latest
+        timestamp; steps and timestamps may be numbers, numeric strings or ISO times
+    """
+    metrics = _run_data(run).get("metrics")
+    if isinstance(metrics, dict):
+        return dict(metrics)
+    latest: Dict[str, Any] = {}
+    order: Dict[str, tuple] = {}
+    for point in metrics or []:
+        key = point.get("key")
+        rank = (_point_position(point.get("step")), _point_position(point.get("timestamp")))
+        if key is not None and (key not in order or rank >= order[key]):
+            latest[key] = point.get("value")
+            order[key] = rank
+    return latest
+
+
+def run_params(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the parameters of an experiment run
+
+    Args:
+        run: Experiment run; parameters are a {key: value} dict or a list of {key, value}
+
+    Returns:
+        Dict of parameter name to value
+    """
+    data = _run_data(run)
+    params = data.get("params", data.get("parameters"))
+    if isinstance(params, dict):
+        return dict(params)
+    return {item.get("key"): item.get("value") for item in params or [] if item.get("key") is not None}
+
+
+def run_tags(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the tags of an experiment run
+
+    Args:
+        run: Experiment run; tags are a {key: value} dict, a list of {key, value},
+            or a list of plain strings
+
+    Returns:
+        Dict of tag name to value; plain string tags have an empty value
+    """
+    tags = _run_data(run).get("tags")
+    if isinstance(tags, dict):
+        return dict(tags)
+    result = {}
+    for tag in tags or []:
+        if isinstance(tag, dict):
+            if tag.get("key") is not None:
+                result[tag["key"]] = tag.get("value")
+        elif tag is not None:
+            result[str(tag)] = ""
+    return result
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else math.nan
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _plain(value: Any) -> Any:
+    """JSON-friendly version of a table value: NaN becomes None, NumPy scalars Python ones"""
+    if isinstance(value, (float, np.floating)):
+        return None if math.isnan(value) else float(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class RunTable:
+    """
+    Experiment runs as columns: one NumPy array per field, metric and parameter
+
+    Metric columns ("metrics.<name>") are float64 arrays holding each run's
+    latest value, with NaN where a run lacks the metric. Parameter columns
+    ("params.<name>") and the id, name and status columns are object
+    arrays; start_time is float64 seconds since the epoch. Rows keep the
+    order the runs were given in.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("all columns must have the same length")
+        self.columns = columns
+
+    @classmethod
+    def from_runs(cls, runs: Sequence[Dict[str, Any]]) -> "RunTable":
+        """
+        Build a table from experiment runs as returned by the API
+
+        Args:
+            runs: Experiment runs
+
+        Returns:
+            RunTable with a column per run field, metric and parameter
+        """
+        metrics = [latest_metrics(run) for run in runs]
+        params = [run_params(run) for run in runs]
+        metric_names = sorted({name for values in metrics for name in values})
+        param_names = sorted({name for values in params for name in values})
+
+        columns: Dict[str, np.ndarray] = {
+            "id": np.array([run.get("id") for run in runs], dtype=object),
+            "name": np.array([run.get("name") for run in runs], dtype=object),
+            "status": np.array([run.get("status") for run in runs], dtype=object),
+            "start_time": np.array([_to_float(parse_remote_time(run.get("start_time") or run.get("created_at")))
+                                    for run in runs], dtype=np.float64),
+        }
+        for name in metric_names:
+            columns[f"metrics.{name}"] = np.array([_to_float(values.get(name)) for values in metrics],
+                                                  dtype=np.float64)
+        for name in param_names:
+            columns[f"params.{name}"] = np.array([values.get(name) for values in params], dtype=object)
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"]) if "id" in self.columns else 0
+
+    @property
+    def metric_names(self) -> List[str]:
+        """Names of the metric columns, without the "metrics." prefix"""
+        return [name[len("metrics."):] for name in self.columns if name.startswith("metrics.")]
+
+    @property
+    def param_names(self) -> List[str]:
+        """Names of the parameter columns, without the "params." prefix"""
+        return [name[len("params."):] for name in self.columns if name.startswith("params.")]
+
+    def metric(self, name: str) -> np.ndarray:
+        """
+        Get a metric column
+
+        Args:
+            name: Metric name
+
+        Returns:
+            float64 array with NaN for runs without the metric
+
+        Raises:
+            KeyError: If no run has the metric
+        """
+        column = self.columns.get(f"metrics.{name}")
+        if column is None:
+            raise KeyError(f"No run has metric {name}")
+        return column
+
+    def rows(self, indices: Iterable[int], columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get rows as dicts with JSON-friendly values
+
+        Args:
+            indices: Row indices
+            columns: Column names to include (default: all)
+
+        Returns:
+            One dict per row
+        """
+        names = list(columns) if columns is not None else list(self.columns)
+        return [{name: _plain(self.columns[name][index]) for name in names} for index in indices]
+
+    def select(self, mask: np.ndarray) -> "RunTable":
+        """Table with only the rows where mask is True"""
+        return RunTable({name: values[mask] for name, values in self.columns.items()})
+
+    def where(self, run_ids: Optional[Iterable[str]] = None,
+              status: Optional[Iterable[str]] = None) -> "RunTable":
+        """
+        Table with only the given runs and/or statuses
+
+        Args:
+            run_ids: Run IDs to keep (default: all)
+            status: Statuses to keep, case-insensitive (default: all)
+
+        Returns:
+            Filtered RunTable
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if run_ids is not None:
+            mask &= np.isin(self.columns["id"], list(run_ids))
+        if status is not None:
+            wanted = [str(item).upper() for item in status]
+            mask &= np.isin(np.array([str(value or "").upper() for value in self.columns["status"]], dtype=object),
+                            wanted)
+        return self.select(mask)
+
+    def top_k(self, metric: str, k: int = 10, ascending: bool = False) -> np.ndarray:
+        """
+        Indices of the k best runs by a metric, best first
+
+        Only the k best values are fully sorted (argpartition, then argsort
+        of those), so this stays fast for large tables. Equal values keep
+        table order. Runs without the metric are never ranked.
+
+        Args:
+            metric: Metric name
+            k: Number of runs to return
+            ascending: Rank the lowest values first, e.g. for losses (default: highest first)
+
+        Returns:
+            Row indices, best first
+        """
+        values = self.metric(metric)
+        candidates = np.flatnonzero(~np.isnan(values))
+        if k <= 0 or not len(candidates):
+            return candidates[:0]
+        # Negate so the best values are always the smallest
+        keys = values[candidates] if ascending else -values[candidates]
+        if k < len(candidates):
+            # argpartition picks any of the runs tied with the k-th value; take the first ones instead
+            kth = keys[np.argpartition(keys, k - 1)[k - 1]]
+            better = np.flatnonzero(keys < kth)
+            best = np.concatenate([better, np.flatnonzero(keys == kth)[:k - len(better)]])
+            best.sort()
+        else:
+            best = np.arange(len(candidates))
+        return candidates[best[np.argsort(keys[best], kind="stable")]]
+
+    def summary(self, metrics: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-metric statistics over the runs that have each metric
+
+        Args:
+            metrics: Metric names (default: all)
+
+        Returns:
+            Dict of metric name to count, min, max, mean and std
+        """
+        result = {}
+        for name in metrics if metrics is not None else self.metric_names:
+            values = self.metric(name)
+            present = values[~np.isnan(values)]
+            if not len(present):
+                result[name] = {"count": 0, "min": None, "max": None, "mean": None, "std": None}
+                continue
+            result[name] = {
+                "count": int(len(present)),
+                "min": float(present.min()),
+                "max": float(present.max()),
+                "mean": float(present.mean()),
+                "std": float(present.std()),
+            }
+        return result
+
+    def to_csv(self, path: str) -> None:
+        """
+        Write the table to a CSV file, one row per run
+
+        Args:
+            path: File to write
+        """
+        names = list(self.columns)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            for row in self.rows(range(len(self)), names):
+                writer.writerow(["" if row[name] is None else row[name] for name in names])
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Write the table to a Parquet file
+
+        Args:
+            path: File to write
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Writing Parquet needs pyarrow: pip install pyarrow")
+        arrays = {}
+        for name, values in self.columns.items():
+            if values.dtype == object:
+                # Parameters can mix types across runs; store them as text like the API does
+                values = [None if value is None else str(value) for value in values]
+            arrays[name] = pyarrow.array(values)
+        pyarrow.parquet.write_table(pyarrow.table(arrays), path)
+
+
+def experiment_runs_url(config: Dict[str, str], project_id: str, experiment_id: str) -> str:
+    """URL of the runs of an experiment, with https:// added to a bare host"""
+    host = config.get("host", "").rstrip("/")
+    if "://" not in host:
+        host = "https://" + host
+    return f"{host}/api/v2/projects/{project_id}/experiments/{experiment_id}/runs"
+
+
+def fetch_runs(config: Dict[str, str], project_id: str, experiment_id: str, run_ids: Sequence[str],
+               concurrency: int = DEFAULT_CONCURRENCY, cache: bool = True) -> List[Dict[str, Any]]:
+    """
+    Get experiment runs one by one with their metrics and parameters, `concurrency` at a time
+
+    Args:
+        config: MCP configuration with host and api_key
+        project_id: ID of the project
+        experiment_id: ID of the experiment
+        run_ids: IDs of the runs to get
+        concurrency: Runs fetched in parallel
+        cache: Whether runs may come from the response cache
+
+    Returns:
+        The runs, in the order of run_ids
+
+    Raises:
+        RuntimeError: If a run could not be fetched
+    """
+    if not run_ids:
+        return []
+
+    # Bulk lane: fetching thousands of runs should not hold up interactive calls
+    @transport.in_bulk
+    def fetch(run_id):
+        return get_experiment_run(config, {"project_id": project_id, "experiment_id": experiment_id,
+                                           "run_id": run_id, "bypass_cache": not cache})
+
+    runs = []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(run_ids))) as executor:
+        for run_id, result in zip(run_ids, executor.map(fetch, run_ids)):
+            if not result.get("success"):
+                raise RuntimeError(f"Could not get run {run_id}: {result.get('message')}")
+            runs.append(result["data"])
+    return runs
+
+
+def fetch_experiment_runs(config: Dict[str, str], project_id: str, experiment_id: str,
+                          concurrency: int = DEFAULT_CONCURRENCY, fetch_details: bool = False,
+                          cache: bool = True) -> List[Dict[str, Any]]:
+    """
+    Get every run of an experiment with its metrics and parameters
+
+    The runs are listed page by page; runs the listing returns without
+    their data (or all runs, with fetch_details) are then fetched one by
+    one, `concurrency` at a time.
+
+    Args:
+        config: MCP configuration with host and api_key
+        project_id: ID of the project
+        experiment_id: ID of the experiment
+        concurrency: Runs fetched in parallel
+        fetch_details: Fetch every run on its own even if the listing has its data
+        cache: Whether list pages and runs may come from the response cache
+
+    Returns:
+        Experiment runs in listing order
+
+    Raises:
+        requests.RequestException: If the listing failed
+        ValueError: If a page is not valid JSON
+        RuntimeError: If a run could not be fetched
+    """
+    url = experiment_runs_url(config, project_id, experiment_id)
+    print(f"Accessing: {url}")
+    runs = list(pagination.paginate(url, "experiment_runs", api_key=config.get("api_key", ""),
+                                    page_size=LIST_PAGE_SIZE, cache=cache))
+
+    missing = [index for index, run in enumerate(runs) if fetch_details or "data" not in run]
+    details = fetch_runs(config, project_id, experiment_id, [runs[index].get("id") for index in missing],
+                         concurrency, cache)
+    for index, run in zip(missing, details):
+        runs[index] = run
+    return runs
+
+
+def load_run_table(config: Dict[str, str], project_id: str, experiment_id: str,
+                   concurrency: int = DEFAULT_CONCURRENCY, fetch_details: bool = False,
+                   cache: bool = True) -> RunTable:
+    """
+    Fetch every run of an experiment into a RunTable
+
+    Args:
+        config: MCP configuration with host and api_key
+        project_id: ID of the project
+        experiment_id: ID of the experiment
+        concurrency: Runs fetched in parallel when the listing lacks their data
+        fetch_details: Fetch every run on its own even if the listing has its data
+        cache: Whether list pages and runs may come from the response cache
+
+    Returns:
+        RunTable of the experiment's runs
+    """
+    return RunTable.from_runs(fetch_experiment_runs(config, project_id, experiment_id, concurrency,
+                                                    fetch_details, cache))
@@ -0,0 +1,500 @@
+"""Shared HTTP transport for Cloudera ML MCP"""
+
+import os
+import time
+import random
+import threading
+import contextlib
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import response_cache
+
+
+# Maximum number of keep-alive connections kept open per host
+POOL_MAXSIZE = 32
+
+# Default (connect, read) timeout in seconds for every request
+DEFAULT_TIMEOUT = (10, 300)
+
+# Methods that are safe to send twice, and therefore retried by default
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses that mean the server did not handle the request and it may be retried
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+def _env_rate_limit(name: str, default: Tuple[float, int]) -> Optional[Tuple[float, int]]:
+    """
+    Read a rate limit from the environment as "rate" or "rate/burst"
+
+    Args:
+        name: Environment variable name
+        default: (rate, burst) used when the variable is not set
+
+    Returns:
+        (requests per second, burst size), or None for no limit when the rate is 0
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    rate, _, burst = value.partition("/")
+    if float(rate) <= 0:
+        return None
+    return float(rate), int(burst) if burst else max(1, int(float(rate) * 2))
+
+
+# Request rate limits per host and endpoint class, as (requests per second, burst size)
+RATE_LIMITS: Dict[str, Optional[Tuple[float, int]]] = {
+    "read": _env_rate_limit("CLOUDERA_ML_RATE_LIMIT_READ", (20.0, 40)),
+    "mutate": _env_rate_limit("CLOUDERA_ML_RATE_LIMIT_MUTATE", (10.0, 20)),
+    "upload": _env_rate_limit("CLOUDERA_ML_RATE_LIMIT_UPLOAD", (10.0, 20)),
+    "all": _env_rate_limit("CLOUDERA_ML_RATE_LIMIT", (20.0, 40)),
+}
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+_buckets: Dict[Tuple[str, str], "TokenBucket"] = {}
+_buckets_lock = threading.Lock()
+_rate_limit_by_class = True
+
+_priority = threading.local()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that makes callers wait for a free token
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers
+    in the bulk lane only take a token when no interactive caller is
+    waiting, so long-running batch work cannot starve one-off calls.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Create a full bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens held
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+        self._waiting = {"interactive": 0, "bulk": 0}
+        self._acquired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, bulk: bool = False) -> float:
+        """
+        Take one token, waiting until one is available
+
+        Args:
+            bulk: Whether the caller is in the bulk lane
+
+        Returns:
+            Seconds spent waiting
+        """
+        lane = "bulk" if bulk else "interactive"
+        start = time.monotonic()
+        with self._condition:
+            self._waiting[lane] += 1
+            try:
+                while True:
+                    self._refill()
+                    yielding = bulk and self._waiting["interactive"] > 0
+                    if self._tokens >= 1 and not yielding:
+                        self._tokens -= 1
+                        break
+                    # Sleep until the next token is due, or until woken by a departing caller
+                    self._condition.wait(max((1 - self._tokens) / self.rate, 0.001) if not yielding else 0.05)
+            finally:
+                self._waiting[lane] -= 1
+                self._condition.notify_all()
+
+            waited = time.monotonic() - start
+            self._acquired += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the bucket's current state and wait statistics
+
+        Returns:
+            Dict with rate, burst, tokens, queue_depth (interactive and bulk),
+            requests, total_wait, average_wait and max_wait in seconds
+        """
+        with self._condition:
+            self._refill()
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 3),
+                "queue_depth": self._waiting["interactive"] + self._waiting["bulk"],
+                "interactive_waiting": self._waiting["interactive"],
+                "bulk_waiting": self._waiting["bulk"],
+                "requests": self._acquired,
+                "total_wait": round(self._total_wait, 3),
+                "average_wait": round(self._total_wait / self._acquired, 4) if self._acquired else 0.0,
+                "max_wait": round(self._max_wait, 3),
+            }
+
+
+def endpoint_class(method: str, url: str) -> str:
+    """
+    Classify a request for rate limiting
+
+    Args:
+        method: HTTP method
+        url: Full request URL
+
+    Returns:
+        "upload" for file uploads, "read" for other GET/HEAD/OPTIONS requests, otherwise "mutate"
+    """
+    method = method.upper()
+    if method in ("PUT", "POST") and urlparse(url).path.rstrip("/").endswith("/files"):
+        return "upload"
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return "read"
+    return "mutate"
+
+
+def set_rate_limits(limits: Optional[Dict[str, Optional[Tuple[float, int]]]] = None,
+                    by_endpoint_class: bool = True) -> None:
+    """
+    Change the rate limits applied to every request
+
+    Args:
+        limits: Mapping of endpoint class ("read", "mutate", "upload", or "all"
+            for the single per-host limit) to (requests per second, burst size),
+            or None to remove that limit; classes not given are unchanged
+        by_endpoint_class: Limit each endpoint class separately (default), or
+            share one "all" bucket per host
+    """
+    global _rate_limit_by_class
+    with _buckets_lock:
+        RATE_LIMITS.update(limits or {})
+        _rate_limit_by_class = by_endpoint_class
+        _buckets.clear()
+
+
+def _get_bucket(url: str, request_class: str) -> Optional[TokenBucket]:
+    if not _rate_limit_by_class:
+        request_class = "all"
+    limit = RATE_LIMITS.get(request_class)
+    if not limit:
+        return None
+
+    key = (_pool_key(url), request_class)
+    bucket = _buckets.get(key)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(key)
+            if bucket is None:
+                bucket = _buckets[key] = TokenBucket(*limit)
+    return bucket
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Get the state of every rate limit bucket in use
+
+    Returns:
+        Mapping of host to endpoint class to bucket statistics (see TokenBucket.stats)
+    """
+    stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for (host, request_class), bucket in list(_buckets.items()):
+        stats.setdefault(host, {})[request_class] = bucket.stats()
+    return stats
+
+
+@contextlib.contextmanager
+def bulk() -> Iterator[None]:
+    """
+    Send the requests made by this thread in the bulk rate-limit lane
+
+    Bulk operations (folder uploads, mass deletes) wrap their work in this
+    so interactive calls made at the same time are served first.
+    """
+    depth = getattr(_priority, "bulk", 0)
+    _priority.bulk = depth + 1
+    try:
+        yield
+    finally:
+        _priority.bulk = depth
+
+
+def in_bulk(func):
+    """
+    Wrap a function so it runs in the bulk lane, e.g. in pool worker threads
+
+    Args:
+        func: Function to wrap
+
+    Returns:
+        Wrapped function
+    """
+    def wrapper(*args, **kwargs):
+        with bulk():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def is_bulk() -> bool:
+    """Whether the current thread is in the bulk lane"""
+    return getattr(_priority, "bulk", 0) > 0
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before resending a failed request
+
+    Waits use full-jitter exponential backoff: a random delay between zero
+    and base_delay * 2 ** (attempt - 1), capped at max_delay. A Retry-After
+    header on the response replaces the backoff delay. No wait is started
+    that would take the total time spent on the request past the budget.
+    """
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 budget: float = 120.0, methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 statuses: Iterable[int] = RETRY_STATUSES):
+        """
+        Configure the policy
+
+        Args:
+            max_attempts: Maximum number of times a request is sent, including the first
+            base_delay: Backoff ceiling in seconds for the first retry
+            max_delay: Largest backoff ceiling in seconds
+            budget: Maximum seconds spent on one request, including waits
+            methods: HTTP methods that may be retried
+            statuses: Response statuses that are retried
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.methods = frozenset(method.upper() for method in methods)
+        self.statuses = frozenset(statuses)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get a full-jitter backoff delay
+
+        Args:
+            attempt: Number of the attempt that just failed (1 for the first)
+
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Read the Retry-After header of a response
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+# Retries disabled: every request is sent exactly once
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+# Policy used when a request does not pass its own; limits can be set in the environment
+_default_retry = RetryPolicy(
+    max_attempts=int(os.environ.get("CLOUDERA_ML_MAX_ATTEMPTS", 4)),
+    budget=float(os.environ.get("CLOUDERA_ML_RETRY_BUDGET", 120))
+)
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """
+    Replace the default retry policy for all requests
+
+    Args:
+        policy: New default policy (NO_RETRY to turn retries off)
+    """
+    global _default_retry
+    _default_retry = policy
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get the default retry policy"""
+    return _default_retry
+
+
+def _pool_key(url: str) -> str:
+    """
+    Get the connection pool key (scheme and host) for a URL
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        Pool key in the form scheme://netloc
+    """
+    parsed_url = urlparse(url)
+    return f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
+
+
+def get_pooled_session(url: str) -> requests.Session:
+    """
+    Get the process-wide keep-alive session for the host of a URL
+
+    Sessions are created lazily, one per scheme and host, and reused by
+    every function module so that repeated calls share TCP and TLS
+    connections instead of opening a new one per request.
+
+    Args:
+        url: Any URL on the target host
+
+    Returns:
+        Shared requests session for that host
+    """
+    key = _pool_key(url)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+    return session
+
+
+def request(method: str, url: str, api_key: Optional[str] = None,
+            headers: Optional[Dict[str, str]] = None, retry: Optional[RetryPolicy] = None,
+            cache: bool = True, **kwargs: Any) -> requests.Response:
+    """
+    Send a request to the Cloudera ML API over the shared connection pool
+
+    Like the curl calls it replaces, HTTP error statuses are returned as
+    normal responses; only connection-level failures raise. Every attempt
+    first takes a token from the host's rate limiter. Requests whose
+    method the retry policy allows are resent after connection errors,
+    timeouts and retryable statuses (429, 502, 503, 504), honouring
+    Retry-After; the last response or error is returned once attempts or
+    budget run out.
+
+    Successful GET responses are kept in the process-wide response cache
+    for their resource's TTL, and any other request drops the cached
+    responses it may have changed (see response_cache.cache_scope).
+
+    Args:
+        method: HTTP method (GET, POST, PATCH, PUT, DELETE)
+        url: Full request URL
+        api_key: Optional API key, sent as a bearer token
+        headers: Optional extra headers
+        retry: Optional retry policy (default: the policy set with set_retry_policy)
+        cache: Whether a GET may be answered from, and stored in, the response cache;
+            pass False to always fetch a fresh response
+        **kwargs: Passed through to requests (data, json, files, params, timeout, ...);
+            a streamed data body must be re-iterable to be retried
+
+    Returns:
+        The HTTP response
+
+    Raises:
+        requests.RequestException: If the request could not be sent
+    """
+    request_headers = {}
+    if api_key:
+        request_headers["Authorization"] = f"Bearer {api_key}"
+    if kwargs.get("data") is not None and not kwargs.get("files"):
+        request_headers["Content-Type"] = "application/json"
+    if headers:
+        request_headers.update(headers)
+
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+
+    method = method.upper()
+    read_only = method in ("GET", "HEAD", "OPTIONS") or urlparse(url).path.rstrip("/").endswith(response_cache.READ_ONLY_POSTS)
+    cacheable = method == "GET" and response_cache.ENABLED and not kwargs.get("stream")
+    key = None
+    if cacheable:
+        key = response_cache.cache_key(url, kwargs.get("params"), request_headers.get("Authorization"))
+        if cache:
+            cached = response_cache.response_cache.get(key)
+            if cached is not None:
+                return cached
+
+    try:
+        response = _send(method, url, request_headers, retry or _default_retry, kwargs)
+    finally:
+        if not read_only:
+            response_cache.response_cache.invalidate(url)
+
+    if cacheable:
+        response_cache.response_cache.put(key, url, response)
+    return response
+
+
+def _send(method: str, url: str, request_headers: Dict[str, str], policy: RetryPolicy,
+          kwargs: Dict[str, Any]) -> requests.Response:
+    """Send a request through the rate limiter, retrying as the policy allows"""
+    session = get_pooled_session(url)
+
+    attempts = policy.max_attempts if method in policy.methods else 1
+    deadline = time.monotonic() + policy.budget
+    bucket = _get_bucket(url, endpoint_class(method, url))
+    for attempt in range(1, attempts + 1):
+        if bucket is not None:
+            bucket.acquire(bulk=is_bulk())
+        try:
+            response = session.request(method, url, headers=request_headers, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            delay = policy.backoff(attempt)
+            if attempt == attempts or time.monotonic() + delay > deadline:
+                raise
+        else:
+            if response.status_code not in policy.statuses or attempt == attempts:
+                return response
+            delay = retry_after(response)
+            if delay is None:
+                delay = policy.backoff(attempt)
+            if time.monotonic() + delay > deadline:
+                return response
+            response.close()
+        time.sleep(delay)
+
+
+def close_all() -> None:
+    """Close every pooled session and drop its connections"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
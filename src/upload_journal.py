@@ -0,0 +1,118 @@
+"""Local journal of completed parts for resumable chunked uploads"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .manifest import hash_file, write_json_atomic
+
+
+# Default location for upload journals (one file per host, project, local file and target)
+JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".cloudera_ml_mcp", "uploads")
+
+
+def journal_path(host: str, project_id: str, file_path: str, target_path: str,
+                 journal_dir: Optional[str] = None) -> str:
+    """
+    Get the journal file location for a chunked upload
+
+    Args:
+        host: CML host URL
+        project_id: ID of the target project
+        file_path: Local file being uploaded
+        target_path: Path of the file in the project
+        journal_dir: Optional directory to keep journals in (default: JOURNAL_DIR)
+
+    Returns:
+        Path of the journal file
+    """
+    file_key = str(Path(file_path).resolve())
+    digest = hashlib.sha256(f"{host}|{project_id}|{file_key}|{target_path}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(journal_dir or JOURNAL_DIR, f"{project_id}_{digest}.json")
+
+
+def load_journal(path: str) -> Dict[str, Any]:
+    """
+    Load an upload journal
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        Journal contents; empty if the journal is missing or unreadable
+    """
+    try:
+        with open(path, "r") as journal_file:
+            data = json.load(journal_file)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_journal(path: str, journal: Dict[str, Any]) -> None:
+    """
+    Atomically write an upload journal
+
+    Args:
+        path: Journal file path
+        journal: Journal contents
+    """
+    write_json_atomic(path, journal)
+
+
+def remove_journal(path: str) -> None:
+    """
+    Delete an upload journal once the upload is complete
+
+    Args:
+        path: Journal file path
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def start_journal(file_path: str, target_path: str, part_size: int,
+                  previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the journal for an upload, resuming a previous one when possible
+
+    Completed parts are only kept if the local file still has the size and
+    mtime it had when they were sent and the part size is unchanged; the
+    whole-file hash is reused in that case rather than recomputed.
+
+    Args:
+        file_path: Local file being uploaded
+        target_path: Path of the file in the project
+        part_size: Size of each part in bytes
+        previous: Journal left by an earlier attempt, if any
+
+    Returns:
+        Journal with size, mtime (nanoseconds), sha256, part_size, part_count and completed parts
+    """
+    stat = os.stat(file_path)
+    if (previous
+            and previous.get("size") == stat.st_size
+            and previous.get("mtime") == stat.st_mtime_ns
+            and previous.get("part_size") == part_size
+            and previous.get("target_path") == target_path
+            and previous.get("sha256")):
+        journal = dict(previous)
+        journal["completed"] = sorted(set(previous.get("completed", [])))
+        return journal
+
+    part_count = max(1, -(-stat.st_size // part_size))
+    return {
+        "version": 1,
+        "file_path": str(Path(file_path).resolve()),
+        "target_path": target_path,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "sha256": hash_file(file_path),
+        "part_size": part_size,
+        "part_count": part_count,
+        "completed": [],
+    }
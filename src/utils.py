@@ -1,5 +1,6 @@
 """Utility functions for Cloudera ML MCP"""
 
+import datetime
 import requests
 from typing import Dict, Any
 
@@ -64,4 +65,25 @@ def format_url(config: Dict[str, str], endpoint: str) -> str:
     if not endpoint.startswith('/'):
         endpoint = f"/{endpoint}"
         
-    return f"{host}{endpoint}" 
\ No newline at end of file
+    return f"{host}{endpoint}"
+
+
+def parse_remote_time(value):
+    """
+    Parse an ISO 8601 timestamp from the API, e.g. a file's last_modified or a run's start_time
+    
+    Args:
+        value: ISO 8601 timestamp string
+        
+    Returns:
+        Seconds since the epoch, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    try:
+        dt = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.timestamp()
@@ -0,0 +1,156 @@
+"""Mock Cloudera ML API servers shared by the tests"""
+
+import os
+import re
+import ssl
+import json
+import tempfile
+import threading
+import contextlib
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from src import transport
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """
+    Base for mock API handlers: keep-alive HTTP/1.1, JSON responses and offset-token paging
+
+    Subclasses implement do_GET, do_POST, ... and answer with send_json or send_page.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    lock = threading.Lock()
+
+    def query(self):
+        """Query parameters of the request, each a list of values"""
+        return parse_qs(urlparse(self.path).query)
+
+    def body(self):
+        """Raw request body"""
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def send_json(self, payload, code=200):
+        """Send payload as JSON; a str is sent as it is"""
+        body = (payload if isinstance(payload, str) else json.dumps(payload)).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_page(self, key, count, record):
+        """
+        Send the page of count records that page_size and page_token ask for
+
+        The page token is the offset of the page's first record.
+
+        Args:
+            key: Name of the list in the response, e.g. "experiment_runs"
+            count: Number of records in the whole listing
+            record: record(i) builds the i-th record; only the page's records are built
+        """
+        query = self.query()
+        offset = int(query.get("page_token", ["0"])[0])
+        end = min(offset + int(query["page_size"][0]), count)
+        self.send_json({key: [record(i) for i in range(offset, end)],
+                        "next_page_token": str(end) if end < count else ""})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def parse_multipart(content_type, body):
+    """Split a multipart/form-data body into (field name, data) pairs"""
+    boundary = content_type.split("boundary=", 1)[1].encode()
+    fields = []
+    for segment in body.split(b"--" + boundary)[1:-1]:
+        head, _, data = segment[2:].partition(b"\r\n\r\n")
+        fields.append((re.search(rb'name="([^"]*)"', head).group(1).decode(), data[:-2]))
+    return fields
+
+
+def experiment_run(run_id, metrics=(), params=None, tags=None, **fields):
+    """
+    An experiment run as the API returns it
+
+    Args:
+        run_id: Run ID
+        metrics: (key, value, step) points
+        params: {key: value} parameters, sent as a list of {key, value}
+        tags: Tags, sent as they are
+        **fields: Other run fields, e.g. status and start_time
+
+    Returns:
+        Run dict with metrics, params and tags under "data"
+    """
+    data = {"metrics": [{"key": key, "value": value, "step": step} for key, value, step in metrics],
+            "params": [{"key": key, "value": value} for key, value in (params or {}).items()]}
+    if tags is not None:
+        data["tags"] = tags
+    return dict({"id": run_id}, **fields, data=data)
+
+
+def without_data(run):
+    """A run as listings without their metrics and parameters show it"""
+    return {key: value for key, value in run.items() if key != "data"}
+
+
+def _wrap_tls(server, workdir):
+    """Serve HTTPS with a throwaway self-signed certificate and return the certificate file"""
+    cert_file = os.path.join(workdir, "cert.pem")
+    key_file = os.path.join(workdir, "key.pem")
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+        "-keyout", key_file, "-out", cert_file, "-days", "1",
+        "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+    ], check=True, capture_output=True)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    return cert_file
+
+
+@contextlib.contextmanager
+def serve(handler, tls=False, rate_limits=False):
+    """
+    Run a mock API server on a free port for the duration of the block
+
+    Function modules that force https need tls: the server then listens on
+    localhost with a self-signed certificate that requests trusts, through
+    REQUESTS_CA_BUNDLE, until the block exits.
+
+    Args:
+        handler: Request handler class
+        tls: Serve HTTPS instead of HTTP
+        rate_limits: Keep the transport's client-side rate limits (default: off inside the block)
+
+    Yields:
+        Config with the server's host, an API key and project_id "p1"
+    """
+    limits = dict(transport.RATE_LIMITS)
+    ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE")
+    with tempfile.TemporaryDirectory() as workdir:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        host = f"http://127.0.0.1:{server.server_address[1]}"
+        if tls:
+            os.environ["REQUESTS_CA_BUNDLE"] = _wrap_tls(server, workdir)
+            host = f"https://localhost:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        if not rate_limits:
+            transport.set_rate_limits({name: None for name in limits})
+        try:
+            yield {"host": host, "api_key": "key", "project_id": "p1"}
+        finally:
+            server.shutdown()
+            server.server_close()
+            transport.set_rate_limits(limits)
+            if tls:
+                if ca_bundle is None:
+                    del os.environ["REQUESTS_CA_BUNDLE"]
+                else:
+                    os.environ["REQUESTS_CA_BUNDLE"] = ca_bundle
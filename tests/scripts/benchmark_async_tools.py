@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark: blocking tool calls on the event loop vs. async tools
+
+Starts a local mock of the Cloudera ML API that takes --latency seconds to
+answer each request, then issues the same mix of list/get tool calls
+concurrently on one asyncio loop, twice:
+
+- blocking: each call runs the tool's synchronous function directly on the
+  loop, which is what FastMCP does for a plain `def` tool
+- async: each call goes through the server's registered async tool
+
+For each run it reports the wall time and the worst event-loop lag seen by
+a heartbeat task, i.e. how long the server could not answer anything else.
+
+Usage:
+    python tests/scripts/benchmark_async_tools.py [--calls N] [--latency SECONDS]
+"""
+
+import os
+import sys
+import json
+import time
+import ssl
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+import contextlib
+import io
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import server  # noqa: E402
+from src import aio  # noqa: E402
+from src import transport  # noqa: E402
+from src import response_cache  # noqa: E402
+
+# Read-only tools the benchmark cycles through, with their arguments
+TOOL_CALLS = [
+    ("list_jobs_tool", {"project_id": "proj-1"}),
+    ("get_job_tool", {"job_id": "job-1", "project_id": "proj-1"}),
+    ("list_applications_tool", {"project_id": "proj-1"}),
+    ("get_job_run_tool", {"job_id": "job-1", "run_id": "run-1", "project_id": "proj-1"}),
+    ("list_models_tool", {"project_id": "proj-1"}),
+    ("get_experiment_tool", {"experiment_id": "exp-1", "project_id": "proj-1"}),
+    ("list_experiments_tool", {"project_id": "proj-1"}),
+    ("get_model_tool", {"model_id": "model-1", "project_id": "proj-1"}),
+]
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Answers every API call with an empty listing after a fixed delay"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.05
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        payload = json.dumps({"jobs": [], "applications": [], "models": [], "experiments": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(workdir):
+    """Start the HTTPS mock server with a throwaway self-signed certificate"""
+    cert_file = os.path.join(workdir, "cert.pem")
+    key_file = os.path.join(workdir, "key.pem")
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+        "-keyout", key_file, "-out", cert_file, "-days", "1",
+        "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+    ], check=True, capture_output=True)
+
+    mock = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    mock.socket = context.wrap_socket(mock.socket, server_side=True)
+    threading.Thread(target=mock.serve_forever, daemon=True).start()
+    return mock, cert_file
+
+
+async def heartbeat(stop, interval=0.005):
+    """Measure the longest gap between ticks of the event loop"""
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        now = time.perf_counter()
+        worst = max(worst, now - last - interval)
+        last = now
+    return worst
+
+
+async def run_calls(calls, use_async):
+    """Issue all calls concurrently; returns (wall time, worst loop lag, failures)"""
+    async def call(name, arguments):
+        tool = getattr(server, name)
+        if use_async:
+            output = await tool(**arguments)
+        else:
+            output = tool.__wrapped__(**arguments)
+        return json.loads(output).get("success", False)
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(heartbeat(stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(call(name, arguments) for name, arguments in calls))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    lag = await monitor
+    return elapsed, lag, results.count(False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark blocking tool calls against async tools")
+    parser.add_argument("--calls", type=int, default=50, help="Concurrent tool calls (default: 50)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock API latency in seconds (default: 0.05)")
+    args = parser.parse_args()
+
+    # Measure concurrency, not the client-side rate limiter or response cache
+    transport.set_rate_limits({name: None for name in transport.RATE_LIMITS})
+    response_cache.ENABLED = False
+
+    SlowHandler.latency = args.latency
+    calls = [TOOL_CALLS[i % len(TOOL_CALLS)] for i in range(args.calls)]
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        mock, cert_file = start_server(workdir)
+        os.environ["REQUESTS_CA_BUNDLE"] = cert_file
+        os.environ["CLOUDERA_ML_HOST"] = f"https://localhost:{mock.server_address[1]}"
+        os.environ["CLOUDERA_ML_API_KEY"] = "benchmark"
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Untimed pass to open the pooled TLS connections, so both runs start warm
+            asyncio.run(run_calls(calls, True))
+            for label, use_async in (("blocking", False), ("async", True)):
+                rows.append((label,) + asyncio.run(run_calls(calls, use_async)))
+        mock.shutdown()
+
+    aio.shutdown()
+    transport.close_all()
+
+    print(f"{args.calls} concurrent tool calls, {args.latency * 1000:.0f} ms mock latency, "
+          f"{aio.MAX_WORKERS} workers")
+    print(f"{'mode':<10}{'wall ms':>10}{'max loop lag ms':>17}{'failed':>8}")
+    for label, elapsed, lag, failed in rows:
+        print(f"{label:<10}{elapsed * 1000:>10.1f}{lag * 1000:>17.1f}{failed:>8}")
+    print(f"speedup: {rows[0][1] / rows[1][1]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark: per-call curl subprocesses vs. the pooled HTTP transport
+
+Starts a local HTTPS mock of the Cloudera ML API, calls each of the function
+modules that used to shell out to curl through the shared transport, records
+the exact requests they make, and replays the same requests with one
+`curl -s` process per request (the previous implementation) for comparison.
+
+Usage:
+    python tests/scripts/benchmark_transport.py [--iterations N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+import contextlib
+import io
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import ssl
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src import functions  # noqa: E402
+from src import transport  # noqa: E402
+from src import response_cache  # noqa: E402
+
+# The 36 modules that previously forked curl for every API call
+CURL_MODULES = [
+    "batch_list_projects",
+    "create_experiment",
+    "create_experiment_run",
+    "create_job_run",
+    "create_model_build",
+    "create_model_deployment",
+    "delete_application",
+    "delete_experiment",
+    "delete_experiment_run",
+    "delete_experiment_run_batch",
+    "delete_job",
+    "delete_model",
+    "delete_project_file",
+    "get_experiment",
+    "get_experiment_run",
+    "get_job",
+    "get_job_run",
+    "get_model",
+    "get_model_build",
+    "get_model_deployment",
+    "list_experiments",
+    "list_job_runs",
+    "list_model_builds",
+    "list_model_deployments",
+    "list_models",
+    "log_experiment_run_batch",
+    "restart_application",
+    "stop_application",
+    "stop_job_run",
+    "stop_model_deployment",
+    "update_application",
+    "update_experiment",
+    "update_experiment_run",
+    "update_job",
+    "update_project",
+    "update_project_file_metadata",
+]
+
+# Superset of parameters; each module only reads the keys it needs
+PARAMS = {
+    "project_id": "proj-1",
+    "job_id": "job-1",
+    "run_id": "run-1",
+    "model_id": "model-1",
+    "build_id": "build-1",
+    "deployment_id": "deploy-1",
+    "experiment_id": "exp-1",
+    "application_id": "app-1",
+    "file_path": "benchmark/predict.py",
+    "function_name": "predict",
+    "name": "benchmark",
+    "description": "benchmark",
+    "ids": ["proj-1"],
+    "run_ids": ["run-1", "run-2"],
+    "run_updates": [{"id": "run-1", "metrics": {"loss": 0.1}}],
+}
+
+recorded_requests = []
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Answers every API call with an empty JSON object over keep-alive HTTP/1.1"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        recorded_requests.append((self.command, self.path, body))
+        payload = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(workdir):
+    """Start the HTTPS mock server with a throwaway self-signed certificate"""
+    cert_file = os.path.join(workdir, "cert.pem")
+    key_file = os.path.join(workdir, "key.pem")
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+        "-keyout", key_file, "-out", cert_file, "-days", "1",
+        "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+    ], check=True, capture_output=True)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, cert_file
+
+
+def run_module(name, config):
+    """Call a function module with its debug output silenced"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return getattr(functions, name)(dict(config), dict(PARAMS))
+
+
+def replay_with_curl(host, cert_file, requests_made):
+    """Replay requests the way the modules used to: one curl process each"""
+    for method, path, body in requests_made:
+        command = [
+            "curl", "-s", "--cacert", cert_file, "-X", method,
+            "-H", "Authorization: Bearer benchmark",
+            "-H", "Content-Type: application/json",
+        ]
+        if body:
+            command.extend(["-d", body.decode()])
+        command.append(f"{host}{path}")
+        subprocess.run(command, capture_output=True, text=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark curl subprocesses against the pooled transport")
+    parser.add_argument("--iterations", type=int, default=20, help="Calls per module (default: 20)")
+    args = parser.parse_args()
+
+    # Measure raw transport latency, not the client-side rate limiter or response cache
+    transport.set_rate_limits({name: None for name in transport.RATE_LIMITS})
+    response_cache.ENABLED = False
+
+    with tempfile.TemporaryDirectory() as workdir:
+        server, cert_file = start_server(workdir)
+        os.environ["REQUESTS_CA_BUNDLE"] = cert_file
+        host = f"https://localhost:{server.server_address[1]}"
+        config = {"host": host, "api_key": "benchmark", "project_id": PARAMS["project_id"]}
+
+        rows = []
+        for name in CURL_MODULES:
+            # Record the requests this module makes (also warms the pool)
+            recorded_requests.clear()
+            result = run_module(name, config)
+            requests_made = list(recorded_requests)
+            ok = result.get("success", result.get("status") == "success")
+
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                replay_with_curl(host, cert_file, requests_made)
+            before = (time.perf_counter() - start) / args.iterations
+
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                run_module(name, config)
+            after = (time.perf_counter() - start) / args.iterations
+
+            rows.append((name, len(requests_made), ok, before, after))
+
+        server.shutdown()
+        transport.close_all()
+
+    print(f"{'module':<32}{'reqs':>5}{'ok':>5}{'curl ms':>10}{'pooled ms':>11}{'speedup':>9}")
+    for name, count, ok, before, after in rows:
+        print(f"{name:<32}{count:>5}{'yes' if ok else 'no':>5}{before * 1000:>10.2f}{after * 1000:>11.2f}{before / after:>8.1f}x")
+    total_before = sum(row[3] for row in rows)
+    total_after = sum(row[4] for row in rows)
+    print(f"{'total':<42}{total_before * 1000:>10.2f}{total_after * 1000:>11.2f}{total_before / total_after:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
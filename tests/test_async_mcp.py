@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""Test AsyncClouderaMCP against a mock API with a fixed response latency"""
+
+import os
+import sys
+import time
+import asyncio
+import inspect
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import aio
+from src import transport
+from src import response_cache
+from src.mcp import ClouderaMCP, AsyncClouderaMCP
+
+LATENCY = 0.05
+
+
+class SlowHandler(ApiHandler):
+    """Answers every GET with a job named after the requested path, after LATENCY seconds"""
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        self.send_json({"id": self.path.rsplit("/", 1)[-1], "jobs": []})
+
+
+def test_async_client_mirrors_sync_methods():
+    public = [name for name, member in vars(ClouderaMCP).items() if callable(member) and not name.startswith("_")]
+    for name in public:
+        method = getattr(AsyncClouderaMCP, name)
+        assert inspect.iscoroutinefunction(method), name
+        assert inspect.signature(method) == inspect.signature(getattr(ClouderaMCP, name))
+
+
+def test_gathered_calls_run_concurrently():
+    cache_enabled = response_cache.ENABLED
+    response_cache.ENABLED = False
+
+    async def run(config):
+        async with AsyncClouderaMCP(config) as client:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(client.get_job(f"job-{i}") for i in range(100)))
+            elapsed = time.perf_counter() - start
+        return client, results, elapsed
+
+    try:
+        with serve(SlowHandler) as config:
+            client, results, elapsed = asyncio.run(run(config))
+    finally:
+        response_cache.ENABLED = cache_enabled
+
+    print(f"100 calls with {LATENCY * 1000:.0f} ms latency took {elapsed * 1000:.0f} ms")
+    assert all(result["success"] for result in results)
+    assert [result["data"]["id"] for result in results] == [f"job-{i}" for i in range(100)]
+    # Sequentially this takes 100 * LATENCY
+    assert elapsed < 100 * LATENCY / 4
+    assert client.closed
+
+
+def test_close_waits_for_calls_in_flight():
+    async def run(config):
+        client = AsyncClouderaMCP(config, max_workers=4)
+        call = asyncio.ensure_future(client.list_jobs(bypass_cache=True))
+        await asyncio.sleep(LATENCY / 5)
+        await client.aclose()
+        assert call.done()
+        try:
+            await client.get_job("job-1")
+        except RuntimeError:
+            return call.result()
+        raise AssertionError("closed client accepted a call")
+
+    with serve(SlowHandler) as config:
+        result = asyncio.run(run(config))
+    assert result["success"]
+
+
+def test_closing_a_client_keeps_the_shared_connection_pool():
+    async def run(config):
+        other = AsyncClouderaMCP(config)
+        async with AsyncClouderaMCP(config) as client:
+            await client.get_job("job-1")
+        # The pool another client and synchronous callers use is still the same, open one
+        result = await other.get_job("job-2")
+        await other.aclose()
+        return result
+
+    with serve(SlowHandler) as config:
+        session = transport.get_pooled_session(config["host"])
+        result = asyncio.run(run(config))
+
+    assert result["success"]
+    assert transport.get_pooled_session(config["host"]) is session
+
+
+def test_long_running_calls_leave_workers_for_short_ones():
+    release = threading.Event()
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+    threads = set()
+
+    def long_call():
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            threads.add(threading.current_thread().name.rsplit("_", 1)[0])
+        release.wait(10)
+        with lock:
+            running["now"] -= 1
+
+    async def run(config):
+        # More long calls than either pool has workers
+        long_calls = [asyncio.ensure_future(aio.run_long_running(long_call)) for _ in range(aio.MAX_WORKERS + 8)]
+        await asyncio.sleep(0.2)
+        async with AsyncClouderaMCP(config) as client:
+            start = time.perf_counter()
+            job = await asyncio.wait_for(client.get_job("job-1"), 5)
+            elapsed = time.perf_counter() - start
+        release.set()
+        await asyncio.gather(*long_calls)
+        return job, elapsed
+
+    try:
+        with serve(SlowHandler) as config:
+            job, elapsed = asyncio.run(run(config))
+    finally:
+        release.set()
+
+    assert job["success"] and job["data"]["id"] == "job-1"
+    assert elapsed < 1
+    assert running["max"] == aio.LONG_RUNNING_WORKERS
+    assert threads == {"cloudera-ml-aio-long"}
+
+
+if __name__ == "__main__":
+    test_async_client_mirrors_sync_methods()
+    test_gathered_calls_run_concurrently()
+    test_close_waits_for_calls_in_flight()
+    test_closing_a_client_keeps_the_shared_connection_pool()
+    test_long_running_calls_leave_workers_for_short_ones()
+    print("OK")
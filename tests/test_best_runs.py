@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""Test best_runs streaming an experiment's runs through a bounded heap against a mock API"""
+
+import os
+import sys
+import math
+import random
+import datetime
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve, experiment_run, without_data
+from src.functions.best_runs import best_runs, top_runs
+
+RUN_COUNT = 4500
+START = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def run_record(index):
+    """Run i has val_auc rounded to 2 digits, so many runs tie; every 7th run lacks it"""
+    rng = random.Random(index)
+    metrics = [("epochs", rng.randint(1, 20), 0)]
+    if index % 7:
+        metrics += [("val_auc", 0.5, 0), ("val_auc", round(rng.random(), 2), 10)]
+    return experiment_run(f"run-{index}", metrics, {"seed": str(index)},
+                          name=f"trial {index}", status="FINISHED" if index % 5 else "FAILED",
+                          start_time=(START + datetime.timedelta(minutes=rng.randint(0, 10000))).isoformat())
+
+
+RUNS = [run_record(i) for i in range(RUN_COUNT)]
+
+
+class RunsHandler(ApiHandler):
+    """Pages RUNS by offset page token; runs with an odd index are listed without their data"""
+
+    pages = 0
+    details = 0
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if not path.endswith("/runs"):
+            with self.lock:
+                RunsHandler.details += 1
+            return self.send_json(RUNS[int(path.rsplit("-", 1)[1])])
+        with self.lock:
+            RunsHandler.pages += 1
+        self.send_page("experiment_runs", RUN_COUNT, lambda i: without_data(RUNS[i]) if i % 2 else RUNS[i])
+
+
+def with_mock(params):
+    """Call best_runs against a fresh mock server"""
+    RunsHandler.pages = RunsHandler.details = 0
+    with serve(RunsHandler) as config:
+        return best_runs(config, dict(params, experiment_id="exp-1", bypass_cache=True))
+
+
+def expected_order(runs, ascending=False, tie_breakers=()):
+    """Full sort of the runs, the way best_runs should rank them"""
+    def key(item):
+        position, run = item
+        metrics = {point["key"]: point["value"] for point in run["data"]["metrics"]}
+        value = metrics["val_auc"]
+        parts = [value if ascending else -value]
+        for spec in tie_breakers:
+            if spec == "-epochs":
+                parts.append(-metrics["epochs"])
+            elif spec == "start_time":
+                parts.append(run["start_time"])
+        return parts + [position]
+    ranked = [(i, run) for i, run in enumerate(runs)
+              if any(point["key"] == "val_auc" for point in run["data"]["metrics"])]
+    return [run["id"] for _, run in sorted(ranked, key=key)]
+
+
+def test_best_runs_match_a_full_sort():
+    result = with_mock({"metric": "val_auc", "k": 10, "tie_breakers": ["-epochs", "start_time"]})
+    assert result["success"], result["message"]
+    expected = expected_order(RUNS, tie_breakers=["-epochs", "start_time"])
+    assert [run["id"] for run in result["runs"]] == expected[:10]
+    assert result["scanned"] == RUN_COUNT
+    assert result["ranked"] == len(expected)
+    assert result["pages"] == (RUN_COUNT + 999) // 1000
+    # Only the runs listed without their data were fetched
+    assert result["fetched"] == RunsHandler.details == RUN_COUNT // 2
+
+    best = result["runs"][0]
+    assert set(best) == {"rank", "id", "name", "status", "start_time", "value", "metrics", "params"}
+    assert best["rank"] == 1
+    assert best["value"] == max(point["value"] for run in RUNS for point in run["data"]["metrics"]
+                                if point["key"] == "val_auc")
+    assert set(best["metrics"]) == {"val_auc", "epochs"}
+    assert best["params"] == {"seed": best["id"].split("-")[1]}
+
+
+def test_direction_status_and_listing_order_ties():
+    result = with_mock({"metric": "val_auc", "k": 5, "ascending": True, "status": "failed"})
+    failed = [run for run in RUNS if run["status"] == "FAILED"]
+    assert [run["id"] for run in result["runs"]] == expected_order(failed, ascending=True)[:5]
+    assert result["scanned"] == len(failed)
+    assert result["message"].startswith("Best 5 of ")
+
+    # Without tie-breakers, equal values keep listing order
+    runs = [{"id": f"r{i}", "metrics": {"loss": i % 3}} for i in range(100)]
+    best, seen, ranked = top_runs(iter(runs), "loss", 4, ascending=True)
+    assert [run["id"] for run, _ in best] == ["r0", "r3", "r6", "r9"]
+    assert (seen, ranked) == (100, 100)
+
+    # A run missing a tie-breaker loses the tie
+    runs = [{"id": "a", "metrics": {"auc": 1}}, {"id": "b", "metrics": {"auc": 1, "epochs": 3}}]
+    best, _, _ = top_runs(runs, "auc", 1, tie_breakers=["epochs"])
+    assert best[0][0]["id"] == "b"
+
+    # NaN values are skipped, whether first in the stream or as a tie-breaker
+    runs = [{"id": str(i), "metrics": {"auc": value}} for i, value in enumerate([math.nan, 1, 2, 3, 4])]
+    best, seen, ranked = top_runs(runs, "auc", 2)
+    assert [run["id"] for run, _ in best] == ["4", "3"]
+    assert (seen, ranked) == (5, 4)
+    best, _, _ = top_runs(runs, "auc", 3, ascending=True)
+    assert [run["id"] for run, _ in best] == ["1", "2", "3"]
+    runs = [{"id": "a", "metrics": {"auc": 1, "epochs": "NaN"}}, {"id": "b", "metrics": {"auc": 1, "epochs": 3}}]
+    best, _, _ = top_runs(runs, "auc", 1, tie_breakers=["-epochs"])
+    assert best[0][0]["id"] == "b"
+
+
+def test_invalid_requests_are_rejected():
+    config = {"host": "http://127.0.0.1:1", "api_key": "key", "project_id": "p1"}
+    result = best_runs(config, {"experiment_id": "exp-1"})
+    assert result["message"] == "Missing required parameters: metric"
+    result = best_runs(config, {"experiment_id": "exp-1", "metric": "auc", "k": 0})
+    assert not result["success"] and "k and concurrency" in result["message"]
+    result = best_runs(config, {"experiment_id": "exp-1", "metric": "auc"})
+    assert not result["success"] and result["message"].startswith("Error reading experiment runs")
+
+
+if __name__ == "__main__":
+    test_best_runs_match_a_full_sort()
+    test_direction_status_and_listing_order_ties()
+    test_invalid_requests_are_rejected()
+    print("OK")
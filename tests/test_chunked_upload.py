@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""Test resumable chunked uploads and their reassembly job against a mock HTTPS project API"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve, parse_multipart
+from src import upload_journal
+from src.functions.upload_file import upload_file
+
+PART_SIZE = 64 * 1024
+
+
+class ProjectHandler(ApiHandler):
+    """
+    Project files and jobs API backed by a local directory
+
+    Uploads named in fail_once are rejected the first time. Starting a job
+    run executes the job's script against the directory, the way a job
+    would see the project at /home/cdsw.
+    """
+
+    root = None
+    puts = []
+    fail_once = set()
+    jobs = {}
+    runs = {}
+
+    def do_PUT(self):
+        fields = parse_multipart(self.headers["Content-Type"], self.body())
+        with self.lock:
+            for name, _ in fields:
+                ProjectHandler.puts.append(name)
+            if any(name in self.fail_once for name, _ in fields):
+                self.fail_once.difference_update(name for name, _ in fields)
+                return self.send_json({"message": "storage unavailable"}, 500)
+            for name, data in fields:
+                path = os.path.join(self.root, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as stored:
+                    stored.write(data)
+        self.send_json({}, 201)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        if parts[-1] == "files":
+            directory = self.query().get("path", [""])[0].strip("/")
+            full = os.path.join(self.root, directory)
+            if not os.path.isdir(full):
+                return self.send_json({"message": "not found"}, 404)
+            files = [{"path": f"{directory}/{name}".lstrip("/"), "is_dir": os.path.isdir(os.path.join(full, name)),
+                      "file_size": os.path.getsize(os.path.join(full, name))} for name in sorted(os.listdir(full))]
+            return self.send_json({"files": files})
+        # api/v2/projects/{project}/jobs/{job}[/runs/{run}]
+        if len(parts) == 8:
+            return self.send_json({"id": parts[7], "status": self.runs[parts[7]]})
+        self.send_json(self.jobs[parts[5]])
+
+    def do_POST(self):
+        parts = urlparse(self.path).path.strip("/").split("/")
+        request = json.loads(self.body() or b"{}")
+        with self.lock:
+            if parts[-1] == "jobs":
+                job_id = f"job-{len(self.jobs) + 1}"
+                ProjectHandler.jobs[job_id] = dict(request, id=job_id, parts=None)
+                return self.send_json({"id": job_id})
+            job = self.jobs[parts[5]]
+        script_path = os.path.join(self.root, job["script"])
+        parts_dir = os.path.dirname(script_path)
+        job["parts"] = sorted(name for name in os.listdir(parts_dir) if name.startswith("part-"))
+        with open(script_path) as script_file:
+            script = script_file.read().replace('"/home/cdsw"', repr(self.root))
+        finished = subprocess.run([sys.executable, "-c", script], capture_output=True)
+        run_id = f"run-{parts[5]}"
+        ProjectHandler.runs[run_id] = "ENGINE_SUCCEEDED" if finished.returncode == 0 else "ENGINE_FAILED"
+        self.send_json({"id": run_id})
+
+    def do_DELETE(self):
+        self.send_json({})
+
+
+def with_mock(test):
+    """Run test(upload, workdir) against a fresh mock project; upload(**params) calls upload_file"""
+    ProjectHandler.puts = []
+    ProjectHandler.fail_once = set()
+    ProjectHandler.jobs = {}
+    ProjectHandler.runs = {}
+    with tempfile.TemporaryDirectory() as workdir, serve(ProjectHandler, tls=True) as config:
+        ProjectHandler.root = os.path.join(workdir, "project")
+        os.makedirs(ProjectHandler.root)
+
+        def upload(**params):
+            ProjectHandler.puts = []
+            return upload_file(config, dict({"chunked": True, "part_size": PART_SIZE, "target_dir": "models",
+                                             "journal_dir": os.path.join(workdir, "journals")}, **params))
+
+        return test(upload, workdir)
+
+
+def write_file(path, size, seed=0):
+    with open(path, "wb") as local_file:
+        local_file.write(bytes((i * 7 + seed) % 251 for i in range(size)))
+
+
+def part_names(indices):
+    return [f"models/.model.bin.parts/part-{index:05d}" for index in indices]
+
+
+def test_failed_part_is_resumed_and_parts_are_assembled():
+    def run(upload, workdir):
+        file_path = os.path.join(workdir, "model.bin")
+        write_file(file_path, 5 * PART_SIZE + 1000)
+        ProjectHandler.fail_once = set(part_names([3]))
+
+        result = upload(file_path=file_path)
+        assert not result["success"]
+        assert "part 4/6" in result["message"] and "resume" in result["message"]
+        assert (result["parts_uploaded"], result["parts_resumed"], result["part_count"]) == (3, 0, 6)
+        assert ProjectHandler.puts == part_names(range(4))
+        journal_path = result["journal_path"]
+        assert upload_journal.load_journal(journal_path)["completed"] == [0, 1, 2]
+        assert ProjectHandler.jobs == {}
+
+        # The second call only sends the parts the journal does not have, then the script
+        result = upload(file_path=file_path)
+        assert result["success"], result["message"]
+        assert (result["parts_uploaded"], result["parts_resumed"], result["part_count"]) == (3, 3, 6)
+        assert ProjectHandler.puts == part_names(range(3, 6)) + ["models/.model.bin.parts/assemble.py"]
+        assert not os.path.exists(journal_path)
+
+        # One job joined all six parts, and its run left only the target behind
+        (job,) = ProjectHandler.jobs.values()
+        assert job["script"] == "models/.model.bin.parts/assemble.py"
+        assert job["name"] == "Assemble models/model.bin"
+        assert job["parts"] == [f"part-{index:05d}" for index in range(6)]
+        assert ProjectHandler.runs == {"run-job-1": "ENGINE_SUCCEEDED"}
+        assert os.listdir(os.path.join(ProjectHandler.root, "models")) == ["model.bin"]
+        with open(file_path, "rb") as local, open(os.path.join(ProjectHandler.root, "models/model.bin"), "rb") as remote:
+            assert local.read() == remote.read()
+
+    with_mock(run)
+
+
+def test_journal_is_discarded_when_the_file_changes():
+    def run(upload, workdir):
+        file_path = os.path.join(workdir, "model.bin")
+
+        # A different size starts over
+        write_file(file_path, 4 * PART_SIZE)
+        ProjectHandler.fail_once = set(part_names([2]))
+        assert not upload(file_path=file_path)["success"]
+        write_file(file_path, 4 * PART_SIZE + 10, seed=1)
+        result = upload(file_path=file_path)
+        assert result["success"], result["message"]
+        assert (result["parts_uploaded"], result["parts_resumed"], result["part_count"]) == (5, 0, 5)
+        assert ProjectHandler.puts[:5] == part_names(range(5))
+
+        # So does the same size with a new mtime
+        write_file(file_path, 4 * PART_SIZE, seed=2)
+        ProjectHandler.fail_once = set(part_names([2]))
+        assert not upload(file_path=file_path)["success"]
+        stat = os.stat(file_path)
+        write_file(file_path, 4 * PART_SIZE, seed=3)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        result = upload(file_path=file_path)
+        assert result["success"], result["message"]
+        assert (result["parts_uploaded"], result["parts_resumed"]) == (4, 0)
+
+        # Only the last content arrives, verified by the assembly job
+        assert list(ProjectHandler.runs.values()) == ["ENGINE_SUCCEEDED"] * 2
+        with open(file_path, "rb") as local, open(os.path.join(ProjectHandler.root, "models/model.bin"), "rb") as remote:
+            assert local.read() == remote.read()
+
+    with_mock(run)
+
+
+def test_journalled_parts_missing_on_the_server_are_sent_again():
+    def run(upload, workdir):
+        file_path = os.path.join(workdir, "model.bin")
+        write_file(file_path, 3 * PART_SIZE)
+        ProjectHandler.fail_once = set(part_names([2]))
+        assert not upload(file_path=file_path)["success"]
+        os.remove(os.path.join(ProjectHandler.root, part_names([0])[0]))
+
+        result = upload(file_path=file_path)
+        assert result["success"], result["message"]
+        assert (result["parts_uploaded"], result["parts_resumed"]) == (2, 1)
+        assert ProjectHandler.puts[:2] == part_names([0, 2])
+
+    with_mock(run)
+
+
+if __name__ == "__main__":
+    test_failed_part_is_resumed_and_parts_are_assembled()
+    test_journal_is_discarded_when_the_file_changes()
+    test_journalled_parts_missing_on_the_server_are_sent_again()
+    print("OK")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Test filtered, concurrent delete_all_jobs against a mock jobs API"""
+
+import os
+import sys
+import time
+import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src.functions.delete_all_jobs import delete_all_jobs
+
+JOB_COUNT = 800
+DELETE_LATENCY = 0.02
+NOW = datetime.datetime.now(datetime.timezone.utc)
+
+
+def make_jobs():
+    """CI jobs every third one failed, half of them 30 days old; plus a few hand-made jobs"""
+    jobs = []
+    for i in range(JOB_COUNT):
+        age = 30 if i % 2 else 1
+        jobs.append({
+            "id": f"job-{i}",
+            "name": f"ci-build-{i}" if i >= 10 else f"nightly-report-{i}",
+            "status": "ENGINE_FAILED" if i % 3 == 0 else "ENGINE_SUCCEEDED",
+            "created_at": (NOW - datetime.timedelta(days=age)).isoformat().replace("+00:00", "Z"),
+        })
+    return jobs
+
+
+class JobsHandler(ApiHandler):
+    """Pages through `jobs` and deletes from it; job-13 cannot be deleted"""
+
+    jobs = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):
+        with self.lock:
+            jobs = list(JobsHandler.jobs)
+        self.send_page("jobs", len(jobs), jobs.__getitem__)
+
+    def do_DELETE(self):
+        job_id = self.path.rsplit("/", 1)[-1]
+        with self.lock:
+            JobsHandler.in_flight += 1
+            JobsHandler.max_in_flight = max(JobsHandler.max_in_flight, JobsHandler.in_flight)
+        time.sleep(DELETE_LATENCY)
+        with self.lock:
+            JobsHandler.in_flight -= 1
+            if job_id != "job-13":
+                JobsHandler.jobs = [job for job in JobsHandler.jobs if job["id"] != job_id]
+        if job_id == "job-13":
+            self.send_json({"message": "forbidden"}, 403)
+        else:
+            self.send_json({})
+
+
+def reset_jobs():
+    JobsHandler.jobs = make_jobs()
+    JobsHandler.max_in_flight = 0
+
+
+def test_dry_run_plans_filtered_jobs_without_deleting():
+    reset_jobs()
+    with serve(JobsHandler, rate_limits=True) as config:
+        result = delete_all_jobs(config, {"name_regex": r"^ci-build-", "older_than_days": 7,
+                                          "status": "engine_failed", "dry_run": True})
+
+    expected = [job["id"] for job in make_jobs()
+                if job["name"].startswith("ci-build-") and int(job["id"][4:]) % 6 == 3]
+    assert result["success"] and result["dry_run"]
+    assert [job["id"] for job in result["planned_jobs"]] == expected
+    assert result["deleted_count"] == 0
+    assert len(JobsHandler.jobs) == JOB_COUNT
+
+
+def test_deletes_all_jobs_concurrently_with_progress():
+    reset_jobs()
+    updates = []
+
+    with serve(JobsHandler) as config:
+        start = time.perf_counter()
+        result = delete_all_jobs(config, {
+            "concurrency": 8,
+            "progress": lambda done, total, job: updates.append((done, total, job))
+        })
+        elapsed = time.perf_counter() - start
+
+    print(f"Deleted {result['deleted_count']} jobs in {elapsed:.2f}s, "
+          f"{JobsHandler.max_in_flight} deletes in flight at most")
+    assert not result["success"]
+    assert result["deleted_count"] == JOB_COUNT - 1
+    assert [job["id"] for job in result["failed_jobs"]] == ["job-13"]
+    assert "403" in result["failed_jobs"][0]["error"]
+    assert result["deleted_jobs"][:2] == [{"id": "job-0", "name": "nightly-report-0"},
+                                          {"id": "job-1", "name": "nightly-report-1"}]
+    assert [job["id"] for job in JobsHandler.jobs] == ["job-13"]
+    assert [done for done, _, _ in updates] == list(range(1, JOB_COUNT + 1))
+    assert all(total == JOB_COUNT for _, total, _ in updates)
+    assert 1 < JobsHandler.max_in_flight <= 8
+    # Serially the deletes alone take JOB_COUNT * DELETE_LATENCY
+    assert elapsed < JOB_COUNT * DELETE_LATENCY / 3
+
+
+def test_invalid_filter_is_reported():
+    result = delete_all_jobs({"host": "http://127.0.0.1:1", "api_key": "key", "project_id": "p1"},
+                             {"name_regex": "("})
+    assert not result["success"]
+    assert "name_regex" in result["message"]
+
+
+if __name__ == "__main__":
+    test_dry_run_plans_filtered_jobs_without_deleting()
+    test_deletes_all_jobs_concurrently_with_progress()
+    test_invalid_filter_is_reported()
+    print("OK")
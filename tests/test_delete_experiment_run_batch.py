@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""Test chunked, filtered delete_experiment_run_batch against a mock experiment runs API"""
+
+import os
+import sys
+import json
+import time
+import datetime
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve, experiment_run, without_data
+from src.functions.delete_experiment_run_batch import delete_experiment_run_batch, metric_value
+
+RUN_COUNT = 5000
+DELETE_LATENCY = 0.02
+NOW = datetime.datetime.now(datetime.timezone.utc)
+STATUSES = ["FINISHED", "FAILED", "KILLED", "RUNNING"]
+
+
+def run_record(index):
+    """Run i started i hours ago, has status STATUSES[i % 4] and an accuracy falling with i"""
+    return experiment_run(f"run-{index}", [("accuracy", 0.99, 0), ("accuracy", 1 - index / RUN_COUNT, 10)],
+                          status=STATUSES[index % 4],
+                          start_time=(NOW - datetime.timedelta(hours=index)).isoformat())
+
+
+class RunsHandler(ApiHandler):
+    """
+    Lists RUN_COUNT runs by offset page token, leaving out the data of every third run,
+    which is served one by one; delete requests naming run-4001 fail
+    """
+
+    deletes = []
+    details = 0
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if not path.endswith("/runs"):
+            with self.lock:
+                RunsHandler.details += 1
+            return self.send_json(run_record(int(path.rsplit("-", 1)[1])))
+        self.send_page("experiment_runs", RUN_COUNT,
+                       lambda i: run_record(i) if i % 3 else without_data(run_record(i)))
+
+    def do_DELETE(self):
+        ids = json.loads(self.body())["ids"]
+        with self.lock:
+            RunsHandler.in_flight += 1
+            RunsHandler.max_in_flight = max(RunsHandler.max_in_flight, RunsHandler.in_flight)
+        time.sleep(DELETE_LATENCY)
+        with self.lock:
+            RunsHandler.in_flight -= 1
+            RunsHandler.deletes.append(ids)
+        if "run-4001" in ids:
+            return self.send_json("Internal Server Error", 500)
+        self.send_json({})
+
+
+def delete_with_mock(params):
+    """Call delete_experiment_run_batch against a fresh mock server"""
+    RunsHandler.deletes = []
+    RunsHandler.details = 0
+    RunsHandler.max_in_flight = 0
+    with serve(RunsHandler) as config:
+        start = time.perf_counter()
+        result = delete_experiment_run_batch(config, dict(params, experiment_id="exp-1"))
+        return result, time.perf_counter() - start
+
+
+def test_filters_select_runs_and_chunks_are_deleted_in_parallel():
+    params = {"older_than_days": 30, "status": ["failed", "KILLED"], "metric": "accuracy", "metric_below": 0.9,
+              "batch_size": 100, "concurrency": 8}
+    expected = [f"run-{i}" for i in range(RUN_COUNT)
+                if i > 30 * 24 and i % 4 in (1, 2) and 1 - i / RUN_COUNT < 0.9]
+
+    planned, _ = delete_with_mock(dict(params, dry_run=True))
+    assert planned["success"] and planned["dry_run"]
+    assert planned["planned_count"] == len(expected)
+    assert planned["planned_run_ids"] == expected[:100]
+    assert RunsHandler.deletes == []
+    # Only the runs listed without their metrics were read one by one
+    assert RunsHandler.details == (RUN_COUNT + 2) // 3
+
+    result, elapsed = delete_with_mock(params)
+    requests_made = len(RunsHandler.deletes)
+    print(f"Deleted {result['deleted_count']} of {len(expected)} runs in {requests_made} requests "
+          f"in {elapsed:.2f}s, {RunsHandler.max_in_flight} in flight at most")
+
+    assert all(len(ids) <= 100 for ids in RunsHandler.deletes)
+    assert sorted(run_id for ids in RunsHandler.deletes for run_id in ids) == sorted(expected)
+    assert RunsHandler.max_in_flight > 1
+
+    # One chunk failed; it is reported and the others still went through
+    failed_chunk = next(ids for ids in RunsHandler.deletes if "run-4001" in ids)
+    assert not result["success"]
+    assert result["failed_run_ids"] == failed_chunk
+    assert result["failed_count"] == len(failed_chunk)
+    assert result["deleted_count"] == len(expected) - len(failed_chunk)
+    assert result["errors"] == ["API error: HTTP 500 Internal Server Error"]
+    assert f"1 of {requests_made} requests failed" in result["message"]
+
+
+def test_run_ids_are_split_into_requests():
+    run_ids = [f"run-{i}" for i in range(1, 1201)]
+    result, _ = delete_with_mock({"run_ids": run_ids})
+    assert result["success"], result
+    assert sorted(len(ids) for ids in RunsHandler.deletes) == [200, 500, 500]
+    assert result["deleted_count"] == 1200 and result["failed_run_ids"] == []
+
+    # Filters that do not need metrics use the listing as it is
+    result, _ = delete_with_mock({"status": "RUNNING", "dry_run": True})
+    assert result["planned_count"] == RUN_COUNT // 4
+    assert RunsHandler.details == 0
+
+    result, _ = delete_with_mock({"run_ids": ["run-1", "run-2"]})
+    assert result["success"]
+    assert result["message"] == "Successfully deleted 2 experiment runs"
+    assert result["data"] == {}
+
+
+def test_invalid_requests_are_rejected():
+    config = {"host": "http://127.0.0.1:1", "api_key": "key", "project_id": "p1"}
+    result = delete_experiment_run_batch(config, {"experiment_id": "exp-1"})
+    assert not result["success"]
+    assert "run_ids must be a non-empty list" in result["message"]
+
+    result = delete_experiment_run_batch(config, {"experiment_id": "exp-1", "run_ids": ["a"], "status": "FAILED"})
+    assert not result["success"]
+    assert "not both" in result["message"]
+
+    result = delete_experiment_run_batch(config, {"experiment_id": "exp-1", "metric_below": 0.5})
+    assert not result["success"]
+    assert "metric is required" in result["message"]
+
+
+def test_metric_value_reads_list_and_dict_metrics():
+    assert metric_value(run_record(500), "accuracy") == 0.9
+    assert metric_value({"metrics": {"loss": "0.25"}}, "loss") == 0.25
+    assert metric_value(run_record(1), "loss") is None
+
+
+if __name__ == "__main__":
+    test_filters_select_runs_and_chunks_are_deleted_in_parallel()
+    test_run_ids_are_split_into_requests()
+    test_invalid_requests_are_rejected()
+    test_metric_value_reads_list_and_dict_metrics()
+    print("OK")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+"""Test the experiment run table, export and vectorized comparison against a mock experiment runs API"""
+
+import os
+import sys
+import csv
+import math
+import time
+import tempfile
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve, experiment_run, without_data
+from src.run_table import RunTable, load_run_table, latest_metrics
+from src.functions.export_experiment_runs import export_experiment_runs
+from src.functions.compare_experiment_runs import compare_experiment_runs
+
+RUN_COUNT = 3000
+DETAIL_LATENCY = 0.002
+STATUSES = ["FINISHED", "FAILED"]
+
+
+def run_record(index):
+    """Run i has val_loss (i * 7919) % RUN_COUNT / RUN_COUNT, except every 10th run, and lr i % 5"""
+    metrics = [("accuracy", 0.5, 0), ("accuracy", (index % 100) / 100, 5)]
+    if index % 10:
+        metrics.append(("val_loss", (index * 7919) % RUN_COUNT / RUN_COUNT, 5))
+    return experiment_run(f"run-{index}", metrics, {"lr": str(index % 5)}, name=f"trial {index}",
+                          status=STATUSES[index % 2], start_time="2026-01-01T00:00:00Z")
+
+
+class RunsHandler(ApiHandler):
+    """Lists RUN_COUNT runs by offset page token; odd runs are listed without their data"""
+
+    detail_requests = 0
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if not path.endswith("/runs"):
+            with self.lock:
+                RunsHandler.detail_requests += 1
+                RunsHandler.in_flight += 1
+                RunsHandler.max_in_flight = max(RunsHandler.max_in_flight, RunsHandler.in_flight)
+            time.sleep(DETAIL_LATENCY)
+            with self.lock:
+                RunsHandler.in_flight -= 1
+            return self.send_json(run_record(int(path.rsplit("-", 1)[1])))
+        self.send_page("experiment_runs", RUN_COUNT,
+                       lambda i: without_data(run_record(i)) if i % 2 else run_record(i))
+
+
+def with_mock(test):
+    """Run test(config) against a fresh mock server"""
+    RunsHandler.detail_requests = 0
+    RunsHandler.max_in_flight = 0
+    with serve(RunsHandler) as config:
+        return test(config)
+
+
+def test_runs_are_loaded_into_columns():
+    table = with_mock(lambda config: load_run_table(config, "p1", "exp-1", concurrency=8))
+    assert len(table) == RUN_COUNT
+    # Only the runs listed without their data are fetched one by one, several at a time
+    assert RunsHandler.detail_requests == RUN_COUNT // 2
+    assert RunsHandler.max_in_flight > 1
+
+    assert table.metric_names == ["accuracy", "val_loss"]
+    assert table.param_names == ["lr"]
+    assert list(table.columns["id"][:3]) == ["run-0", "run-1", "run-2"]
+    assert table.metric("accuracy")[37] == 0.37
+    assert math.isnan(table.metric("val_loss")[20])
+    assert table.columns["params.lr"][7] == "2"
+    assert table.columns["start_time"][0] == 1767225600.0
+
+
+def test_latest_metric_points_are_ordered_numerically():
+    def latest(points):
+        return latest_metrics({"metrics": [dict(point, key="loss", value=index) for index, point in enumerate(points)]})["loss"]
+
+    # Numeric and string steps compare as numbers, not as text
+    assert latest([{"step": 1000}, {"step": 999}]) == 0
+    assert latest([{"step": "10"}, {"step": "9"}]) == 0
+    assert latest([{"step": "9"}, {"step": 10.0}]) == 1
+    # A missing step sorts before any step, also next to a string step
+    assert latest([{"step": "3"}, {}]) == 0
+    assert latest([{}, {"step": "0"}]) == 1
+    # Within a step, the latest timestamp wins: epoch milliseconds, numeric strings or ISO times
+    assert latest([{"step": 5, "timestamp": 1000}, {"step": 5, "timestamp": 999}]) == 0
+    assert latest([{"step": 5, "timestamp": "1000"}, {"step": 5, "timestamp": "999"}]) == 0
+    assert latest([{"timestamp": "2026-01-01T10:00:00Z"}, {"timestamp": "2026-01-01T09:59:59+00:00"},
+                   {"timestamp": None}]) == 0
+    # Unparseable values count as missing; equal positions keep the last point
+    assert latest([{"step": "n/a"}, {"step": None}]) == 1
+    assert latest([{"step": 2}, {"step": 2}]) == 1
+
+
+def test_top_k_matches_a_full_sort():
+    runs = [run_record(i) for i in range(RUN_COUNT)]
+    table = RunTable.from_runs(runs)
+    losses = [(i, (i * 7919) % RUN_COUNT / RUN_COUNT) for i in range(RUN_COUNT) if i % 10]
+
+    lowest = [f"run-{i}" for i, _ in sorted(losses, key=lambda item: item[1])[:25]]
+    assert list(table.columns["id"][table.top_k("val_loss", 25, ascending=True)]) == lowest
+    highest = [f"run-{i}" for i, _ in sorted(losses, key=lambda item: -item[1])[:5]]
+    assert list(table.columns["id"][table.top_k("val_loss", 5)]) == highest
+    # More than there are runs with the metric: all of them, runs without it left out
+    assert len(table.top_k("val_loss", RUN_COUNT)) == len(losses)
+
+    # Ties keep table order
+    assert list(table.top_k("accuracy", 3)) == [99, 199, 299]
+
+    summary = table.summary(["val_loss"])["val_loss"]
+    assert summary["count"] == len(losses)
+    assert summary["min"] == min(loss for _, loss in losses)
+
+    start = time.perf_counter()
+    for _ in range(100):
+        table.top_k("val_loss", 10, ascending=True)
+    print(f"Ranked {RUN_COUNT} runs in {(time.perf_counter() - start) * 10:.2f}ms")
+
+
+def test_compare_returns_the_best_runs():
+    result = with_mock(lambda config: compare_experiment_runs(config, {
+        "experiment_id": "exp-1", "metric": "val_loss", "k": 3, "ascending": True,
+        "status": "FINISHED", "columns": ["params.lr"]}))
+    assert result["success"], result["message"]
+    finished = sorted(((i * 7919) % RUN_COUNT / RUN_COUNT, i) for i in range(0, RUN_COUNT, 2) if i % 10)
+    assert [run["id"] for run in result["runs"]] == [f"run-{i}" for _, i in finished[:3]]
+    best = result["runs"][0]
+    assert set(best) == {"id", "name", "status", "start_time", "params.lr", "rank", "value"}
+    assert best["rank"] == 1 and best["value"] == finished[0][0]
+    assert result["run_count"] == RUN_COUNT // 2
+    assert result["ranked_count"] == len(finished)
+    assert result["message"] == f"Top 3 of {len(finished)} runs by lowest val_loss"
+
+    result = with_mock(lambda config: compare_experiment_runs(config, {"experiment_id": "exp-1", "metric": "f1"}))
+    assert not result["success"]
+    assert result["message"] == "No run has metric f1"
+    assert result["metrics"] == ["accuracy", "val_loss"]
+
+
+def test_export_writes_csv_and_parquet():
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, "runs.csv")
+        result = with_mock(lambda config: export_experiment_runs(config, {"experiment_id": "exp-1",
+                                                                          "path": csv_path}))
+        assert result["success"], result["message"]
+        assert result["run_count"] == RUN_COUNT and result["format"] == "csv"
+        assert result["summary"]["accuracy"]["max"] == 0.99
+        with open(csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == RUN_COUNT
+        assert rows[11]["metrics.accuracy"] == "0.11" and rows[11]["params.lr"] == "1"
+        assert rows[10]["metrics.val_loss"] == ""
+
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            return
+        parquet_path = os.path.join(workdir, "runs.parquet")
+        result = with_mock(lambda config: export_experiment_runs(config, {"experiment_id": "exp-1",
+                                                                          "path": parquet_path}))
+        assert result["success"], result["message"]
+        table = pyarrow.parquet.read_table(parquet_path)
+        assert table.num_rows == RUN_COUNT
+        assert table.column("metrics.accuracy").to_pylist()[11] == 0.11
+
+
+def test_invalid_requests_are_rejected():
+    config = {"host": "http://127.0.0.1:1", "api_key": "key", "project_id": "p1"}
+    result = compare_experiment_runs(config, {"experiment_id": "exp-1"})
+    assert result["message"] == "Missing required parameters: metric"
+    result = compare_experiment_runs(config, {"experiment_id": "exp-1", "metric": "loss", "k": 0})
+    assert not result["success"] and "k and concurrency" in result["message"]
+    result = export_experiment_runs(config, {"experiment_id": "exp-1", "format": "xlsx", "path": "runs.xlsx"})
+    assert not result["success"] and "Unknown format" in result["message"]
+
+
+if __name__ == "__main__":
+    test_runs_are_loaded_into_columns()
+    test_latest_metric_points_are_ordered_numerically()
+    test_top_k_matches_a_full_sort()
+    test_compare_returns_the_best_runs()
+    test_export_writes_csv_and_parquet()
+    test_invalid_requests_are_rejected()
+    print("OK")
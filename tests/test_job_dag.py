@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+"""Test run_job_dag against a mock HTTPS job runs API"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import job_dag
+from src.mcp import AsyncClouderaMCP
+from src.functions.run_job_dag import run_job_dag
+
+# Seconds each job's runs take; "flaky" fails its first run, "broken" fails every run,
+# "busy" refuses its first run request and the status of "lost" runs cannot be read
+DURATIONS = {"extract": 0.1, "features": 0.4, "report": 0.1, "flaky": 0.1, "broken": 0.05, "slow": 10,
+             "busy": 0.05, "lost": 10}
+
+
+class DagHandler(ApiHandler):
+    """Starts runs on POST .../runs, stops them on POST .../stop and reports their status by age on GET"""
+
+    runs = {}
+    stopped = []
+    refused = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def _status(self, run):
+        if run["stopped"]:
+            return "ENGINE_STOPPED"
+        if time.monotonic() - run["started"] < DURATIONS[run["job_id"]]:
+            return "ENGINE_RUNNING"
+        if run["job_id"] == "broken" or (run["job_id"] == "flaky" and run["attempt"] == 1):
+            return "ENGINE_FAILED"
+        return "ENGINE_SUCCEEDED"
+
+    def _count_in_flight(self):
+        running = sum(1 for run in DagHandler.runs.values() if self._status(run) == "ENGINE_RUNNING")
+        DagHandler.max_in_flight = max(DagHandler.max_in_flight, running)
+
+    def do_POST(self):
+        self.body()
+        parts = self.path.strip("/").split("/")
+        with self.lock:
+            if parts[-1] == "stop":
+                run_id = parts[-2]
+                DagHandler.runs[run_id]["stopped"] = True
+                DagHandler.stopped.append(run_id)
+                return self.send_json({"id": run_id, "status": "ENGINE_STOPPED"})
+            job_id = parts[-2]
+            if job_id == "busy" and not DagHandler.refused:
+                DagHandler.refused.append(time.monotonic())
+                return self.send_json({"error": {"message": "too many runs"}}, 500)
+            attempt = sum(1 for run in DagHandler.runs.values() if run["job_id"] == job_id) + 1
+            run_id = f"{job_id}-{attempt}"
+            DagHandler.runs[run_id] = {"job_id": job_id, "attempt": attempt, "started": time.monotonic(),
+                                       "stopped": False}
+            self._count_in_flight()
+        self.send_json({"id": run_id, "status": "ENGINE_SCHEDULING"})
+
+    def do_GET(self):
+        run_id = self.path.rsplit("/", 1)[-1]
+        with self.lock:
+            self._count_in_flight()
+            run = DagHandler.runs[run_id]
+            status = self._status(run)
+        if run["job_id"] == "lost":
+            return self.send_json({"message": "internal error"}, 500)
+        self.send_json({"id": run_id, "status": status})
+
+
+def with_mock(test):
+    """Run test(config) against a fresh mock server"""
+    DagHandler.runs = {}
+    DagHandler.stopped = []
+    DagHandler.refused = []
+    DagHandler.max_in_flight = 0
+    with serve(DagHandler, tls=True) as config:
+        return test(config)
+
+
+def run_against_mock(params):
+    """Run a DAG against a fresh mock server and return its result and how long it took"""
+    def run(config):
+        start = time.perf_counter()
+        result = run_job_dag(config, dict(params, initial_interval=0.02, max_interval=0.02))
+        return result, time.perf_counter() - start
+
+    return with_mock(run)
+
+
+def test_branches_run_in_parallel_in_dependency_order_with_retries():
+    result, elapsed = run_against_mock({"nodes": [
+        {"name": "train", "job_id": "flaky", "depends_on": ["features"], "retries": 1},
+        {"name": "extract", "job_id": "extract"},
+        {"name": "features", "job_id": "features", "depends_on": ["extract"]},
+        {"name": "report", "job_id": "report", "depends_on": ["extract"]},
+    ], "timeout": 10})
+    nodes = {node["name"]: node for node in result["nodes"]}
+    print(f"DAG finished in {elapsed:.2f}s, makespan {result['makespan']}s, "
+          f"critical path {' -> '.join(result['critical_path'])}")
+
+    assert result["success"], result
+    assert result["state_counts"] == {"SUCCEEDED": 4}
+    assert [node["name"] for node in result["nodes"]][0] == "extract"
+    # Downstream nodes start only after their upstream node finished
+    assert nodes["features"]["started_at"] >= nodes["extract"]["finished_at"]
+    assert nodes["report"]["started_at"] >= nodes["extract"]["finished_at"]
+    assert nodes["train"]["started_at"] >= nodes["features"]["finished_at"]
+    # features and report are independent and ran side by side
+    assert DagHandler.max_in_flight == 2
+    assert nodes["report"]["finished_at"] < nodes["features"]["finished_at"]
+    # The first run of train failed and was retried
+    assert nodes["train"]["attempts"] == 2
+    assert nodes["train"]["run_ids"] == ["flaky-1", "flaky-2"]
+    assert nodes["train"]["statuses"] == ["ENGINE_FAILED", "ENGINE_SUCCEEDED"]
+    assert result["critical_path"] == ["extract", "features", "train"]
+    assert result["makespan"] == nodes["train"]["finished_at"]
+    assert result["makespan"] >= 0.1 + 0.4 + 0.1 + 0.1
+    assert elapsed < 3
+
+
+def test_failure_skips_downstream_and_fail_fast_stops_running_nodes():
+    result, elapsed = run_against_mock({"nodes": [
+        {"name": "a", "job_id": "broken"},
+        {"name": "b", "job_id": "slow"},
+        {"name": "c", "job_id": "report", "depends_on": ["a"]},
+        {"name": "d", "job_id": "report", "depends_on": ["c"]},
+    ], "retries": 1, "fail_fast": True, "timeout": 10})
+    nodes = {node["name"]: node for node in result["nodes"]}
+
+    assert not result["success"]
+    assert nodes["a"]["state"] == "FAILED"
+    assert nodes["a"]["attempts"] == 2
+    assert nodes["c"]["state"] == "SKIPPED"
+    assert nodes["d"]["state"] == "SKIPPED"
+    assert nodes["b"]["state"] == "CANCELLED"
+    assert DagHandler.stopped == ["slow-1"]
+    assert elapsed < 3
+
+
+def test_node_timeout_stops_the_run():
+    result, _ = run_against_mock({"nodes": [{"name": "b", "job_id": "slow"}], "node_timeout": 0.2, "timeout": 10})
+    node = result["nodes"][0]
+    assert node["state"] == "FAILED"
+    assert "did not finish within 0.2s" in node["error"]
+    assert DagHandler.stopped == ["slow-1"]
+
+
+def test_unreadable_run_is_stopped_before_the_node_fails():
+    result, elapsed = run_against_mock({"nodes": [{"name": "a", "job_id": "lost"}], "timeout": 10})
+    node = result["nodes"][0]
+
+    assert node["state"] == "FAILED"
+    assert "500" in node["error"]
+    # The poller gave up while the run was still going, so the DAG stopped it
+    assert DagHandler.stopped == ["lost-1"]
+    assert elapsed < 3
+
+
+def test_refused_run_is_requested_again_after_a_delay():
+    delay = job_dag.START_RETRY_DELAY
+    job_dag.START_RETRY_DELAY = 0.3
+    try:
+        result, _ = run_against_mock({"nodes": [{"name": "a", "job_id": "busy", "retries": 1}], "timeout": 10})
+    finally:
+        job_dag.START_RETRY_DELAY = delay
+    node = result["nodes"][0]
+
+    assert result["success"], result
+    assert node["run_ids"] == [None, "busy-1"]
+    assert DagHandler.runs["busy-1"]["started"] - DagHandler.refused[0] >= 0.3
+
+
+def cancel_once_started(coroutine):
+    """Run a coroutine until the mock has started a run, cancel it, then wait for the runs to be stopped"""
+    async def run():
+        task = asyncio.ensure_future(coroutine)
+        while not DagHandler.runs:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    # The DAG notices the cancellation on its worker thread within a tick
+    deadline = time.monotonic() + 2
+    while not DagHandler.stopped and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_cancelling_the_call_stops_running_nodes():
+    nodes = [{"name": "a", "job_id": "slow"}, {"name": "b", "job_id": "report", "depends_on": ["a"]}]
+
+    def run_client(config):
+        async def run():
+            async with AsyncClouderaMCP(config) as client:
+                await client.run_job_dag(nodes, max_interval=0.02)
+
+        cancel_once_started(run())
+        assert DagHandler.stopped == ["slow-1"]
+        assert list(DagHandler.runs) == ["slow-1"]
+
+    def run_tool(config):
+        import server
+        environment = {name: os.environ.get(name) for name in ("CLOUDERA_ML_HOST", "CLOUDERA_ML_API_KEY")}
+        os.environ.update({"CLOUDERA_ML_HOST": config["host"], "CLOUDERA_ML_API_KEY": config["api_key"]})
+        try:
+            cancel_once_started(server.run_job_dag_tool(json.dumps(nodes), project_id="p1"))
+        finally:
+            for name, value in environment.items():
+                if value is None:
+                    del os.environ[name]
+                else:
+                    os.environ[name] = value
+        assert DagHandler.stopped == ["slow-1"]
+        assert list(DagHandler.runs) == ["slow-1"]
+
+    with_mock(run_client)
+    with_mock(run_tool)
+
+
+def test_malformed_dags_are_rejected():
+    config = {"host": "https://127.0.0.1:1", "api_key": "key", "project_id": "p1"}
+    result = run_job_dag(config, {"nodes": [
+        {"name": "a", "job_id": "j", "depends_on": ["c"]},
+        {"name": "b", "job_id": "j", "depends_on": ["a"]},
+        {"name": "c", "job_id": "j", "depends_on": ["b"]},
+        {"name": "d", "job_id": "j"},
+    ]})
+    assert not result["success"]
+    assert result["message"] == "Dependency cycle between nodes: a, b, c"
+
+    result = run_job_dag(config, {"nodes": [{"name": "a", "job_id": "j", "depends_on": ["missing"]}]})
+    assert not result["success"]
+    assert "unknown nodes: missing" in result["message"]
+
+    result = run_job_dag(config, {"nodes": [{"name": "a", "job_id": "j"}, {"name": "a", "job_id": "k"}]})
+    assert not result["success"]
+    assert "Duplicate node name" in result["message"]
+
+
+if __name__ == "__main__":
+    test_branches_run_in_parallel_in_dependency_order_with_retries()
+    test_failure_skips_downstream_and_fail_fast_stops_running_nodes()
+    test_node_timeout_stops_the_run()
+    test_unreadable_run_is_stopped_before_the_node_fails()
+    test_refused_run_is_requested_again_after_a_delay()
+    test_cancelling_the_call_stops_running_nodes()
+    test_malformed_dags_are_rejected()
+    print("OK")
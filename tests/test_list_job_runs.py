@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Test list_job_runs fanning out across every job against a mock HTTPS API"""
+
+import os
+import sys
+import time
+import datetime
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src.functions.list_job_runs import list_job_runs
+
+JOB_COUNT = 200
+RUNS_PER_JOB = 5
+LATENCY = 0.01
+START = datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)
+
+
+def run_record(job_index, run_index):
+    """Run r of job j was created j * 5 + r minutes after START; every seventh run failed"""
+    number = job_index * RUNS_PER_JOB + run_index
+    created_at = START + datetime.timedelta(minutes=number)
+    return {
+        "id": f"run-{job_index}-{run_index}",
+        "status": "ENGINE_FAILED" if number % 7 == 0 else "ENGINE_SUCCEEDED",
+        "created_at": created_at.isoformat().replace("+00:00", "Z"),
+    }
+
+
+class RunsHandler(ApiHandler):
+    """Serves JOB_COUNT jobs and their runs in pages of the requested size; job-13's runs are forbidden"""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if parts[-1] == "jobs":
+            self.send_page("jobs", JOB_COUNT, lambda i: {"id": f"job-{i}", "name": f"job {i}"})
+        else:
+            job_index = int(parts[-2].split("-")[1])
+            if job_index == 13:
+                return self.send_json({"message": "forbidden"}, 403)
+            with self.lock:
+                RunsHandler.in_flight += 1
+                RunsHandler.max_in_flight = max(RunsHandler.max_in_flight, RunsHandler.in_flight)
+            time.sleep(LATENCY)
+            with self.lock:
+                RunsHandler.in_flight -= 1
+            self.send_page("job_runs", RUNS_PER_JOB, lambda r: run_record(job_index, r))
+
+
+def test_runs_of_all_jobs_are_merged_filtered_and_sorted():
+    with serve(RunsHandler, tls=True) as config:
+        start = time.perf_counter()
+        result = list_job_runs(config, {
+            "status": "engine_failed",
+            "since": "2024-05-01T10:00:00Z",
+            "until": (START + datetime.timedelta(hours=20)).timestamp(),
+            "concurrency": 8,
+            "page_size": 2,
+            "bypass_cache": True
+        })
+        elapsed = time.perf_counter() - start
+        limited = list_job_runs(config, {"limit": 3, "bypass_cache": True})
+        single = list_job_runs(config, {"job_id": "job-3", "bypass_cache": True})
+
+    expected = [
+        run_record(j, r) for j in range(JOB_COUNT) for r in range(RUNS_PER_JOB)
+        if j != 13 and (j * RUNS_PER_JOB + r) % 7 == 0 and 600 <= j * RUNS_PER_JOB + r < 1200
+    ]
+    print(f"Listed runs of {JOB_COUNT} jobs in {elapsed:.2f}s, "
+          f"{RunsHandler.max_in_flight} run listings in flight at most")
+    assert not result["success"]
+    assert [job["id"] for job in result["failed_jobs"]] == ["job-13"]
+    assert [run["id"] for run in result["data"]["job_runs"]] == [run["id"] for run in reversed(expected)]
+    assert result["count"] == len(expected)
+    assert result["data"]["job_runs"][0]["job_name"] == f"job {int(expected[-1]['id'].split('-')[1])}"
+    assert 1 < RunsHandler.max_in_flight <= 8
+    # Three pages per job, one job after another, would take at least JOB_COUNT * 3 * LATENCY
+    assert elapsed < JOB_COUNT * 3 * LATENCY / 2
+
+    assert limited["truncated"]
+    assert [run["id"] for run in limited["data"]["job_runs"]] == ["run-199-4", "run-199-3", "run-199-2"]
+
+    assert single["success"]
+    assert [run["id"] for run in single["data"]["job_runs"]] == [f"run-3-{r}" for r in reversed(range(RUNS_PER_JOB))]
+    assert "failed_jobs" not in single
+
+
+def test_invalid_time_window_is_reported():
+    result = list_job_runs({"host": "https://localhost:1", "api_key": "key", "project_id": "p1"},
+                           {"since": "yesterday"})
+    assert not result["success"]
+    assert "yesterday" in result["message"]
+
+
+if __name__ == "__main__":
+    test_runs_of_all_jobs_are_merged_filtered_and_sorted()
+    test_invalid_time_window_is_reported()
+    print("OK")
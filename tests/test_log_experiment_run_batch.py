@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Test chunked, parallel log_experiment_run_batch against a mock HTTPS API"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src.functions.log_experiment_run_batch import log_experiment_run_batch, chunk_run_updates
+
+LATENCY = 0.05
+
+
+class BatchHandler(ApiHandler):
+    """
+    Records run-batch bodies; fails with a non-JSON error when a chunk updates run "bad",
+    and rejects a chunk updating run "invalid" with a JSON error body
+    """
+
+    bodies = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_POST(self):
+        raw = self.body()
+        runs = json.loads(raw)["runs"]
+        with self.lock:
+            BatchHandler.in_flight += 1
+            BatchHandler.max_in_flight = max(BatchHandler.max_in_flight, BatchHandler.in_flight)
+        time.sleep(LATENCY)
+        with self.lock:
+            BatchHandler.in_flight -= 1
+            BatchHandler.bodies.append((len(raw), runs))
+        if any(update["id"] == "bad" for update in runs):
+            self.send_json("Internal Server Error", 500)
+        elif any(update["id"] == "invalid" for update in runs):
+            self.send_json({"error": {"code": 3, "message": "invalid metric key"}}, 400)
+        else:
+            self.send_json({"runs": len(runs)})
+
+
+def send_to_mock(params):
+    """Call log_experiment_run_batch against a fresh mock server"""
+    BatchHandler.bodies = []
+    BatchHandler.max_in_flight = 0
+    with serve(BatchHandler, tls=True) as config:
+        start = time.perf_counter()
+        result = log_experiment_run_batch(config, dict(params, experiment_id="exp-1"))
+        return result, time.perf_counter() - start
+
+
+def test_large_backfills_are_chunked_and_sent_in_parallel():
+    run_updates = [
+        {"id": f"run-{i}", "metrics": {f"m{k}": i * 1000 + k for k in range(200)}, "parameters": {"seed": i}}
+        for i in range(300)
+    ]
+    run_updates.append({"id": "huge", "metrics": {f"step_{k}": k / 3 for k in range(20000)}, "tags": ["backfill"]})
+    result, elapsed = send_to_mock({"run_updates": run_updates, "max_batch_bytes": 64 * 1024,
+                                    "max_batch_runs": 50, "concurrency": 8})
+    chunks = len(BatchHandler.bodies)
+    print(f"Sent {len(run_updates)} run updates in {chunks} chunks in {elapsed:.2f}s, "
+          f"{BatchHandler.max_in_flight} in flight at most")
+
+    assert result["success"], result["message"]
+    assert len(result["data"]["chunks"]) == chunks
+    assert all(size <= 64 * 1024 for size, _ in BatchHandler.bodies)
+    assert all(len(runs) <= 50 for _, runs in BatchHandler.bodies)
+    assert BatchHandler.max_in_flight > 1
+    # Well under the time the chunks take one after another
+    assert elapsed < chunks * LATENCY * 0.8
+
+    # Every value arrives, including all pieces of the huge run
+    received = {}
+    for _, runs in BatchHandler.bodies:
+        for update in runs:
+            entry = received.setdefault(update["id"], {"metrics": {}, "parameters": {}, "tags": []})
+            entry["metrics"].update(update.get("metrics", {}))
+            entry["parameters"].update(update.get("parameters", {}))
+            entry["tags"].extend(update.get("tags", []))
+    assert len(received) == 301
+    assert received["run-7"]["metrics"] == run_updates[7]["metrics"]
+    assert received["run-7"]["parameters"] == {"seed": 7}
+    assert received["huge"]["metrics"] == run_updates[-1]["metrics"]
+    assert received["huge"]["tags"] == ["backfill"]
+
+    runs = {entry["id"]: entry for entry in result["runs"]}
+    assert runs["huge"]["chunks"] > 1 and runs["huge"]["success"]
+    assert runs["run-0"] == {"id": "run-0", "success": True, "chunks": 1}
+
+
+def test_updates_of_the_same_run_keep_their_order():
+    run_updates = []
+    for step in range(12):
+        run_updates.append({"id": "seq", "metrics": {"loss": step}})
+        run_updates.append({"id": f"other-{step}", "metrics": {"loss": step}})
+    result, _ = send_to_mock({"run_updates": run_updates, "max_batch_runs": 1, "concurrency": 8})
+    assert BatchHandler.max_in_flight > 1
+
+    # With 3 updates per chunk, some chunks hold two updates of "seq"
+    for max_batch_runs in (1, 3):
+        result, _ = send_to_mock({"run_updates": run_updates, "max_batch_runs": max_batch_runs, "concurrency": 8})
+
+        assert result["success"]
+        arrived = [update["metrics"]["loss"] for _, runs in BatchHandler.bodies for update in runs
+                   if update["id"] == "seq"]
+        assert arrived == list(range(12))
+
+
+def test_failed_chunks_are_reported_per_run():
+    run_updates = [{"id": f"run-{i}", "metrics": {"loss": i}} for i in range(10)]
+    run_updates.insert(5, {"id": "bad", "metrics": {"loss": -1}})
+    result, _ = send_to_mock({"run_updates": run_updates, "max_batch_runs": 3})
+
+    assert not result["success"]
+    assert "1 of 4 chunks failed" in result["message"]
+    runs = {entry["id"]: entry for entry in result["runs"]}
+    # run-3, run-4 and bad share the failed chunk
+    assert [run_id for run_id, entry in runs.items() if not entry["success"]] == ["run-3", "run-4", "bad"]
+    assert runs["bad"]["error"].startswith("API error: HTTP 500")
+
+
+def test_error_statuses_with_json_bodies_fail():
+    run_updates = [{"id": f"run-{i}", "metrics": {"loss": i}} for i in range(6)]
+    run_updates.insert(4, {"id": "invalid", "metrics": {"": -1}})
+    result, _ = send_to_mock({"run_updates": run_updates, "max_batch_runs": 2})
+
+    assert not result["success"]
+    assert "1 of 4 chunks failed" in result["message"]
+    runs = {entry["id"]: entry for entry in result["runs"]}
+    assert [run_id for run_id, entry in runs.items() if not entry["success"]] == ["invalid", "run-4"]
+    assert runs["invalid"]["error"].startswith("API error: HTTP 400")
+    assert "invalid metric key" in runs["invalid"]["error"]
+
+    result, _ = send_to_mock({"run_updates": [{"id": "invalid", "metrics": {"": -1}}]})
+    assert not result["success"] and result["data"] is None
+
+
+def test_small_lists_are_one_request():
+    result, _ = send_to_mock({"run_updates": [{"id": "run-1", "metrics": {"loss": 0.5}}]})
+    assert result["success"]
+    assert result["data"] == {"runs": 1}
+    assert result["runs"] == [{"id": "run-1", "success": True, "chunks": 1}]
+    assert len(chunk_run_updates([{"id": "r", "metrics": {"a": 1}}] * 250)) == 3
+
+
+if __name__ == "__main__":
+    test_large_backfills_are_chunked_and_sent_in_parallel()
+    test_updates_of_the_same_run_keep_their_order()
+    test_failed_chunks_are_reported_per_run()
+    test_error_statuses_with_json_bodies_fail()
+    test_small_lists_are_one_request()
+    print("OK")
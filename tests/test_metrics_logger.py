@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Test MetricsLogger coalescing writes into run-batch requests against a mock HTTPS API"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src.metrics_logger import MetricsLogger
+
+
+class BatchHandler(ApiHandler):
+    """Records every run-batch request body; rejects updates of run "invalid" with a JSON error"""
+
+    batches = []
+
+    def do_POST(self):
+        request = json.loads(self.body())
+        with self.lock:
+            BatchHandler.batches.append((time.monotonic(), request["runs"]))
+        if any(update["id"] == "invalid" for update in request["runs"]):
+            self.send_json({"error": {"code": 3, "message": "invalid metric key"}}, 400)
+        else:
+            self.send_json({})
+
+
+def with_mock(test):
+    """Run test(config) against a fresh mock server"""
+    BatchHandler.batches = []
+    with serve(BatchHandler, tls=True) as config:
+        return test(config)
+
+
+def test_thousands_of_points_are_coalesced_and_kept_in_order():
+    steps = 10000
+
+    def log(config):
+        start = time.perf_counter()
+        with MetricsLogger(config, "exp-1", batch_size=500, flush_interval=60) as logger:
+            logger.log_params("run-1", {"lr": 0.1, "epochs": 3})
+            logger.log_param("run-1", "lr", 0.01)
+            logger.add_tags("run-1", "baseline")
+            for step in range(steps):
+                logger.log_metrics("run-1", {"loss": 1 / (step + 1), "step": step})
+                logger.log_metric("run-2", "loss", float(step))
+        elapsed = time.perf_counter() - start
+        return elapsed, logger.stats()
+
+    elapsed, stats = with_mock(log)
+    requests_made = len(BatchHandler.batches)
+    print(f"Logged {stats['logged']} writes in {elapsed:.2f}s with {requests_made} requests")
+
+    assert stats["logged"] == 3 * steps + 4
+    assert stats["sent"] == 3 * steps + 3
+    assert stats["failed"] == 0 and stats["pending"] == 0
+    assert stats["requests"] == requests_made
+    # Mostly full batches, not one request per write
+    assert requests_made < 2 * (3 * steps + 3) // 500
+    assert all(sum(len(update.get("metrics", {})) + len(update.get("parameters", {})) + len(update.get("tags", []))
+                   for update in runs) <= 500 for _, runs in BatchHandler.batches)
+
+    updates = [update for _, runs in BatchHandler.batches for update in runs]
+    first = next(update for update in updates if update["id"] == "run-1")
+    assert first["parameters"] == {"lr": 0.01, "epochs": 3}
+    assert first["tags"] == ["baseline"]
+    # Every point of every series arrives, in logging order
+    def series(run_id, key):
+        return [update["metrics"][key] for update in updates
+                if update["id"] == run_id and key in update.get("metrics", {})]
+
+    assert series("run-1", "step") == list(range(steps))
+    assert series("run-1", "loss") == [1 / (step + 1) for step in range(steps)]
+    assert series("run-2", "loss") == [float(step) for step in range(steps)]
+
+
+def test_partial_batches_are_sent_after_the_flush_interval():
+    def log(config):
+        logger = MetricsLogger(config, "exp-1", batch_size=1000, flush_interval=0.2)
+        start = time.monotonic()
+        logger.log_metric("run-1", "accuracy", 0.5)
+        logger.log_metric("run-1", "f1", 0.4)
+        deadline = time.monotonic() + 5
+        while not BatchHandler.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        sent_after = BatchHandler.batches[0][0] - start if BatchHandler.batches else None
+        logger.log_metric("run-1", "accuracy", 0.6)
+        result = logger.close()
+        return sent_after, result, logger
+
+    sent_after, result, logger = with_mock(log)
+    assert sent_after is not None and 0.15 <= sent_after < 2
+    assert BatchHandler.batches[0][1] == [{"id": "run-1", "metrics": {"accuracy": 0.5, "f1": 0.4}}]
+    # close() sends the rest right away
+    assert result["success"] and result["sent"] == 1
+    assert BatchHandler.batches[-1][1] == [{"id": "run-1", "metrics": {"accuracy": 0.6}}]
+    try:
+        logger.log_metric("run-1", "accuracy", 0.7)
+        assert False, "logging after close should fail"
+    except RuntimeError:
+        pass
+
+
+def test_rejected_batches_count_as_failed():
+    def log(config):
+        logger = MetricsLogger(config, "exp-1", batch_size=4, flush_interval=60)
+        logger.log_metrics("run-1", {"loss": 0.5, "accuracy": 0.7})
+        logger.log_metrics("run-1", {"loss": 0.4, "accuracy": 0.8})
+        logger.log_metrics("invalid", {"": 1, "loss": 0.3, "accuracy": 0.9})
+        result = logger.close()
+        return result, logger.stats()
+
+    result, stats = with_mock(log)
+    assert len(BatchHandler.batches) == 2
+    assert not result["success"]
+    assert (result["sent"], result["failed"]) == (4, 3)
+    assert (stats["sent"], stats["failed"], stats["requests"]) == (4, 3, 2)
+    assert "HTTP 400" in stats["last_error"] and "invalid metric key" in stats["last_error"]
+
+
+if __name__ == "__main__":
+    test_thousands_of_points_are_coalesced_and_kept_in_order()
+    test_partial_batches_are_sent_after_the_flush_interval()
+    test_rejected_batches_count_as_failed()
+    print("OK")
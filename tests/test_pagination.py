@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Test lazy pagination against a mock list endpoint with 100k records"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import pagination
+from src.functions.list_jobs import list_jobs
+
+RECORD_COUNT = 100000
+
+
+class PagedJobsHandler(ApiHandler):
+    """Serves RECORD_COUNT generated jobs in pages addressed by offset tokens"""
+
+    pages_served = 0
+
+    def do_GET(self):
+        PagedJobsHandler.pages_served += 1
+        self.send_page("jobs", RECORD_COUNT,
+                       lambda i: {"id": f"job-{i}", "name": f"job {i}", "status": "ENGINE_SUCCEEDED"})
+
+
+def traced_peak(func):
+    """Run a function and return its result and peak traced memory in bytes"""
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def test_paginate_streams_all_records_with_flat_memory():
+    PagedJobsHandler.pages_served = 0
+
+    def stream(url):
+        count, last_id = 0, None
+        for job in pagination.paginate(url, "jobs", page_size=1000, cache=False):
+            count += 1
+            last_id = job["id"]
+        return count, last_id
+
+    with serve(PagedJobsHandler) as config:
+        url = f"{config['host']}/api/v2/projects/p1/jobs"
+        (count, last_id), streamed_peak = traced_peak(lambda: stream(url))
+        pages_served = PagedJobsHandler.pages_served
+        records, listed_peak = traced_peak(lambda: list(pagination.paginate(url, "jobs", page_size=1000,
+                                                                            cache=False)))
+
+    print(f"Streamed {count} records in {pages_served} pages: peak traced memory "
+          f"{streamed_peak / 1024 / 1024:.1f} MiB, vs {listed_peak / 1024 / 1024:.1f} MiB when collected")
+    assert count == len(records) == RECORD_COUNT
+    assert last_id == f"job-{RECORD_COUNT - 1}"
+    assert pages_served == RECORD_COUNT // 1000
+    # Only about one page is alive at a time, not all 100k records
+    assert streamed_peak * 4 < listed_peak
+
+
+def test_stopping_early_fetches_only_the_pages_needed():
+    with serve(PagedJobsHandler) as config:
+        PagedJobsHandler.pages_served = 0
+        records = pagination.paginate(f"{config['host']}/api/v2/projects/p1/jobs", "jobs", page_size=100, cache=False)
+        for index, job in enumerate(records):
+            if index == 249:
+                break
+        assert PagedJobsHandler.pages_served == 3
+
+        PagedJobsHandler.pages_served = 0
+        result = list_jobs(config, {"limit": 250, "page_size": 100, "bypass_cache": True})
+
+    assert result["success"]
+    assert result["count"] == 250
+    assert result["truncated"]
+    assert result["jobs"][-1]["id"] == "job-249"
+    assert PagedJobsHandler.pages_served == 3
+
+
+if __name__ == "__main__":
+    test_paginate_streams_all_records_with_flat_memory()
+    test_stopping_early_fetches_only_the_pages_needed()
+    print("OK")
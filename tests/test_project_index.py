@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""Test the project name index of get_project_id against a mock HTTPS projects API"""
+
+import os
+import sys
+import json
+import time
+import importlib
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import response_cache
+from src.functions.get_project_id import get_project_id, clear_project_index
+from src.functions.update_project import update_project
+
+# The package exports the function under the module's name
+project_lookup = importlib.import_module("src.functions.get_project_id")
+
+PROJECT_COUNT = 250
+
+
+class ProjectsHandler(ApiHandler):
+    """
+    Projects API over ProjectsHandler.projects, paged by offset page token
+
+    The name search filter matches substrings, and the exact match comes last,
+    so finding "proj-1" takes every page of its 111 matches.
+    """
+
+    projects = []
+    requests = []
+
+    def do_GET(self):
+        search = json.loads(self.query().get("search_filter", ["{}"])[0]).get("name")
+        with self.lock:
+            ProjectsHandler.requests.append(search)
+            projects = list(self.projects)
+        if search:
+            projects = sorted((project for project in projects if search in project["name"]),
+                              key=lambda project: project["name"] == search)
+        self.send_page("projects", len(projects), projects.__getitem__)
+
+    def do_PATCH(self):
+        project_id = urlparse(self.path).path.rsplit("/", 1)[1]
+        changes = json.loads(self.body())
+        with self.lock:
+            project = next(project for project in self.projects if project["id"] == project_id)
+            project.update(changes)
+        self.send_json(project)
+
+
+def with_mock(test):
+    """Run test(config) against a fresh mock server, with an empty index and no response cache"""
+    ProjectsHandler.projects = [{"id": f"id-{index}", "name": f"proj-{index}", "owner": {"username": "alice"}}
+                                for index in range(PROJECT_COUNT)]
+    ProjectsHandler.requests = []
+    clear_project_index()
+    cache_enabled = response_cache.ENABLED
+    response_cache.ENABLED = False
+    try:
+        with serve(ProjectsHandler, tls=True) as config:
+            return test(config)
+    finally:
+        clear_project_index()
+        response_cache.ENABLED = cache_enabled
+
+
+def lookup(config, name, **params):
+    """Resolve a name and return (project ID or None, requests made)"""
+    ProjectsHandler.requests = []
+    result = get_project_id(config, dict(params, project_name=name, page_size=50))
+    return result.get("project_id"), len(ProjectsHandler.requests)
+
+
+def test_exact_match_is_searched_across_pages_then_indexed():
+    def run(config):
+        # 111 substring matches in pages of 50, the exact one last
+        assert lookup(config, "proj-1") == ("id-1", 3)
+        assert ProjectsHandler.requests == ["proj-1"] * 3
+        # Index hit: no request
+        assert lookup(config, "proj-1") == ("id-1", 0)
+        # Other API keys do not share entries
+        assert lookup(dict(config, api_key="other"), "proj-1") == ("id-1", 3)
+        # bypass_cache asks again
+        assert lookup(config, "proj-1", bypass_cache=True) == ("id-1", 3)
+        assert lookup(config, "proj-missing")[0] is None
+
+        # Listing every project indexes each name
+        result = get_project_id(config, {"project_name": "*", "page_size": 100})
+        assert result["count"] == PROJECT_COUNT and not result["truncated"]
+        assert lookup(config, "proj-249") == ("id-249", 0)
+
+    with_mock(run)
+
+
+def test_entries_expire_after_the_ttl():
+    def run(config):
+        ttl = project_lookup.INDEX_TTL
+        project_lookup.INDEX_TTL = 0.2
+        try:
+            assert lookup(config, "proj-42") == ("id-42", 1)
+            assert lookup(config, "proj-42") == ("id-42", 0)
+            time.sleep(0.3)
+            assert lookup(config, "proj-42") == ("id-42", 1)
+        finally:
+            project_lookup.INDEX_TTL = ttl
+
+    with_mock(run)
+
+
+def test_renamed_and_deleted_projects_are_not_served_from_the_index():
+    def run(config):
+        assert lookup(config, "proj-7") == ("id-7", 1)
+
+        # A rename through update_project clears the index
+        result = update_project(config, {"project_id": "id-7", "name": "renamed"})
+        assert result["success"], result["message"]
+        assert lookup(config, "proj-7") == (None, 1)
+        assert lookup(config, "renamed") == ("id-7", 1)
+
+        # A project deleted elsewhere stays indexed until a fresh search misses it
+        assert lookup(config, "proj-8") == ("id-8", 1)
+        ProjectsHandler.projects = [project for project in ProjectsHandler.projects if project["id"] != "id-8"]
+        assert lookup(config, "proj-8") == ("id-8", 0)
+        assert lookup(config, "proj-8", bypass_cache=True) == (None, 1)
+        assert lookup(config, "proj-8") == (None, 1)
+
+    with_mock(run)
+
+
+if __name__ == "__main__":
+    test_exact_match_is_searched_across_pages_then_indexed()
+    test_entries_expire_after_the_ttl()
+    test_renamed_and_deleted_projects_are_not_served_from_the_index()
+    print("OK")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Test the transport's token-bucket rate limiter and its bulk lane"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import transport
+from src.transport import TokenBucket
+
+
+def test_bucket_allows_burst_then_holds_rate():
+    bucket = TokenBucket(rate=50, burst=5)
+    start = time.monotonic()
+    for _ in range(15):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # 5 tokens are free, the other 10 arrive at 50 per second
+    assert 0.18 <= elapsed < 0.5
+    stats = bucket.stats()
+    assert stats["requests"] == 15
+    assert stats["queue_depth"] == 0
+    assert stats["total_wait"] > 0
+
+
+def test_interactive_calls_overtake_queued_bulk_calls():
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.acquire()
+    order = []
+
+    def bulk_worker(index):
+        bucket.acquire(bulk=True)
+        order.append(f"bulk-{index}")
+
+    workers = [threading.Thread(target=bulk_worker, args=(i,)) for i in range(5)]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.02)
+    assert bucket.stats()["bulk_waiting"] == 5
+
+    bucket.acquire()
+    order.append("interactive")
+    for worker in workers:
+        worker.join()
+
+    # The interactive call arrived after five bulk calls were queued but got the next token
+    assert order[0] == "interactive"
+    assert len(order) == 6
+
+
+def test_requests_are_classified_by_endpoint():
+    base = "https://ml.example.com/api/v2/projects/p1"
+    assert transport.endpoint_class("GET", f"{base}/jobs") == "read"
+    assert transport.endpoint_class("DELETE", f"{base}/jobs/j1") == "mutate"
+    assert transport.endpoint_class("PUT", f"{base}/files") == "upload"
+    with transport.bulk():
+        assert transport.is_bulk()
+    assert not transport.is_bulk()
+
+
+if __name__ == "__main__":
+    test_bucket_allows_burst_then_holds_rate()
+    test_interactive_calls_overtake_queued_bulk_calls()
+    test_requests_are_classified_by_endpoint()
+    print("OK")
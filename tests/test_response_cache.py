@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Test the transport's GET response cache and its invalidation"""
+
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import transport
+from src.response_cache import ResponseCache, response_cache, cache_scope, resource_type
+
+
+class CountingHandler(ApiHandler):
+    """Answers every request with a body naming how many requests it has seen"""
+
+    count = 0
+
+    def _respond(self):
+        self.body()
+        with self.lock:
+            CountingHandler.count += 1
+            count = CountingHandler.count
+        self.send_json({"count": count})
+
+    do_GET = do_POST = do_DELETE = _respond
+
+
+def test_get_responses_are_cached_until_a_related_mutation():
+    with serve(CountingHandler, rate_limits=True) as config:
+        base = f"{config['host']}/api/v2/projects/p1"
+        response_cache.clear()
+
+        jobs = transport.request("GET", f"{base}/jobs", api_key="key").json()
+        assert transport.request("GET", f"{base}/jobs", api_key="key").json() == jobs
+        apps = transport.request("GET", f"{base}/applications", api_key="key").json()
+
+        # Another API key never sees the cached response, and bypassing fetches a fresh one
+        assert transport.request("GET", f"{base}/jobs", api_key="other").json() != jobs
+        fresh = transport.request("GET", f"{base}/jobs", api_key="key", cache=False).json()
+        assert fresh != jobs
+        assert transport.request("GET", f"{base}/jobs", api_key="key").json() == fresh
+
+        # Creating a job drops the jobs list but not the applications list
+        transport.request("POST", f"{base}/jobs", api_key="key", data="{}")
+        assert transport.request("GET", f"{base}/jobs", api_key="key").json() != fresh
+        assert transport.request("GET", f"{base}/applications", api_key="key").json() == apps
+
+
+def test_scopes_ttls_and_lru_bound():
+    host = "https://ml.example.com/api/v2"
+    assert resource_type(f"{host}/projects/p1/jobs/j1/runs/r1") == "runs"
+    assert resource_type(f"{host}/runtimes") == "runtimes"
+    # Model builds and deployments are invalidated together with models
+    assert cache_scope(f"{host}/projects/p1/model-builds") == cache_scope(f"{host}/projects/p1/models/m1/builds")
+    assert cache_scope(f"{host}/projects/p1")[:len(cache_scope(f"{host}/projects"))] == cache_scope(f"{host}/projects")
+
+    cache = ResponseCache(max_entries=2)
+    for index in range(3):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        cache.put(f"key-{index}", f"{host}/projects/p1/jobs", response)
+    assert cache.get("key-0") is None
+    assert cache.get("key-2") is not None
+    assert cache.stats()["entries"] == 2
+
+
+if __name__ == "__main__":
+    test_get_responses_are_cached_until_a_related_mutation()
+    test_scopes_ttls_and_lru_bound()
+    print("OK")
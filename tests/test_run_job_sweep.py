@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Test run_job_sweep against a mock job runs API"""
+
+import os
+import sys
+import json
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src.functions.run_job_sweep import run_job_sweep
+
+
+class SweepHandler(ApiHandler):
+    """Starts runs on POST; each run takes 0.2 s and fails if its MODE variable is "bad" """
+
+    runs = {}
+    gets = 0
+
+    def do_POST(self):
+        request = json.loads(self.body())
+        with self.lock:
+            run_id = f"run-{len(SweepHandler.runs)}"
+            SweepHandler.runs[run_id] = (time.monotonic(), request)
+        self.send_json({"id": run_id, "status": "ENGINE_SCHEDULING"})
+
+    def do_GET(self):
+        run_id = self.path.rsplit("/", 1)[-1]
+        with self.lock:
+            SweepHandler.gets += 1
+            started, request = SweepHandler.runs[run_id]
+        if time.monotonic() - started < 0.2:
+            status = "ENGINE_RUNNING"
+        elif request["environment_variables"].get("MODE") == "bad":
+            status = "ENGINE_FAILED"
+        else:
+            status = "ENGINE_SUCCEEDED"
+        self.send_json({"id": run_id, "status": status, "environment_variables": request["environment_variables"]})
+
+
+def test_sweep_starts_every_variant_and_tracks_them_to_completion():
+    SweepHandler.runs = {}
+    SweepHandler.gets = 0
+    with serve(SweepHandler) as config:
+        result = run_job_sweep(config, {
+            "job_id": "job-1",
+            "grid": {"LR": [0.1, 0.01, 0.001], "SEED": [1, 2]},
+            "variants": [{"environment_variables": {"MODE": "bad"}, "override_config": {"cpu": 4}}],
+            "environment_variables": {"MODE": "good", "DATASET": "small"},
+            "timeout": 10,
+            "max_interval": 0.05
+        })
+
+    assert not result["succeeded"]
+    assert result["success"], result
+    assert result["status_counts"] == {"ENGINE_SUCCEEDED": 6, "ENGINE_FAILED": 1}
+    assert len(result["runs"]) == 7
+    assert result["runs"][0]["variant"] == {"environment_variables": {"LR": "0.1", "SEED": "1"}}
+    assert result["runs"][-1] == {
+        "run_id": result["runs"][-1]["run_id"],
+        "variant": {"environment_variables": {"MODE": "bad"}, "override_config": {"cpu": 4}},
+        "status": "ENGINE_FAILED"
+    }
+
+    # Base environment variables reach every run; variant values win
+    requests_sent = [request for _, request in SweepHandler.runs.values()]
+    assert all(request["environment_variables"]["DATASET"] == "small" for request in requests_sent)
+    assert sorted(request["environment_variables"]["MODE"] for request in requests_sent) == ["bad"] + ["good"] * 6
+    assert [request.get("override_config") for request in requests_sent].count({"cpu": 4}) == 1
+    # One shared poller: a handful of status checks per run, not a tight loop per caller
+    assert SweepHandler.gets <= 7 * 10
+
+
+def test_oversized_or_empty_sweeps_are_rejected():
+    config = {"host": "http://127.0.0.1:1", "api_key": "key", "project_id": "p1"}
+    result = run_job_sweep(config, {"job_id": "job-1", "grid": {"A": list(range(20)), "B": list(range(20))}})
+    assert not result["success"]
+    assert "400 variants" in result["message"]
+
+    result = run_job_sweep(config, {"job_id": "job-1"})
+    assert not result["success"]
+    assert "grid or variants" in result["message"]
+
+
+if __name__ == "__main__":
+    test_sweep_starts_every_variant_and_tracks_them_to_completion()
+    test_oversized_or_empty_sweeps_are_rejected()
+    print("OK")
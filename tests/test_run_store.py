@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""Test incremental sync and queries of the local run store against a mock experiments API"""
+
+import os
+import sys
+import time
+import tempfile
+import datetime
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve, experiment_run, without_data
+from src.run_store import RunStore
+from src.functions.sync_experiment_runs import sync_experiment_runs
+from src.functions.query_experiment_runs import query_experiment_runs
+
+NOW = datetime.datetime.now(datetime.timezone.utc)
+RUNS_PER_EXPERIMENT = 1500
+
+
+def iso(hours_ago):
+    return (NOW - datetime.timedelta(hours=hours_ago)).isoformat()
+
+
+def run_record(experiment, index):
+    """Run i of an experiment started 1000 + i hours ago, ended an hour later, with lr i % 4"""
+    tags = [{"key": "team", "value": "vision" if index % 2 else "nlp"}] + ([{"key": "best"}] if index == 7 else [])
+    return experiment_run(f"{experiment}-run-{index}", [("auc", index / RUNS_PER_EXPERIMENT, 1)],
+                          {"lr": str(index % 4)}, tags, name=f"trial {index}",
+                          status="FINISHED" if index % 3 else "FAILED",
+                          start_time=iso(1000 + index), end_time=iso(999 + index))
+
+
+class ExperimentsHandler(ApiHandler):
+    """Serves EXPERIMENTS; runs are listed without their data, which is fetched one by one"""
+
+    experiments = {}
+    detail_requests = []
+
+    def do_GET(self):
+        parts = urlparse(self.path).path.strip("/").split("/")
+        # api/v2/projects/{project}/experiments[/{experiment}/runs[/{run}]]
+        if len(parts) == 5:
+            names = sorted(self.experiments)
+            return self.send_page("experiments", len(names), lambda i: {"id": names[i], "name": names[i]})
+        runs = self.experiments[parts[5]]
+        if len(parts) == 7:
+            listed = [without_data(run) for run in runs.values()]
+            return self.send_page("experiment_runs", len(listed), listed.__getitem__)
+        with self.lock:
+            ExperimentsHandler.detail_requests.append(parts[7])
+        self.send_json(runs[parts[7]])
+
+
+def reset_experiments():
+    ExperimentsHandler.experiments = {
+        name: {run["id"]: run for run in (run_record(name, i) for i in range(RUNS_PER_EXPERIMENT))}
+        for name in ("exp-a", "exp-b")
+    }
+    running = run_record("exp-a", 9999)
+    running.update(status="RUNNING", end_time=None)
+    ExperimentsHandler.experiments["exp-a"][running["id"]] = running
+
+
+def test_sync_only_fetches_new_and_changed_runs():
+    reset_experiments()
+    with serve(ExperimentsHandler) as config, tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "runs.db")
+        ExperimentsHandler.detail_requests = []
+        result = sync_experiment_runs(config, {"store_path": path})
+        assert result["success"], result["message"]
+        assert result["experiments"] == 2
+        assert result["added"] == 2 * RUNS_PER_EXPERIMENT + 1 and result["unchanged"] == 0
+        assert len(ExperimentsHandler.detail_requests) == result["fetched"] == result["added"]
+
+        # Nothing changed: besides the listings, only the still running run and the runs
+        # that ended within WATERMARK_SKEW of the watermark are read again
+        ExperimentsHandler.detail_requests = []
+        result = sync_experiment_runs(config, {"store_path": path})
+        assert result["added"] == result["removed"] == 0 and result["updated"] == 3
+        assert sorted(ExperimentsHandler.detail_requests) == ["exp-a-run-0", "exp-a-run-9999", "exp-b-run-0"]
+
+        # A new run, the running run finishes, a run is deleted, an experiment is gone
+        experiment = ExperimentsHandler.experiments["exp-a"]
+        new_run = run_record("exp-a", 5000)
+        new_run.update(start_time=iso(0.5), end_time=None, status="RUNNING")
+        experiment[new_run["id"]] = new_run
+        experiment["exp-a-run-9999"].update(status="FINISHED", end_time=iso(0.1))
+        experiment["exp-a-run-9999"]["data"]["metrics"][0]["value"] = 0.99
+        del experiment["exp-a-run-3"]
+        del ExperimentsHandler.experiments["exp-b"]
+
+        ExperimentsHandler.detail_requests = []
+        result = sync_experiment_runs(config, {"store_path": path})
+        assert result["experiments"] == 1
+        assert (result["added"], result["updated"], result["removed"]) == (1, 2, 1)
+        assert sorted(ExperimentsHandler.detail_requests) == ["exp-a-run-0", "exp-a-run-5000", "exp-a-run-9999"]
+
+        with RunStore(path) as store:
+            assert store.get_run("exp-a-run-9999")["status"] == "FINISHED"
+            assert store.get_run("exp-a-run-3") is None
+            assert store.get_run("exp-b-run-1") is None
+            experiments = store.experiments("p1")
+            assert [(item["id"], item["run_count"]) for item in experiments] == \
+                   [("exp-a", RUNS_PER_EXPERIMENT + 1)]
+
+        # full=True re-reads every run
+        ExperimentsHandler.detail_requests = []
+        result = sync_experiment_runs(config, {"store_path": path, "full": True})
+        assert result["updated"] == RUNS_PER_EXPERIMENT + 1
+        assert len(ExperimentsHandler.detail_requests) == RUNS_PER_EXPERIMENT + 1
+
+
+def test_queries_use_tags_params_and_metric_ranges():
+    with RunStore(":memory:") as store:
+        with store._lock, store._db:
+            store._write_runs("p1", "exp-a", [run_record("exp-a", i) for i in range(RUNS_PER_EXPERIMENT)])
+
+        result = store.query_runs(project_id="p1", metric="auc", metric_min=0.5, metric_max=0.6,
+                                  params={"lr": 2}, tags={"team": "nlp"}, order="desc", limit=3)
+        expected = [i for i in range(RUNS_PER_EXPERIMENT)
+                    if 0.5 <= i / RUNS_PER_EXPERIMENT <= 0.6 and i % 4 == 2 and i % 2 == 0]
+        assert result["total"] == len(expected)
+        assert [run["id"] for run in result["runs"]] == [f"exp-a-run-{i}" for i in expected[::-1][:3]]
+        best = result["runs"][0]
+        assert best["metrics"] == {"auc": expected[-1] / RUNS_PER_EXPERIMENT}
+        assert best["params"] == {"lr": "2"} and best["tags"] == {"team": "nlp"}
+
+        result = store.query_runs(tags=["best"])
+        assert [run["id"] for run in result["runs"]] == ["exp-a-run-7"]
+
+        result = store.query_runs(status=["failed"], limit=None)
+        assert result["total"] == len(result["runs"]) == RUNS_PER_EXPERIMENT // 3
+        # Newest runs first by default
+        assert result["runs"][0]["id"] == "exp-a-run-0"
+
+        start = time.perf_counter()
+        for _ in range(100):
+            store.query_runs(metric="auc", metric_min=0.99, order="desc", limit=5)
+        print(f"Metric range query in {(time.perf_counter() - start) * 10:.3f}ms")
+
+        try:
+            store.query_runs(metric_min=0.5)
+            assert False, "metric_min without a metric should fail"
+        except ValueError:
+            pass
+
+
+def test_query_needs_a_synced_store():
+    config = {"host": "http://127.0.0.1:1", "api_key": "key", "project_id": "p1"}
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "runs.db")
+        result = query_experiment_runs(config, {"store_path": path})
+        assert not result["success"] and "sync_experiment_runs" in result["message"]
+        RunStore(path).close()
+        result = query_experiment_runs(config, {"store_path": path})
+        assert not result["success"] and "never synced" in result["message"]
+
+
+if __name__ == "__main__":
+    test_sync_only_fetches_new_and_changed_runs()
+    test_queries_use_tags_params_and_metric_ranges()
+    test_query_needs_a_synced_store()
+    print("OK")
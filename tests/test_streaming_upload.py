@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Test that large file uploads stream from disk with flat memory use"""
+
+import os
+import sys
+import resource
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src.functions.upload_file import upload_file_to_root
+
+# Size of the sparse file to upload and the allowed peak RSS growth
+FILE_SIZE = 3 * 1024 * 1024 * 1024
+MAX_RSS_GROWTH = 128 * 1024 * 1024
+
+
+class DiscardingHandler(ApiHandler):
+    """Stand-in for the project files API that reads and discards the upload"""
+
+    received = {}
+
+    def do_PUT(self):
+        length = int(self.headers["Content-Length"])
+        remaining = length
+        first_chunk = b""
+        while remaining > 0:
+            chunk = self.rfile.read(min(1024 * 1024, remaining))
+            if not chunk:
+                break
+            if not first_chunk:
+                first_chunk = chunk[:512]
+            remaining -= len(chunk)
+        DiscardingHandler.received = {
+            "content_length": length,
+            "bytes_read": length - remaining,
+            "content_type": self.headers["Content-Type"],
+            "head": first_chunk,
+        }
+        self.send_json({}, 201)
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def test_streaming_upload_keeps_memory_flat():
+    with serve(DiscardingHandler, rate_limits=True) as config, tempfile.TemporaryDirectory() as workdir:
+        file_path = os.path.join(workdir, "model.bin")
+        with open(file_path, "wb") as sparse_file:
+            sparse_file.truncate(FILE_SIZE)
+
+        rss_before = peak_rss_bytes()
+        success = upload_file_to_root(config["host"], "test-key", "test-project", file_path, target_dir="artifacts")
+        rss_growth = peak_rss_bytes() - rss_before
+
+    received = DiscardingHandler.received
+
+    print(f"Uploaded {received.get('bytes_read', 0)} bytes, peak RSS grew by {rss_growth / 1024 / 1024:.1f} MiB")
+    assert success
+    assert received["content_type"].startswith("multipart/form-data; boundary=")
+    assert received["bytes_read"] == received["content_length"] > FILE_SIZE
+    assert b'name="artifacts/model.bin"; filename="model.bin"' in received["head"]
+    assert rss_growth < MAX_RSS_GROWTH
+
+
+if __name__ == "__main__":
+    test_streaming_upload_keeps_memory_flat()
+    print("OK")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Test the transport's retry policy against a local server that fails on demand"""
+
+import os
+import sys
+import time
+import contextlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import transport
+from src.transport import RetryPolicy
+
+
+class FlakyHandler(ApiHandler):
+    """Answers with the queued (status, headers) responses, then 200"""
+
+    responses = []
+    calls = []
+
+    def _respond(self):
+        self.body()
+        FlakyHandler.calls.append((self.command, time.monotonic()))
+        status, headers = FlakyHandler.responses.pop(0) if FlakyHandler.responses else (200, {})
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_POST = do_PUT = _respond
+
+
+@contextlib.contextmanager
+def projects_url():
+    """Run the flaky server and yield its projects URL"""
+    with serve(FlakyHandler) as config:
+        yield config["host"] + "/api/v2/projects"
+
+
+def reset(responses):
+    FlakyHandler.responses = list(responses)
+    FlakyHandler.calls = []
+
+
+def test_retries_transient_statuses_and_honours_retry_after():
+    with projects_url() as url:
+        policy = RetryPolicy(max_attempts=4, base_delay=0.01)
+
+        reset([(503, {}), (429, {"Retry-After": "0.3"}), (502, {})])
+        response = transport.request("GET", url, retry=policy)
+        assert response.status_code == 200
+        assert len(FlakyHandler.calls) == 4
+        # The wait after the 429 is the server's Retry-After, not the much shorter backoff
+        assert FlakyHandler.calls[2][1] - FlakyHandler.calls[1][1] >= 0.3
+
+
+def test_gives_up_after_max_attempts_and_skips_non_idempotent_methods():
+    with projects_url() as url:
+        policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+        reset([(503, {})] * 5)
+        assert transport.request("PUT", url, data="{}", retry=policy).status_code == 503
+        assert len(FlakyHandler.calls) == 3
+
+        reset([(503, {})] * 5)
+        assert transport.request("POST", url, data="{}", retry=policy).status_code == 503
+        assert len(FlakyHandler.calls) == 1
+
+
+def test_budget_stops_waits_that_would_run_over():
+    with projects_url() as url:
+        policy = RetryPolicy(max_attempts=5, budget=1.0)
+
+        reset([(503, {"Retry-After": "30"})])
+        start = time.monotonic()
+        assert transport.request("GET", url, retry=policy).status_code == 503
+        assert time.monotonic() - start < 1.0
+        assert len(FlakyHandler.calls) == 1
+
+
+if __name__ == "__main__":
+    test_retries_transient_statuses_and_honours_retry_after()
+    test_gives_up_after_max_attempts_and_skips_non_idempotent_methods()
+    test_budget_stops_waits_that_would_run_over()
+    print("OK")
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+"""Test upload_folder batching, sync, remote diff and parallel uploads against a mock HTTPS project API"""
+
+import os
+import sys
+import time
+import tempfile
+import datetime
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve, parse_multipart
+from src import manifest
+from src.functions.upload_folder import upload_folder, upload_batch, make_batches, build_remote_index, run_tasks
+
+
+class ProjectHandler(ApiHandler):
+    """
+    Project files API backed by a local directory
+
+    A request uploading any file named in rejected fails as a whole and
+    stores nothing; deleting such a file fails too. Uploads take latency seconds.
+    """
+
+    root = None
+    rejected = set()
+    latency = 0
+    uploads = []
+    listings = []
+    deletes = []
+    in_flight = 0
+    max_in_flight = 0
+
+    def _path(self):
+        return self.query().get("path", [""])[0].strip("/")
+
+    def do_PUT(self):
+        fields = parse_multipart(self.headers["Content-Type"], self.body())
+        with self.lock:
+            ProjectHandler.uploads.append([name for name, _ in fields])
+            ProjectHandler.in_flight += 1
+            ProjectHandler.max_in_flight = max(ProjectHandler.max_in_flight, ProjectHandler.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            ProjectHandler.in_flight -= 1
+        if any(name in self.rejected for name, _ in fields):
+            return self.send_json({"message": "invalid file name"}, 400)
+        for name, data in fields:
+            path = os.path.join(self.root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as stored:
+                stored.write(data)
+        self.send_json({}, 201)
+
+    def do_GET(self):
+        directory = self._path()
+        with self.lock:
+            ProjectHandler.listings.append(directory)
+        full = os.path.join(self.root, directory)
+        if not os.path.isdir(full):
+            return self.send_json({"message": "not found"}, 404)
+        files = []
+        for name in sorted(os.listdir(full)):
+            path = os.path.join(full, name)
+            modified = datetime.datetime.fromtimestamp(os.path.getmtime(path), datetime.timezone.utc)
+            files.append({"path": f"{directory}/{name}".lstrip("/"), "is_dir": os.path.isdir(path),
+                          "file_size": os.path.getsize(path), "last_modified": modified.isoformat()})
+        self.send_json({"files": files})
+
+    def do_DELETE(self):
+        with self.lock:
+            ProjectHandler.deletes.append(self._path())
+        if self._path() in self.rejected:
+            return self.send_json({"error": {"message": "permission denied"}}, 400)
+        os.remove(os.path.join(self.root, self._path()))
+        self.send_json({})
+
+
+
+def reset():
+    ProjectHandler.uploads = []
+    ProjectHandler.listings = []
+    ProjectHandler.deletes = []
+    ProjectHandler.max_in_flight = 0
+
+
+def with_mock(test):
+    """Run test(config, folder, workdir) against a fresh mock project and an empty local folder"""
+    reset()
+    ProjectHandler.rejected = set()
+    ProjectHandler.latency = 0
+    with tempfile.TemporaryDirectory() as workdir, serve(ProjectHandler, tls=True) as config:
+        ProjectHandler.root = os.path.join(workdir, "project")
+        folder = os.path.join(workdir, "folder")
+        os.makedirs(ProjectHandler.root)
+        os.makedirs(folder)
+        return test(config, folder, workdir)
+
+
+def write_files(folder, sizes):
+    """Write one file per {relative path: size} entry and return their (path, relative path) entries"""
+    entries = []
+    for relative_path, size in sizes.items():
+        path = os.path.join(folder, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as local_file:
+            local_file.write(relative_path.encode()[:1] * size)
+        entries.append((path, relative_path))
+    return entries
+
+
+def test_batches_respect_file_and_byte_limits():
+    with tempfile.TemporaryDirectory() as folder:
+        sizes = {"a": 100, "b": 100, "c": 100, "d": 100, "e": 700, "f": 400, "big": 5000, "g": 10, "h": 10}
+        entries = write_files(folder, sizes)
+        batches = make_batches(entries, 3, 1000)
+
+        assert [[relative_path for _, relative_path in batch] for batch in batches] == \
+               [["a", "b", "c"], ["d", "e"], ["f"], ["big"], ["g", "h"]]
+        for batch in batches:
+            assert len(batch) <= 3
+            # Only a file larger than the limit goes over it, alone
+            assert sum(sizes[name] for _, name in batch) <= 1000 or len(batch) == 1
+        assert [entry for batch in batches for entry in batch] == entries
+        assert make_batches([], 3, 1000) == []
+        assert len(make_batches(entries, 100, 10 ** 6)) == 1
+
+
+def test_bisection_isolates_a_rejected_file():
+    def run(config, folder, workdir):
+        entries = write_files(folder, {f"f{index}": 10 for index in range(8)})
+        ProjectHandler.rejected = {"f5"}
+
+        outcomes = upload_batch(config["host"], "key", "p1", entries)
+        assert outcomes == [True] * 5 + [False] + [True] * 2
+        # Halves that fail are split again until the bad file is alone
+        assert ProjectHandler.uploads == [
+            [f"f{index}" for index in range(8)],
+            ["f0", "f1", "f2", "f3"],
+            ["f4", "f5", "f6", "f7"],
+            ["f4", "f5"],
+            ["f4"],
+            ["f5"],
+            ["f6", "f7"],
+        ]
+        assert sorted(os.listdir(ProjectHandler.root)) == ["f0", "f1", "f2", "f3", "f4", "f6", "f7"]
+
+    with_mock(run)
+
+
+def test_batch_mode_reports_every_file():
+    def run(config, folder, workdir):
+        sizes = {f"data/part-{index:02d}.csv": 50 + index for index in range(10)}
+        sizes.update({"README.md": 20, "data/bad name.csv": 5})
+        write_files(folder, sizes)
+        ProjectHandler.rejected = {"data/bad name.csv"}
+
+        result = upload_folder(config, {"folder_path": folder, "batch": True, "batch_max_files": 4,
+                                        "batch_max_bytes": 200})
+        assert result["success"], result["message"]
+        assert all(len(names) <= 4 for names in ProjectHandler.uploads)
+        assert result["successful_count"] == len(sizes) - 1 and result["failed_count"] == 1
+        assert sorted(result["results"]["success"] + [item["file"] for item in result["results"]["failed"]]) == \
+               sorted(sizes)
+        assert result["results"]["failed"] == [{"file": "data/bad name.csv", "error": "Failed to upload file"}]
+        for relative_path, size in sizes.items():
+            stored = os.path.join(ProjectHandler.root, relative_path)
+            assert os.path.exists(stored) == (relative_path != "data/bad name.csv")
+
+    with_mock(run)
+
+
+def test_sync_skips_unchanged_files_and_forgets_deleted_ones():
+    def run(config, folder, workdir):
+        sizes = {f"src/module_{index}.py": 100 + index for index in range(6)}
+        sizes.update({"README.md": 30, "data/train.csv": 500, "data/test.csv": 200})
+        write_files(folder, sizes)
+        params = {"folder_path": folder, "sync": True, "manifest_dir": os.path.join(workdir, "manifests")}
+        manifest_file = manifest.manifest_path(config["host"], "p1", folder, params["manifest_dir"])
+
+        result = upload_folder(config, params)
+        assert result["success"], result["message"]
+        assert sorted(result["results"]["success"]) == sorted(sizes)
+        assert result["skipped_count"] == 0
+        assert sorted(manifest.load_manifest(manifest_file)) == sorted(sizes)
+
+        reset()
+        result = upload_folder(config, params)
+        assert result["successful_count"] == 0 and ProjectHandler.uploads == []
+        assert sorted(result["results"]["skipped"]) == sorted(sizes)
+
+        # One file changes, one is deleted; without delete_removed the remote copy stays
+        with open(os.path.join(folder, "data/train.csv"), "wb") as local_file:
+            local_file.write(b"x" * 500)
+        os.remove(os.path.join(folder, "README.md"))
+        reset()
+        result = upload_folder(config, params)
+        assert result["results"]["success"] == ["data/train.csv"]
+        assert ProjectHandler.uploads == [["data/train.csv"]]
+        assert result["skipped_count"] == len(sizes) - 2
+        assert result["deleted_count"] == 0 and ProjectHandler.deletes == []
+        assert os.path.exists(os.path.join(ProjectHandler.root, "README.md"))
+        recorded = manifest.load_manifest(manifest_file)
+        assert sorted(recorded) == sorted(set(sizes) - {"README.md"})
+        with open(os.path.join(ProjectHandler.root, "data/train.csv"), "rb") as stored:
+            assert stored.read() == b"x" * 500
+
+        # With delete_removed, remote copies go too; a failed delete is kept and retried
+        os.remove(os.path.join(folder, "src/module_0.py"))
+        os.remove(os.path.join(folder, "src/module_1.py"))
+        ProjectHandler.rejected = {"src/module_1.py"}
+        reset()
+        result = upload_folder(config, dict(params, delete_removed=True))
+        assert result["results"]["deleted"] == ["src/module_0.py"]
+        assert [item["file"] for item in result["results"]["delete_failed"]] == ["src/module_1.py"]
+        assert "src/module_0.py" not in manifest.load_manifest(manifest_file)
+        assert "src/module_1.py" in manifest.load_manifest(manifest_file)
+
+        ProjectHandler.rejected = set()
+        reset()
+        result = upload_folder(config, dict(params, delete_removed=True))
+        assert result["results"]["deleted"] == ["src/module_1.py"]
+        assert ProjectHandler.deletes == ["src/module_1.py"] and ProjectHandler.uploads == []
+        assert sorted(manifest.load_manifest(manifest_file)) == \
+               sorted(set(sizes) - {"README.md", "src/module_0.py", "src/module_1.py"})
+
+    with_mock(run)
+
+
+def test_remote_diff_uploads_only_files_that_differ():
+    def run(config, folder, workdir):
+        sizes = {"same.txt": 40, "models/same.bin": 300, "models/resized.bin": 300, "models/stale.bin": 300,
+                 "models/new.bin": 50}
+        write_files(folder, sizes)
+        # The project already has copies: equal ones, one of another size and one older than the local file
+        write_files(ProjectHandler.root, dict(sizes, **{"models/resized.bin": 299, "other/unrelated.txt": 10}))
+        os.remove(os.path.join(ProjectHandler.root, "models/new.bin"))
+        local_mtime = os.path.getmtime(os.path.join(folder, "models/stale.bin"))
+        os.utime(os.path.join(ProjectHandler.root, "models/stale.bin"), (local_mtime - 3600, local_mtime - 3600))
+
+        remote_files, errors = build_remote_index(config, "p1", ["same.txt", "models/same.bin", "models/new.bin"], 4)
+        assert errors == []
+        assert remote_files["models/same.bin"]["size"] == 300
+        assert abs(remote_files["models/stale.bin"]["mtime"] - (local_mtime - 3600)) < 1
+        # Only directories on the way to a wanted file are listed
+        assert sorted(ProjectHandler.listings) == ["", "models"]
+        assert "other/unrelated.txt" not in remote_files
+
+        reset()
+        result = upload_folder(config, {"folder_path": folder, "remote_diff": True, "concurrency": 4})
+        assert result["success"], result["message"]
+        assert sorted(result["results"]["success"]) == ["models/new.bin", "models/resized.bin", "models/stale.bin"]
+        assert sorted(result["results"]["skipped"]) == ["models/same.bin", "same.txt"]
+        assert sorted(names[0] for names in ProjectHandler.uploads) == sorted(result["results"]["success"])
+        assert result["results"]["listing_errors"] == []
+        assert os.path.getsize(os.path.join(ProjectHandler.root, "models/resized.bin")) == 300
+
+        # Now everything matches
+        reset()
+        result = upload_folder(config, {"folder_path": folder, "remote_diff": True})
+        assert result["successful_count"] == 0 and result["skipped_count"] == len(sizes)
+        assert ProjectHandler.uploads == []
+
+    with_mock(run)
+
+
+def test_run_tasks_keeps_task_order_and_bounds_concurrency():
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+    finished = []
+
+    def task(index):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        # Later tasks finish first
+        time.sleep(0.01 * (20 - index))
+        with lock:
+            running["now"] -= 1
+            finished.append(index)
+        return index % 7 != 3
+
+    results = run_tasks(task, list(range(20)), 5)
+    assert results == [index % 7 != 3 for index in range(20)]
+    assert finished != sorted(finished)
+    assert 1 < running["max"] <= 5
+    assert run_tasks(task, list(range(4)), 1) == [True, True, True, False]
+
+
+def test_parallel_uploads_isolate_failed_files():
+    def run(config, folder, workdir):
+        sizes = {f"logs/run-{index:02d}.log": 100 + index for index in range(24)}
+        write_files(folder, sizes)
+        ProjectHandler.rejected = {"logs/run-05.log", "logs/run-17.log"}
+        ProjectHandler.latency = 0.05
+
+        start = time.perf_counter()
+        result = upload_folder(config, {"folder_path": folder, "concurrency": 6})
+        elapsed = time.perf_counter() - start
+        print(f"Uploaded {result['successful_count']} files in {elapsed:.2f}s, "
+              f"{ProjectHandler.max_in_flight} in flight at most")
+
+        assert result["success"], result["message"]
+        assert 1 < ProjectHandler.max_in_flight <= 6
+        # Well under the time the uploads take one after another
+        assert elapsed < len(sizes) * ProjectHandler.latency * 0.6
+        assert sorted(item["file"] for item in result["results"]["failed"]) == sorted(ProjectHandler.rejected)
+        assert sorted(result["results"]["success"]) == sorted(set(sizes) - ProjectHandler.rejected)
+        # Every file was sent once, and each failure stayed with its own file
+        assert sorted(names[0] for names in ProjectHandler.uploads) == sorted(sizes)
+        for relative_path in sizes:
+            stored = os.path.join(ProjectHandler.root, relative_path)
+            assert os.path.exists(stored) == (relative_path not in ProjectHandler.rejected)
+
+    with_mock(run)
+
+
+if __name__ == "__main__":
+    test_batches_respect_file_and_byte_limits()
+    test_bisection_isolates_a_rejected_file()
+    test_batch_mode_reports_every_file()
+    test_sync_skips_unchanged_files_and_forgets_deleted_ones()
+    test_remote_diff_uploads_only_files_that_differ()
+    test_run_tasks_keeps_task_order_and_bounds_concurrency()
+    test_parallel_uploads_isolate_failed_files()
+    print("OK")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Test wait_for_job_run and the shared job run poller against a mock runs API"""
+
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from mock_api import ApiHandler, serve
+from src import job_watcher
+from src.functions.wait_for_job_run import wait_for_job_run
+
+RUN_COUNT = 20
+
+
+class RunsHandler(ApiHandler):
+    """Runs are scheduling for 50 ms, then run for 0.3 s plus 10 ms per run index; run-7 fails"""
+
+    started = {}
+    polls = Counter()
+
+    def do_GET(self):
+        run_id = self.path.rsplit("/", 1)[-1]
+        index = int(run_id.split("-")[1])
+        with self.lock:
+            started = RunsHandler.started.setdefault(run_id, time.monotonic())
+            RunsHandler.polls[run_id] += 1
+        age = time.monotonic() - started
+        if index == 99:
+            status = "ENGINE_RUNNING"
+        elif age < 0.05:
+            status = "ENGINE_SCHEDULING"
+        elif age < 0.3 + index * 0.01:
+            status = "ENGINE_RUNNING"
+        else:
+            status = "ENGINE_FAILED" if index == 7 else "ENGINE_SUCCEEDED"
+        self.send_json({"id": run_id, "status": status, "script": "x" * 1000})
+
+
+def reset_runs():
+    RunsHandler.started = {}
+    RunsHandler.polls = Counter()
+
+
+def test_waiters_share_adaptive_polls():
+    reset_runs()
+
+    def wait(config, index):
+        return wait_for_job_run(config, {"job_id": "job-1", "run_id": f"run-{index % RUN_COUNT}", "timeout": 10,
+                                         "initial_interval": 0.01, "max_interval": 0.08})
+
+    # Two callers wait for each run at the same time
+    with serve(RunsHandler) as config, ThreadPoolExecutor(max_workers=2 * RUN_COUNT) as executor:
+        results = list(executor.map(lambda index: wait(config, index), range(2 * RUN_COUNT)))
+
+    for index, result in enumerate(results):
+        assert result["success"], result
+        assert not result["timed_out"]
+        assert "script" not in result
+        expected = "ENGINE_FAILED" if index % RUN_COUNT == 7 else "ENGINE_SUCCEEDED"
+        assert result["status"] == expected
+        assert result["succeeded"] == (expected == "ENGINE_SUCCEEDED")
+        assert [step["status"] for step in result["transitions"]] == ["ENGINE_SCHEDULING", "ENGINE_RUNNING", expected]
+
+    # One poller serves both callers of a run, backing off while the run's state is unchanged:
+    # a fixed 10 ms interval for both callers would need about 2 * 0.5 / 0.01 = 100 polls for the slowest run
+    print(f"Polls per run: {sorted(RunsHandler.polls.values())}")
+    assert all(count <= 20 for count in RunsHandler.polls.values())
+    assert job_watcher.poller.stats()["watching"] == 0
+
+
+def test_deadline_and_multiple_runs():
+    reset_runs()
+    with serve(RunsHandler, rate_limits=True) as config:
+        result = wait_for_job_run(config, {
+            "runs": [{"job_id": "job-1", "run_id": "run-0"}, {"job_id": "job-1", "run_id": "run-99"}],
+            "timeout": 0.5, "initial_interval": 0.02, "max_interval": 0.05
+        })
+
+    assert not result["success"]
+    assert result["timed_out"]
+    assert 0.5 <= result["elapsed"] < 1.0
+    assert [run["status"] for run in result["runs"]] == ["ENGINE_SUCCEEDED", "ENGINE_RUNNING"]
+    assert [run["terminal"] for run in result["runs"]] == [True, False]
+
+
+if __name__ == "__main__":
+    test_waiters_share_adaptive_polls()
+    test_deadline_and_multiple_runs()
+    print("OK")